@@ -0,0 +1,31 @@
+"""Retention checkpoints
+
+Revision ID: 2c8e5f1d7a90
+Revises: 7d2f1c9a4b83
+Create Date: 2026-10-16 21:32:47.210938
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2c8e5f1d7a90"
+down_revision = "7d2f1c9a4b83"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "retention_checkpoints",
+        sa.Column("step", sa.String(), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("step"),
+    )
+
+
+def downgrade():
+    op.drop_table("retention_checkpoints")
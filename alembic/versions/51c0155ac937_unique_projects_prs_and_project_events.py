@@ -0,0 +1,167 @@
+"""Unique projects, pull requests and project events
+
+Revision ID: 51c0155ac937
+Revises: b4e11a52ea52
+Create Date: 2026-10-16 09:12:41.532108
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "51c0155ac937"
+down_revision = "b4e11a52ea52"
+branch_labels = None
+depends_on = None
+
+# tables referencing git_projects.id
+GIT_PROJECT_REFERENCES = (
+    "sync_release_pull_request",
+    "pull_requests",
+    "project_issues",
+    "git_branches",
+    "project_releases",
+    "koji_build_tags",
+    "project_authentication_issue",
+)
+
+
+def deduplicate_git_projects():
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE duplicate_git_projects ON COMMIT DROP AS
+        SELECT id, keep_id FROM (
+            SELECT id, min(id) OVER (PARTITION BY namespace, repo_name, project_url) AS keep_id
+            FROM git_projects
+        ) AS projects
+        WHERE id != keep_id
+        """,
+    )
+    for table in GIT_PROJECT_REFERENCES:
+        op.execute(
+            f"""
+            UPDATE {table} SET project_id = duplicate_git_projects.keep_id
+            FROM duplicate_git_projects WHERE {table}.project_id = duplicate_git_projects.id
+            """,
+        )
+    op.execute(
+        """
+        UPDATE github_installations SET repositories = ARRAY(
+            SELECT DISTINCT coalesce(duplicate_git_projects.keep_id, repository.id)
+            FROM unnest(github_installations.repositories) AS repository(id)
+            LEFT JOIN duplicate_git_projects ON duplicate_git_projects.id = repository.id
+        )
+        WHERE github_installations.repositories && ARRAY(SELECT id FROM duplicate_git_projects)
+        """,
+    )
+    op.execute(
+        """
+        DELETE FROM git_projects USING duplicate_git_projects
+        WHERE git_projects.id = duplicate_git_projects.id
+        """,
+    )
+
+
+def deduplicate_pull_requests():
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE duplicate_pull_requests ON COMMIT DROP AS
+        SELECT id, keep_id FROM (
+            SELECT id, min(id) OVER (PARTITION BY pr_id, project_id) AS keep_id
+            FROM pull_requests
+        ) AS pull_requests
+        WHERE id != keep_id
+        """,
+    )
+    op.execute(
+        """
+        UPDATE project_events SET event_id = duplicate_pull_requests.keep_id
+        FROM duplicate_pull_requests
+        WHERE project_events.type = 'pull_request'
+            AND project_events.event_id = duplicate_pull_requests.id
+        """,
+    )
+    for column in ("source_git_pull_request_id", "dist_git_pull_request_id"):
+        op.execute(
+            f"""
+            UPDATE source_git_pr_dist_git_pr SET {column} = duplicate_pull_requests.keep_id
+            FROM duplicate_pull_requests
+            WHERE source_git_pr_dist_git_pr.{column} = duplicate_pull_requests.id
+            """,
+        )
+    op.execute(
+        """
+        DELETE FROM pull_requests USING duplicate_pull_requests
+        WHERE pull_requests.id = duplicate_pull_requests.id
+        """,
+    )
+
+
+def deduplicate_project_events():
+    # merging the duplicate pull requests might have created duplicate project events
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE duplicate_project_events ON COMMIT DROP AS
+        SELECT id, keep_id FROM (
+            SELECT id, min(id) OVER (PARTITION BY type, event_id, commit_sha) AS keep_id
+            FROM project_events
+        ) AS project_events
+        WHERE id != keep_id
+        """,
+    )
+    op.execute(
+        """
+        UPDATE pipelines SET project_event_id = duplicate_project_events.keep_id
+        FROM duplicate_project_events
+        WHERE pipelines.project_event_id = duplicate_project_events.id
+        """,
+    )
+    op.execute(
+        """
+        DELETE FROM project_events USING duplicate_project_events
+        WHERE project_events.id = duplicate_project_events.id
+        """,
+    )
+
+
+def upgrade():
+    # the rows created by concurrent workers before the indexes existed
+    deduplicate_git_projects()
+    deduplicate_pull_requests()
+    deduplicate_project_events()
+
+    op.create_index(
+        "ix_git_projects_namespace_repo_name_project_url",
+        "git_projects",
+        ["namespace", "repo_name", "project_url"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_pull_requests_pr_id_project_id",
+        "pull_requests",
+        ["pr_id", "project_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_project_events_type_event_id_commit_sha",
+        "project_events",
+        ["type", "event_id", "commit_sha"],
+        unique=True,
+        postgresql_where=sa.text("commit_sha IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_project_events_type_event_id_no_commit_sha",
+        "project_events",
+        ["type", "event_id"],
+        unique=True,
+        postgresql_where=sa.text("commit_sha IS NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_project_events_type_event_id_no_commit_sha", table_name="project_events")
+    op.drop_index("ix_project_events_type_event_id_commit_sha", table_name="project_events")
+    op.drop_index("ix_pull_requests_pr_id_project_id", table_name="pull_requests")
+    op.drop_index("ix_git_projects_namespace_repo_name_project_url", table_name="git_projects")
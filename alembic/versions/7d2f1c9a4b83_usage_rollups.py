@@ -0,0 +1,61 @@
+"""Usage rollups
+
+Revision ID: 7d2f1c9a4b83
+Revises: 51c0155ac937
+Create Date: 2026-10-16 14:27:09.184512
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2f1c9a4b83"
+down_revision = "51c0155ac937"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    project_event_type = postgresql.ENUM(name="projecteventmodeltype", create_type=False)
+
+    op.create_table(
+        "usage_event_days",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("project_event_type", project_event_type, nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("day", "project_event_type", "event_id"),
+    )
+    op.create_index(
+        op.f("ix_usage_event_days_project_id"),
+        "usage_event_days",
+        ["project_id"],
+        unique=False,
+    )
+    op.create_table(
+        "usage_job_days",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("project_event_type", project_event_type, nullable=False),
+        sa.Column("job_type", sa.String(), nullable=False),
+        sa.Column("runs", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "project_id", "project_event_type", "job_type"),
+    )
+    op.create_table(
+        "usage_rollup_watermark",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_pipelines_datetime"), "pipelines", ["datetime"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_pipelines_datetime"), table_name="pipelines")
+    op.drop_table("usage_rollup_watermark")
+    op.drop_table("usage_job_days")
+    op.drop_index(op.f("ix_usage_event_days_project_id"), table_name="usage_event_days")
+    op.drop_table("usage_event_days")
@@ -34,11 +34,28 @@ See get_pg_url() for details.
         help="Remove data older than this. For example: "
         "'1 year' or '6 months'. Defaults to '1 year'.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Number of rows deleted in a single transaction.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Stop after this number of seconds, the next run resumes "
+        "where this one stopped. Unlimited by default.",
+    )
 
     args = parser.parse_args()
 
     try:
-        delete_old_data(age=args.age)
+        delete_old_data(
+            age=args.age,
+            batch_size=args.batch_size,
+            time_budget=args.time_budget,
+        )
         return 0
     except Exception as e:
         print(f"Error during cleanup: {e}")
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Script for recomputing the daily usage rollups.
+
+This script provides a CLI interface to the refresh_usage_rollups function
+from packit_service.models module for backfilling the rollups.
+"""
+
+import argparse
+import sys
+from datetime import date
+
+from packit_service.models import refresh_usage_rollups
+
+
+def main():
+    """CLI entry point for usage rollups script."""
+    parser = argparse.ArgumentParser(
+        description="""\
+Recompute the daily usage rollups the usage statistics are read from.
+
+Set POSTGRESQL_* environment variables to define the DB URL.
+See get_pg_url() for details.
+""",
+    )
+    parser.add_argument(
+        "since",
+        type=date.fromisoformat,
+        nargs="?",
+        default=None,
+        help="First day to recompute, e.g. '2024-01-31'. "
+        "Defaults to the day of the first pipeline if the rollups were never computed "
+        "or to the last few days otherwise.",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        refresh_usage_rollups(since=args.since)
+        return 0
+    except Exception as e:
+        print(f"Error during recomputing the usage rollups: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
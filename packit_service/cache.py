@@ -0,0 +1,239 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Caches shared across worker processes.
+
+Every cache has two tiers: a process-local `TTLCache` and a Redis tier
+(the Redis database used as the Celery broker), so that a value fetched
+by one prefork worker is reused by all the others. The Redis tier is
+best-effort: when Redis is unreachable, the caches silently degrade
+to the process-local tier.
+"""
+
+import json
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Optional, TypeVar
+
+import redis
+from cachetools import Cache, TTLCache
+
+from packit_service.celerizer import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# prefix of all the Redis keys used by the caches
+REDIS_CACHE_KEY_PREFIX = "packit-service:cache"
+# for how long not to try Redis again after a connection error (in seconds)
+REDIS_CACHE_RETRY_AFTER = 60
+
+# sentinel distinguishing a cache miss from a cached `None`
+MISSING = object()
+
+# process-local caches of objects that can't be shared via Redis
+_local_caches: list[Cache] = []
+
+CacheT = TypeVar("CacheT", bound=Cache)
+
+_redis_client: Optional[redis.Redis] = None
+_redis_disabled_until: float = 0.0
+_redis_lock = threading.Lock()
+
+
+def get_cache_redis() -> Optional[redis.Redis]:
+    """
+    Get the Redis client for the shared tier of the caches.
+
+    Returns:
+        Redis client or `None` if Redis recently failed to respond.
+    """
+    global _redis_client
+
+    if time.monotonic() < _redis_disabled_until:
+        return None
+
+    with _redis_lock:
+        if _redis_client is None:
+            _redis_client = get_redis_client(socket_connect_timeout=1, socket_timeout=1)
+        return _redis_client
+
+
+def _disable_redis(ex: Exception) -> None:
+    global _redis_disabled_until
+
+    logger.warning(
+        f"Redis tier of the caches is unavailable ({ex}), "
+        f"using only process-local caches for the next {REDIS_CACHE_RETRY_AFTER}s.",
+    )
+    _redis_disabled_until = time.monotonic() + REDIS_CACHE_RETRY_AFTER
+
+
+def redis_call(method: str, *args, **kwargs) -> Any:
+    """
+    Call a method of the Redis client, swallowing Redis errors.
+
+    Args:
+        method: Name of the `redis.Redis` method.
+        *args: Positional arguments of the method.
+        **kwargs: Keyword arguments of the method.
+
+    Returns:
+        Result of the call or `None` if Redis is not available.
+    """
+    client = get_cache_redis()
+    if client is None:
+        return None
+    try:
+        return getattr(client, method)(*args, **kwargs)
+    except redis.RedisError as ex:
+        _disable_redis(ex)
+        return None
+
+
+def redis_pipeline(*commands: tuple) -> Optional[list]:
+    """
+    Execute multiple Redis commands in a single round-trip, swallowing Redis errors.
+
+    Args:
+        *commands: Tuples of the `redis.Redis` method name and its positional arguments.
+
+    Returns:
+        List of the results of the commands or `None` if Redis is not available.
+    """
+    client = get_cache_redis()
+    if client is None:
+        return None
+    try:
+        pipeline = client.pipeline(transaction=False)
+        for method, *args in commands:
+            getattr(pipeline, method)(*args)
+        return pipeline.execute()
+    except redis.RedisError as ex:
+        _disable_redis(ex)
+        return None
+
+
+class SharedCache:
+    """
+    Two-tier (process-local and Redis) cache of JSON-serializable values.
+
+    Attributes:
+        namespace: Name of the cache, used in the Redis keys.
+        ttl: Time to live of the entries in seconds.
+        local_ttl: Time to live of the entries in the process-local tier,
+            defaults to `ttl`. Entries deleted by another process are
+            served from the local tier of this one until they expire.
+    """
+
+    _instances: "weakref.WeakSet[SharedCache]" = weakref.WeakSet()
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int,
+        maxsize: int = 256,
+        local_ttl: Optional[int] = None,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local_ttl = local_ttl or ttl
+        self._local: TTLCache = TTLCache(maxsize=maxsize, ttl=self.local_ttl)
+        self._lock = threading.Lock()
+        SharedCache._instances.add(self)
+
+    def redis_key(self, key: str) -> str:
+        return f"{REDIS_CACHE_KEY_PREFIX}:{self.namespace}:{key}"
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """
+        Get the value from the process-local tier, falling back to Redis.
+
+        Args:
+            key: Key of the entry.
+            default: Value returned on a cache miss.
+
+        Returns:
+            Cached value or `default`.
+        """
+        with self._lock:
+            value = self._local.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        raw = redis_call("get", self.redis_key(key))
+        if raw is None:
+            return default
+
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            logger.debug(f"Invalid entry {self.redis_key(key)} in Redis, ignoring.")
+            return default
+
+        with self._lock:
+            self._local[key] = value
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store the value in both tiers.
+
+        Args:
+            key: Key of the entry.
+            value: JSON-serializable value.
+            ttl: Time to live of the Redis entry, defaults to the TTL of the cache.
+        """
+        with self._lock:
+            self._local[key] = value
+        redis_call("set", self.redis_key(key), json.dumps(value), ex=ttl or self.ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry from both tiers."""
+        with self._lock:
+            self._local.pop(key, None)
+        redis_call("delete", self.redis_key(key))
+
+    def acquire_lock(self, key: str, timeout: int = 60) -> bool:
+        """
+        Try to acquire a lock shared by all workers, e.g. to let only one
+        of them refresh an entry.
+
+        Args:
+            key: Key of the entry the lock is for.
+            timeout: Seconds after which the lock expires on its own.
+
+        Returns:
+            Whether the lock was acquired. Always `True` when Redis
+            is not available.
+        """
+        acquired = redis_call("set", f"{self.redis_key(key)}:lock", "1", nx=True, ex=timeout)
+        # SET NX returns None both when the lock is held by someone else
+        # and when Redis failed (in which case the tier gets disabled)
+        if acquired is None and get_cache_redis() is None:
+            return True
+        return bool(acquired)
+
+    def release_lock(self, key: str) -> None:
+        redis_call("delete", f"{self.redis_key(key)}:lock")
+
+    def clear_local(self) -> None:
+        """Clear the process-local tier only."""
+        with self._lock:
+            self._local.clear()
+
+
+def register_local_cache(local_cache: CacheT) -> CacheT:
+    """Register a process-local cache to be cleared by `clear_local_caches`."""
+    _local_caches.append(local_cache)
+    return local_cache
+
+
+def clear_local_caches() -> None:
+    """Clear the process-local tier of all the shared and registered caches."""
+    for shared_cache in list(SharedCache._instances):
+        shared_cache.clear_local()
+    for local_cache in _local_caches:
+        local_cache.clear()
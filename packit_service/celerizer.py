@@ -3,6 +3,7 @@
 
 from os import getenv
 
+import redis
 from celery import Celery
 from lazy_object_proxy import Proxy
 
@@ -33,6 +34,27 @@ def get_redis_config():
     }
 
 
+def get_redis_client(**kwargs) -> redis.Redis:
+    """
+    Create a Redis client connected to the database used as the Celery broker.
+
+    Args:
+        **kwargs: Additional keyword arguments passed to `redis.Redis`.
+
+    Returns:
+        Redis client with decoded responses.
+    """
+    redis_config = get_redis_config()
+    return redis.Redis(
+        host=redis_config["host"],
+        port=int(redis_config["port"]),
+        db=int(redis_config["db"]),
+        password=redis_config["password"],
+        decode_responses=True,
+        **kwargs,
+    )
+
+
 class Celerizer:
     def __init__(self):
         self._celery_app = None
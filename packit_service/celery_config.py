@@ -42,13 +42,27 @@ beat_schedule = {
     "database-maintenance": {
         "task": "packit_service.worker.tasks.database_maintenance",
         "schedule": crontab(minute=0, hour=1),  # nightly at 1AM
-        "options": {"queue": "long-running", "time_limit": 1800},
+        "options": {
+            "queue": "long-running",
+            "time_limit": packit_service.constants.DATABASE_MAINTENANCE_TIME_LIMIT,
+        },
+    },
+    "rebuild-known-build-ids": {
+        "task": "packit_service.worker.tasks.rebuild_known_build_ids",
+        "schedule": 3600.0,
+        "options": {"queue": "long-running"},
     },
     "check-onboarded-projects": {
         "task": "packit_service.worker.tasks.run_check_onboarded_projects",
         "schedule": crontab(minute=0, hour=2),  # nightly at 2AM
         "options": {"queue": "long-running"},
     },
+    "update-usage-rollups": {
+        "task": "packit_service.worker.tasks.update_usage_rollups",
+        "schedule": 3600.0,
+        # the first run computes the rollups of all the existing pipelines
+        "options": {"queue": "long-running", "time_limit": 3600},
+    },
     "get_usage_statistics": {
         "task": "packit_service.worker.tasks.get_usage_statistics",
         "schedule": 10800.0,
@@ -121,6 +121,11 @@ class ServiceConfig(Config):
         fedora_ci: Optional[FedoraCISettings] = None,
         fedora_ci_run_by_default: bool = False,
         rate_limit_threshold: Optional[int] = None,
+        sync_release_concurrency: int = 1,
+        koji_build_concurrency: int = 1,
+        bodhi_update_concurrency: int = 1,
+        repository_mirror_cache: Optional[str] = None,
+        repository_mirror_cache_size: int = 20,
         logdetective_enabled: bool = False,
         logdetective_url: str = LOGDETECTIVE_PACKIT_SERVER_URL,
         logdetective_token: str = "",
@@ -211,6 +216,23 @@ class ServiceConfig(Config):
         # to the rate-limited queue. If 0 disables moving to rate-limited queue.
         self.rate_limit_threshold = rate_limit_threshold
 
+        # Number of dist-git branches synced in parallel by propose-downstream
+        # and pull-from-upstream. 1 syncs them one by one in a single clone.
+        self.sync_release_concurrency = sync_release_concurrency
+
+        # Number of downstream Koji builds of a group (dist-git branches) submitted
+        # in parallel. 1 submits them one by one from a single clone.
+        self.koji_build_concurrency = koji_build_concurrency
+
+        # Number of Bodhi updates of a group (dist-git branches) created in parallel.
+        self.bodhi_update_concurrency = bodhi_update_concurrency
+
+        # Persistent directory (outside of the sandcastle work dir) of the local mirrors
+        # the upstream and dist-git repositories are cloned from, and its size limit in GiB.
+        # Takes precedence over the `repository_cache`.
+        self.repository_mirror_cache = repository_mirror_cache
+        self.repository_mirror_cache_size = repository_mirror_cache_size
+
         # Once the interface server instance is up, we will enable it in stg for tests/debug,
         # and when we are satisfied with it, then prod.
         self.logdetective_enabled = logdetective_enabled
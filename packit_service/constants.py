@@ -69,6 +69,13 @@ TESTING_FARM_EXTRA_PARAM_MERGED_SUBTREES = (
     "settings",
 )
 TESTING_FARM_ARTIFACTS_KEY = "artifacts"
+# Number of Testing Farm requests the babysitter checks concurrently
+TESTING_FARM_BABYSIT_CONCURRENCY = 16
+# Timeout (in seconds) of a single check of a Testing Farm request
+TESTING_FARM_BABYSIT_REQUEST_TIMEOUT = 30
+# A pending Testing Farm request is checked again after a quarter of the time
+# it has been pending for, but at least once in this number of seconds
+TESTING_FARM_BABYSIT_MAX_INTERVAL = 60 * 60
 
 ELN_PACKAGE_LIST = "https://tiny.distro.builders/view-all-source-package-name-list--view-eln.txt"
 ELN_EXTRAS_PACKAGE_LIST = (
@@ -168,6 +175,25 @@ PACKAGE_CONFIGS_OUTDATED_AFTER_DAYS = 1
 # outdated and can be deleted along with related data.
 PIPELINES_OUTDATED_AFTER_DAYS = 365
 
+# Number of rows deleted (or updated) in a single transaction when removing old data
+RETENTION_BATCH_SIZE = 1000
+# Pause (in seconds) between the batches, to let the other queries take the locks
+RETENTION_BATCH_PAUSE = 0.1
+# Time (in seconds) after which the removal of old data stops,
+# the interrupted step is resumed by the next run
+RETENTION_TIME_BUDGET = 30 * 60
+# Time limit (in seconds) of the nightly database maintenance, after which it's killed
+DATABASE_MAINTENANCE_TIME_LIMIT = 60 * 60
+# Time (in seconds) left at the end of the database maintenance for the batch in progress,
+# the removal of old data is given the rest of the time left after the backup
+DATABASE_MAINTENANCE_TIME_RESERVE = 5 * 60
+
+# Size (in bytes) of the chunks of the database dump read from pg_dump
+DATABASE_BACKUP_CHUNK_SIZE = 1024 * 1024
+# Size (in bytes) of the parts of the compressed database dump uploaded to S3,
+# S3 requires at least 5 MiB for all but the last part
+DATABASE_BACKUP_PART_SIZE = 64 * 1024 * 1024
+
 ALLOWLIST_CONSTANTS = {
     "approved_automatically": "approved_automatically",
     "waiting": "waiting",
@@ -343,6 +369,10 @@ DENIED_MSG = (
 # shared sandcastle dir
 SANDCASTLE_DG_REPO_DIR = "dist-git"
 SANDCASTLE_LOCAL_PROJECT_DIR = "local-project"
+# Time (in seconds) a repository mirror is kept in the cache after its last use
+# regardless of the size of the cache, the clones of the running tasks share its objects,
+# so it has to exceed the time limit of the tasks
+REPOSITORY_MIRROR_EVICTION_MIN_AGE = 2 * 60 * 60
 
 FAILURE_COMMENT_MESSAGE_VARIABLES = {
     # placeholder name in the user customized failure message:
@@ -364,6 +394,12 @@ USAGE_PAST_YEAR_DATE_STR = (datetime.now() - timedelta(days=365)).strftime("%Y-%
 USAGE_DATE_IN_THE_PAST = USAGE_CURRENT_DATE.replace(year=USAGE_CURRENT_DATE.year - 100)
 USAGE_DATE_IN_THE_PAST_STR = USAGE_DATE_IN_THE_PAST.strftime("%Y-%m-%d")
 
+# Days of the usage rollups recomputed on each refresh, so that the jobs
+# connected to already existing pipelines (e.g. tests of finished builds) are counted
+USAGE_ROLLUP_REFRESH_DAYS = 2
+# Days of the usage rollups recomputed in a single transaction
+USAGE_ROLLUP_CHUNK_DAYS = 31
+
 OPEN_SCAN_HUB_FEATURE_DESCRIPTION = (
     ":warning: You can see the list of known issues and also provide your feedback"
     " [here](https://github.com/packit/packit/discussions/2371). \n\n"
@@ -385,3 +421,12 @@ REDIS_DEFAULT_CELERY_BACKEND = "1"
 
 # TTL for orphaned Celery pidbox reply queues (in seconds)
 REDIS_PIDBOX_TTL_SECONDS = 3600  # 1 hour
+# Number of keys requested from Redis by a single SCAN during the pidbox cleanup
+REDIS_PIDBOX_SCAN_COUNT = 1000
+# Time (in seconds) after which the pidbox cleanup stops, the rest of the keys
+# is left for the next run
+REDIS_PIDBOX_CLEANUP_TIME_BUDGET = 5 * 60
+
+# Interval (in seconds) in which the metrics collected by a worker
+# are pushed to the Pushgateway
+PUSHGATEWAY_FLUSH_INTERVAL = 15
@@ -25,6 +25,8 @@ logger = getLogger(__name__)
 class ForgeIndependent(Event):
     commit_sha: Optional[str]
     project_url: str
+    # labels of the PR, set (and passed to the tasks) once fetched for the dispatching
+    pr_labels: Optional[list[str]] = None
 
     def __init__(
         self,
@@ -50,10 +50,8 @@ class CommentEvent(ForgeIndependent):
     def comment_object(self) -> Optional[Comment]:
         raise NotImplementedError("Use subclass instead.")
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result.pop("_comment_object")
-        return result
+    def get_non_serializable_attributes(self):
+        return [*super().get_non_serializable_attributes(), "_comment_object"]
 
 
 class PullRequest(AddPullRequestEventToDb, CommentEvent):
@@ -132,11 +130,16 @@ class PullRequest(AddPullRequestEventToDb, CommentEvent):
             )
         return self._tests_targets_override
 
+    def get_non_serializable_attributes(self):
+        return [
+            *super().get_non_serializable_attributes(),
+            "_build_targets_override",
+            "_tests_targets_override",
+        ]
+
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         result = super().get_dict()
         result["commit_sha"] = self.commit_sha
-        result.pop("_build_targets_override")
-        result.pop("_tests_targets_override")
         return result
 
 
@@ -209,9 +212,11 @@ class Issue(AddIssueEventToDb, CommentEvent):
         result["tag_name"] = self.tag_name
         result["commit_sha"] = self.commit_sha
         result["issue_id"] = self.issue_id
-        result.pop("_issue_object")
         return result
 
+    def get_non_serializable_attributes(self):
+        return [*super().get_non_serializable_attributes(), "_issue_object"]
+
 
 class Commit(CommentEvent):
     _trigger: Union[GitBranchModel, ProjectReleaseModel] = None
@@ -339,10 +344,11 @@ class Commit(CommentEvent):
         (_, event) = self._add_trigger_and_event()
         return event
 
+    def get_non_serializable_attributes(self):
+        return [*super().get_non_serializable_attributes(), "_trigger", "_event"]
+
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         result = super().get_dict()  # type: ignore
-        result.pop("_trigger", None)
-        result.pop("_event", None)
         result["git_ref"] = self.git_ref
         result["identifier"] = self.identifier
         result["tag_name"] = self.tag_name
@@ -139,7 +139,7 @@ class AnityaUpdate(Event):
         d["repo_name"] = self.repo_name
         d["repo_namespace"] = self.repo_namespace
         d["versions"] = self.versions
-        result = super().get_dict(d)
-        result.pop("project")
-        result.pop("repo_url")
-        return result
+        return super().get_dict(d)
+
+    def get_non_serializable_attributes(self):
+        return [*super().get_non_serializable_attributes(), "project", "repo_url"]
@@ -3,7 +3,7 @@
 
 import os
 from logging import getLogger
-from typing import Optional, Union
+from typing import ClassVar, Optional, Union
 
 from ogr.abstract import GitProject
 from ogr.services.pagure import PagureProject
@@ -19,11 +19,14 @@ from packit_service.models import (
 
 from .abstract.base import Result
 from .enums import FedmsgTopic
+from .event import FieldSerializers, serialize_enum
 
 logger = getLogger(__name__)
 
 
 class CoprBuild(Result):
+    serializers: ClassVar[FieldSerializers] = {"topic": serialize_enum}
+
     build: Optional[Union[SRPMBuildModel, CoprBuildTargetModel]]
 
     def __init__(
@@ -154,11 +157,6 @@ class CoprBuild(Result):
     def get_non_serializable_attributes(self):
         return [*super().get_non_serializable_attributes(), "build"]
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["topic"] = result["topic"].value
-        return result
-
     def get_copr_build_url(self) -> str:
         return (
             "https://copr.fedorainfracloud.org/coprs/"
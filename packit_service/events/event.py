@@ -8,8 +8,9 @@ Generic/abstract event classes.
 import copy
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
+from enum import Enum
 from logging import getLogger
-from typing import Optional, Union
+from typing import Any, Callable, ClassVar, Optional, Union
 
 from ogr.abstract import GitProject
 from packit.config import JobConfigTriggerType, PackageConfig
@@ -25,6 +26,24 @@ logger = getLogger(__name__)
 
 MAP_EVENT_TO_JOB_CONFIG_TRIGGER_TYPE: dict[type["Event"], JobConfigTriggerType] = {}
 
+FieldSerializers = dict[str, Callable[[Any], Any]]
+
+
+def serialize_timestamp(value: Optional[datetime]) -> Optional[int]:
+    return int(value.timestamp()) if value else None
+
+
+def serialize_precise_timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value else None
+
+
+def serialize_enum(value: Optional[Enum]) -> Any:
+    return value.value if value is not None else None
+
+
+def serialize_collection(value: Optional[Union[set, list]]) -> Optional[list]:
+    return list(value) if value else None
+
 
 def use_for_job_config_trigger(trigger_type: JobConfigTriggerType):
     """
@@ -54,6 +73,23 @@ class Event(ABC):
     cancel_cutoff_time: Optional[datetime] = None
     actor: Optional[str]
 
+    # Declared schema of the attributes that are not JSON serializable as they
+    # are, i.e. attribute name → serializer of its value. Subclasses declare
+    # only their own attributes, the serializers of the parents are merged in
+    # once per class. The other attributes are taken as they are.
+    serializers: ClassVar[FieldSerializers] = {
+        "created_at": serialize_timestamp,
+        "task_accepted_time": serialize_timestamp,
+        "cancel_cutoff_time": serialize_precise_timestamp,
+    }
+    _serializers: ClassVar[FieldSerializers] = serializers
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._serializers = {}
+        for kls in reversed(cls.__mro__):
+            cls._serializers.update(kls.__dict__.get("serializers", {}))
+
     def __init__(self, created_at: Optional[Union[int, float, str]] = None):
         self.created_at: datetime
         if created_at:
@@ -89,12 +125,29 @@ class Event(ABC):
         ...
 
     @staticmethod
-    def make_serializable(d: dict, skip: list) -> dict:
+    def make_serializable(
+        d: dict,
+        skip: list,
+        serializers: Optional[FieldSerializers] = None,
+    ) -> dict:
         """We need a JSON serializable dict (because of redis and celery tasks)
         This method will copy everything from dict except the specified
-        non serializable keys.
+        non serializable keys. The values with a declared serializer are
+        serialized by it. Of the rest only the containers are copied deeply,
+        the other values are immutable.
         """
-        return {k: copy.deepcopy(v) for k, v in d.items() if k not in skip}
+        serializers = serializers or {}
+        return {
+            k: (
+                serializers[k](v)
+                if k in serializers
+                else copy.deepcopy(v)
+                if isinstance(v, (dict, list, set))
+                else v
+            )
+            for k, v in d.items()
+            if k not in skip
+        }
 
     def store_packages_config(self):
         """
@@ -115,7 +168,8 @@ class Event(ABC):
     def get_non_serializable_attributes(self):
         """List here both non serializable attributes and attributes that
         we want to skip from the dict because are not needed to re-create
-        the event.
+        the event. They are skipped before copying, so that e.g. the ogr
+        objects and DB models are never copied.
         """
         return [
             "_db_project_object",
@@ -129,19 +183,19 @@ class Event(ABC):
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         d = default_dict or self.__dict__
         # whole dict has to be JSON serializable because of redis
-        d = self.make_serializable(d, self.get_non_serializable_attributes())
+        d = self.make_serializable(
+            d,
+            self.get_non_serializable_attributes(),
+            self._serializers,
+        )
         d["event_type"] = self.event_type()
 
         # we are trying to be lazy => don't touch database if it is not needed
         d["event_id"] = self._db_project_object.id if self._db_project_object else None
 
-        d["created_at"] = int(d["created_at"].timestamp())
-        task_accepted_time = d.get("task_accepted_time")
-        d["task_accepted_time"] = (
-            int(task_accepted_time.timestamp()) if task_accepted_time else None
-        )
-        cancel_cutoff_time = d.get("cancel_cutoff_time")
-        d["cancel_cutoff_time"] = cancel_cutoff_time.timestamp() if cancel_cutoff_time else None
+        # set on the class by default, not present in the instance dict
+        d["task_accepted_time"] = serialize_timestamp(self.task_accepted_time)
+        d["cancel_cutoff_time"] = serialize_precise_timestamp(self.cancel_cutoff_time)
         d["project_url"] = d.get("project_url") or (
             self.db_project_object.project.project_url
             if (
@@ -256,8 +310,19 @@ class Event(ABC):
     @abstractmethod
     def get_project(self) -> GitProject: ...
 
+    def get_summary(self) -> dict:
+        """
+        Get the public attributes of simple types, unlike `get_dict`
+        this doesn't copy anything nor touch the database.
+        """
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if not k.startswith("_") and isinstance(v, (str, int, float, bool, Enum))
+        }
+
     def __str__(self):
-        return str(self.get_dict())
+        return str(self.get_summary())
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.get_dict()})"
+        return f"{self.__class__.__name__}({self.get_summary()})"
@@ -4,7 +4,7 @@
 import copy
 from datetime import datetime, timezone
 from logging import getLogger
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import GitProject
 
@@ -14,7 +14,13 @@ from packit_service.models import (
     ProjectEventModel,
 )
 
-from .event import Event
+from .event import (
+    Event,
+    FieldSerializers,
+    serialize_collection,
+    serialize_precise_timestamp,
+    serialize_timestamp,
+)
 
 logger = getLogger(__name__)
 
@@ -24,6 +30,14 @@ class EventData:
     Class to represent the data which are common for handlers and comes from the original event
     """
 
+    serializers: ClassVar[FieldSerializers] = {
+        "task_accepted_time": serialize_timestamp,
+        "cancel_cutoff_time": serialize_precise_timestamp,
+        "build_targets_override": serialize_collection,
+        "tests_targets_override": serialize_collection,
+        "branches_override": serialize_collection,
+    }
+
     def __init__(
         self,
         event_type: str,
@@ -73,6 +87,11 @@ class EventData:
         self._db_project_object: Optional[AbstractProjectObjectDbType] = None
         self._db_project_event: Optional[ProjectEventModel] = None
 
+    @property
+    def pr_labels(self) -> Optional[list[str]]:
+        """Labels of the PR, if they were fetched when dispatching the event."""
+        return (self.event_dict or {}).get("pr_labels")
+
     @classmethod
     def from_event_dict(cls, event: dict):
         event_type = event.get("event_type")
@@ -322,24 +341,11 @@ class EventData:
         return self._db_project_event
 
     def get_dict(self) -> dict:
-        d = self.__dict__
-        d = copy.deepcopy(d)
-        task_accepted_time = d.get("task_accepted_time")
-        d["task_accepted_time"] = (
-            int(task_accepted_time.timestamp()) if task_accepted_time else None
+        return Event.make_serializable(
+            self.__dict__,
+            ["_project", "_db_project_object", "_db_project_event"],
+            self.serializers,
         )
-        cancel_cutoff_time = d.get("cancel_cutoff_time")
-        d["cancel_cutoff_time"] = cancel_cutoff_time.timestamp() if cancel_cutoff_time else None
-        if self.build_targets_override:
-            d["build_targets_override"] = list(self.build_targets_override)
-        if self.tests_targets_override:
-            d["tests_targets_override"] = list(self.tests_targets_override)
-        if self.branches_override:
-            d["branches_override"] = list(self.branches_override)
-        d.pop("_project", None)
-        d.pop("_db_project_object", None)
-        d.pop("_db_project_event", None)
-        return d
 
     def get_project(self) -> Optional[GitProject]:
         if not self.project_url:
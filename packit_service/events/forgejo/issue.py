@@ -1,16 +1,19 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import Comment as OgrComment
 
 from ..abstract.comment import Issue as AbstractIssueCommentEvent
 from ..enums import IssueCommentAction
+from ..event import FieldSerializers, serialize_enum
 from .abstract import ForgejoEvent
 
 
 class Comment(AbstractIssueCommentEvent, ForgejoEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: IssueCommentAction,
@@ -47,8 +50,3 @@ class Comment(AbstractIssueCommentEvent, ForgejoEvent):
     @classmethod
     def event_type(cls) -> str:
         return "forgejo.issue.Comment"
-
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = self.action.value
-        return result
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 from logging import getLogger
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import Comment as OgrComment
 from ogr.abstract import GitProject
@@ -16,12 +16,15 @@ from packit_service.utils import get_packit_commands_from_comment
 
 from ..abstract.comment import PullRequest as AbstractPRCommentEvent
 from ..enums import PullRequestAction, PullRequestCommentAction
+from ..event import FieldSerializers, serialize_enum
 from .abstract import ForgejoEvent
 
 logger = getLogger(__name__)
 
 
 class Action(AddPullRequestEventToDb, ForgejoEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: PullRequestAction,
@@ -52,11 +55,6 @@ class Action(AddPullRequestEventToDb, ForgejoEvent):
         self.commit_sha_before = commit_sha_before
         self.body = body
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = result["action"].value
-        return result
-
     @classmethod
     def event_type(cls) -> str:
         return "forgejo.pr.Action"
@@ -78,6 +76,8 @@ class Action(AddPullRequestEventToDb, ForgejoEvent):
 
 
 class Comment(AbstractPRCommentEvent, ForgejoEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: PullRequestCommentAction,
@@ -120,6 +120,10 @@ class Comment(AbstractPRCommentEvent, ForgejoEvent):
     def event_type(cls) -> str:
         return "forgejo.pr.Comment"
 
+    def get_non_serializable_attributes(self):
+        # prevent leakage of private attributes
+        return [*super().get_non_serializable_attributes(), "_repo_url"]
+
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         """
         Override get_dict to avoid accessing properties that make API calls.
@@ -128,13 +132,6 @@ class Comment(AbstractPRCommentEvent, ForgejoEvent):
         from ..abstract.comment import CommentEvent
 
         result = CommentEvent.get_dict(self, default_dict=default_dict)
-
-        # prevent leakage of private attributes
-        result.pop("_build_targets_override", None)
-        result.pop("_tests_targets_override", None)
-        result.pop("_repo_url", None)
-
-        result["action"] = self.action.value
         result["pr_id"] = self.pr_id
         result["commit_sha"] = self._commit_sha
         return result
@@ -1,14 +1,16 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from typing import Optional, Union
+from typing import ClassVar, Union
 
 from packit_service.models import AllowlistStatus
 
-from ..event import Event
+from ..event import Event, FieldSerializers, serialize_enum
 
 
 class Installation(Event):
+    serializers: ClassVar[FieldSerializers] = {"status": serialize_enum}
+
     def __init__(
         self,
         installation_id: int,
@@ -55,11 +57,6 @@ class Installation(Event):
             sender_login=event.get("sender_login"),
         )
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["status"] = result["status"].value
-        return result
-
     @property
     def packages_config(self):
         return None
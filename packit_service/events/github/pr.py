@@ -1,7 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import Comment as OgrComment
 from ogr.abstract import GitProject
@@ -13,10 +13,13 @@ from ..enums import (
     PullRequestAction,
     PullRequestCommentAction,
 )
+from ..event import FieldSerializers, serialize_enum
 from .abstract import GithubEvent
 
 
 class Action(AddPullRequestEventToDb, GithubEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: PullRequestAction,
@@ -48,16 +51,13 @@ class Action(AddPullRequestEventToDb, GithubEvent):
     def event_type(cls) -> str:
         return "github.pr.Action"
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = result["action"].value
-        return result
-
     def get_base_project(self) -> Optional[GitProject]:
         return None  # With Github app, we cannot work with fork repo
 
 
 class Comment(AbstractPRCommentEvent, GithubEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: PullRequestCommentAction,
@@ -96,10 +96,5 @@ class Comment(AbstractPRCommentEvent, GithubEvent):
     def event_type(cls) -> str:
         return "github.pr.Comment"
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = result["action"].value
-        return result
-
     def get_base_project(self) -> Optional[GitProject]:
         return None  # With Github app, we cannot work with fork repo
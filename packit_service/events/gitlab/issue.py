@@ -1,17 +1,20 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import Comment as OgrComment
 
 from ..abstract.comment import (
     Issue as AbstractIssueCommentEvent,
 )
+from ..event import FieldSerializers, serialize_enum
 from .abstract import GitlabEvent
 from .enums import Action
 
 
 class Comment(AbstractIssueCommentEvent, GitlabEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: Action,
@@ -43,8 +46,3 @@ class Comment(AbstractIssueCommentEvent, GitlabEvent):
     @classmethod
     def event_type(cls) -> str:
         return "gitlab.issue.Comment"
-
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = result["action"].value
-        return result
@@ -1,7 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import Comment as OgrComment
 from ogr.abstract import GitProject
@@ -13,11 +13,14 @@ from packit_service.service.db_project_events import (
 from ..abstract.comment import (
     PullRequest as AbstractPRCommentEvent,
 )
+from ..event import FieldSerializers, serialize_enum
 from .abstract import GitlabEvent
 from .enums import Action as GitlabAction
 
 
 class Action(AddPullRequestEventToDb, GitlabEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: GitlabAction,
@@ -64,11 +67,6 @@ class Action(AddPullRequestEventToDb, GitlabEvent):
     def event_type(cls) -> str:
         return "gitlab.mr.Action"
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = result["action"].value
-        return result
-
     def get_base_project(self) -> GitProject:
         return self.project.service.get_project(
             namespace=self.source_repo_namespace,
@@ -77,6 +75,8 @@ class Action(AddPullRequestEventToDb, GitlabEvent):
 
 
 class Comment(AbstractPRCommentEvent, GitlabEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: GitlabAction,
@@ -114,11 +114,6 @@ class Comment(AbstractPRCommentEvent, GitlabEvent):
     def event_type(cls) -> str:
         return "gitlab.mr.Comment"
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = result["action"].value
-        return result
-
     def get_base_project(self) -> GitProject:
         return self.project.service.get_project(
             namespace=self.source_repo_namespace,
@@ -107,8 +107,9 @@ class KojiEvent(Result):
             for arch, rpm_build_task_id in self.rpm_build_task_ids.items()
         }
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result.pop("_build_model")
-        result.pop("_build_model_searched")
-        return result
+    def get_non_serializable_attributes(self):
+        return [
+            *super().get_non_serializable_attributes(),
+            "_build_model",
+            "_build_model_searched",
+        ]
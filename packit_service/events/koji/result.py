@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
-from typing import Optional, Union
+from typing import ClassVar, Optional, Union
 
 from ogr.abstract import GitProject
 from ogr.services.pagure import PagureProject
@@ -17,6 +17,8 @@ from packit_service.models import (
 from packit_service.package_config_getter import PackageConfigGetter
 
 from ..event import (
+    FieldSerializers,
+    serialize_enum,
     use_for_job_config_trigger,
 )
 from .abstract import KojiEvent
@@ -31,6 +33,8 @@ class Build(KojiEvent):
     Docs: https://fedora-fedmsg.readthedocs.io/en/latest/topics.html#buildsys-build-state-change
     """
 
+    serializers: ClassVar[FieldSerializers] = {"state": serialize_enum, "old_state": serialize_enum}
+
     def __init__(
         self,
         build_id: int,
@@ -112,8 +116,6 @@ class Build(KojiEvent):
 
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         result = super().get_dict()
-        result["state"] = result["state"].value
-        result["old_state"] = result["old_state"].value if self.old_state else None
         result["commit_sha"] = result.pop("_commit_sha")  # commit_sha is a property
         return result
 
@@ -147,6 +149,8 @@ class Task(KojiEvent):
     Docs: https://fedora-fedmsg.readthedocs.io/en/latest/topics.html#buildsys-task-state-change
     """
 
+    serializers: ClassVar[FieldSerializers] = {"state": serialize_enum, "old_state": serialize_enum}
+
     def __init__(
         self,
         task_id: int,
@@ -245,8 +249,6 @@ class Task(KojiEvent):
 
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         result = super().get_dict()
-        result["state"] = result["state"].value
-        result["old_state"] = result["old_state"].value
         result["commit_sha"] = self.commit_sha
         result["pr_id"] = self.pr_id
         result["git_ref"] = self.git_ref
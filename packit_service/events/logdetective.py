@@ -3,7 +3,7 @@
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import GitProject
 from ogr.services.pagure import PagureProject
@@ -17,6 +17,7 @@ from packit_service.models import (
 )
 
 from .abstract.base import Result as AbstractResult
+from .event import FieldSerializers, serialize_enum
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,12 @@ logger = logging.getLogger(__name__)
 class Result(AbstractResult):
     """Result of Log Detective analysis"""
 
+    serializers: ClassVar[FieldSerializers] = {
+        "status": serialize_enum,
+        "build_system": serialize_enum,
+        "log_detective_analysis_start": datetime.isoformat,
+    }
+
     @classmethod
     def event_type(cls) -> str:
         return "logdetective.result"
@@ -60,22 +67,6 @@ class Result(AbstractResult):
         self.commit_sha = commit_sha
         self.error_msg = error_msg
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        """Return Log Detective result as a dictionary,
-        serializable as json."""
-        result = super().get_dict()
-        result["status"] = self.status.value
-        result["build_system"] = self.build_system.value
-        result["log_detective_analysis_start"] = self.log_detective_analysis_start.isoformat()
-        result["log_detective_analysis_id"] = self.log_detective_analysis_id
-        result["target_build"] = self.target_build
-        result["log_detective_response"] = self.log_detective_response
-        result["identifier"] = self.identifier
-        result["commit_sha"] = self.commit_sha
-        result["error_msg"] = self.error_msg
-
-        return result
-
     def get_db_project_event(self) -> Optional[ProjectEventModel]:
         """Get ProjectEventModel describing event that triggered Log Detective
         analysis run. If no such model exists, return None."""
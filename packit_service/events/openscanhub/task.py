@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: MIT
 
 import enum
+from typing import ClassVar
 
+from ..event import FieldSerializers, serialize_enum
 from .abstract import OpenScanHubEvent
 
 
@@ -20,6 +22,8 @@ class Started(OpenScanHubEvent):
 
 
 class Finished(OpenScanHubEvent):
+    serializers: ClassVar[FieldSerializers] = {"status": serialize_enum}
+
     def __init__(
         self,
         status: Status,
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 from logging import getLogger
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import Comment as OgrComment
 from ogr.abstract import GitProject
@@ -21,12 +21,15 @@ from ..enums import (
     PullRequestAction,
     PullRequestCommentAction,
 )
+from ..event import FieldSerializers, serialize_enum
 from .abstract import PagureEvent
 
 logger = getLogger(__name__)
 
 
 class Comment(AbstractPRCommentEvent, PagureEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: PullRequestCommentAction,
@@ -69,14 +72,14 @@ class Comment(AbstractPRCommentEvent, PagureEvent):
     def event_type(cls) -> str:
         return "pagure.pr.Comment"
 
+    def get_non_serializable_attributes(self):
+        return [*super().get_non_serializable_attributes(), "_repo_url"]
+
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         d = self.__dict__
         d["repo_name"] = self.repo_name
         d["repo_namespace"] = self.repo_namespace
-        result = super().get_dict(d)
-        result.pop("_repo_url")
-        result["action"] = result["action"].value
-        return result
+        return super().get_dict(d)
 
     def get_base_project(self) -> GitProject:
         project = self.project.service.get_project(
@@ -150,6 +153,8 @@ class Comment(AbstractPRCommentEvent, PagureEvent):
 
 
 class Action(AddPullRequestEventToDb, PagureEvent):
+    serializers: ClassVar[FieldSerializers] = {"action": serialize_enum}
+
     def __init__(
         self,
         action: PullRequestAction,
@@ -184,11 +189,6 @@ class Action(AddPullRequestEventToDb, PagureEvent):
     def event_type(cls) -> str:
         return "pagure.pr.Action"
 
-    def get_dict(self, default_dict: Optional[dict] = None) -> dict:
-        result = super().get_dict()
-        result["action"] = result["action"].value
-        return result
-
     def get_base_project(self) -> GitProject:
         fork = self.project.service.get_project(
             namespace=self.base_repo_namespace,
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ogr.abstract import GitProject
 from ogr.services.pagure import PagureProject
@@ -16,9 +16,12 @@ from packit_service.models import (
 )
 
 from .abstract.base import Result as AbstractResult
+from .event import FieldSerializers, serialize_enum
 
 
 class Result(AbstractResult):
+    serializers: ClassVar[FieldSerializers] = {"result": serialize_enum}
+
     __test__ = False
 
     @classmethod
@@ -64,7 +67,6 @@ class Result(AbstractResult):
 
     def get_dict(self, default_dict: Optional[dict] = None) -> dict:
         result = super().get_dict()
-        result["result"] = result["result"].value
         result["pr_id"] = self.pr_id
         return result
 
@@ -1,7 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from typing import Optional, Union
+from typing import ClassVar, Optional, Union
 
 from packit_service.models import (
     ProjectEventModel,
@@ -12,10 +12,14 @@ from packit_service.models import (
 from .abstract.base import Result as AbstractResult
 from .event import (
     AbstractProjectObjectDbType,
+    FieldSerializers,
+    serialize_enum,
 )
 
 
 class Result(AbstractResult):
+    serializers: ClassVar[FieldSerializers] = {"status": serialize_enum}
+
     def __init__(
         self,
         build_id: str,
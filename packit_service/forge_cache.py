@@ -0,0 +1,209 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Cache of the forge checks of project visibility, user permissions
+and group membership.
+
+The checks call the forge API for every event and handler, although
+the answers rarely change. They are kept in shared caches
+(see `packit_service.cache`) with per-entry TTLs. Only one worker fetches
+a missing entry, the others wait for it instead of calling the forge too.
+The entries are invalidated when a webhook about a change of the repository
+or of the membership arrives; the process-local tier can't be reached by
+the invalidation, so its TTL is kept short.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from ogr.abstract import GitProject, GitService
+from ogr.parsing import parse_git_repo
+
+from packit_service.cache import (
+    MISSING,
+    REDIS_CACHE_KEY_PREFIX,
+    SharedCache,
+    redis_call,
+)
+
+logger = logging.getLogger(__name__)
+
+PROJECT_VISIBILITY_CACHE_TTL = 60 * 60
+PERMISSIONS_CACHE_TTL = 10 * 60
+# denied permissions are likely to be granted soon (that's why the user is trying)
+PERMISSIONS_NEGATIVE_CACHE_TTL = 2 * 60
+GROUP_MEMBERS_CACHE_TTL = 10 * 60
+# for how long a process serves the entries without asking Redis
+FORGE_CACHE_LOCAL_TTL = 30
+# for how long (in seconds) to wait for another worker fetching the same entry
+FORGE_CACHE_LOCK_WAIT = 5
+FORGE_CACHE_LOCK_POLL_INTERVAL = 0.1
+
+# Redis key of the counter bumped to invalidate the permissions in a namespace
+_PERMISSIONS_GENERATION_KEY = f"{REDIS_CACHE_KEY_PREFIX}:forge-permissions-generation"
+
+project_visibility_cache = SharedCache(
+    namespace="project-visibility",
+    ttl=PROJECT_VISIBILITY_CACHE_TTL,
+    local_ttl=FORGE_CACHE_LOCAL_TTL,
+    maxsize=1024,
+)
+permissions_cache = SharedCache(
+    namespace="forge-permissions",
+    ttl=PERMISSIONS_CACHE_TTL,
+    local_ttl=FORGE_CACHE_LOCAL_TTL,
+    maxsize=4096,
+)
+group_members_cache = SharedCache(
+    namespace="group-members",
+    ttl=GROUP_MEMBERS_CACHE_TTL,
+    local_ttl=FORGE_CACHE_LOCAL_TTL,
+    maxsize=256,
+)
+
+
+def _get_or_fetch(
+    cache: SharedCache,
+    key: str,
+    fetch: Callable[[], Any],
+    negative_ttl: Optional[int] = None,
+) -> Any:
+    """
+    Get the entry from the cache, fetching it by a single worker on a miss.
+
+    Args:
+        cache: Cache of the entry.
+        key: Key of the entry.
+        fetch: Callable getting the value from the forge.
+        negative_ttl: Time to live of a falsy value, defaults to the TTL of the cache.
+
+    Returns:
+        Cached or fetched value.
+    """
+    if (value := cache.get(key)) is not MISSING:
+        return value
+
+    if not cache.acquire_lock(key, timeout=FORGE_CACHE_LOCK_WAIT * 2):
+        # another worker is fetching the entry
+        deadline = time.monotonic() + FORGE_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(FORGE_CACHE_LOCK_POLL_INTERVAL)
+            if (value := cache.get(key)) is not MISSING:
+                return value
+        logger.debug(f"Timed out waiting for {cache.redis_key(key)} to be fetched.")
+        return fetch()
+
+    try:
+        value = fetch()
+        cache.set(key, value, ttl=negative_ttl if not value else None)
+    finally:
+        cache.release_lock(key)
+    return value
+
+
+def _get_namespace_key(instance_url: str, namespace: str) -> str:
+    return f"{instance_url.rstrip('/')}/{namespace}"
+
+
+def get_project_key(project: GitProject) -> Optional[str]:
+    """
+    Get a key identifying the project across the forges.
+
+    Returns:
+        Key or `None` for projects without a known forge instance, which
+        shouldn't be cached.
+    """
+    if not (instance_url := getattr(getattr(project, "service", None), "instance_url", None)):
+        return None
+    return f"{_get_namespace_key(instance_url, project.namespace)}/{project.repo}"
+
+
+def _get_permissions_key(project: GitProject, permission: str, user: str) -> Optional[str]:
+    if not (project_key := get_project_key(project)):
+        return None
+    namespace_key = _get_namespace_key(project.service.instance_url, project.namespace)
+    generation = redis_call("get", f"{_PERMISSIONS_GENERATION_KEY}:{namespace_key}") or 0
+    return f"{project_key}:{generation}:{permission}:{user}"
+
+
+def is_project_private(project: GitProject) -> bool:
+    """Is the project private? Cached `project.is_private()`."""
+    if not (key := get_project_key(project)):
+        return project.is_private()
+    return _get_or_fetch(project_visibility_cache, key, project.is_private)
+
+
+def can_merge_pr(project: GitProject, user: str) -> bool:
+    """Can the user merge PRs in the project? Cached `project.can_merge_pr()`."""
+    if not (key := _get_permissions_key(project, "can-merge-pr", user)):
+        return project.can_merge_pr(user)
+    return _get_or_fetch(
+        permissions_cache,
+        key,
+        lambda: project.can_merge_pr(user),
+        negative_ttl=PERMISSIONS_NEGATIVE_CACHE_TTL,
+    )
+
+
+def has_write_access(project: GitProject, user: str) -> bool:
+    """Does the user have write access to the project? Cached `project.has_write_access()`."""
+    if not (key := _get_permissions_key(project, "write-access", user)):
+        return project.has_write_access(user=user)
+    return _get_or_fetch(
+        permissions_cache,
+        key,
+        lambda: project.has_write_access(user=user),
+        negative_ttl=PERMISSIONS_NEGATIVE_CACHE_TTL,
+    )
+
+
+def get_group_members(service: GitService, group_name: str) -> set[str]:
+    """Get the members of the group. Cached `service.get_group().members`."""
+    key = f"{service.instance_url.rstrip('/')}:{group_name}"
+    return set(
+        _get_or_fetch(
+            group_members_cache,
+            key,
+            lambda: sorted(service.get_group(group_name).members),
+        ),
+    )
+
+
+def invalidate_project_visibility(instance_url: str, namespace: str, repo: str) -> None:
+    project_visibility_cache.delete(f"{_get_namespace_key(instance_url, namespace)}/{repo}")
+
+
+def invalidate_permissions(instance_url: str, namespace: str) -> None:
+    """Invalidate the cached permissions in all the projects of the namespace."""
+    namespace_key = _get_namespace_key(instance_url, namespace)
+    redis_call("incr", f"{_PERMISSIONS_GENERATION_KEY}:{namespace_key}")
+
+
+def invalidate_group_members(instance_url: str, group_name: str) -> None:
+    group_members_cache.delete(f"{instance_url.rstrip('/')}:{group_name}")
+
+
+def invalidate_from_github_webhook(event_type: Optional[str], payload: dict) -> None:
+    """
+    Invalidate the entries affected by a GitHub webhook.
+
+    Args:
+        event_type: Value of the `X-GitHub-Event` header.
+        payload: Payload of the webhook.
+    """
+    if event_type == "repository" and (url := payload.get("repository", {}).get("html_url")):
+        parsed = parse_git_repo(url)
+        logger.debug(f"Repository {url} changed, invalidating its visibility.")
+        invalidate_project_visibility(f"https://{parsed.hostname}", parsed.namespace, parsed.repo)
+    elif event_type == "member" and (url := payload.get("repository", {}).get("html_url")):
+        parsed = parse_git_repo(url)
+        logger.debug(f"Collaborators of {url} changed, invalidating the permissions.")
+        invalidate_permissions(f"https://{parsed.hostname}", parsed.namespace)
+    elif event_type in ("organization", "membership", "team") and (
+        organization := payload.get("organization", {}).get("login")
+    ):
+        logger.debug(f"Membership in {organization} changed, invalidating the permissions.")
+        invalidate_permissions("https://github.com", organization)
+        invalidate_group_members("https://github.com", organization)
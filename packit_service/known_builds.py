@@ -0,0 +1,162 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Index of the Copr build IDs and Koji task IDs submitted by Packit.
+
+Nearly all the Copr and Koji messages on the Fedora messaging bus are about
+builds that are not ours. The index lets the parser drop those messages
+with a single Redis round-trip instead of a database query.
+
+The index is kept in Redis sorted sets (scored by the time of the submission,
+so that old IDs can be trimmed) and is filled when the IDs are stored
+in the database and rebuilt from the database periodically and when a worker
+starts. Until the index is built, or when it might have missed an ID,
+all the IDs are reported as known so that no message is dropped by mistake.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from enum import Enum
+from typing import Union
+
+from packit_service.cache import redis_pipeline
+
+logger = logging.getLogger(__name__)
+
+# for how long (in seconds) the IDs are kept in the index
+KNOWN_BUILDS_RETENTION = 30 * 24 * 60 * 60
+# how many IDs are added to Redis at once when rebuilding the index
+KNOWN_BUILDS_REBUILD_CHUNK_SIZE = 10_000
+
+KNOWN_BUILDS_KEY_PREFIX = "packit-service:known-builds"
+# present only when the index is complete
+KNOWN_BUILDS_READY_KEY = f"{KNOWN_BUILDS_KEY_PREFIX}:ready"
+
+# set when an ID could not be added, so that the index is marked incomplete
+# as soon as Redis is reachable again
+_missed_ids = False
+
+
+class KnownBuildKind(str, Enum):
+    copr = "copr"
+    koji_task = "koji-task"
+
+    @property
+    def key(self) -> str:
+        return f"{KNOWN_BUILDS_KEY_PREFIX}:{self.value}"
+
+
+def _mark_incomplete_if_missed() -> None:
+    global _missed_ids
+
+    if _missed_ids and redis_pipeline(("delete", KNOWN_BUILDS_READY_KEY)) is not None:
+        logger.info("Known build IDs index missed some IDs, marked as incomplete.")
+        _missed_ids = False
+
+
+def remember_build_id(kind: KnownBuildKind, build_id: Union[str, int, None]) -> None:
+    """
+    Add the ID of a build submitted by us to the index.
+
+    Args:
+        kind: Build system the ID belongs to.
+        build_id: Copr build ID or Koji task ID.
+    """
+    global _missed_ids
+
+    if not build_id:
+        return
+
+    now = time.time()
+    if (
+        redis_pipeline(
+            ("zadd", kind.key, {str(build_id): now}),
+            ("zremrangebyscore", kind.key, "-inf", now - KNOWN_BUILDS_RETENTION),
+        )
+        is None
+    ):
+        _missed_ids = True
+        return
+
+    _mark_incomplete_if_missed()
+
+
+def is_build_id_known(kind: KnownBuildKind, build_id: Union[str, int, None]) -> bool:
+    """
+    Check whether the message about the build can be about a build submitted by us.
+
+    Args:
+        kind: Build system the ID belongs to.
+        build_id: Copr build ID or Koji task ID.
+
+    Returns:
+        `False` only if the index is complete and the ID is not in it.
+    """
+    if build_id is None:
+        return True
+
+    _mark_incomplete_if_missed()
+    results = redis_pipeline(
+        ("exists", KNOWN_BUILDS_READY_KEY),
+        ("zscore", kind.key, str(build_id)),
+    )
+    if results is None:
+        return True
+
+    ready, score = results
+    return not ready or score is not None
+
+
+def rebuild_known_build_ids(
+    build_ids: dict[KnownBuildKind, Iterable[tuple[str, float]]],
+) -> None:
+    """
+    Rebuild the index from the IDs stored in the database.
+
+    The IDs are first loaded to temporary keys and then merged into the index,
+    so that the IDs added concurrently are not lost.
+
+    Args:
+        build_ids: IDs and timestamps of their submission per build system.
+    """
+    global _missed_ids
+
+    # IDs added from now on are not lost
+    _missed_ids = False
+
+    for kind, ids in build_ids.items():
+        tmp_key = f"{kind.key}:rebuild"
+        if redis_pipeline(("delete", tmp_key)) is None:
+            logger.warning("Redis not available, known build IDs index not rebuilt.")
+            return
+
+        chunk: dict[str, float] = {}
+        loaded = 0
+        for build_id, submitted in ids:
+            if not build_id:
+                continue
+            chunk[str(build_id)] = submitted
+            if len(chunk) >= KNOWN_BUILDS_REBUILD_CHUNK_SIZE:
+                if redis_pipeline(("zadd", tmp_key, chunk)) is None:
+                    return
+                loaded += len(chunk)
+                chunk = {}
+        if chunk and redis_pipeline(("zadd", tmp_key, chunk)) is None:
+            return
+        loaded += len(chunk)
+
+        if (
+            redis_pipeline(
+                ("zunionstore", kind.key, [kind.key, tmp_key], "MAX"),
+                ("delete", tmp_key),
+                ("zremrangebyscore", kind.key, "-inf", time.time() - KNOWN_BUILDS_RETENTION),
+            )
+            is None
+        ):
+            return
+        logger.info(f"Loaded {loaded} {kind.value} IDs to the known build IDs index.")
+
+    if not _missed_ids and redis_pipeline(("set", KNOWN_BUILDS_READY_KEY, "1")) is not None:
+        logger.info("Known build IDs index is complete.")
@@ -9,13 +9,15 @@ import datetime as dt
 import enum
 import logging
 import re
-from collections import Counter
+from collections import Counter, defaultdict
 from collections.abc import Generator, Iterable
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from os import getenv
 from typing import (
     TYPE_CHECKING,
+    Any,
     Optional,
     Union,
     overload,
@@ -29,35 +31,57 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
+    and_,
     asc,
     case,
     create_engine,
+    delete,
     desc,
+    exists,
     func,
+    insert,
+    inspect,
+    literal,
     null,
     or_,
+    select,
+    text,
+    true,
+    tuple_,
+    union_all,
 )
 from sqlalchemy.dialects.postgresql import array as psql_array
+from sqlalchemy.dialects.postgresql import insert as psql_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import (
     Session as SQLASession,
 )
 from sqlalchemy.orm import (
+    aliased,
     relationship,
     scoped_session,
+    selectinload,
     sessionmaker,
 )
 from sqlalchemy.sql.functions import count
 from sqlalchemy.types import ARRAY
 
-from packit_service.constants import ALLOWLIST_CONSTANTS
+from packit_service.cache import REDIS_CACHE_KEY_PREFIX, redis_call, redis_pipeline
+from packit_service.constants import (
+    ALLOWLIST_CONSTANTS,
+    USAGE_ROLLUP_CHUNK_DAYS,
+    USAGE_ROLLUP_REFRESH_DAYS,
+)
+from packit_service.known_builds import KnownBuildKind, remember_build_id
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +126,11 @@ else:  # service/httpd
     singleton_session = None
 
 
+# whether the changes are committed at once at the end of a unit of work,
+# a context variable, so that it isn't shared by the (green)threads
+_in_unit_of_work: ContextVar[bool] = ContextVar("in_unit_of_work", default=False)
+
+
 @contextmanager
 def sa_session_transaction(commit: bool = False) -> SQLASession:
     """
@@ -114,12 +143,16 @@ def sa_session_transaction(commit: bool = False) -> SQLASession:
     Args:
         commit: Whether to call `Session.commit()` upon exiting the context. Should be set to True
             if any changes are made within the context. Defaults to False.
+            Within `sa_unit_of_work()`, the changes are only flushed and committed
+            at the end of the unit of work.
     """
     # if we use single session, use it, otherwise get a new session from registry
     session = singleton_session or Session()
     try:
         yield session
-        if commit:
+        if commit and _in_unit_of_work.get():
+            session.flush()
+        elif commit:
             session.commit()
     except Exception as ex:
         logger.warning(f"Exception while working with database: {ex!r}")
@@ -127,6 +160,117 @@ def sa_session_transaction(commit: bool = False) -> SQLASession:
         raise
 
 
+@contextmanager
+def sa_unit_of_work() -> Generator[SQLASession, None, None]:
+    """
+    Context manager committing all the changes made within it in a single transaction.
+
+    The `sa_session_transaction(commit=True)` contexts within it (e.g. of the `get_or_create`
+    and setter methods of the models) only flush their changes. If an error occurs,
+    the whole unit of work is rolled back. Nested units of work are committed
+    by the outermost one.
+    """
+    outermost = not _in_unit_of_work.get()
+    token = _in_unit_of_work.set(True)
+    try:
+        with sa_session_transaction() as session:
+            yield session
+            if outermost:
+                session.commit()
+            else:
+                session.flush()
+    finally:
+        _in_unit_of_work.reset(token)
+
+
+def get_or_insert(
+    session: SQLASession,
+    model: type["Base"],
+    values: dict[str, Any],
+    index_elements: list[str],
+    index_where: Optional[Any] = None,
+):
+    """
+    Get the row matching the values or insert it, within the transaction of the session.
+
+    The existing row is looked up first, so that the usual case is a single `SELECT`
+    that doesn't write anything. On PostgreSQL, a missing row is inserted by
+    `INSERT ... ON CONFLICT DO NOTHING RETURNING` relying on the unique index
+    on the `index_elements`, so if a concurrent worker has inserted the row
+    in the meantime, it's looked up again instead of failing. Other dialects
+    (e.g. SQLite) insert the row directly.
+
+    Args:
+        session: Session to use, the transaction is not committed.
+        model: Model of the row.
+        values: Values of the columns, also used to look up the existing row.
+        index_elements: Columns of the unique index to detect the conflict on.
+        index_where: Condition of the partial unique index, if any.
+
+    Returns:
+        Existing or newly created instance of the model.
+    """
+    query = session.query(model).filter_by(**values)
+    if instance := query.first():
+        return instance
+
+    if session.get_bind().dialect.name != "postgresql":
+        instance = model(**values)
+        session.add(instance)
+        session.flush()
+        return instance
+
+    statement = (
+        psql_insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=index_elements, index_where=index_where)
+        .returning(model)
+    )
+    # nothing is returned if a concurrent worker has inserted the row
+    return session.scalars(statement).first() or query.one()
+
+
+def bulk_insert(session: SQLASession, model: type, rows: list[dict[str, Any]]) -> list:
+    """
+    Insert multiple rows with a single `INSERT ... RETURNING` statement.
+
+    Args:
+        session: Session to use, the transaction is not committed.
+        model: Model of the rows.
+        rows: Values of the columns for each row.
+
+    Returns:
+        Created instances of the model in the order of `rows`.
+    """
+    if not rows:
+        return []
+    return session.scalars(
+        insert(model).returning(model, sort_by_parameter_order=True),
+        rows,
+    ).all()
+
+
+def get_by_ids(model: type, ids: Iterable[int], *options) -> dict[int, Any]:
+    """
+    Get multiple rows of a model by their IDs with a single query.
+
+    Args:
+        model: Model of the rows.
+        ids: IDs of the rows.
+        *options: Loader options, e.g. `selectinload()` of the relationships
+            that are going to be accessed.
+
+    Returns:
+        Mapping of the IDs to the rows, IDs that were not found are missing.
+    """
+    if not (ids := set(ids)):
+        return {}
+    with sa_session_transaction() as session:
+        return {
+            row.id: row for row in session.query(model).filter(model.id.in_(ids)).options(*options)
+        }
+
+
 def optional_time(
     datetime_object: Union[datetime, None],
     fmt: str = "%d/%m/%Y %H:%M:%S",
@@ -159,6 +303,26 @@ def optional_timestamp(datetime_object: Optional[datetime]) -> Optional[int]:
     return None if datetime_object is None else int(datetime_object.timestamp())
 
 
+@ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=timedelta(minutes=10).total_seconds())
+def get_estimated_count(model: type) -> Optional[int]:
+    """
+    Estimate the number of rows of the model's table from the statistics
+    PostgreSQL keeps for the query planner, without scanning the table.
+
+    Args:
+        model: Model of the table.
+
+    Returns:
+        Approximate number of rows or `None` if the table was not analyzed yet.
+    """
+    with sa_session_transaction() as session:
+        reltuples = session.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": inspect(model).local_table.name},
+        ).scalar()
+    return None if reltuples is None or reltuples < 0 else int(reltuples)
+
+
 @overload
 def get_most_recent_targets(
     models: Iterable["CoprBuildTargetModel"],
@@ -526,7 +690,7 @@ class AnityaMultipleVersionsModel(BuildsAndTestsConnector, Base):
         project_name: str,
         package: str,
     ) -> "AnityaMultipleVersionsModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = AnityaProjectModel.get_or_create(
                 project_id=project_id,
                 project_name=project_name,
@@ -571,7 +735,7 @@ class AnityaVersionModel(BuildsAndTestsConnector, Base):
         project_name: str,
         package: str,
     ) -> "AnityaVersionModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = AnityaProjectModel.get_or_create(
                 project_id=project_id,
                 project_name=project_name,
@@ -600,6 +764,15 @@ class AnityaVersionModel(BuildsAndTestsConnector, Base):
 
 class GitProjectModel(Base):
     __tablename__ = "git_projects"
+    __table_args__ = (
+        Index(
+            "ix_git_projects_namespace_repo_name_project_url",
+            "namespace",
+            "repo_name",
+            "project_url",
+            unique=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)
     # github.com/NAMESPACE/REPO_NAME
     namespace = Column(String, index=True)
@@ -642,23 +815,18 @@ class GitProjectModel(Base):
         project_url: str,
     ) -> "GitProjectModel":
         with sa_session_transaction(commit=True) as session:
-            project = (
-                session.query(GitProjectModel)
-                .filter_by(
-                    namespace=namespace,
-                    repo_name=repo_name,
-                    project_url=project_url,
-                )
-                .first()
+            return get_or_insert(
+                session,
+                cls,
+                values={
+                    "namespace": namespace,
+                    "repo_name": repo_name,
+                    "project_url": project_url,
+                    # derived from the URL, `__init__` is bypassed by the insert
+                    "instance_url": urlparse(project_url).hostname,
+                },
+                index_elements=["namespace", "repo_name", "project_url"],
             )
-            if not project:
-                project = cls(
-                    repo_name=repo_name,
-                    namespace=namespace,
-                    project_url=project_url,
-                )
-                session.add(project)
-            return project
 
     @classmethod
     def get_all(cls) -> Iterable["GitProjectModel"]:
@@ -673,13 +841,24 @@ class GitProjectModel(Base):
             return session.query(GitProjectModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["GitProjectModel"]:
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        after: Optional[tuple[str, int]] = None,
+    ) -> Iterable["GitProjectModel"]:
+        """Return projects ordered by namespace, either from `first` to `last`
+        or `last - first` of them following the `(namespace, id)` key of `after`."""
         with sa_session_transaction() as session:
-            return (
-                session.query(GitProjectModel)
-                .order_by(GitProjectModel.namespace)
-                .slice(first, last)
+            query = session.query(GitProjectModel).order_by(
+                GitProjectModel.namespace,
+                GitProjectModel.id,
             )
+            if after is not None:
+                return query.filter(
+                    tuple_(GitProjectModel.namespace, GitProjectModel.id) > tuple_(*after),
+                ).limit(last - first)
+            return query.slice(first, last)
 
     @classmethod
     def get_by_forge(
@@ -813,67 +992,46 @@ class GitProjectModel(Base):
                 .slice(first, last)
             )
 
-    # ACTIVE PROJECTS
-
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_active_projects(
-        cls,
-        top: Optional[int] = None,
-        datetime_from=None,
-        datetime_to=None,
-    ) -> list[str]:
+    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=timedelta(minutes=1).total_seconds())
+    def get_handled_counts(cls, project_ids: tuple[int, ...]) -> dict[int, dict[str, int]]:
         """
-        Active project is the one with at least one activity (=one pipeline)
-        during the given period.
-        """
-        return list(
-            cls.get_active_projects_usage_numbers(
-                top=top,
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-            ).keys(),
-        )
+        Count the pull requests, branches, releases and issues handled for
+        the projects with grouped subqueries joined in a single statement,
+        instead of loading the whole relationships.
 
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_active_projects_count(cls, datetime_from=None, datetime_to=None) -> int:
-        """
-        Active project is the one with at least one activity (=one pipeline)
-        during the given period.
-        """
-        return len(
-            cls.get_active_projects_usage_numbers(
-                top=None,
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-            ),
-        )
+        Args:
+            project_ids: IDs of the projects.
 
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_active_projects_usage_numbers(
-        cls,
-        top: Optional[int] = 10,
-        datetime_from=None,
-        datetime_to=None,
-    ) -> dict[str, int]:
-        """
-        Get the most active projects sorted by the number of related pipelines.
+        Returns:
+            Mapping of the IDs of the projects to the numbers of
+            `prs_handled`, `branches_handled`, `releases_handled`
+            and `issues_handled`.
         """
-        all_usage_numbers: dict[str, int] = Counter()
-        for project_event_type in ProjectEventModelType:
-            all_usage_numbers.update(
-                cls.get_project_event_usage_numbers(
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to,
-                    top=None,
-                    project_event_type=project_event_type,
-                ),
-            )
-        return dict(
-            sorted(all_usage_numbers.items(), key=lambda x: x[1], reverse=True)[:top],
-        )
+        if not project_ids:
+            return {}
+
+        with sa_session_transaction() as session:
+            counts = {
+                name: session.query(model.project_id, count(model.id).label("count"))
+                .filter(model.project_id.in_(project_ids))
+                .group_by(model.project_id)
+                .subquery()
+                for name, model in (
+                    ("prs_handled", PullRequestModel),
+                    ("branches_handled", GitBranchModel),
+                    ("releases_handled", ProjectReleaseModel),
+                    ("issues_handled", IssueModel),
+                )
+            }
+            query = session.query(
+                GitProjectModel.id,
+                *(func.coalesce(subquery.c.count, 0) for subquery in counts.values()),
+            ).filter(GitProjectModel.id.in_(project_ids))
+            for subquery in counts.values():
+                query = query.outerjoin(subquery, subquery.c.project_id == GitProjectModel.id)
+
+            return {project_id: dict(zip(counts, row)) for project_id, *row in query}
 
     # ALL PROJECTS
 
@@ -904,279 +1062,6 @@ class GitProjectModel(Base):
                 .all(),
             )
 
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_instance_numbers_for_active_projects(
-        cls,
-        datetime_from=None,
-        datetime_to=None,
-    ) -> dict[str, int]:
-        """
-        Get the number of projects (at least one pipeline during the time period)
-        per each GIT instances.
-        """
-        projects_per_instance: dict[str, set[str]] = {}
-
-        with sa_session_transaction() as session:
-            for project_event_type in ProjectEventModelType:
-                project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-                query = (
-                    session.query(
-                        GitProjectModel.instance_url,
-                        GitProjectModel.project_url,
-                    )
-                    .join(
-                        project_event_model,
-                        GitProjectModel.id == project_event_model.project_id,
-                    )
-                    .join(
-                        ProjectEventModel,
-                        ProjectEventModel.event_id == project_event_model.id,
-                    )
-                    .join(
-                        PipelineModel,
-                        PipelineModel.project_event_id == ProjectEventModel.id,
-                    )
-                    .filter(ProjectEventModel.type == project_event_type)
-                )
-                if datetime_from:
-                    query = query.filter(PipelineModel.datetime >= datetime_from)
-                if datetime_to:
-                    query = query.filter(PipelineModel.datetime <= datetime_to)
-
-                query = query.group_by(
-                    GitProjectModel.project_url,
-                    GitProjectModel.instance_url,
-                )
-                for instance, project in query.all():
-                    projects_per_instance.setdefault(instance, set())
-                    projects_per_instance[instance].add(project)
-
-        return {instance: len(projects) for instance, projects in projects_per_instance.items()}
-
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_project_event_usage_count(
-        cls,
-        project_event_type: ProjectEventModelType,
-        datetime_from=None,
-        datetime_to=None,
-    ):
-        """
-        Get the number of triggers of a given type with at least one pipeline from the given period.
-        """
-        # TODO: share the computation with _get_trigger_usage_numbers
-        #       (one query with top and one without)
-        return sum(
-            cls.get_project_event_usage_numbers(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                project_event_type=project_event_type,
-                top=None,
-            ).values(),
-        )
-
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_project_event_usage_numbers(
-        cls,
-        project_event_type,
-        datetime_from=None,
-        datetime_to=None,
-        top=None,
-    ) -> dict[str, int]:
-        """
-        For each project, get the number of triggers of a given type with at least one pipeline
-        from the given period.
-
-        Order from the highest numbers.
-        All if `top` not set, the first `top` projects returned otherwise.
-        """
-        project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-        with sa_session_transaction() as session:
-            query = (
-                session.query(
-                    GitProjectModel.project_url,
-                    count(project_event_model.id).over(
-                        partition_by=GitProjectModel.project_url,
-                    ),
-                )
-                .join(
-                    project_event_model,
-                    GitProjectModel.id == project_event_model.project_id,
-                )
-                .join(
-                    ProjectEventModel,
-                    ProjectEventModel.event_id == project_event_model.id,
-                )
-                .join(
-                    PipelineModel,
-                    PipelineModel.project_event_id == ProjectEventModel.id,
-                )
-                .filter(ProjectEventModel.type == project_event_type)
-            )
-            if datetime_from:
-                query = query.filter(PipelineModel.datetime >= datetime_from)
-            if datetime_to:
-                query = query.filter(PipelineModel.datetime <= datetime_to)
-
-            query = (
-                query.group_by(GitProjectModel.project_url, project_event_model.id)
-                .distinct()
-                .order_by(
-                    desc(
-                        count(project_event_model.id).over(
-                            partition_by=GitProjectModel.project_url,
-                        ),
-                    ),
-                )
-            )
-
-            if top:
-                query = query.limit(top)
-
-            return dict(query.all())
-
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_job_usage_numbers_count(
-        cls,
-        job_result_model,
-        project_event_type,
-        datetime_from=None,
-        datetime_to=None,
-    ) -> int:
-        """
-        Get the number of jobs of a given type with at least one pipeline
-        from the given period and given project event.
-        """
-        return sum(
-            cls.get_job_usage_numbers(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                job_result_model=job_result_model,
-                top=None,
-                project_event_type=project_event_type,
-            ).values(),
-        )
-
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_job_usage_numbers_count_all_project_events(
-        cls,
-        job_result_model,
-        datetime_from=None,
-        datetime_to=None,
-    ) -> int:
-        """
-        Get the number of all the jobs of a given type with at least one pipeline
-        from the given period.
-        """
-        return sum(
-            cls.get_job_usage_numbers_all_project_events(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                job_result_model=job_result_model,
-                top=None,
-            ).values(),
-        )
-
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_job_usage_numbers(
-        cls,
-        job_result_model,
-        project_event_type,
-        datetime_from=None,
-        datetime_to=None,
-        top: Optional[int] = 10,
-    ) -> dict[str, int]:
-        """
-        For each project, get the number of jobs of a given type with at least one pipeline
-        from the given period.
-
-        Order from the highest numbers.
-        All if `top` not set, the first `top` projects returned otherwise.
-        """
-        project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-        pipeline_attribute = {
-            SRPMBuildModel: PipelineModel.srpm_build_id,
-            CoprBuildGroupModel: PipelineModel.copr_build_group_id,
-            KojiBuildGroupModel: PipelineModel.koji_build_group_id,
-            VMImageBuildTargetModel: PipelineModel.vm_image_build_id,
-            TFTTestRunGroupModel: PipelineModel.test_run_group_id,
-            SyncReleaseModel: PipelineModel.sync_release_run_id,
-            LogDetectiveRunGroupModel: PipelineModel.log_detective_run_group_id,
-        }[job_result_model]
-
-        with sa_session_transaction() as session:
-            query = (
-                session.query(
-                    GitProjectModel.project_url,
-                    count(job_result_model.id).over(
-                        partition_by=GitProjectModel.project_url,
-                    ),
-                )
-                .join(
-                    project_event_model,
-                    GitProjectModel.id == project_event_model.project_id,
-                )
-                .join(
-                    ProjectEventModel,
-                    ProjectEventModel.event_id == project_event_model.id,
-                )
-                .join(
-                    PipelineModel,
-                    PipelineModel.project_event_id == ProjectEventModel.id,
-                )
-                .join(job_result_model, job_result_model.id == pipeline_attribute)
-                .filter(ProjectEventModel.type == project_event_type)
-            )
-            if datetime_from:
-                query = query.filter(PipelineModel.datetime >= datetime_from)
-            if datetime_to:
-                query = query.filter(PipelineModel.datetime <= datetime_to)
-            return dict(
-                query.group_by(GitProjectModel.project_url, job_result_model.id)
-                .distinct()
-                .order_by(
-                    desc(
-                        count(job_result_model.id).over(
-                            partition_by=GitProjectModel.project_url,
-                        ),
-                    ),
-                )
-                .limit(top)
-                .all(),
-            )
-
-    @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
-    def get_job_usage_numbers_all_project_events(
-        cls,
-        job_result_model,
-        datetime_from=None,
-        datetime_to=None,
-        top: Optional[int] = None,
-    ) -> dict[str, int]:
-        """
-        For each job, get the per-project number of jobs from the given period.
-        """
-        all_usage_numbers: dict[str, int] = Counter()
-        for project_event_type in ProjectEventModelType:
-            all_usage_numbers.update(
-                cls.get_job_usage_numbers(
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to,
-                    top=None,
-                    job_result_model=job_result_model,
-                    project_event_type=project_event_type,
-                ),
-            )
-        return dict(
-            sorted(all_usage_numbers.items(), key=lambda x: x[1], reverse=True)[:top],
-        )
-
     @classmethod
     def get_known_onboarded_downstream_projects(
         cls,
@@ -1255,7 +1140,7 @@ class SyncReleasePullRequestModel(Base):
         url: str,
         is_fast_forward: bool = False,
     ) -> "SyncReleasePullRequestModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = GitProjectModel.get_or_create(
                 namespace=namespace,
                 repo_name=repo_name,
@@ -1307,6 +1192,9 @@ class SyncReleasePullRequestModel(Base):
 
 class PullRequestModel(BuildsAndTestsConnector, Base):
     __tablename__ = "pull_requests"
+    __table_args__ = (
+        Index("ix_pull_requests_pr_id_project_id", "pr_id", "project_id", unique=True),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     # GitHub PR ID
     # this is not our PK b/c:
@@ -1328,23 +1216,18 @@ class PullRequestModel(BuildsAndTestsConnector, Base):
         repo_name: str,
         project_url: str,
     ) -> "PullRequestModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = GitProjectModel.get_or_create(
                 namespace=namespace,
                 repo_name=repo_name,
                 project_url=project_url,
             )
-            pr = (
-                session.query(PullRequestModel)
-                .filter_by(pr_id=pr_id, project_id=project.id)
-                .first()
+            return get_or_insert(
+                session,
+                cls,
+                values={"pr_id": pr_id, "project_id": project.id},
+                index_elements=["pr_id", "project_id"],
             )
-            if not pr:
-                pr = PullRequestModel()
-                pr.pr_id = pr_id
-                pr.project_id = project.id
-                session.add(pr)
-            return pr
 
     @classmethod
     def get(
@@ -1393,7 +1276,7 @@ class IssueModel(BuildsAndTestsConnector, Base):
         repo_name: str,
         project_url: str,
     ) -> "IssueModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = GitProjectModel.get_or_create(
                 namespace=namespace,
                 repo_name=repo_name,
@@ -1438,7 +1321,7 @@ class GitBranchModel(BuildsAndTestsConnector, Base):
         repo_name: str,
         project_url: str,
     ) -> "GitBranchModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = GitProjectModel.get_or_create(
                 namespace=namespace,
                 repo_name=repo_name,
@@ -1485,7 +1368,7 @@ class ProjectReleaseModel(BuildsAndTestsConnector, Base):
         project_url: str,
         commit_hash: Optional[str] = None,
     ) -> "ProjectReleaseModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = GitProjectModel.get_or_create(
                 namespace=namespace,
                 repo_name=repo_name,
@@ -1535,7 +1418,7 @@ class KojiBuildTagModel(BuildsAndTestsConnector, Base):
         repo_name: str,
         project_url: str,
     ) -> "KojiBuildTagModel":
-        with sa_session_transaction(commit=True) as session:
+        with sa_unit_of_work() as session:
             project = GitProjectModel.get_or_create(
                 namespace=namespace,
                 repo_name=repo_name,
@@ -1613,6 +1496,24 @@ class ProjectEventModel(Base):
     """
 
     __tablename__ = "project_events"
+    __table_args__ = (
+        # the events without a commit (e.g. Koji build tags) are unique per project object
+        Index(
+            "ix_project_events_type_event_id_commit_sha",
+            "type",
+            "event_id",
+            "commit_sha",
+            unique=True,
+            postgresql_where=text("commit_sha IS NOT NULL"),
+        ),
+        Index(
+            "ix_project_events_type_event_id_no_commit_sha",
+            "type",
+            "event_id",
+            unique=True,
+            postgresql_where=text("commit_sha IS NULL"),
+        ),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     type = Column(Enum(ProjectEventModelType))
     event_id = Column(Integer, index=True)
@@ -1630,18 +1531,19 @@ class ProjectEventModel(Base):
         project_url: str,
         commit_sha: str,
     ) -> tuple[PullRequestModel, "ProjectEventModel"]:
-        pull_request = PullRequestModel.get_or_create(
-            pr_id=pr_id,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=pull_request.project_event_model_type,
-            event_id=pull_request.id,
-            commit_sha=commit_sha,
-        )
-        return (pull_request, event)
+        with sa_unit_of_work():
+            pull_request = PullRequestModel.get_or_create(
+                pr_id=pr_id,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            )
+            event = ProjectEventModel.get_or_create(
+                type=pull_request.project_event_model_type,
+                event_id=pull_request.id,
+                commit_sha=commit_sha,
+            )
+            return (pull_request, event)
 
     @classmethod
     def add_branch_push_event(
@@ -1652,18 +1554,19 @@ class ProjectEventModel(Base):
         project_url: str,
         commit_sha: str,
     ) -> tuple[GitBranchModel, "ProjectEventModel"]:
-        branch_push = GitBranchModel.get_or_create(
-            branch_name=branch_name,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=branch_push.project_event_model_type,
-            event_id=branch_push.id,
-            commit_sha=commit_sha,
-        )
-        return (branch_push, event)
+        with sa_unit_of_work():
+            branch_push = GitBranchModel.get_or_create(
+                branch_name=branch_name,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            )
+            event = ProjectEventModel.get_or_create(
+                type=branch_push.project_event_model_type,
+                event_id=branch_push.id,
+                commit_sha=commit_sha,
+            )
+            return (branch_push, event)
 
     @classmethod
     def add_release_event(
@@ -1674,19 +1577,20 @@ class ProjectEventModel(Base):
         project_url: str,
         commit_hash: str,
     ) -> tuple[ProjectReleaseModel, "ProjectEventModel"]:
-        release = ProjectReleaseModel.get_or_create(
-            tag_name=tag_name,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-            commit_hash=commit_hash,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=release.project_event_model_type,
-            event_id=release.id,
-            commit_sha=commit_hash,
-        )
-        return (release, event)
+        with sa_unit_of_work():
+            release = ProjectReleaseModel.get_or_create(
+                tag_name=tag_name,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+                commit_hash=commit_hash,
+            )
+            event = ProjectEventModel.get_or_create(
+                type=release.project_event_model_type,
+                event_id=release.id,
+                commit_sha=commit_hash,
+            )
+            return (release, event)
 
     @classmethod
     def add_anitya_version_event(
@@ -1696,18 +1600,19 @@ class ProjectEventModel(Base):
         project_id: int,
         package: str,
     ) -> tuple[AnityaVersionModel, "ProjectEventModel"]:
-        project_version = AnityaVersionModel.get_or_create(
-            version=version,
-            project_name=project_name,
-            project_id=project_id,
-            package=package,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=project_version.project_event_model_type,
-            event_id=project_version.id,
-            commit_sha=None,
-        )
-        return (project_version, event)
+        with sa_unit_of_work():
+            project_version = AnityaVersionModel.get_or_create(
+                version=version,
+                project_name=project_name,
+                project_id=project_id,
+                package=package,
+            )
+            event = ProjectEventModel.get_or_create(
+                type=project_version.project_event_model_type,
+                event_id=project_version.id,
+                commit_sha=None,
+            )
+            return (project_version, event)
 
     @classmethod
     def add_anitya_multiple_versions_event(
@@ -1717,18 +1622,19 @@ class ProjectEventModel(Base):
         project_id: int,
         package: str,
     ) -> tuple[AnityaMultipleVersionsModel, "ProjectEventModel"]:
-        project_version = AnityaMultipleVersionsModel.get_or_create(
-            versions=versions,
-            project_name=project_name,
-            project_id=project_id,
-            package=package,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=project_version.project_event_model_type,
-            event_id=project_version.id,
-            commit_sha=None,
-        )
-        return (project_version, event)
+        with sa_unit_of_work():
+            project_version = AnityaMultipleVersionsModel.get_or_create(
+                versions=versions,
+                project_name=project_name,
+                project_id=project_id,
+                package=package,
+            )
+            event = ProjectEventModel.get_or_create(
+                type=project_version.project_event_model_type,
+                event_id=project_version.id,
+                commit_sha=None,
+            )
+            return (project_version, event)
 
     @classmethod
     def add_issue_event(
@@ -1738,18 +1644,19 @@ class ProjectEventModel(Base):
         repo_name: str,
         project_url: str,
     ) -> tuple[IssueModel, "ProjectEventModel"]:
-        issue = IssueModel.get_or_create(
-            issue_id=issue_id,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=issue.project_event_model_type,
-            event_id=issue.id,
-            commit_sha=None,
-        )
-        return (issue, event)
+        with sa_unit_of_work():
+            issue = IssueModel.get_or_create(
+                issue_id=issue_id,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            )
+            event = ProjectEventModel.get_or_create(
+                type=issue.project_event_model_type,
+                event_id=issue.id,
+                commit_sha=None,
+            )
+            return (issue, event)
 
     @classmethod
     def add_koji_build_tag_event(
@@ -1760,23 +1667,24 @@ class ProjectEventModel(Base):
         repo_name: str,
         project_url: str,
     ) -> tuple[KojiBuildTagModel, "ProjectEventModel"]:
-        target = None
-        if sidetag := SidetagModel.get_by_koji_name(koji_tag_name):
-            target = sidetag.target
-        koji_build_tag = KojiBuildTagModel.get_or_create(
-            task_id=task_id,
-            koji_tag_name=koji_tag_name,
-            target=target,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=koji_build_tag.project_event_model_type,
-            event_id=koji_build_tag.id,
-            commit_sha=None,
-        )
-        return (koji_build_tag, event)
+        with sa_unit_of_work():
+            target = None
+            if sidetag := SidetagModel.get_by_koji_name(koji_tag_name):
+                target = sidetag.target
+            koji_build_tag = KojiBuildTagModel.get_or_create(
+                task_id=task_id,
+                koji_tag_name=koji_tag_name,
+                target=target,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            )
+            event = ProjectEventModel.get_or_create(
+                type=koji_build_tag.project_event_model_type,
+                event_id=koji_build_tag.id,
+                commit_sha=None,
+            )
+            return (koji_build_tag, event)
 
     @classmethod
     def get_or_create(
@@ -1785,50 +1693,25 @@ class ProjectEventModel(Base):
         event_id: int,
         commit_sha: str,
     ) -> "ProjectEventModel":
+        if commit_sha is None:
+            index_elements = ["type", "event_id"]
+            index_where = cls.commit_sha.is_(None)
+        else:
+            index_elements = ["type", "event_id", "commit_sha"]
+            index_where = cls.commit_sha.isnot(None)
         with sa_session_transaction(commit=True) as session:
-            project_event = (
-                session.query(ProjectEventModel)
-                .filter_by(type=type, event_id=event_id, commit_sha=commit_sha)
-                .first()
-            )
-            if not project_event:
-                project_event = ProjectEventModel()
-                project_event.type = type
-                project_event.event_id = event_id
-                project_event.commit_sha = commit_sha
-                session.add(project_event)
-            return project_event
-
-    @classmethod
-    def get_by_id(cls, id_: int) -> Optional["ProjectEventModel"]:
-        with sa_session_transaction() as session:
-            return session.query(ProjectEventModel).filter_by(id=id_).first()
-
-    @classmethod
-    def get_and_reset_older_than_with_packages_config(
-        cls,
-        delta: timedelta,
-    ) -> Iterable["ProjectEventModel"]:
-        """Return project events with all runs older than delta
-        and set to null their stored packages config.
-        Cleanup project events here to speed up the process."""
-        delta_ago = datetime.now(timezone.utc) - delta
-        with sa_session_transaction(commit=True) as session:
-            events = (
-                session.query(ProjectEventModel)
-                .filter(ProjectEventModel.packages_config.isnot(null()))
-                .filter(
-                    ~ProjectEventModel.runs.any(PipelineModel.datetime >= delta_ago),
-                )
+            return get_or_insert(
+                session,
+                cls,
+                values={"type": type, "event_id": event_id, "commit_sha": commit_sha},
+                index_elements=index_elements,
+                index_where=index_where,
             )
-            # After we reset the packages config
-            # the query will be empty.
-            # Store the query result in a new list
-            events_list = list(events)
-            for event in events:
-                event.packages_config = null()
-                session.add(event)
-            return events_list
+
+    @classmethod
+    def get_by_id(cls, id_: int) -> Optional["ProjectEventModel"]:
+        with sa_session_transaction() as session:
+            return session.query(ProjectEventModel).filter_by(id=id_).first()
 
     def set_packages_config(self, packages_config: dict):
         with sa_session_transaction(commit=True) as session:
@@ -1843,6 +1726,42 @@ class ProjectEventModel(Base):
                 .first()
             )
 
+    @staticmethod
+    def get_project_event_objects(
+        project_events: Iterable["ProjectEventModel"],
+    ) -> dict[int, AbstractProjectObjectDbType]:
+        """
+        Get the project event objects (with their projects loaded) of multiple
+        project events with a single query per project event type.
+
+        Args:
+            project_events: Project events to get the objects for.
+
+        Returns:
+            Mapping of the IDs of the project events to their objects.
+        """
+        project_events = list(project_events)
+        event_ids = defaultdict(set)
+        for project_event in project_events:
+            event_ids[project_event.type].add(project_event.event_id)
+
+        project_event_objects = {}
+        for project_event_type, ids in event_ids.items():
+            model = MODEL_FOR_PROJECT_EVENT[project_event_type]
+            for id_, project_event_object in get_by_ids(
+                model,
+                ids,
+                selectinload(model.project),
+            ).items():
+                project_event_objects[project_event_type, id_] = project_event_object
+
+        return {
+            project_event.id: project_event_objects.get(
+                (project_event.type, project_event.event_id),
+            )
+            for project_event in project_events
+        }
+
     def __repr__(self):
         return (
             f"ProjectEventModel(type={self.type}, event_id={self.event_id}, "
@@ -1869,7 +1788,7 @@ class PipelineModel(Base):
     id = Column(Integer, primary_key=True)  # our database PK
     # datetime.utcnow instead of datetime.utcnow() because it's an argument to the function,
     # so it will run when the model is initiated, not when the table is made
-    datetime = Column(DateTime, default=datetime.utcnow)
+    datetime = Column(DateTime, default=datetime.utcnow, index=True)
 
     project_event_id = Column(Integer, ForeignKey("project_events.id"), index=True)
     package_name = Column(String, index=True)
@@ -2003,9 +1922,42 @@ class PipelineModel(Base):
             )
 
     @classmethod
-    def get_merged_chroots(cls, first: int, last: int) -> Iterable["PipelineModel"]:
+    def get_merged_chroots(
+        cls,
+        first: int,
+        last: int,
+        after: Optional[int] = None,
+    ) -> Iterable["PipelineModel"]:
+        """Return merged runs from the newest, either from `first` to `last`
+        or `last - first` of them following the run with `merged_id` `after`."""
+        # The runs on the page are found by walking the pipelines from the newest
+        # and picking the first (lowest ID) pipeline of each SRPM build, so that
+        # only the pipelines of these runs are aggregated instead of the whole table.
+        page = aliased(PipelineModel)
+        other = aliased(PipelineModel)
+        page_runs = (
+            select(page.id, page.srpm_build_id)
+            .where(
+                ~exists().where(
+                    other.srpm_build_id == page.srpm_build_id,
+                    other.id < page.id,
+                ),
+            )
+            .order_by(desc(page.id))
+            .limit(last - first)
+        )
+        page_runs = (
+            page_runs.where(page.id < after) if after is not None else page_runs.offset(first)
+        ).cte("page_runs")
+
         return (
             cls.__query_merged_runs()
+            .filter(
+                or_(
+                    PipelineModel.id.in_(select(page_runs.c.id)),
+                    PipelineModel.srpm_build_id.in_(select(page_runs.c.srpm_build_id)),
+                ),
+            )
             .group_by(
                 PipelineModel.srpm_build_id,
                 case(
@@ -2014,7 +1966,6 @@ class PipelineModel(Base):
                 ),
             )
             .order_by(desc("merged_id"))
-            .slice(first, last)
         )
 
     @classmethod
@@ -2364,6 +2315,7 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         with sa_session_transaction(commit=True) as session:
             self.build_id = build_id
             session.add(self)
+        remember_build_id(KnownBuildKind.copr, build_id)
 
     def get_srpm_build(self) -> Optional["SRPMBuildModel"]:
         # All SRPMBuild models for all the runs have to be same.
@@ -2412,16 +2364,58 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
                 desc(CoprBuildTargetModel.id),
             )
 
+    @staticmethod
+    def _listed_builds_filter(model) -> tuple:
+        """Conditions of the targets of `model` (or its alias) listed as Copr builds."""
+        return (
+            # Exclude builds without build_id (to not mix targets from
+            # different builds together)
+            model.build_id.isnot(None),
+            # Exclude builds waiting for SRPM - not actual Copr builds yet
+            model.status != BuildStatus.waiting_for_srpm,
+            # Exclude SRPM build failures (no build_start_time/build_logs_url)
+            or_(
+                model.status != BuildStatus.failure,
+                model.build_start_time.isnot(None),
+                model.build_logs_url.isnot(None),
+            ),
+        )
+
     @classmethod
     def get_merged_chroots(
         cls,
         first: int,
         last: int,
+        after: Optional[int] = None,
     ) -> Iterable["CoprBuildTargetModel"]:
-        """Returns a list of unique build ids with merged status, chroots
+        """Returns a list of unique build ids with merged status, chroots,
+        either from `first` to `last` or `last - first` of them following
+        the build with `new_id` `after`.
         Details:
         https://github.com/packit/packit-service/pull/674#discussion_r439819852
         """
+        # The builds on the page are found by walking the targets from the newest
+        # and picking the first (lowest ID) target of each build, so that only
+        # the targets of these builds are aggregated instead of the whole table.
+        page = aliased(CoprBuildTargetModel)
+        other = aliased(CoprBuildTargetModel)
+        page_builds = (
+            select(page.build_id)
+            .where(
+                *cls._listed_builds_filter(page),
+                ~exists().where(
+                    other.build_id == page.build_id,
+                    other.id < page.id,
+                    *cls._listed_builds_filter(other),
+                ),
+            )
+            .order_by(desc(page.id))
+            .limit(last - first)
+        )
+        page_builds = (
+            page_builds.where(page.id < after) if after is not None else page_builds.offset(first)
+        )
+
         with sa_session_transaction() as session:
             return (
                 session.query(
@@ -2442,23 +2436,13 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
                     ),
                 )
                 .filter(
-                    # Exclude builds without build_id (to not mix targets from
-                    # different builds together)
-                    CoprBuildTargetModel.build_id.isnot(None),
-                    # Exclude builds waiting for SRPM - not actual Copr builds yet
-                    CoprBuildTargetModel.status != BuildStatus.waiting_for_srpm,
-                    # Exclude SRPM build failures (no build_start_time/build_logs_url)
-                    or_(
-                        CoprBuildTargetModel.status != BuildStatus.failure,
-                        CoprBuildTargetModel.build_start_time.isnot(None),
-                        CoprBuildTargetModel.build_logs_url.isnot(None),
-                    ),
+                    *cls._listed_builds_filter(CoprBuildTargetModel),
+                    CoprBuildTargetModel.build_id.in_(page_builds),
                 )
                 .group_by(
                     CoprBuildTargetModel.build_id,
                 )  # Group by identical element(s)
                 .order_by(desc("new_id"))
-                .slice(first, last)
             )
 
     # Returns all builds with that build_id, irrespective of target
@@ -2587,7 +2571,48 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
             copr_build_group.copr_build_targets.append(build)
             session.add(copr_build_group)
 
-            return build
+        remember_build_id(KnownBuildKind.copr, build_id)
+        return build
+
+    @classmethod
+    def bulk_create(
+        cls,
+        copr_build_group: "CoprBuildGroupModel",
+        builds: list[dict[str, Any]],
+    ) -> list["CoprBuildTargetModel"]:
+        """
+        Create all the builds of the group in a single transaction, see `create`.
+
+        Args:
+            copr_build_group: Group of the builds.
+            builds: Keyword arguments of `create` (except the group) for each build.
+
+        Returns:
+            Created builds in the order of `builds`.
+        """
+        if not builds:
+            return []
+
+        with sa_session_transaction(commit=True) as session:
+            created = bulk_insert(
+                session,
+                cls,
+                [{**build, "copr_build_group_id": copr_build_group.id} for build in builds],
+            )
+
+        for build in builds:
+            remember_build_id(KnownBuildKind.copr, build.get("build_id"))
+        return created
+
+    @classmethod
+    def get_build_ids_submitted_since(cls, since: datetime) -> Iterable[tuple[str, datetime]]:
+        """Returns Copr build IDs and submission times of the builds submitted since given time."""
+        with sa_session_transaction() as session:
+            return (
+                session.query(cls.build_id, cls.submitted_time)
+                .filter(cls.submitted_time >= since, cls.build_id.isnot(None))
+                .yield_per(10_000)
+            )
 
     @classmethod
     def get(
@@ -2810,6 +2835,29 @@ class BodhiUpdateTargetModel(GroupAndTargetModelConnector, Base):
 
             return update
 
+    @classmethod
+    def bulk_create(
+        cls,
+        bodhi_update_group: "BodhiUpdateGroupModel",
+        updates: list[dict[str, Any]],
+    ) -> list["BodhiUpdateTargetModel"]:
+        """
+        Create all the updates of the group in a single transaction, see `create`.
+
+        Args:
+            bodhi_update_group: Group of the updates.
+            updates: Keyword arguments of `create` (except the group) for each update.
+
+        Returns:
+            Created updates in the order of `updates`.
+        """
+        with sa_session_transaction(commit=True) as session:
+            return bulk_insert(
+                session,
+                cls,
+                [{**update, "bodhi_update_group_id": bodhi_update_group.id} for update in updates],
+            )
+
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["BodhiUpdateTargetModel"]:
         with sa_session_transaction() as session:
@@ -2991,6 +3039,7 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
         with sa_session_transaction(commit=True) as session:
             self.task_id = task_id
             session.add(self)
+        remember_build_id(KnownBuildKind.koji_task, task_id)
 
     def set_build_start_time(self, build_start_time: Optional[DateTime]):
         with sa_session_transaction(commit=True) as session:
@@ -3086,6 +3135,7 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
         first: int,
         last: int,
         scratch: Optional[bool] = None,
+        after: Optional[int] = None,
     ) -> Iterable["KojiBuildTargetModel"]:
         with sa_session_transaction() as session:
             query = session.query(KojiBuildTargetModel).order_by(
@@ -3095,6 +3145,8 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
             if scratch is not None:
                 query = query.filter_by(scratch=scratch)
 
+            if after is not None:
+                return query.filter(KojiBuildTargetModel.id < after).limit(last - first)
             return query.slice(first, last)
 
     @classmethod
@@ -3144,7 +3196,18 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
             koji_build_group.koji_build_targets.append(build)
             session.add(koji_build_group)
 
-            return build
+        remember_build_id(KnownBuildKind.koji_task, task_id)
+        return build
+
+    @classmethod
+    def get_task_ids_submitted_since(cls, since: datetime) -> Iterable[tuple[str, datetime]]:
+        """Returns Koji task IDs and submission times of the builds submitted since given time."""
+        with sa_session_transaction() as session:
+            return (
+                session.query(cls.task_id, cls.submitted_time)
+                .filter(cls.submitted_time >= since, cls.task_id.isnot(None))
+                .yield_per(10_000)
+            )
 
     @classmethod
     def get(
@@ -3205,6 +3268,30 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
                 .all(),
             )
 
+    @classmethod
+    def get_all_successful_or_in_progress_by_nvrs(
+        cls,
+        nvrs: Iterable[str],
+    ) -> dict[str, set["KojiBuildTargetModel"]]:
+        """
+        Get the successful or in-progress non-scratch builds of multiple NVRs
+        with a single query.
+
+        Returns:
+            Builds by their NVRs, NVRs without any such build are missing.
+        """
+        builds: dict[str, set[KojiBuildTargetModel]] = defaultdict(set)
+        with sa_session_transaction() as session:
+            for build in session.query(KojiBuildTargetModel).filter(
+                KojiBuildTargetModel.nvr.in_(set(nvrs)),
+                KojiBuildTargetModel.scratch == False,  # noqa
+                KojiBuildTargetModel.status.in_(
+                    ("queued", "pending", "retry", "running", "success"),
+                ),
+            ):
+                builds[build.nvr].add(build)
+        return dict(builds)
+
     @classmethod
     def get_all_projects(cls) -> set["GitProjectModel"]:
         """Get all git projects with a successful downstream koji build."""
@@ -3436,7 +3523,8 @@ class SRPMBuildModel(ProjectAndEventsConnector, Base):
             new_run_model.srpm_build = srpm_build
             session.add(new_run_model)
 
-            return srpm_build, new_run_model
+        remember_build_id(KnownBuildKind.copr, copr_build_id)
+        return srpm_build, new_run_model
 
     @classmethod
     def get_by_id(
@@ -3447,11 +3535,17 @@ class SRPMBuildModel(ProjectAndEventsConnector, Base):
             return session.query(SRPMBuildModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["SRPMBuildModel"]:
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        after: Optional[int] = None,
+    ) -> Iterable["SRPMBuildModel"]:
         with sa_session_transaction() as session:
-            return (
-                session.query(SRPMBuildModel).order_by(desc(SRPMBuildModel.id)).slice(first, last)
-            )
+            query = session.query(SRPMBuildModel).order_by(desc(SRPMBuildModel.id))
+            if after is not None:
+                return query.filter(SRPMBuildModel.id < after).limit(last - first)
+            return query.slice(first, last)
 
     @classmethod
     def get_by_copr_build_id(
@@ -3487,6 +3581,20 @@ class SRPMBuildModel(ProjectAndEventsConnector, Base):
         with sa_session_transaction(commit=True) as session:
             self.copr_build_id = copr_build_id
             session.add(self)
+        remember_build_id(KnownBuildKind.copr, copr_build_id)
+
+    @classmethod
+    def get_copr_build_ids_submitted_since(
+        cls,
+        since: datetime,
+    ) -> Iterable[tuple[str, datetime]]:
+        """Returns Copr build IDs and submission times of SRPM builds submitted since given time."""
+        with sa_session_transaction() as session:
+            return (
+                session.query(cls.copr_build_id, cls.submitted_time)
+                .filter(cls.submitted_time >= since, cls.copr_build_id.isnot(None))
+                .yield_per(10_000)
+            )
 
     def set_copr_web_url(self, copr_web_url: str) -> None:
         with sa_session_transaction(commit=True) as session:
@@ -3524,6 +3632,10 @@ class AllowlistStatus(str, enum.Enum):
     denied = ALLOWLIST_CONSTANTS["denied"]
 
 
+# Redis key of the counter bumped whenever the allowlist changes
+ALLOWLIST_GENERATION_KEY = f"{REDIS_CACHE_KEY_PREFIX}:allowlist-generation"
+
+
 class AllowlistModel(Base):
     __tablename__ = "allowlist"
     id = Column(Integer, primary_key=True)
@@ -3565,7 +3677,26 @@ class AllowlistModel(Base):
                 namespace_entry.fas_account = fas_account
 
             session.add(namespace_entry)
-            return namespace_entry
+
+        cls.bump_generation()
+        return namespace_entry
+
+    @staticmethod
+    def get_generation() -> Optional[int]:
+        """
+        Get the generation of the allowlist, it changes whenever the allowlist does.
+
+        Returns:
+            Generation or `None` if it can't be tracked (Redis is not available).
+        """
+        # unlike a plain call, the pipeline tells a missing key from unavailable Redis
+        if (result := redis_pipeline(("get", ALLOWLIST_GENERATION_KEY))) is None:
+            return None
+        return int(result[0] or 0)
+
+    @staticmethod
+    def bump_generation() -> None:
+        redis_call("incr", ALLOWLIST_GENERATION_KEY)
 
     @classmethod
     def get_namespace(cls, namespace: str) -> Optional["AllowlistModel"]:
@@ -3605,11 +3736,21 @@ class AllowlistModel(Base):
             if namespace_entry.one_or_none():
                 namespace_entry.delete()
 
+        cls.bump_generation()
+
     @classmethod
     def get_all(cls) -> Iterable["AllowlistModel"]:
         with sa_session_transaction() as session:
             return session.query(AllowlistModel)
 
+    @classmethod
+    def get_statuses(cls) -> list[tuple[str, AllowlistStatus]]:
+        """
+        Get the namespaces with their statuses, without loading the whole entries.
+        """
+        with sa_session_transaction() as session:
+            return session.query(AllowlistModel.namespace, AllowlistModel.status).all()
+
     def to_dict(self) -> dict[str, str]:
         return {
             "namespace": self.namespace,
@@ -3911,6 +4052,57 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
 
             return test_run
 
+    @classmethod
+    def bulk_create(
+        cls,
+        test_run_group: "TFTTestRunGroupModel",
+        test_runs: list[dict[str, Any]],
+    ) -> list["TFTTestRunTargetModel"]:
+        """
+        Create all the test runs of the group in a single transaction, see `create`.
+
+        Args:
+            test_run_group: Group of the test runs.
+            test_runs: Keyword arguments of `create` (except the group) for each test run.
+
+        Returns:
+            Created test runs in the order of `test_runs`.
+        """
+        if not test_runs:
+            return []
+
+        rows = [
+            {
+                key: value
+                for key, value in test_run.items()
+                if key not in ("copr_build_targets", "koji_build_targets")
+            }
+            for test_run in test_runs
+        ]
+        with sa_session_transaction(commit=True) as session:
+            created = bulk_insert(
+                session,
+                cls,
+                [{**row, "tft_test_run_group_id": test_run_group.id} for row in rows],
+            )
+
+            copr_links = [
+                {"copr_id": build.id, "tft_id": test_run.id}
+                for test_run, kwargs in zip(created, test_runs)
+                for build in kwargs.get("copr_build_targets") or []
+            ]
+            if copr_links:
+                session.execute(insert(tf_copr_association_table), copr_links)
+            koji_links = [
+                {"koji_id": build.id, "tft_id": test_run.id}
+                for test_run, kwargs in zip(created, test_runs)
+                for build in kwargs.get("koji_build_targets") or []
+            ]
+            if koji_links:
+                session.execute(insert(tf_koji_association_table), koji_links)
+
+            return created
+
     @classmethod
     def get_by_pipeline_id(cls, pipeline_id: str) -> Optional["TFTTestRunTargetModel"]:
         with sa_session_transaction() as session:
@@ -3959,6 +4151,18 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
                 TFTTestRunTargetModel.status.in_(status),
             )
 
+    @classmethod
+    def set_status_of_all(cls, ids: list[int], status: TestingFarmResult) -> None:
+        """Set the status of all the given runs with a single statement."""
+        if not ids:
+            return
+
+        with sa_session_transaction(commit=True) as session:
+            session.query(cls).filter(cls.id.in_(ids)).update(
+                {cls.status: status},
+                synchronize_session=False,
+            )
+
     @classmethod
     def get_by_id(cls, id: int) -> Optional["TFTTestRunTargetModel"]:
         with sa_session_transaction() as session:
@@ -3994,13 +4198,19 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
             return query
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["TFTTestRunTargetModel"]:
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        after: Optional[int] = None,
+    ) -> Iterable["TFTTestRunTargetModel"]:
         with sa_session_transaction() as session:
-            return (
-                session.query(TFTTestRunTargetModel)
-                .order_by(desc(TFTTestRunTargetModel.id))
-                .slice(first, last)
+            query = session.query(TFTTestRunTargetModel).order_by(
+                desc(TFTTestRunTargetModel.id),
             )
+            if after is not None:
+                return query.filter(TFTTestRunTargetModel.id < after).limit(last - first)
+            return query.slice(first, last)
 
     def __repr__(self):
         return f"TFTTestRunTargetModel(id={self.id}, pipeline_id={self.pipeline_id})"
@@ -5196,6 +5406,364 @@ class LogDetectiveRunGroupModel(ProjectAndEventsConnector, GroupModel, Base):
             return q
 
 
+class UsageEventDayModel(Base):
+    """
+    Daily rollup of the handled project events, one row for each project event
+    with at least one pipeline on the given day.
+    """
+
+    __tablename__ = "usage_event_days"
+    day = Column(Date, primary_key=True)
+    project_event_type = Column(Enum(ProjectEventModelType), primary_key=True)
+    event_id = Column(Integer, primary_key=True)
+    # not a foreign key, Anitya events belong to Anitya projects
+    project_id = Column(Integer, index=True)
+
+
+class UsageJobDayModel(Base):
+    """
+    Daily rollup of the jobs, number of jobs of the given type first run
+    on the given day for the project events of the given type and project.
+    """
+
+    __tablename__ = "usage_job_days"
+    day = Column(Date, primary_key=True)
+    project_id = Column(Integer, primary_key=True)
+    project_event_type = Column(Enum(ProjectEventModelType), primary_key=True)
+    job_type = Column(String, primary_key=True)
+    runs = Column(Integer, nullable=False)
+
+
+class UsageRollupWatermarkModel(Base):
+    """Day before which the usage rollups are complete."""
+
+    __tablename__ = "usage_rollup_watermark"
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)
+
+    @classmethod
+    def get_day(cls) -> Optional[dt.date]:
+        with sa_session_transaction() as session:
+            return session.query(cls.day).filter_by(id=1).scalar()
+
+
+class RetentionCheckpointModel(Base):
+    """Last ID processed by an interrupted step of the old data removal."""
+
+    __tablename__ = "retention_checkpoints"
+    step = Column(String, primary_key=True)
+    last_id = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def get_last_id(cls, step: str) -> int:
+        """Get the last ID processed by the step, 0 if it has not been interrupted."""
+        with sa_session_transaction() as session:
+            return session.query(cls.last_id).filter_by(step=step).scalar() or 0
+
+
+# models of the jobs counted in the usage data and the pipeline columns referencing them
+USAGE_JOB_MODELS = {
+    SRPMBuildModel: PipelineModel.srpm_build_id,
+    CoprBuildGroupModel: PipelineModel.copr_build_group_id,
+    KojiBuildGroupModel: PipelineModel.koji_build_group_id,
+    VMImageBuildTargetModel: PipelineModel.vm_image_build_id,
+    TFTTestRunGroupModel: PipelineModel.test_run_group_id,
+    SyncReleaseModel: PipelineModel.sync_release_run_id,
+    LogDetectiveRunGroupModel: PipelineModel.log_detective_run_group_id,
+}
+
+
+def _select_pipelines_with_project(project_event_type: ProjectEventModelType, *columns):
+    """Select the given columns and the project ID of the pipelines of a project event type."""
+    project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
+    return (
+        select(
+            func.date(PipelineModel.datetime).label("day"),
+            ProjectEventModel.type.label("project_event_type"),
+            *columns,
+            project_event_model.project_id.label("project_id"),
+        )
+        .select_from(PipelineModel)
+        .join(ProjectEventModel, PipelineModel.project_event_id == ProjectEventModel.id)
+        .join(project_event_model, project_event_model.id == ProjectEventModel.event_id)
+        .where(ProjectEventModel.type == project_event_type)
+    )
+
+
+def _select_usage_events(*conditions) -> list:
+    """Select the rows of `UsageEventDayModel` from the pipelines matching the conditions."""
+    return [
+        _select_pipelines_with_project(project_event_type, ProjectEventModel.event_id)
+        .where(*conditions)
+        .distinct()
+        for project_event_type in ProjectEventModelType
+    ]
+
+
+def _select_usage_jobs(*conditions) -> list:
+    """
+    Select the rows of `UsageJobDayModel` from the pipelines matching the conditions.
+
+    A job is counted on the day of its first pipeline only,
+    so that the jobs connected to multiple pipelines are counted once.
+    """
+    queries = []
+    for job_model, pipeline_attribute in USAGE_JOB_MODELS.items():
+        earlier_pipeline = aliased(PipelineModel)
+        earlier_pipeline_attribute = getattr(earlier_pipeline, pipeline_attribute.key)
+        for project_event_type, project_event_model in MODEL_FOR_PROJECT_EVENT.items():
+            queries.append(
+                _select_pipelines_with_project(
+                    project_event_type,
+                    literal(job_model.__tablename__).label("job_type"),  # type: ignore
+                    count(pipeline_attribute.distinct()).label("runs"),
+                )
+                .where(
+                    pipeline_attribute.isnot(None),
+                    ~exists().where(
+                        earlier_pipeline_attribute == pipeline_attribute,
+                        earlier_pipeline.datetime < PipelineModel.datetime,
+                    ),
+                    *conditions,
+                )
+                .group_by(
+                    func.date(PipelineModel.datetime),
+                    ProjectEventModel.type,
+                    project_event_model.project_id,
+                ),
+            )
+    return queries
+
+
+def _to_utc_datetime(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """Convert the boundary of the usage data period to a naive UTC datetime."""
+    if value is None or isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(value)
+    if parsed is not None and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def refresh_usage_rollups(since: Optional[dt.date] = None) -> None:
+    """
+    Recompute the daily usage rollups from the given day up to yesterday.
+
+    The last days before the previous refresh are recomputed as well, so that
+    the jobs connected to already existing pipelines are not missed.
+    The days are recomputed in chunks, each in its own transaction,
+    so an interrupted backfill keeps the days computed so far.
+
+    Args:
+        since: First day to recompute. Defaults to `USAGE_ROLLUP_REFRESH_DAYS`
+            before the previous refresh or to the first pipeline if the rollups
+            were never computed.
+    """
+    today = datetime.now(timezone.utc).date()
+    watermark = UsageRollupWatermarkModel.get_day()
+    if since is None:
+        if watermark is not None:
+            since = watermark - timedelta(days=USAGE_ROLLUP_REFRESH_DAYS)
+        else:
+            with sa_session_transaction() as session:
+                first_pipeline = session.query(func.min(PipelineModel.datetime)).scalar()
+            since = first_pipeline.date() if first_pipeline else today
+
+    # the rollups stay complete up to the recomputed days only if there is no gap
+    update_watermark = watermark is None or since <= watermark
+    day = since
+    while day < today:
+        until = min(day + timedelta(days=USAGE_ROLLUP_CHUNK_DAYS), today)
+        logger.debug(f"Recomputing usage rollups from {day} until {until}.")
+        in_period = (
+            PipelineModel.datetime >= datetime.combine(day, dt.time()),
+            PipelineModel.datetime < datetime.combine(until, dt.time()),
+        )
+        with sa_session_transaction(commit=True) as session:
+            for model in (UsageEventDayModel, UsageJobDayModel):
+                session.execute(delete(model).where(model.day >= day, model.day < until))
+            session.execute(
+                insert(UsageEventDayModel).from_select(
+                    ["day", "project_event_type", "event_id", "project_id"],
+                    union_all(*_select_usage_events(*in_period)),
+                ),
+            )
+            session.execute(
+                insert(UsageJobDayModel).from_select(
+                    ["day", "project_event_type", "job_type", "runs", "project_id"],
+                    union_all(*_select_usage_jobs(*in_period)),
+                ),
+            )
+            if update_watermark:
+                watermark_model = UsageRollupWatermarkModel()
+                watermark_model.id = 1
+                watermark_model.day = until
+                session.merge(watermark_model)
+        day = until
+
+
+def get_usage_numbers(
+    datetime_from=None,
+    datetime_to=None,
+) -> tuple[
+    dict[ProjectEventModelType, dict[str, int]],
+    dict[str, dict[ProjectEventModelType, dict[str, int]]],
+    dict[str, int],
+]:
+    """
+    Get the per-project numbers of the handled events and of the jobs from the given period.
+
+    The whole days are read from the daily rollups, the rest of the period
+    (and all of it if the rollups were not computed yet) from the pipelines.
+
+    The jobs are counted in the period of their first pipeline, a job reused
+    by a pipeline from the period is not counted if it was first run before.
+
+    Returns:
+        Triplet of
+        * the number of events per project URL per project event type,
+        * the number of jobs per project URL per project event type per job
+          (`__tablename__` of its model),
+        * the number of active projects per instance.
+        The project URLs are ordered from the highest numbers.
+    """
+    period_from = _to_utc_datetime(datetime_from)
+    period_to = _to_utc_datetime(datetime_to)
+    watermark = UsageRollupWatermarkModel.get_day()
+
+    # whole days of the period covered by the rollups
+    first_day = last_day = None
+    if watermark is not None:
+        first_day = period_from and period_from.date()
+        if period_from and period_from.time() != dt.time():
+            first_day += timedelta(days=1)
+        last_day = min(watermark, period_to.date()) if period_to else watermark
+        if first_day is not None and first_day >= last_day:
+            first_day = last_day = None
+
+    # the rest of the period
+    outside_rollups = []
+    if last_day is None:
+        outside_rollups.append(
+            and_(
+                true(),
+                *([PipelineModel.datetime >= period_from] if period_from else []),
+                *([PipelineModel.datetime <= period_to] if period_to else []),
+            ),
+        )
+    else:
+        if first_day is not None and period_from < datetime.combine(first_day, dt.time()):
+            outside_rollups.append(
+                and_(
+                    PipelineModel.datetime >= period_from,
+                    PipelineModel.datetime < datetime.combine(first_day, dt.time()),
+                ),
+            )
+        outside_rollups.append(
+            and_(
+                PipelineModel.datetime >= datetime.combine(last_day, dt.time()),
+                *([PipelineModel.datetime <= period_to] if period_to else []),
+            ),
+        )
+
+    events_queries = _select_usage_events(or_(*outside_rollups))
+    jobs_queries = _select_usage_jobs(or_(*outside_rollups))
+    if last_day is not None:
+        events_queries.append(
+            select(
+                UsageEventDayModel.day,
+                UsageEventDayModel.project_event_type,
+                UsageEventDayModel.event_id,
+                UsageEventDayModel.project_id,
+            ).where(
+                UsageEventDayModel.day < last_day,
+                *([UsageEventDayModel.day >= first_day] if first_day else []),
+            ),
+        )
+        jobs_queries.append(
+            select(
+                UsageJobDayModel.day,
+                UsageJobDayModel.project_event_type,
+                UsageJobDayModel.job_type,
+                UsageJobDayModel.runs,
+                UsageJobDayModel.project_id,
+            ).where(
+                UsageJobDayModel.day < last_day,
+                *([UsageJobDayModel.day >= first_day] if first_day else []),
+            ),
+        )
+    events = union_all(*events_queries).subquery()
+    jobs = union_all(*jobs_queries).subquery()
+
+    events_numbers: dict[ProjectEventModelType, Counter] = {
+        project_event_type: Counter() for project_event_type in ProjectEventModelType
+    }
+    active_projects: dict[str, set[str]] = {}
+    jobs_numbers: dict[str, dict[ProjectEventModelType, Counter]] = {
+        job_model.__tablename__: {  # type: ignore
+            project_event_type: Counter() for project_event_type in ProjectEventModelType
+        }
+        for job_model in USAGE_JOB_MODELS
+    }
+    with sa_session_transaction() as session:
+        for project_url, instance_url, project_event_type, events_handled in session.execute(
+            select(
+                GitProjectModel.project_url,
+                GitProjectModel.instance_url,
+                events.c.project_event_type,
+                count(events.c.event_id.distinct()),
+            )
+            .join(events, GitProjectModel.id == events.c.project_id)
+            .group_by(
+                GitProjectModel.project_url,
+                GitProjectModel.instance_url,
+                events.c.project_event_type,
+            ),
+        ):
+            events_numbers[project_event_type][project_url] += events_handled
+            active_projects.setdefault(instance_url, set()).add(project_url)
+
+        for project_url, job_type, project_event_type, job_runs in session.execute(
+            select(
+                GitProjectModel.project_url,
+                jobs.c.job_type,
+                jobs.c.project_event_type,
+                func.sum(jobs.c.runs),
+            )
+            .join(jobs, GitProjectModel.id == jobs.c.project_id)
+            .group_by(GitProjectModel.project_url, jobs.c.job_type, jobs.c.project_event_type),
+        ):
+            jobs_numbers[job_type][project_event_type][project_url] += job_runs
+
+    return (
+        {
+            project_event_type: dict(numbers.most_common())
+            for project_event_type, numbers in events_numbers.items()
+        },
+        {
+            job_type: {
+                project_event_type: dict(numbers.most_common())
+                for project_event_type, numbers in per_event.items()
+            }
+            for job_type, per_event in jobs_numbers.items()
+        },
+        {instance_url: len(projects) for instance_url, projects in active_projects.items()},
+    )
+
+
+def get_top_projects(
+    numbers: Iterable[dict[str, int]],
+    top: Optional[int] = None,
+) -> dict[str, int]:
+    """Sum the per-project numbers and get the `top` projects with the highest ones."""
+    total: Counter = Counter()
+    for per_project in numbers:
+        total.update(per_project)
+    return dict(total.most_common()[:top])
+
+
 @cached(cache=TTLCache(maxsize=2048, ttl=(60 * 60 * 24)))
 def get_usage_data(datetime_from=None, datetime_to=None, top=10) -> dict:
     """
@@ -5287,34 +5855,10 @@ def get_usage_data(datetime_from=None, datetime_to=None, top=10) -> dict:
 
     ```
     """
-    jobs = {}
-    for job_model in [
-        SRPMBuildModel,
-        CoprBuildGroupModel,
-        KojiBuildGroupModel,
-        VMImageBuildTargetModel,
-        TFTTestRunGroupModel,
-        SyncReleaseModel,
-        LogDetectiveRunGroupModel,
-    ]:
-        if not hasattr(job_model, "__tablename__"):
-            # otherwise mypi complains:
-            # "type[ProjectAndEventsConnector]" has no attribute "__tablename__"
-            continue
-
-        jobs[job_model.__tablename__] = {
-            "job_runs": GitProjectModel.get_job_usage_numbers_count_all_project_events(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                job_result_model=job_model,
-            ),
-            "top_projects_by_job_runs": GitProjectModel.get_job_usage_numbers_all_project_events(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                top=top,
-                job_result_model=job_model,
-            ),
-        }
+    events, jobs, active_projects_instances = get_usage_numbers(
+        datetime_from=datetime_from,
+        datetime_to=datetime_to,
+    )
 
     return {
         "all_projects": {
@@ -5322,37 +5866,24 @@ def get_usage_data(datetime_from=None, datetime_to=None, top=10) -> dict:
             "instances": GitProjectModel.get_instance_numbers(),
         },
         "active_projects": {
-            "project_count": GitProjectModel.get_active_projects_count(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-            ),
-            "top_projects_by_events_handled": GitProjectModel.get_active_projects_usage_numbers(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                top=top,
-            ),
-            "instances": GitProjectModel.get_instance_numbers_for_active_projects(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-            ),
+            "project_count": len(get_top_projects(events.values(), top=None)),
+            "top_projects_by_events_handled": get_top_projects(events.values(), top=top),
+            "instances": active_projects_instances,
         },
         "events": {
             project_event_type.value: {
-                "events_handled": GitProjectModel.get_project_event_usage_count(
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to,
-                    project_event_type=project_event_type,
-                ),
-                "top_projects": GitProjectModel.get_project_event_usage_numbers(
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to,
-                    top=top,
-                    project_event_type=project_event_type,
-                ),
+                "events_handled": sum(events[project_event_type].values()),
+                "top_projects": get_top_projects([events[project_event_type]], top=top),
             }
             for project_event_type in ProjectEventModelType
         },
-        "jobs": jobs,
+        "jobs": {
+            job_type: {
+                "job_runs": sum(sum(numbers.values()) for numbers in per_event.values()),
+                "top_projects_by_job_runs": get_top_projects(per_event.values(), top=top),
+            }
+            for job_type, per_event in jobs.items()
+        },
     }
 
 
@@ -1,19 +1,32 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import copy
+import hashlib
 import logging
+import re
+import threading
 from typing import Optional
 
+from cachetools import LRUCache
 from ogr.abstract import GitProject
 from packit.config import (
     PackageConfig,
     get_package_config_from_repo,
 )
+from packit.config.package_config import (
+    find_remote_package_config,
+    get_specfile_path_from_repo,
+    load_packit_yaml,
+    parse_loaded_config,
+)
+from packit.constants import PACKAGE_CONFIG_HEADERS
 from packit.exceptions import (
     PackitConfigException,
     PackitMissingConfigException,
 )
 
+from packit_service.cache import MISSING, SharedCache, register_local_cache
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     CONTACTS_URL,
@@ -25,6 +38,147 @@ from packit_service.worker.reporting import comment_without_duplicating, create_
 
 logger = logging.getLogger(__name__)
 
+# package config at a given commit never changes, so it can be cached for long
+PACKAGE_CONFIG_CACHE_TTL = 24 * 60 * 60
+# repos without a config can get one without a new commit (e.g. by installing the app)
+PACKAGE_CONFIG_NEGATIVE_CACHE_TTL = 10 * 60
+# configs bigger than this (in bytes) are not cached
+PACKAGE_CONFIG_CACHE_MAX_SIZE = 256 * 1024
+
+COMMIT_SHA_REGEX = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+# (project, commit, config path override) -> where the config is and its content hash
+package_config_refs_cache = SharedCache(
+    namespace="package-config-ref",
+    ttl=PACKAGE_CONFIG_CACHE_TTL,
+    maxsize=1024,
+)
+# content hash -> raw and loaded config, shared by all the commits with the same config
+package_config_contents_cache = SharedCache(
+    namespace="package-config-content",
+    ttl=PACKAGE_CONFIG_CACHE_TTL,
+    maxsize=256,
+)
+# (project, commit, content hash) -> parsed config, process-local only
+_parsed_package_configs: LRUCache = register_local_cache(LRUCache(maxsize=256))
+_parsed_package_configs_lock = threading.Lock()
+
+
+def _fetch_package_config_entries(
+    project: GitProject,
+    ref: str,
+    package_config_path: Optional[str],
+) -> tuple[dict, Optional[dict]]:
+    """
+    Fetch the package config from the forge.
+
+    Returns:
+        Tuple of the reference entry (location and content hash of the config,
+        or `{"missing": True}`) and the content entry (raw and loaded config).
+    """
+    if not (package_config_path := package_config_path or find_remote_package_config(project, ref)):
+        return {"missing": True}, None
+
+    try:
+        raw = project.get_file_content(
+            path=package_config_path,
+            ref=ref,
+            headers=PACKAGE_CONFIG_HEADERS,
+        )
+    except FileNotFoundError:
+        logger.warning(
+            f"No config file {package_config_path!r} found on ref {ref!r} "
+            f"of the {project.full_repo_name!r} repository.",
+        )
+        return {"missing": True}, None
+
+    content = {"raw": raw, "loaded": load_packit_yaml(raw_text=raw)}
+    return {
+        "path": package_config_path,
+        "content_sha256": hashlib.sha256(raw.encode()).hexdigest(),
+    }, content
+
+
+def get_cached_package_config_from_repo(
+    project: GitProject,
+    ref: str,
+    package_config_path: Optional[str] = None,
+) -> Optional[PackageConfig]:
+    """
+    Get the package config at the given commit, caching the fetched and parsed config.
+
+    Args:
+        project: Project to get the config from.
+        ref: Commit SHA, configs at branches or tags are not cached.
+        package_config_path: Path of the config overriding the search for it.
+
+    Returns:
+        Package config or `None` if there is no config at the commit.
+    """
+    ref_key = f"{project.service.instance_url}/{project.full_repo_name}:{ref}:{package_config_path}"
+    ref_entry = package_config_refs_cache.get(ref_key)
+    content = None
+    store_ref_entry = cacheable = True
+
+    if ref_entry is MISSING:
+        ref_entry, content = _fetch_package_config_entries(project, ref, package_config_path)
+        if ref_entry.get("missing"):
+            package_config_refs_cache.set(
+                ref_key,
+                ref_entry,
+                ttl=PACKAGE_CONFIG_NEGATIVE_CACHE_TTL,
+            )
+            return None
+        if len(content["raw"]) > PACKAGE_CONFIG_CACHE_MAX_SIZE:
+            logger.debug(f"Package config of {ref_key} is too big to be cached.")
+            cacheable = False
+        else:
+            package_config_contents_cache.set(ref_entry["content_sha256"], content)
+    elif ref_entry.get("missing"):
+        return None
+    else:
+        store_ref_entry = False
+
+    parsed_key = (ref_key, ref_entry["content_sha256"])
+    if cacheable:
+        with _parsed_package_configs_lock:
+            package_config = _parsed_package_configs.get(parsed_key)
+        if package_config is not None:
+            return copy.deepcopy(package_config)
+
+    if content is None:
+        content = package_config_contents_cache.get(ref_entry["content_sha256"])
+        if content is MISSING:
+            # the content expired sooner than the reference to it
+            package_config_refs_cache.delete(ref_key)
+            return get_cached_package_config_from_repo(project, ref, package_config_path)
+
+    def search_specfile(**kwargs) -> Optional[str]:
+        nonlocal store_ref_entry
+
+        if "specfile_path" not in ref_entry:
+            ref_entry["specfile_path"] = get_specfile_path_from_repo(**kwargs)
+            store_ref_entry = True
+        return ref_entry["specfile_path"]
+
+    package_config = parse_loaded_config(
+        # parsing fills in the defaults in place
+        loaded_config=copy.deepcopy(content["loaded"]),
+        config_file_path=ref_entry["path"],
+        repo_name=project.repo,
+        search_specfile=search_specfile,
+        project=project,
+        ref=ref,
+    )
+    if not cacheable:
+        return package_config
+
+    if store_ref_entry:
+        package_config_refs_cache.set(ref_key, ref_entry)
+    with _parsed_package_configs_lock:
+        _parsed_package_configs[parsed_key] = package_config
+    return copy.deepcopy(package_config)
+
 
 class PackageConfigGetter:
     @staticmethod
@@ -43,12 +197,20 @@ class PackageConfigGetter:
             return None
 
         project_to_search_in = base_project or project
+        package_config_path = ServiceConfig.get_service_config().package_config_path_override
         try:
-            package_config: PackageConfig = get_package_config_from_repo(
-                project=project_to_search_in,
-                ref=reference,
-                package_config_path=ServiceConfig.get_service_config().package_config_path_override,
-            )
+            if reference and COMMIT_SHA_REGEX.match(reference):
+                package_config = get_cached_package_config_from_repo(
+                    project=project_to_search_in,
+                    ref=reference,
+                    package_config_path=package_config_path,
+                )
+            else:
+                package_config = get_package_config_from_repo(
+                    project=project_to_search_in,
+                    ref=reference,
+                    package_config_path=package_config_path,
+                )
             if not package_config and fail_when_missing:
                 raise PackitMissingConfigException(
                     f"No config file for packit (e.g. `.packit.yaml`) found in "
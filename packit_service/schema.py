@@ -98,6 +98,11 @@ class ServiceConfigSchema(UserConfigSchema):
     appcode = fields.String()
     fedora_ci = fields.Nested(FedoraCISettingsSchema, missing=None)
     rate_limit_threshold = fields.Integer(missing=None)
+    sync_release_concurrency = fields.Integer(missing=1)
+    koji_build_concurrency = fields.Integer(missing=1)
+    bodhi_update_concurrency = fields.Integer(missing=1)
+    repository_mirror_cache = fields.String(missing=None)
+    repository_mirror_cache_size = fields.Integer(missing=20)
     fedora_ci_run_by_default = fields.Bool(missing=False)
     logdetective_enabled = fields.Bool(missing=False, default=False)
     logdetective_url = fields.String()
@@ -11,10 +11,11 @@ from packit_service.models import (
     CoprBuildTargetModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import get_page, pagination_arguments
 from packit_service.service.api.utils import (
     get_log_detective_runs,
     get_project_info_from_build,
+    paginated_response_maker,
     response_maker,
 )
 
@@ -35,8 +36,11 @@ class CoprBuildsList(Resource):
 
         result = []
 
-        first, last = indices()
-        for build in CoprBuildTargetModel.get_merged_chroots(first, last):
+        page = get_page()
+        builds = list(
+            CoprBuildTargetModel.get_merged_chroots(page.first, page.last, after=page.after),
+        )
+        for build in builds:
             build_info = CoprBuildTargetModel.get_by_build_id(build.build_id, None)
             project_info = build_info.get_project()
             build_dict = {
@@ -64,12 +68,12 @@ class CoprBuildsList(Resource):
 
             result.append(build_dict)
 
-        resp = response_maker(
+        return paginated_response_maker(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "copr-builds",
+            page,
+            next_after=builds[-1].new_id if builds else None,
         )
-        resp.headers["Content-Range"] = f"copr-builds {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<int:id>")
@@ -12,10 +12,11 @@ from packit_service.models import (
     KojiBuildTargetModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import get_page, pagination_arguments
 from packit_service.service.api.utils import (
     get_log_detective_runs,
     get_project_info_from_build,
+    paginated_response_maker,
     response_maker,
 )
 
@@ -33,10 +34,15 @@ class KojiBuildsList(Resource):
         scratch = (
             request.args.get("scratch").lower() == "true" if "scratch" in request.args else None
         )
-        first, last = indices()
+        page = get_page()
         result = []
 
-        for build in KojiBuildTargetModel.get_range(first, last, scratch):
+        for build in KojiBuildTargetModel.get_range(
+            page.first,
+            page.last,
+            scratch,
+            after=page.after,
+        ):
             build_dict = {
                 "packit_id": build.id,
                 "task_id": build.task_id,
@@ -59,12 +65,14 @@ class KojiBuildsList(Resource):
 
             result.append(build_dict)
 
-        resp = response_maker(
+        return paginated_response_maker(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "koji-builds",
+            page,
+            next_after=result[-1]["packit_id"] if result else None,
+            # the total of all the builds is not the one of the (non-)scratch ones
+            model=KojiBuildTargetModel if scratch is None else None,
         )
-        resp.headers["Content-Range"] = f"koji-builds {first + 1}-{last}/*"
-        return resp
 
 
 @koji_builds_ns.route("/<int:id>")
@@ -1,8 +1,15 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any, NamedTuple, Optional
+
 from flask import request
-from flask_restx import reqparse
+from flask_restx import abort, inputs, reqparse
 
 DEFAULT_PAGE = 1
 DEFAULT_PER_PAGE = 10
@@ -23,6 +30,38 @@ pagination_arguments.add_argument(
     default=DEFAULT_PER_PAGE,
     help="Results per page",
 )
+pagination_arguments.add_argument(
+    "cursor",
+    type=str,
+    required=False,
+    help="Cursor of the next page from the 'Link' header of the previous one, "
+    "faster than 'page' for deep pages",
+)
+pagination_arguments.add_argument(
+    "with_total",
+    type=inputs.boolean,
+    required=False,
+    default=False,
+    help="Include the approximate total number of results in 'Content-Range' if available",
+)
+
+
+class Page(NamedTuple):
+    """
+    Requested page of a list.
+
+    Attributes:
+        first: Index of the first entry.
+        last: Index after the last entry.
+        after: Key of the last entry of the previous page if requested
+            by a cursor, `None` if requested by the page number.
+        with_total: Whether the total number of entries was requested.
+    """
+
+    first: int
+    last: int
+    after: Optional[Any]
+    with_total: bool
 
 
 def indices():
@@ -35,3 +74,35 @@ def indices():
     first = (page - 1) * per_page
     last = page * per_page
     return first, last
+
+
+def encode_cursor(first: int, after: Any) -> str:
+    """Encode the index of the first entry of a page and the key of the entry
+    preceding it into an opaque cursor."""
+    return urlsafe_b64encode(json.dumps([first, after]).encode()).decode()
+
+
+def get_page(key: Callable[[Any], Any] = int) -> Page:
+    """
+    Return the page requested by the request arguments, either by the page
+    number or by a cursor.
+
+    Args:
+        key: Converts the key decoded from the cursor, raising `IndexError`,
+            `KeyError`, `TypeError` or `ValueError` if it is not valid.
+
+    Returns:
+        Requested page.
+    """
+    args = pagination_arguments.parse_args(request)
+    if not args.get("cursor"):
+        first, last = indices()
+        return Page(first, last, None, args["with_total"])
+
+    try:
+        first, after = json.loads(urlsafe_b64decode(args["cursor"]))
+        first, after = int(first), key(after)
+    except (BinasciiError, IndexError, KeyError, TypeError, ValueError):
+        abort(HTTPStatus.BAD_REQUEST, "Invalid cursor")
+    per_page = args.get("per_page", DEFAULT_PER_PAGE)
+    return Page(first, first + per_page, after, args["with_total"])
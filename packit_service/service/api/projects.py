@@ -1,14 +1,15 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+from collections.abc import Iterable
 from http import HTTPStatus
 from logging import getLogger
 
 from flask_restx import Namespace, Resource
 
 from packit_service.models import GitProjectModel
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import response_maker
+from packit_service.service.api.parsers import get_page, indices, pagination_arguments
+from packit_service.service.api.utils import paginated_response_maker, response_maker
 from packit_service.service.urls import get_srpm_build_info_url
 
 logger = getLogger("packit_service")
@@ -19,6 +20,24 @@ ns = Namespace(
 )
 
 
+def get_projects_info(projects: Iterable[GitProjectModel]) -> list[dict]:
+    """
+    Get the info about the projects, the numbers of the handled
+    pull requests, branches, releases and issues are counted by a single query.
+    """
+    projects = list(projects)
+    counts = GitProjectModel.get_handled_counts(tuple(project.id for project in projects))
+    return [
+        {
+            "namespace": project.namespace,
+            "repo_name": project.repo_name,
+            "project_url": project.project_url,
+            **counts[project.id],
+        }
+        for project in projects
+    ]
+
+
 @ns.route("")
 class ProjectsList(Resource):
     @ns.expect(pagination_arguments)
@@ -27,27 +46,18 @@ class ProjectsList(Resource):
     def get(self):
         """List all GitProjects"""
 
-        result = []
-        first, last = indices()
+        page = get_page(key=lambda key: (str(key[0]), int(key[1])))
+        projects = list(GitProjectModel.get_range(page.first, page.last, after=page.after))
+        result = get_projects_info(projects)
 
-        for project in GitProjectModel.get_range(first, last):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
-
-        resp = response_maker(
+        return paginated_response_maker(
             result,
+            "git-projects",
+            page,
+            next_after=[projects[-1].namespace, projects[-1].id] if projects else None,
+            model=GitProjectModel,
             status=HTTPStatus.PARTIAL_CONTENT if result else HTTPStatus.OK,
         )
-        resp.headers["Content-Range"] = f"git-projects {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<forge>/<path:namespace>/<repo_name>")
@@ -64,16 +74,7 @@ class ProjectInfo(Resource):
                 {"error": "No info about project stored in DB"},
                 status=HTTPStatus.NOT_FOUND,
             )
-        project_info = {
-            "namespace": project.namespace,
-            "repo_name": project.repo_name,
-            "project_url": project.project_url,
-            "prs_handled": len(project.pull_requests),
-            "branches_handled": len(project.branches),
-            "releases_handled": len(project.releases),
-            "issues_handled": len(project.issues),
-        }
-        return response_maker(project_info)
+        return response_maker(get_projects_info([project])[0])
 
 
 @ns.route("/<forge>")
@@ -85,20 +86,8 @@ class ProjectsForge(Resource):
     def get(self, forge):
         """List of projects of given forge (e.g. github.com, gitlab.com)"""
 
-        result = []
         first, last = indices()
-
-        for project in GitProjectModel.get_by_forge(first, last, forge):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+        result = get_projects_info(GitProjectModel.get_by_forge(first, last, forge))
 
         resp = response_maker(
             result,
@@ -116,25 +105,10 @@ class ProjectsNamespace(Resource):
     @ns.response(HTTPStatus.OK.value, "Projects details follow")
     def get(self, forge, namespace):
         """List of projects of given forge and namespace"""
-        result = []
         first, last = indices()
-
-        for project in GitProjectModel.get_by_forge_namespace(
-            first,
-            last,
-            forge,
-            namespace,
-        ):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+        result = get_projects_info(
+            GitProjectModel.get_by_forge_namespace(first, last, forge, namespace),
+        )
 
         resp = response_maker(
             result,
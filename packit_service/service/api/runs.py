@@ -3,24 +3,31 @@
 
 from http import HTTPStatus
 from logging import getLogger
+from typing import Callable, Optional
 
 from flask_restx import Namespace, Resource
+from sqlalchemy.orm import selectinload
 
 from packit_service.models import (
+    AbstractProjectObjectDbType,
     BodhiUpdateGroupModel,
     BuildStatus,
     CoprBuildGroupModel,
     KojiBuildGroupModel,
     PipelineModel,
+    ProjectAndEventsConnector,
+    ProjectEventModel,
     SRPMBuildModel,
     SyncReleaseModel,
     TFTTestRunGroupModel,
     VMImageBuildTargetModel,
+    get_by_ids,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import get_page, pagination_arguments
 from packit_service.service.api.utils import (
     get_project_info_from_build,
+    paginated_response_maker,
     response_maker,
 )
 
@@ -29,7 +36,24 @@ logger = getLogger("packit_service")
 ns = Namespace("runs", description="Pipelines")
 
 
-def _add_sync_release(run: SyncReleaseModel, response_dict: dict):
+class _PreloadedProjectEvent(ProjectAndEventsConnector):
+    """
+    Project event object loaded in advance so that `get_project_info_from_build`
+    does not query it again.
+    """
+
+    def __init__(self, project_event_object: Optional[AbstractProjectObjectDbType]):
+        self.project_event_object = project_event_object
+
+    def get_project_event_object(self) -> Optional[AbstractProjectObjectDbType]:
+        return self.project_event_object
+
+
+def _add_sync_release(
+    run: SyncReleaseModel,
+    response_dict: dict,
+    get_trigger: Callable[[ProjectAndEventsConnector], dict],
+):
     targets = response_dict[run.job_type.value]
 
     for target in run.sync_release_targets:
@@ -43,10 +67,14 @@ def _add_sync_release(run: SyncReleaseModel, response_dict: dict):
 
     if "trigger" not in response_dict:
         response_dict["time_submitted"] = optional_timestamp(run.submitted_time)
-        response_dict["trigger"] = get_project_info_from_build(run)
+        response_dict["trigger"] = get_trigger(run)
 
 
-def _add_vm_image_build(run: VMImageBuildTargetModel, response_dict: dict):
+def _add_vm_image_build(
+    run: VMImageBuildTargetModel,
+    response_dict: dict,
+    get_trigger: Callable[[ProjectAndEventsConnector], dict],
+):
     response_dict["vm_image_build"].append(
         {
             "packit_id": run.id,
@@ -56,24 +84,97 @@ def _add_vm_image_build(run: VMImageBuildTargetModel, response_dict: dict):
     )
     if "trigger" not in response_dict:
         response_dict["time_submitted"] = optional_timestamp(run.submitted_time)
-        response_dict["trigger"] = get_project_info_from_build(run)
+        response_dict["trigger"] = get_trigger(run)
 
 
 def flatten_and_remove_none(ids):
     return filter(None, (arr[0] for arr in ids))
 
 
+GROUP_MODELS = (
+    ("copr", CoprBuildGroupModel, "copr_build_group_id", CoprBuildGroupModel.copr_build_targets),
+    ("koji", KojiBuildGroupModel, "koji_build_group_id", KojiBuildGroupModel.koji_build_targets),
+    (
+        "test_run",
+        TFTTestRunGroupModel,
+        "test_run_group_id",
+        TFTTestRunGroupModel.tft_test_run_targets,
+    ),
+    (
+        "bodhi_update",
+        BodhiUpdateGroupModel,
+        "bodhi_update_group_id",
+        BodhiUpdateGroupModel.bodhi_update_targets,
+    ),
+)
+
+
 def process_runs(runs):
     """
     Process `PipelineModel`s and construct a JSON that is returned from the endpoints
     that return merged chroots.
 
+    The referenced builds, tests and project event objects of all the pipelines
+    are loaded in advance with a constant number of queries.
+
     Args:
         runs: Iterator over merged `PipelineModel`s.
 
     Returns:
         List of JSON objects where each represents pipelines run on single SRPM.
     """
+    runs = list(runs)
+
+    def get_ids(column: str) -> set[int]:
+        return {
+            id_ for pipeline in runs for id_ in flatten_and_remove_none(getattr(pipeline, column))
+        }
+
+    def get_by_ids_with_runs(model, ids, *options) -> dict:
+        return get_by_ids(
+            model,
+            ids,
+            selectinload(model.runs).selectinload(PipelineModel.project_event),
+            *options,
+        )
+
+    srpm_builds = get_by_ids_with_runs(
+        SRPMBuildModel,
+        {pipeline.srpm_build_id for pipeline in runs if pipeline.srpm_build_id},
+    )
+    groups = {
+        Model: get_by_ids_with_runs(Model, get_ids(column), selectinload(targets))
+        for _, Model, column, targets in GROUP_MODELS
+    }
+    sync_releases = get_by_ids_with_runs(
+        SyncReleaseModel,
+        {
+            sync_release[0]
+            for pipeline in runs
+            if (sync_release := list(flatten_and_remove_none(pipeline.sync_release_run_id)))
+        },
+        selectinload(SyncReleaseModel.sync_release_targets),
+    )
+    vm_image_builds = get_by_ids_with_runs(
+        VMImageBuildTargetModel,
+        get_ids("vm_image_build_id"),
+    )
+
+    project_event_objects = ProjectEventModel.get_project_event_objects(
+        project_event
+        for loaded in (srpm_builds, *groups.values(), sync_releases, vm_image_builds)
+        for row in loaded.values()
+        if (project_event := row.get_project_event_model())
+    )
+
+    def get_trigger(row: ProjectAndEventsConnector) -> dict:
+        project_event = row.get_project_event_model()
+        return get_project_info_from_build(
+            _PreloadedProjectEvent(
+                project_event_objects.get(project_event.id) if project_event else None,
+            ),
+        )
+
     result = []
 
     for pipeline in runs:
@@ -89,7 +190,7 @@ def process_runs(runs):
             "vm_image_build": [],
         }
 
-        if srpm_build := SRPMBuildModel.get_by_id(pipeline.srpm_build_id):
+        if srpm_build := srpm_builds.get(pipeline.srpm_build_id):
             response_dict["srpm"] = {
                 "packit_id": srpm_build.id,
                 "status": srpm_build.status,
@@ -97,16 +198,12 @@ def process_runs(runs):
             response_dict["time_submitted"] = optional_timestamp(
                 srpm_build.submitted_time,
             )
-            response_dict["trigger"] = get_project_info_from_build(srpm_build)
+            response_dict["trigger"] = get_trigger(srpm_build)
 
-        for model_type, Model, packit_ids in (
-            ("copr", CoprBuildGroupModel, pipeline.copr_build_group_id),
-            ("koji", KojiBuildGroupModel, pipeline.koji_build_group_id),
-            ("test_run", TFTTestRunGroupModel, pipeline.test_run_group_id),
-            ("bodhi_update", BodhiUpdateGroupModel, pipeline.bodhi_update_group_id),
-        ):
-            for packit_id in set(flatten_and_remove_none(packit_ids)):
-                group_row = Model.get_by_id(packit_id)
+        for model_type, Model, column, _ in GROUP_MODELS:
+            for packit_id in set(flatten_and_remove_none(getattr(pipeline, column))):
+                if not (group_row := groups[Model].get(packit_id)):
+                    continue
                 for row in group_row.grouped_targets:
                     if row.status == BuildStatus.waiting_for_srpm:
                         continue
@@ -121,23 +218,20 @@ def process_runs(runs):
                         response_dict["time_submitted"] = optional_timestamp(
                             row.submitted_time,
                         )
-                        response_dict["trigger"] = get_project_info_from_build(row)
+                        response_dict["trigger"] = get_trigger(group_row)
 
         # handle propose-downstream and pull-from-upstream
-        if sync_release := list(flatten_and_remove_none(pipeline.sync_release_run_id)):
-            _add_sync_release(
-                SyncReleaseModel.get_by_id(sync_release[0]),
-                response_dict,
-            )
+        if (sync_release := list(flatten_and_remove_none(pipeline.sync_release_run_id))) and (
+            sync_release_run := sync_releases.get(sync_release[0])
+        ):
+            _add_sync_release(sync_release_run, response_dict, get_trigger)
 
         # handle VM image builds
         for vm_image_build_id in set(
             flatten_and_remove_none(pipeline.vm_image_build_id),
         ):
-            _add_vm_image_build(
-                VMImageBuildTargetModel.get_by_id(vm_image_build_id),
-                response_dict,
-            )
+            if vm_image_build := vm_image_builds.get(vm_image_build_id):
+                _add_vm_image_build(vm_image_build, response_dict, get_trigger)
 
         result.append(response_dict)
 
@@ -150,14 +244,14 @@ class RunsList(Resource):
     @ns.response(HTTPStatus.PARTIAL_CONTENT.value, "List of runs follows")
     def get(self):
         """List all runs."""
-        first, last = indices()
-        result = process_runs(PipelineModel.get_merged_chroots(first, last))
-        resp = response_maker(
-            result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+        page = get_page()
+        runs = list(PipelineModel.get_merged_chroots(page.first, page.last, after=page.after))
+        return paginated_response_maker(
+            process_runs(runs),
+            "runs",
+            page,
+            next_after=runs[-1].merged_id if runs else None,
         )
-        resp.headers["Content-Range"] = f"runs {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/merged/<int:id>")
@@ -7,8 +7,12 @@ from logging import getLogger
 from flask_restx import Namespace, Resource
 
 from packit_service.models import SRPMBuildModel, optional_timestamp
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import get_page, pagination_arguments
+from packit_service.service.api.utils import (
+    get_project_info_from_build,
+    paginated_response_maker,
+    response_maker,
+)
 from packit_service.service.urls import get_srpm_build_info_url
 
 logger = getLogger("packit_service")
@@ -25,8 +29,8 @@ class SRPMBuildsList(Resource):
 
         result = []
 
-        first, last = indices()
-        for build in SRPMBuildModel.get_range(first, last):
+        page = get_page()
+        for build in SRPMBuildModel.get_range(page.first, page.last, after=page.after):
             build_dict = {
                 "srpm_build_id": build.id,
                 "status": build.status,
@@ -44,12 +48,13 @@ class SRPMBuildsList(Resource):
 
             result.append(build_dict)
 
-        resp = response_maker(
+        return paginated_response_maker(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "srpm-builds",
+            page,
+            next_after=result[-1]["srpm_build_id"] if result else None,
+            model=SRPMBuildModel,
         )
-        resp.headers["Content-Range"] = f"srpm-builds {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<int:id>")
@@ -21,14 +21,15 @@ from packit_service.constants import (
 )
 from packit_service.models import (
     CoprBuildGroupModel,
-    GitProjectModel,
     KojiBuildGroupModel,
     ProjectEventModelType,
     SRPMBuildModel,
     SyncReleaseModel,
     TFTTestRunGroupModel,
     VMImageBuildTargetModel,
+    get_top_projects,
     get_usage_data,
+    get_usage_numbers,
 )
 from packit_service.service.api.utils import response_maker
 from packit_service.service.tasks import (
@@ -54,6 +55,10 @@ class Usage(Resource):
         (e.g. `/api/usage?from=2022-01-30`).
         Also, you can use `top` argument to specify number of project
         in the top_projects_by_something parts of the response.
+
+        A job is counted in the period of its first pipeline only, i.e. a job
+        reused by a pipeline from the period is not counted if it was first
+        run before the period.
         """
 
         top = int(request.args.get("top")) if "top" in request.args else None
@@ -259,6 +264,11 @@ def get_project_usage_data(project: str, datetime_from=None, datetime_to=None):
         position: 1
     ```
     """
+    events, jobs_numbers, _ = get_usage_numbers(
+        datetime_from=datetime_from,
+        datetime_to=datetime_to,
+    )
+
     jobs: dict[str, Any] = {}
     for job_model in [
         SRPMBuildModel,
@@ -271,12 +281,7 @@ def get_project_usage_data(project: str, datetime_from=None, datetime_to=None):
         job_name: str = job_model.__tablename__  # type: ignore
         jobs[job_name] = get_result_dictionary(
             project,
-            top_projects=GitProjectModel.get_job_usage_numbers_all_project_events(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                top=None,
-                job_result_model=job_model,
-            ),
+            top_projects=get_top_projects(jobs_numbers[job_name].values()),
             count_name="job_runs",
         )
 
@@ -284,34 +289,19 @@ def get_project_usage_data(project: str, datetime_from=None, datetime_to=None):
         for project_event_type in ProjectEventModelType:
             jobs[job_name]["per_event"][project_event_type.value] = get_result_dictionary(
                 project,
-                top_projects=GitProjectModel.get_job_usage_numbers(
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to,
-                    top=None,
-                    job_result_model=job_model,
-                    project_event_type=project_event_type,
-                ),
+                top_projects=jobs_numbers[job_name][project_event_type],
                 count_name="job_runs",
             )
 
     events_handled: dict[str, Any] = get_result_dictionary(
         project=project,
-        top_projects=GitProjectModel.get_active_projects_usage_numbers(
-            datetime_from=datetime_from,
-            datetime_to=datetime_to,
-            top=None,
-        ),
+        top_projects=get_top_projects(events.values()),
         count_name="events_handled",
     )
     events_handled["per_event"] = {
         project_event_type.value: get_result_dictionary(
             project=project,
-            top_projects=GitProjectModel.get_project_event_usage_numbers(
-                datetime_from=datetime_from,
-                datetime_to=datetime_to,
-                top=None,
-                project_event_type=project_event_type,
-            ),
+            top_projects=events[project_event_type],
             count_name="events_handled",
         )
         for project_event_type in ProjectEventModelType
@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: MIT
 
 from http import HTTPStatus
-from typing import Any, Union
+from typing import Any, Optional, Union
+from urllib.parse import urlencode
 
+from flask import request
 from flask.json import jsonify
 
 from packit_service.models import (
@@ -16,14 +18,17 @@ from packit_service.models import (
     KojiBuildTargetModel,
     LogDetectiveRunGroupModel,
     LogDetectiveRunModel,
+    ProjectAndEventsConnector,
     SRPMBuildModel,
     SyncReleaseModel,
     SyncReleaseTargetModel,
     TFTTestRunGroupModel,
     TFTTestRunTargetModel,
     VMImageBuildTargetModel,
+    get_estimated_count,
     optional_timestamp,
 )
+from packit_service.service.api.parsers import Page, encode_cursor
 
 
 def response_maker(result: Any, status: HTTPStatus = HTTPStatus.OK):
@@ -33,6 +38,42 @@ def response_maker(result: Any, status: HTTPStatus = HTTPStatus.OK):
     return resp
 
 
+def paginated_response_maker(
+    result: list,
+    unit: str,
+    page: Page,
+    next_after: Any = None,
+    model: Optional[type] = None,
+    status: HTTPStatus = HTTPStatus.PARTIAL_CONTENT,
+):
+    """
+    Wrap a page of a list into a response with the 'Content-Range' header
+    and the 'Link' header pointing to the next page.
+
+    Args:
+        result: Entries on the page.
+        unit: Unit of the 'Content-Range' header.
+        page: Requested page.
+        next_after: Key of the last entry on the page, used by the cursor
+            of the next page.
+        model: Model of the listed table, its approximate number of rows
+            is used as the total if requested.
+        status: Status of the response.
+    """
+    resp = response_maker(result, status=status)
+
+    total = get_estimated_count(model) if page.with_total and model else None
+    resp.headers["Content-Range"] = (
+        f"{unit} {page.first + 1}-{page.last}/{'*' if total is None else total}"
+    )
+
+    if next_after is not None and len(result) == page.last - page.first:
+        args = {arg: value for arg, value in request.args.items() if arg not in ("page", "cursor")}
+        args["cursor"] = encode_cursor(page.last, next_after)
+        resp.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    return resp
+
+
 def get_project_info_from_build(
     build: Union[
         SRPMBuildModel,
@@ -47,6 +88,8 @@ def get_project_info_from_build(
         VMImageBuildTargetModel,
         LogDetectiveRunModel,
         LogDetectiveRunGroupModel,
+        # e.g. a project event loaded in advance
+        ProjectAndEventsConnector,
     ],
 ) -> dict[str, Any]:
     if not (project := build.get_project()):
@@ -18,6 +18,7 @@ from prometheus_client import Counter
 from packit_service.celerizer import celery_app
 from packit_service.config import ServiceConfig
 from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME, GITLAB_ISSUE
+from packit_service.forge_cache import invalidate_from_github_webhook
 from packit_service.models import ProjectAuthenticationIssueModel
 from packit_service.service.api.errors import ValidationFailed
 
@@ -90,6 +91,8 @@ class GithubWebhook(Resource):
             ).inc()
             return str(exc), HTTPStatus.UNAUTHORIZED
 
+        invalidate_from_github_webhook(request.headers.get("X-GitHub-Event"), msg)
+
         if not self.interested():
             github_webhook_calls.labels(
                 result="not_interested",
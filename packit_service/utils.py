@@ -417,7 +417,21 @@ def pr_labels_match_configuration(
         f"(label.present: {configured_labels_present}, label.absent: {configured_labels_absent})",
     )
 
-    pr_labels = [label.name for label in pull_request.labels]
+    return labels_match_configuration(
+        pr_labels=[label.name for label in pull_request.labels],
+        configured_labels_present=configured_labels_present,
+        configured_labels_absent=configured_labels_absent,
+    )
+
+
+def labels_match_configuration(
+    pr_labels: list[str],
+    configured_labels_present: list[str],
+    configured_labels_absent: list[str],
+) -> bool:
+    """
+    Do the already fetched PR labels match the configuration of the labels?
+    """
     logger.info(f"Labels on PR: {pr_labels}")
 
     return (
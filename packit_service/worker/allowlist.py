@@ -2,10 +2,12 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import threading
 from collections.abc import Iterable
 from typing import Any, Callable, Optional, Union
 from urllib.parse import urlparse
 
+from cachetools import TTLCache
 from fasjson_client import Client
 from fasjson_client.errors import APIError
 from ogr.abstract import GitProject
@@ -13,6 +15,7 @@ from packit.api import PackitAPI
 from packit.config.job_config import JobConfig, JobType
 from packit.exceptions import PackitCommandFailedError, PackitException
 
+from packit_service.cache import register_local_cache
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     DENIED_MSG,
@@ -55,6 +58,90 @@ UncheckedEvent = Union[
 ]
 
 
+# rebuild the trie even if no change was announced (e.g. while Redis was down)
+ALLOWLIST_TRIE_MAX_AGE = 10 * 60
+
+
+class AllowlistTrie:
+    """
+    Prefix tree of the allowlist entries keyed by the segments of the namespaces
+    (`forge host/namespace/[subgroups/]repository.git`).
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, AllowlistStatus]]):
+        self._root: dict = {}
+        for namespace, status in entries:
+            if not namespace:
+                continue
+            node = self._root
+            for segment in namespace.split("/"):
+                node = node.setdefault(segment, {})
+            # `None` can't clash with a segment
+            node[None] = AllowlistStatus(status)
+
+    def get_path_statuses(self, namespace: str) -> list[Optional[AllowlistStatus]]:
+        """
+        Get statuses of the namespace and its parents.
+
+        Args:
+            namespace: Namespace in format `example.com/namespace/repository.git`.
+
+        Returns:
+            Statuses of the namespace and of its parents, from the namespace
+            up to the forge, `None` for those not in the allowlist.
+        """
+        statuses: list[Optional[AllowlistStatus]] = []
+        node: Optional[dict] = self._root
+        for segment in namespace.split("/"):
+            node = node.get(segment) if node is not None else None
+            statuses.append(node.get(None) if node is not None else None)
+        return statuses[::-1]
+
+
+# generation -> trie, process-local only
+_allowlist_tries: TTLCache = register_local_cache(
+    TTLCache(maxsize=1, ttl=ALLOWLIST_TRIE_MAX_AGE),
+)
+_allowlist_tries_lock = threading.Lock()
+
+
+def get_allowlist_trie() -> Optional[AllowlistTrie]:
+    """
+    Get the trie of the current allowlist, rebuilding it when the allowlist changed.
+
+    Returns:
+        Trie or `None` if the changes can't be tracked (Redis is not available).
+    """
+    if (generation := AllowlistModel.get_generation()) is None:
+        return None
+
+    with _allowlist_tries_lock:
+        if (trie := _allowlist_tries.get(generation)) is None:
+            logger.debug(f"Loading the allowlist (generation {generation}).")
+            # the generation is read before the entries, so a concurrent change
+            # leads to another rebuild
+            trie = _allowlist_tries[generation] = AllowlistTrie(AllowlistModel.get_statuses())
+        return trie
+
+
+def get_path_statuses(namespace: str) -> Iterable[Optional[AllowlistStatus]]:
+    """
+    Get statuses of the namespace and its parents, from the namespace up to the forge.
+
+    Uses the in-memory trie of the allowlist, or queries the entries one by one
+    if the changes of the allowlist can't be tracked.
+    """
+    if trie := get_allowlist_trie():
+        yield from trie.get_path_statuses(namespace)
+        return
+
+    separated_path = [namespace, None]
+    while len(separated_path) > 1:
+        matching_namespace = AllowlistModel.get_namespace(separated_path[0])
+        yield AllowlistStatus(matching_namespace.status) if matching_namespace else None
+        separated_path = separated_path[0].rsplit("/", 1)
+
+
 class Allowlist:
     def __init__(self, service_config: ServiceConfig):
         self.service_config = service_config
@@ -183,17 +270,12 @@ class Allowlist:
         if not namespace:
             return False
 
-        separated_path = [namespace, None]
-        while len(separated_path) > 1:
-            if matching_namespace := AllowlistModel.get_namespace(separated_path[0]):
-                status = AllowlistStatus(matching_namespace.status)
-                if status != AllowlistStatus.waiting:
-                    return status in (
-                        AllowlistStatus.approved_automatically,
-                        AllowlistStatus.approved_manually,
-                    )
-
-            separated_path = separated_path[0].rsplit("/", 1)
+        for status in get_path_statuses(namespace):
+            if status and status != AllowlistStatus.waiting:
+                return status in (
+                    AllowlistStatus.approved_automatically,
+                    AllowlistStatus.approved_manually,
+                )
 
         logger.info(f"Could not find approved entry for: {namespace}")
         return False
@@ -213,21 +295,19 @@ class Allowlist:
         if not namespace:
             return False
 
-        separated_path = [namespace, None]
-        while len(separated_path) > 1:
-            if matching_namespace := AllowlistModel.get_namespace(separated_path[0]):
-                status = AllowlistStatus(matching_namespace.status)
-                if status == AllowlistStatus.denied:
-                    logger.info(f"Namespace {namespace} is denied.")
-                    return True
-
-            separated_path = separated_path[0].rsplit("/", 1)
+        for status in get_path_statuses(namespace):
+            if status == AllowlistStatus.denied:
+                logger.info(f"Namespace {namespace} is denied.")
+                return True
 
         logger.info(f"Could not find denied entry for: {namespace}")
         return False
 
     @staticmethod
     def is_denied(namespace: str) -> bool:
+        if trie := get_allowlist_trie():
+            return trie.get_path_statuses(namespace)[0] == AllowlistStatus.denied
+
         model = AllowlistModel.get_namespace(namespace)
         return bool(model) and model.status == AllowlistStatus.denied
 
@@ -12,6 +12,7 @@ from packit_service.events import (
     koji,
     pagure,
 )
+from packit_service.forge_cache import has_write_access
 from packit_service.worker.checker.abstract import (
     ActorChecker,
     Checker,
@@ -117,7 +118,7 @@ class HasIssueCommenterRetriggeringPermissions(ActorChecker, ConfigFromEventMixi
     """
 
     def _pre_check(self) -> bool:
-        has_write_access = self.project.has_write_access(user=self.actor)
+        write_access = has_write_access(self.project, user=self.actor)
         if self.data.event_type in (
             github.issue.Comment.event_type(),
             gitlab.issue.Comment.event_type(),
@@ -127,7 +128,7 @@ class HasIssueCommenterRetriggeringPermissions(ActorChecker, ConfigFromEventMixi
                 f"repo {self.project_url} and issue {self.data.issue_id} "
                 f"by {self.actor}.",
             )
-            if not has_write_access:
+            if not write_access:
                 msg = (
                     f"Re-triggering Bodhi update through comment in "
                     f"repo **{self.project_url}** and issue **{self.data.issue_id}** "
@@ -152,7 +153,7 @@ class HasIssueCommenterRetriggeringPermissions(ActorChecker, ConfigFromEventMixi
                 f"repo {self.project_url} and #PR {self.data.pr_id} "
                 f"by {self.actor}.",
             )
-            if not has_write_access:
+            if not write_access:
                 msg = (
                     f"Re-triggering Bodhi update via dist-git comment in "
                     f"**PR#{self.data.pr_id}** and project **{self.project.repo}** "
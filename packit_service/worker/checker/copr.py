@@ -7,6 +7,7 @@ from packit_service.constants import (
     INTERNAL_TF_BUILDS_AND_TESTS_NOT_ALLOWED,
 )
 from packit_service.events import gitlab
+from packit_service.forge_cache import can_merge_pr
 from packit_service.worker.checker.abstract import (
     ActorChecker,
     Checker,
@@ -127,7 +128,7 @@ class CanActorRunTestsJob(
                 test_job
                 and test_job.use_internal_tf
                 and not test_job.skip_build
-                and not self.project.can_merge_pr(self.actor)
+                and not can_merge_pr(self.project, self.actor)
                 and self.actor not in self.service_config.admins
             ):
                 self.copr_build_helper.report_status_to_build(
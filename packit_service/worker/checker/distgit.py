@@ -17,8 +17,10 @@ from packit_service.events import (
     pagure,
 )
 from packit_service.fedora_ci_config import FedoraCIConfig
+from packit_service.forge_cache import has_write_access
 from packit_service.utils import (
     get_packit_commands_from_comment,
+    labels_match_configuration,
     pr_labels_match_configuration,
 )
 from packit_service.worker.checker.abstract import ActorChecker, Checker
@@ -44,6 +46,14 @@ class LabelsOnDistgitPR(Checker, GetPagurePullRequestMixin):
         ):
             return True
 
+        if (pr_labels := self.data.pr_labels) is not None:
+            # fetched when dispatching the event
+            return labels_match_configuration(
+                pr_labels=pr_labels,
+                configured_labels_present=self.job_config.require.label.present,
+                configured_labels_absent=self.job_config.require.label.absent,
+            )
+
         return pr_labels_match_configuration(
             self.pull_request,
             self.job_config.require.label.present,
@@ -216,7 +226,7 @@ class HasIssueCommenterRetriggeringPermissions(ActorChecker):
                 f"repo {self.project.repo} and issue {self.data.issue_id} "
                 f"by {self.actor}.",
             )
-            if not self.project.has_write_access(user=self.actor):
+            if not has_write_access(self.project, user=self.actor):
                 msg = (
                     f"Re-triggering downstream koji-build through comment in "
                     f"repo **{self.project_url}** and issue **{self.data.issue_id}** "
@@ -5,6 +5,8 @@ from enum import Enum
 
 from ogr.abstract import AccessLevel, GitProject
 
+from packit_service.forge_cache import get_group_members
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,8 +58,9 @@ class DistgitAccountsChecker:
                 try:
                     # remove @
                     group_name = value[1:]
-                    group = self.project.service.get_group(group_name)
-                    all_accounts.update(group.members)
+                    all_accounts.update(
+                        get_group_members(self.project.service, group_name),
+                    )
                 except Exception as ex:
                     logger.debug(
                         f"Exception while getting the members of group {value}: {ex!r}",
@@ -10,6 +10,7 @@ from packit_service.constants import (
     PERMISSIONS_ERROR_WRITE_OR_ADMIN,
 )
 from packit_service.events import github, gitlab
+from packit_service.forge_cache import can_merge_pr
 from packit_service.models import SidetagModel
 from packit_service.worker.checker.abstract import Checker
 from packit_service.worker.handlers.mixin import GetKojiBuildJobHelperMixin
@@ -41,7 +42,7 @@ class PermissionOnKoji(Checker, GetKojiBuildJobHelperMixin):
             github.pr.Action.event_type(),
             gitlab.mr.Action.event_type(),
         ):
-            user_can_merge_pr = self.project.can_merge_pr(self.data.actor)
+            user_can_merge_pr = can_merge_pr(self.project, self.data.actor)
             if not (user_can_merge_pr or self.data.actor in self.service_config.admins):
                 self.koji_build_helper.report_status_to_all(
                     description=PERMISSIONS_ERROR_WRITE_OR_ADMIN,
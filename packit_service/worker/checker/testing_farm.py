@@ -14,6 +14,7 @@ from packit_service.constants import (
     KojiTaskState,
 )
 from packit_service.events import gitlab, testing_farm
+from packit_service.forge_cache import can_merge_pr
 from packit_service.models import TFTTestRunTargetModel
 from packit_service.worker.checker.abstract import (
     ActorChecker,
@@ -132,7 +133,7 @@ class CanActorRunJob(ActorChecker, GetTestingFarmJobHelperMixin):
         )
         if (
             (self.job_config.use_internal_tf or any_internal_test_job_build_required)
-            and not self.project.can_merge_pr(self.actor)
+            and not can_merge_pr(self.project, self.actor)
             and self.actor not in self.service_config.admins
         ):
             message = (
@@ -4,6 +4,7 @@
 import logging
 
 from packit_service.constants import DOCS_VM_IMAGE_BUILD
+from packit_service.forge_cache import has_write_access
 from packit_service.models import (
     VMImageBuildStatus,
 )
@@ -96,7 +97,7 @@ class IsCoprBuildForChrootOk(Checker, GetVMImageBuildReporterFromJobHelperMixin)
 
 class HasAuthorWriteAccess(ActorChecker, GetVMImageBuildReporterFromJobHelperMixin):
     def _pre_check(self) -> bool:
-        if not self.project.has_write_access(user=self.actor):
+        if not has_write_access(self.project, user=self.actor):
             msg = (
                 f"User {self.actor} is not allowed to build a VM Image "
                 f"for PR#{self.data.pr_id} and "
@@ -1,24 +1,39 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import timedelta
-from gzip import open as gzip_open
-from logging import DEBUG, INFO, getLogger
+import time
+import zlib
+from base64 import b64encode
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from logging import getLogger
 from os import getenv
-from pathlib import Path
-from shutil import copyfileobj
-from typing import Optional
+from subprocess import PIPE, Popen
+from threading import Thread
+from typing import Any, Optional
 
 from boto3 import client as boto3_client
-from botocore.exceptions import ClientError
-from packit.utils.commands import run_command
-from sqlalchemy import create_engine, delete, distinct, func, select, union
+from packit.exceptions import PackitCommandFailedError
+from sqlalchemy import delete, distinct, exists, func, null, select, union, update
+from sqlalchemy.sql import Select
 
 from packit_service.constants import (
+    DATABASE_BACKUP_CHUNK_SIZE,
+    DATABASE_BACKUP_PART_SIZE,
     PACKAGE_CONFIGS_OUTDATED_AFTER_DAYS,
     PIPELINES_OUTDATED_AFTER_DAYS,
+    RETENTION_BATCH_PAUSE,
+    RETENTION_BATCH_SIZE,
+    RETENTION_TIME_BUDGET,
     SRPMBUILDS_OUTDATED_AFTER_DAYS,
 )
+from packit_service.known_builds import (
+    KNOWN_BUILDS_RETENTION,
+    KnownBuildKind,
+    rebuild_known_build_ids,
+)
 from packit_service.models import (
     BodhiUpdateGroupModel,
     BodhiUpdateTargetModel,
@@ -38,6 +53,7 @@ from packit_service.models import (
     ProjectEventModelType,
     ProjectReleaseModel,
     PullRequestModel,
+    RetentionCheckpointModel,
     SRPMBuildModel,
     SyncReleaseModel,
     SyncReleasePullRequestModel,
@@ -46,6 +62,7 @@ from packit_service.models import (
     TFTTestRunTargetModel,
     VMImageBuildTargetModel,
     get_pg_url,
+    sa_session_transaction,
     sync_release_pr_association_table,
     tf_copr_association_table,
     tf_koji_association_table,
@@ -56,83 +73,181 @@ logger = getLogger(__name__)
 DB_NAME = getenv("POSTGRESQL_DATABASE")
 
 
-def discard_old_srpm_build_logs():
-    """Called periodically (see celery_config.py) to discard logs of old SRPM builds."""
+def discard_old_srpm_build_logs(time_budget: Optional[float] = RETENTION_TIME_BUDGET):
+    """Called periodically (see celery_config.py) to discard logs of old SRPM builds.
+
+    Args:
+        time_budget: Number of seconds after which the discarding stops,
+            `None` for no limit.
+    """
     logger.info("About to discard old SRPM build logs & artifact urls.")
     outdated_after_days = getenv(
         "SRPMBUILDS_OUTDATED_AFTER_DAYS",
         SRPMBUILDS_OUTDATED_AFTER_DAYS,
     )
     ago = timedelta(days=int(outdated_after_days))
-    for build in SRPMBuildModel.get_older_than(ago):
-        logger.debug(
-            f"SRPM build {build.id} is older than '{ago}'. Discarding log and artifact url.",
-        )
-        build.set_logs(None)
-        build.set_url(None)
+    step = RetentionStep(
+        name="srpm_build_logs",
+        ids=select(SRPMBuildModel.id).where(
+            SRPMBuildModel.submitted_time < datetime.now(timezone.utc) - ago,
+            SRPMBuildModel.logs.isnot(None),
+        ),
+        id_column=SRPMBuildModel.id,
+        statements=lambda ids: [
+            update(SRPMBuildModel).where(SRPMBuildModel.id.in_(ids)).values(logs=None, url=None),
+        ],
+    )
+    run_retention_step(
+        step,
+        batch_size=get_retention_batch_size(),
+        deadline=get_retention_deadline(time_budget),
+    )
 
 
-def discard_old_package_configs():
-    """Called periodically (see celery_config.py) to discard package configs of old events."""
+def discard_old_package_configs(time_budget: Optional[float] = RETENTION_TIME_BUDGET):
+    """Called periodically (see celery_config.py) to discard package configs of old events.
+
+    Args:
+        time_budget: Number of seconds after which the discarding stops,
+            `None` for no limit.
+    """
     logger.info("About to discard old package configs.")
     outdated_after_days = getenv(
         "PACKAGE_CONFIGS_OUTDATED_AFTER_DAYS",
         PACKAGE_CONFIGS_OUTDATED_AFTER_DAYS,
     )
     ago = timedelta(days=int(outdated_after_days))
-    events = ProjectEventModel.get_and_reset_older_than_with_packages_config(ago)
-    event_ids = "".join([" " + str(event.id) for event in events])
+    step = RetentionStep(
+        name="package_configs",
+        # the events with all runs older than `ago`
+        ids=select(ProjectEventModel.id).where(
+            ProjectEventModel.packages_config.isnot(null()),
+            ~exists().where(
+                PipelineModel.project_event_id == ProjectEventModel.id,
+                PipelineModel.datetime >= datetime.now(timezone.utc) - ago,  # type: ignore
+            ),
+        ),
+        id_column=ProjectEventModel.id,
+        statements=lambda ids: [
+            update(ProjectEventModel)
+            .where(ProjectEventModel.id.in_(ids))
+            .values(packages_config=null()),
+        ],
+    )
+    run_retention_step(
+        step,
+        batch_size=get_retention_batch_size(),
+        deadline=get_retention_deadline(time_budget),
+    )
+
 
-    logger.debug(
-        f"ProjectEventModels with ids [{event_ids}] have all runs older than '{ago}'. "
-        "Discarded package configs.",
+def rebuild_known_build_ids_index():
+    """Called on worker start and periodically (see celery_config.py) to rebuild
+    the index of build IDs used to filter the Copr and Koji messages."""
+    logger.info("About to rebuild the known build IDs index.")
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+        seconds=KNOWN_BUILDS_RETENTION,
     )
 
+    def with_timestamps(rows):
+        # submitted times are stored as naive UTC
+        for build_id, submitted_time in rows:
+            yield build_id, submitted_time.replace(tzinfo=timezone.utc).timestamp()
+
+    copr_build_ids = (
+        *with_timestamps(CoprBuildTargetModel.get_build_ids_submitted_since(since)),
+        *with_timestamps(SRPMBuildModel.get_copr_build_ids_submitted_since(since)),
+    )
+    rebuild_known_build_ids(
+        {
+            KnownBuildKind.copr: copr_build_ids,
+            KnownBuildKind.koji_task: with_timestamps(
+                KojiBuildTargetModel.get_task_ids_submitted_since(since),
+            ),
+        },
+    )
 
-def gzip_file(file: Path) -> Path:
-    """Gzip compress given file into {file}.gz
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip compress given stream of bytes incrementally.
 
     Args:
-        file: File to be compressed.
+        chunks: Data to be compressed.
     Returns:
-        Compressed file.
-    Raises:
-        OSError: If the 'file' can't be opened.
+        Compressed data in chunks.
     """
-    compressed_file = Path(f"{file}.gz")
-    try:
-        with (
-            file.open(mode="rb") as f_in,
-            gzip_open(
-                compressed_file,
-                mode="wb",
-            ) as f_out,
-        ):
-            logger.info(f"Compressing {file} into {compressed_file}")
-            copyfileobj(f_in, f_out)
-    except OSError as e:
-        logger.error(e)
-        raise
-    return compressed_file
+    # wbits > 16 produces the gzip container instead of the raw zlib one
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
 
 
 def upload_to_s3(
-    file: Path,
+    chunks: Iterable[bytes],
+    key: str,
     bucket: str = f"arr-packit-{getenv('DEPLOYMENT', 'dev')}",
+    part_size: int = DATABASE_BACKUP_PART_SIZE,
 ) -> None:
-    """Upload a file to an S3 bucket.
+    """Upload a stream of bytes to an S3 bucket as a multipart upload.
+
+    At most one part is kept in memory, every part is uploaded
+    with its SHA-256 checksum, which S3 verifies.
 
     Args:
-        file: File to upload.
+        chunks: Data to upload.
+        key: Name of the object to create.
         bucket: Bucket to upload to.
+        part_size: Size of all the parts but the last one.
+    Raises:
+        Any exception raised while reading `chunks` or uploading the parts,
+        the multipart upload is aborted in such case.
     """
 
     s3_client = boto3_client("s3")
+    logger.info(f"Uploading {key} to S3 ({bucket})")
+    upload_id = s3_client.create_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        ChecksumAlgorithm="SHA256",
+    )["UploadId"]
+    parts: list[dict] = []
+
+    def upload_part(data: bytes) -> None:
+        part_number = len(parts) + 1
+        checksum = b64encode(sha256(data).digest()).decode()
+        response = s3_client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+            ChecksumAlgorithm="SHA256",
+            ChecksumSHA256=checksum,
+        )
+        parts.append(
+            {"PartNumber": part_number, "ETag": response["ETag"], "ChecksumSHA256": checksum},
+        )
+
     try:
-        logger.info(f"Uploading {file} to S3 ({bucket})")
-        s3_client.upload_file(str(file), bucket, file.name)
-    except ClientError as e:
-        logger.error(e)
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= part_size:
+                upload_part(bytes(buffer[:part_size]))
+                del buffer[:part_size]
+        if buffer or not parts:
+            upload_part(bytes(buffer))
+        s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception as e:
+        logger.error(f"Failed to upload {key} to S3, aborting: {e}")
+        s3_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
         raise
 
 
@@ -141,110 +256,223 @@ def is_aws_configured() -> bool:
     return bool(getenv("AWS_ACCESS_KEY_ID") and getenv("AWS_SECRET_ACCESS_KEY"))
 
 
-def dump_to(file: Path):
-    """Dump 'packit' database into a file.
+def dump(chunk_size: int = DATABASE_BACKUP_CHUNK_SIZE) -> Iterator[bytes]:
+    """Dump 'packit' database and stream the dump in chunks.
 
-    To restore db from this file, run:
+    To restore db from the dump, run:
     psql -d packit < database_packit.sql
 
     Args:
-        file: File where to put the dump.
+        chunk_size: Maximal size of the chunks.
+    Returns:
+        The dump in chunks.
     Raises:
         PackitCommandFailedError: When pg_dump fails.
     """
     # We have to specify libpq connection string to be able to pass the
     # password to the pg_dump. Luckily get_pg_url() does almost what we need.
+    # The command is not logged to avoid leaking the password into logs.
     pg_connection = get_pg_url().replace("+psycopg2", "")
-    cmd = ["pg_dump", f"--file={file}", f"--dbname={pg_connection}"]
-    packit_logger = getLogger("packit")
-    was_debug = packit_logger.level == DEBUG
+    cmd = ["pg_dump", f"--dbname={pg_connection}"]
 
     logger.info(f"Running pg_dump to create '{DB_NAME}' database backup")
-    try:
-        if was_debug:
-            # Temporarily increase log level to avoid password leaking into logs
-            packit_logger.setLevel(INFO)
-        run_command(cmd=cmd)
-    finally:
-        if was_debug:
-            packit_logger.setLevel(DEBUG)
+    with Popen(cmd, stdout=PIPE, stderr=PIPE) as process:
+        # drain stderr in the background, pg_dump would block on a full pipe
+        stderr: list[bytes] = []
+        reader = Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)
+        reader.start()
+        try:
+            while chunk := process.stdout.read(chunk_size):
+                yield chunk
+            process.wait()
+        finally:
+            # the consumer of the dump failed
+            if process.poll() is None:
+                process.kill()
+                process.stdout.close()
+            reader.join()
+
+        if process.returncode:
+            raise PackitCommandFailedError(
+                f"pg_dump failed with exit code {process.returncode}",
+                stdout_output="",
+                stderr_output=b"".join(stderr).decode(errors="replace"),
+            )
 
 
 def backup():
-    """Dump the 'packit' database into a file, compress and upload to S3."""
+    """Dump the 'packit' database, compress and upload it to S3.
+
+    The dump is streamed from pg_dump through the compression
+    to the upload, nothing is written to the disk.
+    """
     if not is_aws_configured():
         logger.info("Not backing up database since AWS is not configured.")
         # probably dev/test deployment
         return
 
     project = getenv("PROJECT", "packit")
-    file = Path(f"/tmp/{project}_database_{DB_NAME}.sql")
-    compressed_file = None
-    try:
-        logger.info("About to backup database")
-        dump_to(file)
-        compressed_file = gzip_file(file)
-        upload_to_s3(compressed_file)
-        logger.info("Backup complete")
-    finally:
-        file.unlink(missing_ok=True)
-        if compressed_file:
-            compressed_file.unlink()
-
-
-def delete_old_data(age: Optional[str] = None):
+    logger.info("About to backup database")
+    upload_to_s3(gzip_chunks(dump()), key=f"{project}_database_{DB_NAME}.sql.gz")
+    logger.info("Backup complete")
+
+
+@dataclass
+class RetentionStep:
     """
-    Remove old data from the DB.
+    Part of the old data removal processing the rows of a single table.
+
+    Attributes:
+        name: Name of the step, identifies its checkpoint.
+        ids: Query selecting the IDs of the rows to process.
+        id_column: Column of the IDs, the rows are processed in its order.
+        statements: Returns the statements processing a batch of the IDs.
+        pause: Number of seconds to wait after each batch.
+    """
+
+    name: str
+    ids: Select
+    id_column: Any
+    statements: Callable[[list[int]], list[Any]]
+    pause: float = RETENTION_BATCH_PAUSE
+
+
+def delete_where_in(*columns) -> Callable[[list[int]], list[Any]]:
+    """Get statements deleting the rows whose column value is in the batch,
+    for each of the columns in the given order."""
+    return lambda ids: [delete(column.table).where(column.in_(ids)) for column in columns]
+
+
+def get_retention_batch_size() -> int:
+    return int(getenv("RETENTION_BATCH_SIZE", RETENTION_BATCH_SIZE))
+
+
+def get_retention_deadline(time_budget: Optional[float]) -> Optional[float]:
+    return None if time_budget is None else time.monotonic() + time_budget
+
+
+def run_retention_step(
+    step: RetentionStep,
+    batch_size: int,
+    deadline: Optional[float] = None,
+) -> bool:
+    """
+    Process the rows selected by the step in batches ordered by their IDs,
+    each batch in its own transaction.
+
+    The last processed ID is stored with each batch, so that a step
+    interrupted by a deadline (or a crash) is resumed by the next run.
 
     Args:
-        age: PostgreSQL interval string (e.g., '1 year', '6 months', '365 days').
-             If not provided, reads from PIPELINES_OUTDATED_AFTER_DAYS env var.
+        step: Step to run.
+        batch_size: Maximal number of rows processed in a single transaction.
+        deadline: Time (`time.monotonic()`) after which no more batches are
+            started, `None` for no limit.
+
+    Returns:
+        Whether all the rows were processed.
     """
-    if age is None:
-        outdated_after_days = getenv(
-            "PIPELINES_OUTDATED_AFTER_DAYS",
-            PIPELINES_OUTDATED_AFTER_DAYS,
-        )
-        age = f"{outdated_after_days} days"
+    last_id = RetentionCheckpointModel.get_last_id(step.name)
+    if last_id:
+        logger.info(f"Resuming {step.name} after ID {last_id}")
+
+    started = time.monotonic()
+    processed = 0
+    while True:
+        if deadline is not None and time.monotonic() > deadline:
+            logger.info(
+                f"Out of time, stopping {step.name} after ID {last_id}, "
+                f"{processed} rows processed.",
+            )
+            return False
+
+        with sa_session_transaction(commit=True) as session:
+            ids = (
+                session.execute(
+                    step.ids.where(step.id_column > last_id)
+                    .order_by(step.id_column)
+                    .limit(batch_size),
+                )
+                .scalars()
+                .all()
+            )
+            if not ids:
+                session.query(RetentionCheckpointModel).filter_by(step=step.name).delete()
+                break
+
+            for statement in step.statements(ids):
+                session.execute(statement)
+            last_id = ids[-1]
+            checkpoint = RetentionCheckpointModel()
+            checkpoint.step = step.name
+            checkpoint.last_id = last_id
+            session.merge(checkpoint)
+
+        processed += len(ids)
+        time.sleep(step.pause)
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Finished {step.name}: {processed} rows processed in {elapsed:.1f}s "
+        f"({processed / elapsed if elapsed else processed:.0f} rows/s).",
+    )
+    return True
 
-    logger.info(f"About to delete data older than {age}")
 
-    engine = create_engine(get_pg_url(), echo=True)
+def get_delete_old_data_steps(age: str) -> list[RetentionStep]:
+    """
+    Get the steps removing the data older than `age`.
 
-    with engine.begin() as conn:
-        # Delete the pipelines older than AGE
-        stmt = delete(PipelineModel).where(func.age(PipelineModel.datetime) >= age)
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} pipelines older than {age}")
+    The pipelines are deleted first, then the data not belonging
+    to any pipeline anymore, in the order of the foreign keys.
 
-        # Delete ProjectEventModels which don't belong to any pipeline
-        orphaned_events = (
-            select(distinct(ProjectEventModel.id))
+    Args:
+        age: PostgreSQL interval string (e.g., '1 year', '6 months', '365 days').
+    """
+    steps = [
+        # The pipelines older than AGE, they are referenced by nothing,
+        # but have plenty of foreign keys to check
+        RetentionStep(
+            name="pipelines",
+            ids=select(PipelineModel.id).where(func.age(PipelineModel.datetime) >= age),
+            id_column=PipelineModel.id,
+            statements=delete_where_in(PipelineModel.id),
+            pause=5 * RETENTION_BATCH_PAUSE,
+        ),
+        # ProjectEventModels which don't belong to any pipeline
+        RetentionStep(
+            name="project_events",
+            ids=select(distinct(ProjectEventModel.id))
             .outerjoin(PipelineModel, PipelineModel.project_event_id == ProjectEventModel.id)
-            .filter(PipelineModel.id == None)  # noqa
-        )
-        stmt = delete(ProjectEventModel).where(ProjectEventModel.id.in_(orphaned_events))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned ProjectEventModels")
-
-        # Delete SRPMBuilds and VMImageBuilds which don't belong to a pipeline
-        attr = [
-            (SRPMBuildModel, PipelineModel.srpm_build_id),
-            (VMImageBuildTargetModel, PipelineModel.vm_image_build_id),
-        ]
-        for model, field in attr:
-            orphaned = (
-                select(distinct(model.id))  # type: ignore
+            .filter(PipelineModel.id == None),  # noqa
+            id_column=ProjectEventModel.id,
+            statements=delete_where_in(ProjectEventModel.id),
+            pause=5 * RETENTION_BATCH_PAUSE,
+        ),
+    ]
+
+    # SRPMBuilds and VMImageBuilds which don't belong to a pipeline
+    for model, field in (
+        (SRPMBuildModel, PipelineModel.srpm_build_id),
+        (VMImageBuildTargetModel, PipelineModel.vm_image_build_id),
+    ):
+        steps.append(
+            RetentionStep(
+                name=model.__tablename__,
+                ids=select(distinct(model.id))  # type: ignore
                 .outerjoin(PipelineModel, field == model.id)  # type: ignore
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(model).where(model.id.in_(orphaned))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {model.__name__}")
+                .filter(PipelineModel.id == None),  # noqa
+                id_column=model.id,  # type: ignore
+                statements=delete_where_in(model.id),  # type: ignore
+            ),
+        )
 
-        # Delete CoprBuildTargets and tf-copr associations which don't belong to a pipeline
-        orphaned = (
-            select(distinct(CoprBuildTargetModel.id))
+    # CoprBuildTargets, tf-copr associations and OpenScanHub scans
+    # which don't belong to a pipeline
+    steps.append(
+        RetentionStep(
+            name=CoprBuildTargetModel.__tablename__,
+            ids=select(distinct(CoprBuildTargetModel.id))
             .outerjoin_from(
                 CoprBuildGroupModel,
                 CoprBuildTargetModel,
@@ -254,26 +482,21 @@ def delete_old_data(age: Optional[str] = None):
                 PipelineModel,
                 PipelineModel.copr_build_group_id == CoprBuildGroupModel.id,
             )
-            .filter(PipelineModel.id == None)  # noqa
-        )
-        stmt = delete(tf_copr_association_table).where(
-            tf_copr_association_table.c.copr_id.in_(orphaned),
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned tf-copr associations")
-
-        # Delete OpenScanHub scans that reference orphaned copr build targets
-        stmt = delete(OSHScanModel).where(OSHScanModel.copr_build_target_id.in_(orphaned))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned OSHScanModel records")
-
-        stmt = delete(CoprBuildTargetModel).where(CoprBuildTargetModel.id.in_(orphaned))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned CoprBuildTargets")
+            .filter(PipelineModel.id == None),  # noqa
+            id_column=CoprBuildTargetModel.id,
+            statements=delete_where_in(
+                tf_copr_association_table.c.copr_id,
+                OSHScanModel.copr_build_target_id,
+                CoprBuildTargetModel.id,
+            ),
+        ),
+    )
 
-        # Delete KojiBuildTargets and tf-koji associations which don't belong to a pipeline
-        orphaned_koji = (
-            select(distinct(KojiBuildTargetModel.id))
+    # KojiBuildTargets and tf-koji associations which don't belong to a pipeline
+    steps.append(
+        RetentionStep(
+            name=KojiBuildTargetModel.__tablename__,
+            ids=select(distinct(KojiBuildTargetModel.id))
             .outerjoin_from(
                 KojiBuildGroupModel,
                 KojiBuildTargetModel,
@@ -283,22 +506,20 @@ def delete_old_data(age: Optional[str] = None):
                 PipelineModel,
                 PipelineModel.koji_build_group_id == KojiBuildGroupModel.id,
             )
-            .filter(PipelineModel.id == None)  # noqa
-        )
-        stmt = delete(tf_koji_association_table).where(
-            tf_koji_association_table.c.koji_id.in_(orphaned_koji),
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned tf-koji associations")
-
-        stmt = delete(KojiBuildTargetModel).where(KojiBuildTargetModel.id.in_(orphaned_koji))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned KojiBuildTargets")
+            .filter(PipelineModel.id == None),  # noqa
+            id_column=KojiBuildTargetModel.id,
+            statements=delete_where_in(
+                tf_koji_association_table.c.koji_id,
+                KojiBuildTargetModel.id,
+            ),
+        ),
+    )
 
-        # Delete TFTTestRunTargets and their associations
-        logger.info("Working on TFTTestRunTargetModel...")
-        orphaned_tft = (
-            select(distinct(TFTTestRunTargetModel.id))
+    # TFTTestRunTargets and their associations
+    steps.append(
+        RetentionStep(
+            name=TFTTestRunTargetModel.__tablename__,
+            ids=select(distinct(TFTTestRunTargetModel.id))
             .outerjoin_from(
                 TFTTestRunGroupModel,
                 TFTTestRunTargetModel,
@@ -308,30 +529,21 @@ def delete_old_data(age: Optional[str] = None):
                 PipelineModel,
                 PipelineModel.test_run_group_id == TFTTestRunGroupModel.id,
             )
-            .filter(PipelineModel.id == None)  # noqa
-        )
-
-        # Delete associations referencing these orphaned TFT targets
-        stmt = delete(tf_copr_association_table).where(
-            tf_copr_association_table.c.tft_id.in_(orphaned_tft)
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} tf-copr associations (by tft_id)")
-
-        stmt = delete(tf_koji_association_table).where(
-            tf_koji_association_table.c.tft_id.in_(orphaned_tft)
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} tf-koji associations (by tft_id)")
-
-        stmt = delete(TFTTestRunTargetModel).where(TFTTestRunTargetModel.id.in_(orphaned_tft))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned TFTTestRunTargets")
+            .filter(PipelineModel.id == None),  # noqa
+            id_column=TFTTestRunTargetModel.id,
+            statements=delete_where_in(
+                tf_copr_association_table.c.tft_id,
+                tf_koji_association_table.c.tft_id,
+                TFTTestRunTargetModel.id,
+            ),
+        ),
+    )
 
-        # Delete SyncReleaseTargets and their associations
-        logger.info("Working on SyncReleaseTargetModel...")
-        orphaned_sync = (
-            select(distinct(SyncReleaseTargetModel.id))
+    # SyncReleaseTargets and their associations
+    steps.append(
+        RetentionStep(
+            name=SyncReleaseTargetModel.__tablename__,
+            ids=select(distinct(SyncReleaseTargetModel.id))
             .outerjoin_from(
                 SyncReleaseModel,
                 SyncReleaseTargetModel,
@@ -341,126 +553,166 @@ def delete_old_data(age: Optional[str] = None):
                 PipelineModel,
                 PipelineModel.sync_release_run_id == SyncReleaseModel.id,
             )
-            .filter(PipelineModel.id == None)  # noqa
-        )
-
-        # Delete associations referencing these orphaned SyncRelease targets
-        stmt = delete(sync_release_pr_association_table).where(
-            sync_release_pr_association_table.c.sync_release_target_id.in_(orphaned_sync)
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} sync-release-pr associations")
-
-        stmt = delete(SyncReleaseTargetModel).where(SyncReleaseTargetModel.id.in_(orphaned_sync))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned SyncReleaseTargets")
-
-        # Delete remaining target types (BodhiUpdate and KojiTagRequest) using generic logic
-        attr = [
-            (  # type: ignore
-                BodhiUpdateTargetModel,
-                BodhiUpdateGroupModel,
-                PipelineModel.bodhi_update_group_id,
-                BodhiUpdateTargetModel.bodhi_update_group_id,
+            .filter(PipelineModel.id == None),  # noqa
+            id_column=SyncReleaseTargetModel.id,
+            statements=delete_where_in(
+                sync_release_pr_association_table.c.sync_release_target_id,
+                SyncReleaseTargetModel.id,
             ),
-            (  # type: ignore
-                KojiTagRequestTargetModel,
-                KojiTagRequestGroupModel,
-                PipelineModel.koji_tag_request_group_id,
-                KojiTagRequestTargetModel.koji_tag_request_group_id,
-            ),
-        ]
-        for target_m, group_m, id_f, model_group_id in attr:  # type: ignore
-            logger.info(f"Working on {target_m.__name__}...")
-            orphaned = (
-                select(distinct(target_m.id))  # type: ignore
+        ),
+    )
+
+    # Remaining target types (BodhiUpdate and KojiTagRequest) using generic logic
+    for target_m, group_m, id_f, model_group_id in (  # type: ignore
+        (
+            BodhiUpdateTargetModel,
+            BodhiUpdateGroupModel,
+            PipelineModel.bodhi_update_group_id,
+            BodhiUpdateTargetModel.bodhi_update_group_id,
+        ),
+        (
+            KojiTagRequestTargetModel,
+            KojiTagRequestGroupModel,
+            PipelineModel.koji_tag_request_group_id,
+            KojiTagRequestTargetModel.koji_tag_request_group_id,
+        ),
+    ):
+        steps.append(
+            RetentionStep(
+                name=target_m.__tablename__,
+                ids=select(distinct(target_m.id))  # type: ignore
                 .outerjoin_from(group_m, target_m, model_group_id == group_m.id)  # type: ignore
                 .outerjoin(PipelineModel, id_f == group_m.id)  # type: ignore
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(target_m).where(target_m.id.in_(orphaned))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {target_m.__name__}")
-
-        # Delete orphaned Groups
-        groups = [  # type: ignore
-            (
-                CoprBuildGroupModel,
-                CoprBuildTargetModel,
-                CoprBuildTargetModel.copr_build_group_id,
-                PipelineModel.copr_build_group_id,
-            ),
-            (
-                KojiBuildGroupModel,
-                KojiBuildTargetModel,
-                KojiBuildTargetModel.koji_build_group_id,
-                PipelineModel.koji_build_group_id,
-            ),
-            (
-                TFTTestRunGroupModel,
-                TFTTestRunTargetModel,
-                TFTTestRunTargetModel.tft_test_run_group_id,
-                PipelineModel.test_run_group_id,
-            ),
-            (
-                BodhiUpdateGroupModel,
-                BodhiUpdateTargetModel,
-                BodhiUpdateTargetModel.bodhi_update_group_id,
-                PipelineModel.bodhi_update_group_id,
-            ),
-            (
-                KojiTagRequestGroupModel,
-                KojiTagRequestTargetModel,
-                KojiTagRequestTargetModel.koji_tag_request_group_id,
-                PipelineModel.koji_tag_request_group_id,
+                .filter(PipelineModel.id == None),  # noqa
+                id_column=target_m.id,  # type: ignore
+                statements=delete_where_in(target_m.id),  # type: ignore
             ),
-        ]
-        for group, target, target_group_id, pipeline_group_id in groups:  # type: ignore
-            orphaned_groups = (
-                select(distinct(group.id))  # type: ignore
+        )
+
+    # Orphaned Groups
+    for group, target, target_group_id, pipeline_group_id in (  # type: ignore
+        (
+            CoprBuildGroupModel,
+            CoprBuildTargetModel,
+            CoprBuildTargetModel.copr_build_group_id,
+            PipelineModel.copr_build_group_id,
+        ),
+        (
+            KojiBuildGroupModel,
+            KojiBuildTargetModel,
+            KojiBuildTargetModel.koji_build_group_id,
+            PipelineModel.koji_build_group_id,
+        ),
+        (
+            TFTTestRunGroupModel,
+            TFTTestRunTargetModel,
+            TFTTestRunTargetModel.tft_test_run_group_id,
+            PipelineModel.test_run_group_id,
+        ),
+        (
+            BodhiUpdateGroupModel,
+            BodhiUpdateTargetModel,
+            BodhiUpdateTargetModel.bodhi_update_group_id,
+            PipelineModel.bodhi_update_group_id,
+        ),
+        (
+            KojiTagRequestGroupModel,
+            KojiTagRequestTargetModel,
+            KojiTagRequestTargetModel.koji_tag_request_group_id,
+            PipelineModel.koji_tag_request_group_id,
+        ),
+    ):
+        steps.append(
+            RetentionStep(
+                name=group.__tablename__,
+                ids=select(distinct(group.id))  # type: ignore
                 .outerjoin(target, group.id == target_group_id)  # type: ignore
                 .outerjoin(PipelineModel, pipeline_group_id == group.id)  # type: ignore
                 .filter(target.id == None)  # type: ignore  # noqa
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(group).where(group.id.in_(orphaned_groups))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {group.__name__}")
-
-        # Delete orphaned project event trigger objects
-        trigger_types = [
-            (ProjectEventModelType.pull_request, PullRequestModel),
-            (ProjectEventModelType.branch_push, GitBranchModel),
-            (ProjectEventModelType.release, ProjectReleaseModel),
-            (ProjectEventModelType.issue, IssueModel),
-        ]
-        for event_type, trigger_model in trigger_types:
-            # Find trigger objects not referenced by any ProjectEventModel
-            project_events = (
-                select(ProjectEventModel).filter(ProjectEventModel.type == event_type).subquery()
-            )
-            orphaned_triggers = (
-                select(trigger_model.id)  # type: ignore
+                .filter(PipelineModel.id == None),  # noqa
+                id_column=group.id,  # type: ignore
+                statements=delete_where_in(group.id),  # type: ignore
+            ),
+        )
+
+    # Orphaned project event trigger objects
+    for event_type, trigger_model in (
+        (ProjectEventModelType.pull_request, PullRequestModel),
+        (ProjectEventModelType.branch_push, GitBranchModel),
+        (ProjectEventModelType.release, ProjectReleaseModel),
+        (ProjectEventModelType.issue, IssueModel),
+    ):
+        # Find trigger objects not referenced by any ProjectEventModel
+        project_events = (
+            select(ProjectEventModel).filter(ProjectEventModel.type == event_type).subquery()
+        )
+        steps.append(
+            RetentionStep(
+                name=trigger_model.__tablename__,
+                ids=select(trigger_model.id)  # type: ignore
                 .outerjoin(project_events, trigger_model.id == project_events.c.event_id)  # type: ignore
-                .filter(project_events.c.event_id == None)  # noqa
-            )
-            stmt = delete(trigger_model).where(trigger_model.id.in_(orphaned_triggers))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {trigger_model.__name__}")
-
-        # Delete orphaned GitProjectModel records
-        referenced_projects = union(
-            select(PullRequestModel.project_id),
-            select(GitBranchModel.project_id),
-            select(ProjectReleaseModel.project_id),
-            select(IssueModel.project_id),
-            select(ProjectAuthenticationIssueModel.project_id),
-            select(SyncReleasePullRequestModel.project_id),
+                .filter(project_events.c.event_id == None),  # noqa
+                id_column=trigger_model.id,  # type: ignore
+                statements=delete_where_in(trigger_model.id),  # type: ignore
+            ),
         )
-        stmt = delete(GitProjectModel).where(
-            GitProjectModel.id.not_in(referenced_projects),
+
+    # Orphaned GitProjectModel records
+    referenced_projects = union(
+        select(PullRequestModel.project_id),
+        select(GitBranchModel.project_id),
+        select(ProjectReleaseModel.project_id),
+        select(IssueModel.project_id),
+        select(ProjectAuthenticationIssueModel.project_id),
+        select(SyncReleasePullRequestModel.project_id),
+    )
+    steps.append(
+        RetentionStep(
+            name=GitProjectModel.__tablename__,
+            ids=select(GitProjectModel.id).where(
+                GitProjectModel.id.not_in(referenced_projects),
+            ),
+            id_column=GitProjectModel.id,
+            statements=delete_where_in(GitProjectModel.id),
+        ),
+    )
+    return steps
+
+
+def delete_old_data(
+    age: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    time_budget: Optional[float] = RETENTION_TIME_BUDGET,
+):
+    """
+    Remove old data from the DB.
+
+    The rows are deleted in batches, each in its own transaction, so that
+    the tables are not locked for long. A run interrupted by the time budget
+    is resumed by the next one.
+
+    Args:
+        age: PostgreSQL interval string (e.g., '1 year', '6 months', '365 days').
+             If not provided, reads from PIPELINES_OUTDATED_AFTER_DAYS env var.
+        batch_size: Number of rows deleted in a single transaction.
+             If not provided, reads from RETENTION_BATCH_SIZE env var.
+        time_budget: Number of seconds after which the removal stops,
+             `None` for no limit.
+    """
+    if age is None:
+        outdated_after_days = getenv(
+            "PIPELINES_OUTDATED_AFTER_DAYS",
+            PIPELINES_OUTDATED_AFTER_DAYS,
         )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned GitProjectModels")
+        age = f"{outdated_after_days} days"
+    batch_size = batch_size or get_retention_batch_size()
+    deadline = get_retention_deadline(time_budget)
+
+    logger.info(f"About to delete data older than {age}")
+
+    for step in get_delete_old_data_steps(age):
+        if not run_retention_step(step, batch_size=batch_size, deadline=deadline):
+            logger.info("Deleting old data from database interrupted, will be resumed")
+            return
 
     logger.info("Finished deleting old data from database")
@@ -43,11 +43,13 @@ from packit_service.utils import (
 )
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.checker.abstract import Checker
+from packit_service.worker.helpers.koji_multicall import memoized_koji_lookups
 from packit_service.worker.mixin import (
     Config,
     PackitAPIProtocol,
 )
 from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.reporting import coalesced_reporting
 from packit_service.worker.result import TaskResults
 
 logger = logging.getLogger(__name__)
@@ -339,7 +341,8 @@ class Handler(PackitAPIProtocol, Config):
                     scope.set_tag(k, v)
 
                 self.log_memory_stats()
-                return self.run()
+                with coalesced_reporting(), memoized_koji_lookups():
+                    return self.run()
         except Exception as ex:
             logger.info(f"Failed to run the handler: {ex}")
             raise
@@ -439,7 +442,7 @@ class JobHandler(Handler):
         # always use job_config to pick up values, use package_config only for package_config.jobs
         self.job_config = job_config
         self.data = EventData.from_event_dict(event)
-        self.pushgateway = Pushgateway()
+        self.pushgateway = Pushgateway.get_instance()
 
         self._db_project_object: Optional[AbstractProjectObjectDbType] = None
         self._project: Optional[GitProject] = None
@@ -576,7 +579,7 @@ class JobHandler(Handler):
             )
             # Increment the metric for tasks enqueued to the rate-limited queue
             self.pushgateway.rate_limited_tasks_enqueued.inc()
-            # Push metrics immediately since we're about to raise an exception
+            # Schedule pushing of the metrics since we're about to raise an exception
             # that will prevent the normal push() call in run_job()
             self.pushgateway.push()
             # Use apply_async to reschedule the task to the rate-limited queue
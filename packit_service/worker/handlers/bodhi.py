@@ -7,13 +7,16 @@ This file defines classes for job handlers related to Bodhi
 
 import abc
 import logging
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from os import getenv
-from typing import Optional
+from typing import Any, NoReturn, Optional, Union
 
 from celery import Task
 from packit.config import Deployment, JobConfig, JobType, PackageConfig
 from packit.exceptions import PackitException
+from packit.utils.bodhi import get_bodhi_client
 
 from packit_service import sentry_integration
 from packit_service.config import ServiceConfig
@@ -35,6 +38,7 @@ from packit_service.models import (
     BodhiUpdateTargetModel,
     KojiBuildTargetModel,
     PipelineModel,
+    sa_unit_of_work,
 )
 from packit_service.service.urls import get_bodhi_update_info_url
 from packit_service.worker.checker.abstract import Checker
@@ -111,63 +115,37 @@ class BodhiUpdateHandler(
             logger.debug(f"Bodhi update failed to be created: {ex}")
             return TaskResults(success=True, details={})
 
-        errors = {}
-        for target_model in group.grouped_targets:
+        errors: dict[str, str] = {}
+        targets = group.grouped_targets
+        if self._bodhi_update_group_model_id is not None:
+            # only the updates that failed are retried
+            targets = [target_model for target_model in targets if target_model.status == "retry"]
+        updates = [
+            (target_model, kwargs)
+            for target_model in targets
+            if (kwargs := self._prepare_update(target_model, errors)) is not None
+        ]
+
+        # all the created updates are recorded before the failed ones are retried
+        retried: list[BodhiUpdateTargetModel] = []
+        retry_exception: Optional[PackitException] = None
+        internal_error: Optional[Exception] = None
+        for target_model, result in self._create_updates(updates):
             try:
-                existing_alias = None
-                # get update alias from previous run(s) from the same sidetag (if any)
-                if target_model.sidetag and (
-                    existing_model := BodhiUpdateTargetModel.get_last_successful_by_sidetag(
-                        target_model.sidetag,
-                    )
-                ):
-                    existing_alias = existing_model.alias
-                    if set(target_model.koji_nvrs.split()) == set(
-                        existing_model.koji_nvrs.split(),
-                    ):
-                        logger.info("No changes, skipping Bodhi update edit")
-                        target_model.set_status("skipped")
-                        continue
-
-                if not existing_alias:
-                    # avoid creating another update containing the same build - Bodhi shouldn't
-                    # allow it anyway but there is a race condition that makes it possible
-                    existing_models = (
-                        BodhiUpdateTargetModel.get_all_successful_or_in_progress_by_nvrs(
-                            target_model.koji_nvrs,
-                        )
-                    )
-                    if existing_models - {target_model}:
-                        logger.info(
-                            "Bodhi update containing one or more builds from "
-                            f"{{{target_model.koji_nvrs}}} already exists, skipping",
-                        )
-                        target_model.set_status("skipped")
-                        continue
-
-                logger.debug(
-                    (f"Edit update {existing_alias} " if existing_alias else "Create update ")
-                    + f"for dist-git branch: {target_model.target} "
-                    f"and nvrs: {target_model.koji_nvrs}"
-                    + (f" from sidetag: {target_model.sidetag}." if target_model.sidetag else "."),
-                )
-                result = self.packit_api.create_update(
-                    dist_git_branch=target_model.target,
-                    update_type="enhancement",
-                    koji_builds=target_model.koji_nvrs.split(),  # it accepts NVRs, not build IDs
-                    sidetag=target_model.sidetag,
-                    alias=existing_alias,
-                )
+                if isinstance(result, Exception):
+                    raise result
+
                 if not result:
                     # update was already created
                     target_model.set_status("skipped")
                     continue
 
                 alias, url = result
-                target_model.set_status("success")
-                target_model.set_alias(alias)
-                target_model.set_web_url(url)
-                target_model.set_update_creation_time(datetime.now())
+                with sa_unit_of_work():
+                    target_model.set_status("success")
+                    target_model.set_alias(alias)
+                    target_model.set_web_url(url)
+                    target_model.set_update_creation_time(datetime.now())
 
             except PackitException as ex:
                 logger.debug(f"Bodhi update failed to be created: {ex}")
@@ -177,25 +155,9 @@ class BodhiUpdateHandler(
                     and self.celery_task.can_retry_for(ex)
                     and not self.celery_task.is_last_try()
                 ):
-                    kargs = self.celery_task.task.request.kwargs.copy()
-                    kargs["bodhi_update_group_model_id"] = group.id
-                    for model in group.grouped_targets:
-                        model.set_status("retry")
-
-                    logger.debug(
-                        "Celery task will be retried. User will not be notified about the failure.",
-                    )
-                    retry_backoff = int(
-                        getenv("CELERY_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF),
-                    )
-                    delay = retry_backoff * 2**self.celery_task.retries
-                    self.celery_task.task.retry(exc=ex, countdown=delay, kwargs=kargs)
-                    return TaskResults(
-                        success=True,
-                        details={
-                            "msg": f"There was an error: {ex}. Task will be retried.",
-                        },
-                    )
+                    retried.append(target_model)
+                    retry_exception = ex
+                    continue
 
                 # Send to Sentry after all retries are exhausted
                 sentry_integration.send_to_sentry(ex)
@@ -203,33 +165,191 @@ class BodhiUpdateHandler(
                 error = str(ex)
                 errors[target_model.target] = get_bodhi_update_info_url(target_model.id)
 
-                target_model.set_status("error")
-                target_model.set_data({"error": error})
-
-            except Exception as ex:
-                if (
-                    self.celery_task
-                    and self.celery_task.can_retry_for(ex)
-                    and not self.celery_task.is_last_try()
-                ):
+                with sa_unit_of_work():
                     target_model.set_status("error")
-                    raise
-
-                error = f"Internal error, please contact us: {ex}"
-                errors[target_model.target] = get_bodhi_update_info_url(target_model.id)
+                    target_model.set_data({"error": error})
 
-                target_model.set_status("error")
-                target_model.set_data({"error": error})
-                raise
+            except Exception as ex:
+                self._record_internal_error(ex, target_model, errors)
+                internal_error = internal_error or ex
+
+        if retry_exception:
+            kargs = self.celery_task.task.request.kwargs.copy()
+            kargs["bodhi_update_group_model_id"] = group.id
+            with sa_unit_of_work():
+                for target_model in retried:
+                    target_model.set_status("retry")
+
+            logger.debug(
+                "Celery task will be retried. User will not be notified about the failure.",
+            )
+            retry_backoff = int(
+                getenv("CELERY_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF),
+            )
+            delay = retry_backoff * 2**self.celery_task.retries
+            self.celery_task.task.retry(exc=retry_exception, countdown=delay, kwargs=kargs)
+            return TaskResults(
+                success=True,
+                details={
+                    "msg": f"There was an error: {retry_exception}. Task will be retried.",
+                },
+            )
 
         if errors:
             self.report_in_issue_repository(errors=errors)
 
+        if internal_error:
+            raise internal_error
+
         # `success=True` for all known errors
         # (=The task was correctly processed.)
         # Sentry issue will be created otherwise.
         return TaskResults(success=True, details={})
 
+    def _record_internal_error(
+        self,
+        ex: Exception,
+        target_model: BodhiUpdateTargetModel,
+        errors: dict[str, str],
+    ):
+        """Record an unexpected error of the update."""
+        if (
+            self.celery_task
+            and self.celery_task.can_retry_for(ex)
+            and not self.celery_task.is_last_try()
+        ):
+            target_model.set_status("error")
+            return
+
+        error = f"Internal error, please contact us: {ex}"
+        errors[target_model.target] = get_bodhi_update_info_url(target_model.id)
+
+        with sa_unit_of_work():
+            target_model.set_status("error")
+            target_model.set_data({"error": error})
+
+    def _handle_internal_error(
+        self,
+        ex: Exception,
+        target_model: BodhiUpdateTargetModel,
+        errors: dict[str, str],
+    ) -> NoReturn:
+        """Record an unexpected error of the update and re-raise it."""
+        self._record_internal_error(ex, target_model, errors)
+        raise ex
+
+    def _prepare_update(
+        self,
+        target_model: BodhiUpdateTargetModel,
+        errors: dict[str, str],
+    ) -> Optional[dict[str, Any]]:
+        """Get the arguments of `PackitAPI.create_update` for the target, record the errors."""
+        try:
+            return self._get_update_kwargs(target_model)
+        except Exception as ex:
+            self._handle_internal_error(ex, target_model, errors)
+
+    @staticmethod
+    def _get_update_kwargs(target_model: BodhiUpdateTargetModel) -> Optional[dict[str, Any]]:
+        """
+        Get the arguments of `PackitAPI.create_update` for the target,
+        skip the target if there is nothing to create.
+
+        Returns:
+            Keyword arguments of `PackitAPI.create_update` or `None` if the target was skipped.
+        """
+        existing_alias = None
+        # get update alias from previous run(s) from the same sidetag (if any)
+        if target_model.sidetag and (
+            existing_model := BodhiUpdateTargetModel.get_last_successful_by_sidetag(
+                target_model.sidetag,
+            )
+        ):
+            existing_alias = existing_model.alias
+            if set(target_model.koji_nvrs.split()) == set(
+                existing_model.koji_nvrs.split(),
+            ):
+                logger.info("No changes, skipping Bodhi update edit")
+                target_model.set_status("skipped")
+                return None
+
+        if not existing_alias:
+            # avoid creating another update containing the same build - Bodhi shouldn't
+            # allow it anyway but there is a race condition that makes it possible
+            existing_models = BodhiUpdateTargetModel.get_all_successful_or_in_progress_by_nvrs(
+                target_model.koji_nvrs,
+            )
+            if existing_models - {target_model}:
+                logger.info(
+                    "Bodhi update containing one or more builds from "
+                    f"{{{target_model.koji_nvrs}}} already exists, skipping",
+                )
+                target_model.set_status("skipped")
+                return None
+
+        logger.debug(
+            (f"Edit update {existing_alias} " if existing_alias else "Create update ")
+            + f"for dist-git branch: {target_model.target} "
+            f"and nvrs: {target_model.koji_nvrs}"
+            + (f" from sidetag: {target_model.sidetag}." if target_model.sidetag else "."),
+        )
+        return {
+            "dist_git_branch": target_model.target,
+            "update_type": "enhancement",
+            "koji_builds": target_model.koji_nvrs.split(),  # it accepts NVRs, not build IDs
+            "sidetag": target_model.sidetag,
+            "alias": existing_alias,
+        }
+
+    def _create_updates(
+        self,
+        updates: list[tuple[BodhiUpdateTargetModel, dict[str, Any]]],
+    ) -> Generator[
+        tuple[BodhiUpdateTargetModel, Union[Optional[tuple[str, str]], Exception]],
+        None,
+        None,
+    ]:
+        """
+        Create (or edit) the updates, up to `bodhi_update_concurrency` of them in parallel.
+
+        The models are not touched outside of the handler thread, the results are yielded
+        in the order of the updates and the pending updates are cancelled
+        when the iteration stops.
+
+        Args:
+            updates: Target models and the keyword arguments of `PackitAPI.create_update`.
+
+        Yields:
+            Target models and the results of `PackitAPI.create_update`
+            or the exceptions it raised.
+        """
+
+        def create_update(kwargs: dict[str, Any]) -> Union[Optional[tuple[str, str]], Exception]:
+            try:
+                return self.packit_api.create_update(**kwargs)
+            except Exception as ex:
+                return ex
+
+        if len(updates) < 2 or self.service_config.bodhi_update_concurrency < 2:
+            for target_model, kwargs in updates:
+                yield target_model, create_update(kwargs)
+            return
+
+        # obtain the Kerberos ticket and set up the dist-git before the threads share it
+        _ = self.packit_api.dg
+        # authenticate just once, the Bodhi clients of the threads then reuse the stored
+        # tokens instead of all of them refreshing ~/bodhi-client.json at the same time
+        get_bodhi_client().ensure_auth()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.service_config.bodhi_update_concurrency, len(updates)),
+        )
+        try:
+            results = executor.map(create_update, [kwargs for _, kwargs in updates])
+            for (target_model, _), result in zip(updates, results):
+                yield target_model, result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     @abc.abstractmethod
     def get_trigger_type_description(self) -> str:
         """Describe the user's action which triggered the Bodhi update"""
@@ -253,6 +373,7 @@ class BodhiUpdateHandler(
         )
         group = BodhiUpdateGroupModel.create(run_model)
 
+        updates = []
         for koji_build_data in self:
             sidetag = builds = None
             if self.job_config.sidetag_group:
@@ -275,14 +396,16 @@ class BodhiUpdateHandler(
                     str(b) for b in sidetag.get_builds_suitable_for_update(dependencies)
                 )
 
-            BodhiUpdateTargetModel.create(
-                target=koji_build_data.dist_git_branch,
-                koji_nvrs=builds if builds else koji_build_data.nvr,
-                sidetag=sidetag.koji_name if sidetag else None,
-                status="queued",
-                bodhi_update_group=group,
+            updates.append(
+                {
+                    "target": koji_build_data.dist_git_branch,
+                    "koji_nvrs": builds if builds else koji_build_data.nvr,
+                    "sidetag": sidetag.koji_name if sidetag else None,
+                    "status": "queued",
+                },
             )
 
+        BodhiUpdateTargetModel.bulk_create(bodhi_update_group=group, updates=updates)
         return group
 
     @staticmethod
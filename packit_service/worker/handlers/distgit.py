@@ -6,19 +6,26 @@ This file defines classes for job handlers specific for distgit
 """
 
 import abc
+import contextlib
 import logging
 import re
 import shutil
+import threading
 from collections import defaultdict
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from datetime import datetime
 from functools import cmp_to_key, partial
 from os import getenv
-from typing import ClassVar, Optional
+from pathlib import Path
+from typing import ClassVar, NoReturn, Optional, Union
 
 from celery import Task
 from ogr.abstract import AuthMethod, PullRequest
 from ogr.parsing import RepoUrl, parse_git_repo
 from ogr.services.github import GithubService
+from packit.api import PackitAPI
 from packit.config import Deployment, JobConfig, JobType, aliases
 from packit.config.package_config import PackageConfig
 from packit.exceptions import (
@@ -27,6 +34,7 @@ from packit.exceptions import (
     PackitException,
     ReleaseSkippedPackitException,
 )
+from packit.local_project import LocalProject
 from packit.utils import commands
 from packit.utils.koji_helper import KojiHelper
 from packit.utils.release_monitoring import get_monitoring_metadata
@@ -44,6 +52,8 @@ from packit_service.constants import (
     MSG_RETRIGGER,
     MSG_RETRIGGER_DISTGIT,
     RETRY_LIMIT_RELEASE_ARCHIVE_DOWNLOAD_ERROR,
+    SANDCASTLE_DG_REPO_DIR,
+    SANDCASTLE_LOCAL_PROJECT_DIR,
     KojiBuildState,
 )
 from packit_service.events import (
@@ -67,6 +77,7 @@ from packit_service.models import (
     SyncReleaseStatus,
     SyncReleaseTargetModel,
     SyncReleaseTargetStatus,
+    sa_unit_of_work,
 )
 from packit_service.service.urls import (
     get_koji_build_info_url,
@@ -112,7 +123,12 @@ from packit_service.worker.handlers.mixin import (
     GetProjectToSyncMixin,
 )
 from packit_service.worker.helpers.fedora_ci import FedoraCIHelper
+from packit_service.worker.helpers.koji_multicall import MulticallKojiHelper
 from packit_service.worker.helpers.sidetag import SidetagHelper
+from packit_service.worker.helpers.sync_release.clone import (
+    SharedUpstreamArchives,
+    clone_local_project,
+)
 from packit_service.worker.helpers.sync_release.propose_downstream import (
     ProposeDownstreamJobHelper,
 )
@@ -170,6 +186,69 @@ class ChoosenGithubAuthMethod:
                 service.reset_auth_method()
 
 
+@contextlib.contextmanager
+def packit_api_in_clones(
+    service_config: ServiceConfig,
+    job_config: JobConfig,
+    branch: str,
+    downstream_local_project: LocalProject,
+    upstream_local_project: Optional[LocalProject] = None,
+    **kwargs,
+) -> Generator[PackitAPI, None, None]:
+    """
+    Packit API working in local clones of the repositories, so that multiple
+    dist-git branches can be processed at once. The clones are removed afterwards.
+
+    The Kerberos ticket has to be obtained beforehand (e.g. by accessing the dist-git
+    of the Packit API the repositories come from), the keytab is not passed
+    to the clones, so that `kinit` doesn't run in multiple threads at once.
+
+    Args:
+        service_config: Service configuration.
+        job_config: Configuration of the job.
+        branch: dist-git branch the clones are for.
+        downstream_local_project: Dist-git repository to clone.
+        upstream_local_project: Upstream repository to clone, if any.
+        **kwargs: Other arguments of `PackitAPI`.
+
+    Yields:
+        Packit API using the clones.
+    """
+    working_dir = (
+        Path(service_config.command_handler_work_dir) / f"{SANDCASTLE_DG_REPO_DIR}-{branch}"
+    )
+    config = copy(service_config)
+    config.keytab_path = None
+
+    packit_api = None
+    try:
+        packit_api = PackitAPI(
+            config,
+            job_config,
+            upstream_local_project=(
+                clone_local_project(
+                    upstream_local_project,
+                    working_dir / SANDCASTLE_LOCAL_PROJECT_DIR,
+                )
+                if upstream_local_project
+                else None
+            ),
+            downstream_local_project=clone_local_project(
+                downstream_local_project,
+                working_dir / SANDCASTLE_DG_REPO_DIR,
+            ),
+            **kwargs,
+        )
+        yield packit_api
+    finally:
+        if packit_api:
+            try:
+                packit_api.clean()
+            except Exception as ex:
+                logger.warning(f"Failed to clean up the clones for {branch}: {ex}")
+        shutil.rmtree(working_dir, ignore_errors=True)
+
+
 @configured_as(job_type=JobType.sync_from_downstream)
 @reacts_to(event=pagure.push.Commit)
 class SyncFromDownstream(
@@ -267,73 +346,98 @@ class AbstractSyncReleaseHandler(
             )
         return self.helper
 
+    def _get_sync_release_kwargs(
+        self,
+        branch: str,
+        tag: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> dict:
+        branch_suffix = f"update-{self.sync_release_job_type.value}"
+        is_pull_from_upstream_job = (
+            self.sync_release_job_type == SyncReleaseJobType.pull_from_upstream
+        )
+        kwargs = {
+            "dist_git_branch": branch,
+            "create_pr": True,
+            "local_pr_branch_suffix": branch_suffix,
+            "use_downstream_specfile": is_pull_from_upstream_job,
+            "add_pr_instructions": True,
+            "resolved_bugs": self.get_resolved_bugs(),
+            "release_monitoring_project_id": self.data.event_dict.get(
+                "anitya_project_id",
+            ),
+            "sync_acls": True,
+            "pr_description_footer": DistgitAnnouncement.get_announcement(),
+            # [TODO] Remove for CentOS support once it gets refined
+            "add_new_sources": self.package_config.pkg_tool in (None, "fedpkg"),
+            "fast_forward_merge_branches": self.helper.get_fast_forward_merge_branches_for(
+                branch,
+            ),
+        }
+        if tag:
+            kwargs["tag"] = tag
+        elif version:
+            kwargs["versions"] = [version]
+        return kwargs
+
+    def _retry_after_download_failure(
+        self,
+        ex: PackitDownloadFailedException,
+        model: SyncReleaseModel,
+        tag: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> NoReturn:
+        """
+        Schedule a retry of the task if the archive could not be downloaded.
+
+        Raises:
+            AbortSyncRelease: If the retry has been scheduled.
+            PackitDownloadFailedException: If there are no retries left.
+        """
+        # the archive has not been uploaded to PyPI yet
+        # retry for the archive to become available
+        logger.info(f"We were not able to download the archive: {ex}")
+        # when the task hits max_retries, it raises MaxRetriesExceededError
+        # and the error handling code would be never executed
+        retries = self.celery_task.retries
+        if retries < RETRY_LIMIT_RELEASE_ARCHIVE_DOWNLOAD_ERROR:
+            # retry after 1 min, 2 mins, 4 mins, 8 mins, 16 mins, 32 mins
+            delay = 60 * 2**retries
+            logger.info(
+                f"Will retry for the {retries + 1}. time in {delay}s \
+                    with sync_release_run_id {model.id}.",
+            )
+            # throw=False so that exception is not raised and task
+            # is not retried also automatically
+            kargs = self.celery_task.task.request.kwargs.copy()
+            kargs["sync_release_run_id"] = model.id
+            kargs["retry_tag"] = tag
+            kargs["retry_version"] = version
+            # https://docs.celeryq.dev/en/stable/userguide/tasks.html#retrying
+            # https://docs.celeryq.dev/en/stable/reference/celery.app.task.html#celery.app.task.Task.retry
+            self.celery_task.task.retry(
+                exc=ex,
+                countdown=delay,
+                throw=False,
+                args=(),
+                kwargs=kargs,
+                max_retries=RETRY_LIMIT_RELEASE_ARCHIVE_DOWNLOAD_ERROR,
+            )
+            raise AbortSyncRelease() from ex
+        raise ex
+
     def sync_branch(
         self,
         branch: str,
         model: SyncReleaseModel,
         tag: Optional[str] = None,
         version: Optional[str] = None,
-    ) -> Optional[tuple[PullRequest, dict[str, PullRequest]]]:
+    ) -> tuple[PullRequest, dict[str, PullRequest]]:
         try:
-            branch_suffix = f"update-{self.sync_release_job_type.value}"
-            is_pull_from_upstream_job = (
-                self.sync_release_job_type == SyncReleaseJobType.pull_from_upstream
-            )
-            kwargs = {
-                "dist_git_branch": branch,
-                "create_pr": True,
-                "local_pr_branch_suffix": branch_suffix,
-                "use_downstream_specfile": is_pull_from_upstream_job,
-                "add_pr_instructions": True,
-                "resolved_bugs": self.get_resolved_bugs(),
-                "release_monitoring_project_id": self.data.event_dict.get(
-                    "anitya_project_id",
-                ),
-                "sync_acls": True,
-                "pr_description_footer": DistgitAnnouncement.get_announcement(),
-                # [TODO] Remove for CentOS support once it gets refined
-                "add_new_sources": self.package_config.pkg_tool in (None, "fedpkg"),
-                "fast_forward_merge_branches": self.helper.get_fast_forward_merge_branches_for(
-                    branch,
-                ),
-            }
-            if tag:
-                kwargs["tag"] = tag
-            elif version:
-                kwargs["versions"] = [version]
+            kwargs = self._get_sync_release_kwargs(branch, tag=tag, version=version)
             downstream_pr, additional_prs = self.packit_api.sync_release(**kwargs)
         except PackitDownloadFailedException as ex:
-            # the archive has not been uploaded to PyPI yet
-            # retry for the archive to become available
-            logger.info(f"We were not able to download the archive: {ex}")
-            # when the task hits max_retries, it raises MaxRetriesExceededError
-            # and the error handling code would be never executed
-            retries = self.celery_task.retries
-            if retries < RETRY_LIMIT_RELEASE_ARCHIVE_DOWNLOAD_ERROR:
-                # retry after 1 min, 2 mins, 4 mins, 8 mins, 16 mins, 32 mins
-                delay = 60 * 2**retries
-                logger.info(
-                    f"Will retry for the {retries + 1}. time in {delay}s \
-                        with sync_release_run_id {model.id}.",
-                )
-                # throw=False so that exception is not raised and task
-                # is not retried also automatically
-                kargs = self.celery_task.task.request.kwargs.copy()
-                kargs["sync_release_run_id"] = model.id
-                kargs["retry_tag"] = tag
-                kargs["retry_version"] = version
-                # https://docs.celeryq.dev/en/stable/userguide/tasks.html#retrying
-                # https://docs.celeryq.dev/en/stable/reference/celery.app.task.html#celery.app.task.Task.retry
-                self.celery_task.task.retry(
-                    exc=ex,
-                    countdown=delay,
-                    throw=False,
-                    args=(),
-                    kwargs=kargs,
-                    max_retries=RETRY_LIMIT_RELEASE_ARCHIVE_DOWNLOAD_ERROR,
-                )
-                raise AbortSyncRelease() from ex
-            raise ex
+            self._retry_after_download_failure(ex, model, tag=tag, version=version)
         finally:
             if self.packit_api.up.local_project:
                 self.packit_api.up.local_project.git_repo.head.reset(
@@ -350,6 +454,52 @@ class AbstractSyncReleaseHandler(
 
         return downstream_pr, additional_prs
 
+    def sync_branch_in_clone(
+        self,
+        branch: str,
+        kwargs: dict,
+        archives: SharedUpstreamArchives,
+    ) -> tuple[Union[tuple[PullRequest, dict[str, PullRequest]], Exception], str]:
+        """
+        Sync the release to the branch in its own clones of the upstream
+        and dist-git repositories, so that multiple branches can be synced
+        at once. Runs in a worker thread, doesn't touch the DB.
+
+        Args:
+            branch: dist-git branch.
+            kwargs: Arguments of `PackitAPI.sync_release()`.
+            archives: Upstream archives shared by the clones.
+
+        Returns:
+            Created pull requests or the exception, and the packit logs.
+        """
+        buffer, handler = gather_packit_logs_to_buffer(logging_level=logging.DEBUG)
+        # the other branches are logging at the same time
+        thread_id = threading.get_ident()
+        handler.addFilter(lambda record: record.thread == thread_id)
+        try:
+            with packit_api_in_clones(
+                self.service_config,
+                self.job_config,
+                branch,
+                downstream_local_project=self.packit_api.dg.local_project,
+                upstream_local_project=(
+                    self.local_project if self.packit_api.up.local_project else None
+                ),
+                non_git_upstream=self.non_git_upstream,
+            ) as packit_api:
+                archives.share_with(packit_api.dg)
+                result = packit_api.sync_release(**kwargs)
+        except Exception as ex:
+            logger.debug(f"{self.sync_release_job_type} for {branch} failed: {ex}")
+            # make sure exception message is propagated to the logs
+            logging.getLogger("packit").error(str(ex))
+            result = ex
+        finally:
+            logs = collect_packit_logs(buffer=buffer, handler=handler)
+
+        return result, logs
+
     def _get_or_create_sync_release_run(
         self,
         project_event_model: Optional[ProjectEventModel] = None,
@@ -396,62 +546,60 @@ class AbstractSyncReleaseHandler(
 
         return sync_release_model
 
-    def run_for_target(
-        self,
-        sync_release_run_model: SyncReleaseModel,
-        model: SyncReleaseTargetModel,
-        tag: Optional[str] = None,
-        version: Optional[str] = None,
-    ) -> Optional[str]:
-        """
-        Run sync-release for the single target specified by the given model.
-
-        Args:
-            sync_release_run_model: Model for the whole sync release run.
-            model: Model for the single target that is to be executed.
-
-        Returns:
-            String representation of the exception, if occurs.
-
-        Raises:
-            AbortSyncRelease: In case the archives cannot be downloaded.
-        """
-        branch = model.branch
-
+    @staticmethod
+    def _is_target_to_run(model: SyncReleaseTargetModel) -> bool:
         # skip submitting a branch if we already did that (even if it failed)
-        if model.status not in [
+        return model.status in [
             SyncReleaseTargetStatus.running,
             SyncReleaseTargetStatus.retry,
             SyncReleaseTargetStatus.queued,
-        ]:
-            logger.debug(
-                f"Skipping {self.sync_release_job_type} for branch {branch} "
-                f"that was already processed.",
-            )
-            return None
+        ]
 
-        logger.debug(f"Running {self.sync_release_job_type} for {branch}")
+    def _start_target(self, model: SyncReleaseTargetModel) -> str:
+        """
+        Mark the target as running and report it.
+
+        Returns:
+            URL of the target in the dashboard.
+        """
+        logger.debug(f"Running {self.sync_release_job_type} for {model.branch}")
         model.set_status(status=SyncReleaseTargetStatus.running)
         # for now the url is used only for propose-downstream
         # so it does not matter URL may not be valid for pull-from-upstream
         url = get_propose_downstream_info_url(model.id)
-        buffer, handler = gather_packit_logs_to_buffer(logging_level=logging.DEBUG)
 
         model.set_start_time(start_time=datetime.utcnow())
         self.sync_release_helper.report_status_for_branch(
-            branch=branch,
+            branch=model.branch,
             description=f"Starting {self.job_name_for_reporting}...",
             state=BaseCommitStatus.running,
             url=url,
         )
+        return url
+
+    def _finish_target(
+        self,
+        model: SyncReleaseTargetModel,
+        url: str,
+        result: Union[tuple[PullRequest, dict[str, PullRequest]], Exception],
+    ) -> Optional[str]:
+        """
+        Store the result of sync-release for the target and report it.
+
+        Args:
+            model: Model for the target.
+            url: URL of the target in the dashboard.
+            result: Created pull requests or the exception.
+
+        Returns:
+            String representation of the exception, if occurs.
+        """
+        branch = model.branch
 
         try:
-            downstream_pr, additional_prs = self.sync_branch(
-                branch=branch,
-                model=sync_release_run_model,
-                tag=tag,
-                version=version,
-            )
+            if isinstance(result, Exception):
+                raise result
+            downstream_pr, additional_prs = result
             logger.debug("Downstream PR(s) created successfully.")
             model.set_downstream_pr_url(downstream_pr_url=downstream_pr.url)
             downstream_pr_project = downstream_pr.target_project
@@ -482,12 +630,7 @@ class AbstractSyncReleaseHandler(
 
             model.set_downstream_prs(downstream_prs=pr_models)
 
-        except AbortSyncRelease:
-            raise
         except Exception as ex:
-            logger.debug(f"{self.sync_release_job_type} failed: {ex}")
-            # make sure exception message is propagated to the logs
-            logging.getLogger("packit").error(str(ex))
             (state, status) = (
                 (BaseCommitStatus.neutral, SyncReleaseTargetStatus.skipped)
                 if isinstance(ex, ReleaseSkippedPackitException)
@@ -504,9 +647,6 @@ class AbstractSyncReleaseHandler(
             sentry_integration.send_to_sentry(ex)
 
             return str(ex)
-        finally:
-            model.set_finished_time(finished_time=datetime.utcnow())
-            model.set_logs(collect_packit_logs(buffer=buffer, handler=handler))
 
         dashboard_url = self.get_dashboard_url(model.id)
         self.report_dashboard_url(
@@ -524,6 +664,162 @@ class AbstractSyncReleaseHandler(
         # no error occurred
         return None
 
+    def run_for_target(
+        self,
+        sync_release_run_model: SyncReleaseModel,
+        model: SyncReleaseTargetModel,
+        tag: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Run sync-release for the single target specified by the given model.
+
+        Args:
+            sync_release_run_model: Model for the whole sync release run.
+            model: Model for the single target that is to be executed.
+
+        Returns:
+            String representation of the exception, if occurs.
+
+        Raises:
+            AbortSyncRelease: In case the archives cannot be downloaded.
+        """
+        if not self._is_target_to_run(model):
+            logger.debug(
+                f"Skipping {self.sync_release_job_type} for branch {model.branch} "
+                f"that was already processed.",
+            )
+            return None
+
+        url = self._start_target(model)
+        buffer, handler = gather_packit_logs_to_buffer(logging_level=logging.DEBUG)
+
+        result: Union[tuple[PullRequest, dict[str, PullRequest]], Exception]
+        try:
+            result = self.sync_branch(
+                branch=model.branch,
+                model=sync_release_run_model,
+                tag=tag,
+                version=version,
+            )
+        except AbortSyncRelease:
+            raise
+        except Exception as ex:
+            logger.debug(f"{self.sync_release_job_type} failed: {ex}")
+            # make sure exception message is propagated to the logs
+            logging.getLogger("packit").error(str(ex))
+            result = ex
+        finally:
+            model.set_finished_time(finished_time=datetime.utcnow())
+            model.set_logs(collect_packit_logs(buffer=buffer, handler=handler))
+
+        return self._finish_target(model, url, result)
+
+    def _can_run_targets_in_parallel(self, models: list[SyncReleaseTargetModel]) -> bool:
+        if len(models) < 2 or self.service_config.sync_release_concurrency < 2:
+            return False
+        # fast-forward merges check out the other branches as well
+        return not any(
+            self.sync_release_helper.get_fast_forward_merge_branches_for(model.branch)
+            for model in models
+        )
+
+    def run_for_targets_in_parallel(
+        self,
+        sync_release_run_model: SyncReleaseModel,
+        models: list[SyncReleaseTargetModel],
+        tag: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> dict[str, str]:
+        """
+        Run sync-release for multiple targets at once, at most
+        `sync_release_concurrency` of them at a time.
+
+        The branches are synced in their own clones of the repositories
+        (see `sync_branch_in_clone()`), the upstream archives are downloaded
+        just once for all of them. The models are updated and the statuses
+        are reported only from this thread, in the order of the targets.
+
+        If the archives cannot be downloaded yet, the remaining branches are
+        not started, the results of the branches already synced are recorded
+        and the task is retried.
+
+        Args:
+            sync_release_run_model: Model for the whole sync release run.
+            models: Models for the targets that are to be executed.
+
+        Returns:
+            Dict of branch → error message for branches that failed.
+
+        Raises:
+            AbortSyncRelease: In case the archives cannot be downloaded.
+        """
+        # clone the repositories just once (in this thread),
+        # the clones for the branches are made locally from them
+        if self.packit_api.up.local_project:
+            logger.debug(f"Upstream cloned to {self.packit_api.up.local_project.working_dir}")
+        logger.debug(f"Dist-git cloned to {self.packit_api.dg.local_project.working_dir}")
+
+        urls = {model.branch: self._start_target(model) for model in models}
+        kwargs = {
+            model.branch: self._get_sync_release_kwargs(model.branch, tag=tag, version=version)
+            for model in models
+        }
+
+        archives = SharedUpstreamArchives(
+            Path(self.service_config.command_handler_work_dir) / "upstream-archives",
+        )
+
+        def sync(model: SyncReleaseTargetModel):
+            result, logs = self.sync_branch_in_clone(
+                model.branch,
+                kwargs[model.branch],
+                archives,
+            )
+            return result, logs, datetime.utcnow()
+
+        errors = {}
+        aborted: Optional[AbortSyncRelease] = None
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.service_config.sync_release_concurrency, len(models)),
+        )
+        futures = [(model, executor.submit(sync, model)) for model in models]
+        try:
+            for model, future in futures:
+                if future.cancelled():
+                    # not started, stays running to be synced by the retried task
+                    continue
+                result, logs, finished_time = future.result()
+                model.set_finished_time(finished_time=finished_time)
+                model.set_logs(logs)
+                if isinstance(result, PackitDownloadFailedException):
+                    if aborted:
+                        # retried along with the rest
+                        continue
+                    try:
+                        with contextlib.suppress(PackitDownloadFailedException):
+                            self._retry_after_download_failure(
+                                result,
+                                sync_release_run_model,
+                                tag=tag,
+                                version=version,
+                            )
+                    except AbortSyncRelease as ex:
+                        # don't start syncing the remaining branches,
+                        # record just the ones already synced
+                        aborted = ex
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        continue
+                if error := self._finish_target(model, urls[model.branch], result):
+                    errors[model.branch] = error
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            archives.clean()
+
+        if aborted:
+            raise aborted
+        return errors
+
     def _filter_tags(self, tags: list[str]) -> list[str]:
         """Filter the given tags using upstream_tag_include and
         upstream_tag_exclude from the job config.
@@ -642,12 +938,23 @@ class AbstractSyncReleaseHandler(
             f"(tag={tag}, version={version}): {branches_to_run}"
         )
 
+        models_to_run = [
+            model
+            for model in sync_release_run_model.sync_release_targets
+            if self._is_target_to_run(model)
+        ]
+
         try:
-            for model in sync_release_run_model.sync_release_targets:
-                if error := self.run_for_target(
-                    sync_release_run_model, model, tag=tag, version=version
-                ):
-                    errors[model.branch] = error
+            if self._can_run_targets_in_parallel(models_to_run):
+                errors = self.run_for_targets_in_parallel(
+                    sync_release_run_model, models_to_run, tag=tag, version=version
+                )
+            else:
+                for model in sync_release_run_model.sync_release_targets:
+                    if error := self.run_for_target(
+                        sync_release_run_model, model, tag=tag, version=version
+                    ):
+                        errors[model.branch] = error
         except AbortSyncRelease:
             logger.debug(
                 f"{self.sync_release_job_type} is being retried because "
@@ -1194,11 +1501,13 @@ class AbstractDownstreamKojiBuildHandler(
         self._pull_request: Optional[PullRequest] = None
         self._packit_api = None
         self._koji_group_model_id = koji_group_model_id
+        # NVR -> Koji build info, prefetched for all the branches
+        self._builds_info: dict[str, Optional[dict]] = {}
 
     @property
     def koji_helper(self):
         if not self._koji_helper:
-            self._koji_helper = KojiHelper()
+            self._koji_helper = MulticallKojiHelper()
         return self._koji_helper
 
     @staticmethod
@@ -1261,7 +1570,11 @@ class AbstractDownstreamKojiBuildHandler(
         Check if the build was already triggered
         (building or completed state).
         """
-        existing_build = self.koji_helper.get_build_info(nvr)
+        existing_build = (
+            self._builds_info[nvr]
+            if nvr in self._builds_info
+            else self.koji_helper.get_build_info(nvr)
+        )
 
         if existing_build:
             raw_state = existing_build["state"]
@@ -1276,6 +1589,141 @@ class AbstractDownstreamKojiBuildHandler(
 
         return False
 
+    def _skip_already_triggered(
+        self,
+        koji_build_models: list[KojiBuildTargetModel],
+    ) -> list[KojiBuildTargetModel]:
+        """
+        Mark the builds of NVRs that were already triggered as skipped.
+
+        The existing builds of all the branches are looked up at once,
+        with a single DB query and a single Koji multicall.
+
+        Returns:
+            Builds to be submitted.
+        """
+        existing_models = KojiBuildTargetModel.get_all_successful_or_in_progress_by_nvrs(
+            model.nvr for model in koji_build_models
+        )
+        self._builds_info.update(
+            self.koji_helper.get_builds_info(
+                {
+                    model.nvr
+                    for model in koji_build_models
+                    if not existing_models.get(model.nvr, set()) - {model}
+                },
+            ),
+        )
+
+        to_submit: list[KojiBuildTargetModel] = []
+        for koji_build_model in koji_build_models:
+            nvr = koji_build_model.nvr
+            if (
+                existing_models.get(nvr, set()) - {koji_build_model}
+                # the same NVR in multiple branches is built only once
+                or nvr in {model.nvr for model in to_submit}
+                or self.is_already_triggered(nvr)
+            ):
+                logger.info(
+                    f"Skipping downstream Koji build {nvr} "
+                    f"for branch {koji_build_model.target} that was already triggered.",
+                )
+                koji_build_model.set_status("skipped")
+                continue
+            to_submit.append(koji_build_model)
+
+        return to_submit
+
+    def submit_build_in_clone(
+        self,
+        branch: str,
+        koji_target: Optional[str],
+    ) -> Union[Optional[str], Exception]:
+        """
+        Submit the build of the branch from its own clone of the dist-git repository,
+        so that multiple branches can be submitted at once. Runs in a worker thread,
+        doesn't touch the DB.
+
+        Args:
+            branch: dist-git branch.
+            koji_target: Koji target to build for, the sidetag.
+
+        Returns:
+            Output of the build submission or the exception.
+        """
+        try:
+            with packit_api_in_clones(
+                self.service_config,
+                self.job_config,
+                branch,
+                downstream_local_project=self.packit_api.dg.local_project,
+            ) as packit_api:
+                return packit_api.build(
+                    dist_git_branch=branch,
+                    scratch=self.job_config.scratch,
+                    nowait=True,
+                    from_upstream=False,
+                    koji_target=koji_target,
+                )
+        except Exception as ex:
+            logger.debug(f"Downstream Koji build for {branch} failed: {ex}")
+            return ex
+
+    def _submit_builds(
+        self,
+        koji_build_models: list[KojiBuildTargetModel],
+    ) -> Generator[
+        tuple[KojiBuildTargetModel, Union[Optional[str], Exception]],
+        None,
+        None,
+    ]:
+        """
+        Submit the builds, up to `koji_build_concurrency` of them in parallel.
+
+        The models are not touched outside of the handler thread, the results are yielded
+        in the order of the builds and the pending submissions are cancelled
+        when the iteration stops.
+
+        Yields:
+            Build models and the outputs of the submissions or the exceptions raised.
+        """
+        if len(koji_build_models) < 2 or self.service_config.koji_build_concurrency < 2:
+            # the submissions share the dist-git working tree
+            for koji_build_model in koji_build_models:
+                logger.debug(f"Running downstream Koji build for {koji_build_model.target}")
+                koji_build_model.set_status("pending")
+                try:
+                    result = self.packit_api.build(
+                        dist_git_branch=koji_build_model.target,
+                        scratch=self.job_config.scratch,
+                        nowait=True,
+                        from_upstream=False,
+                        koji_target=koji_build_model.sidetag,
+                    )
+                except PackitException as ex:
+                    result = ex
+                yield koji_build_model, result
+            return
+
+        with sa_unit_of_work():
+            for koji_build_model in koji_build_models:
+                logger.debug(f"Running downstream Koji build for {koji_build_model.target}")
+                koji_build_model.set_status("pending")
+        # clone the dist-git repository and obtain the Kerberos ticket just once,
+        # the branches are built in local clones of the repository
+        self.packit_api.init_kerberos_ticket()
+        logger.debug(f"Dist-git cloned to {self.packit_api.dg.local_project.working_dir}")
+
+        builds = [(model.target, model.sidetag) for model in koji_build_models]
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.service_config.koji_build_concurrency, len(builds)),
+        )
+        try:
+            results = executor.map(lambda build: self.submit_build_in_clone(*build), builds)
+            yield from zip(koji_build_models, results)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _run(self) -> TaskResults:
         if getenv("CANCEL_RUNNING_JOBS"):
             self.koji_build_helper.cancel_running_builds()
@@ -1286,86 +1734,92 @@ class AbstractDownstreamKojiBuildHandler(
             logger.debug(f"Koji build failed to be submitted: {ex}")
             return TaskResults(success=True, details={})
 
-        errors = {}
+        koji_build_models = []
         for koji_build_model in group.grouped_targets:
-            branch = koji_build_model.target
-
             # skip submitting build for a branch if we already did that (even if it failed)
-            if koji_build_model.status not in ["queued", "pending", "retry"]:
+            if (
+                koji_build_model.status not in ["queued", "pending", "retry"]
+                # submitted before the task was retried
+                or koji_build_model.task_id
+            ):
                 logger.debug(
-                    f"Skipping downstream Koji build for branch {branch} "
+                    f"Skipping downstream Koji build for branch {koji_build_model.target} "
                     f"that was already processed.",
                 )
                 continue
+            koji_build_models.append(koji_build_model)
 
-            if not self.job_config.scratch:
-                existing_models = KojiBuildTargetModel.get_all_successful_or_in_progress_by_nvr(
-                    koji_build_model.nvr,
-                )
-                if existing_models - {koji_build_model} or self.is_already_triggered(
-                    koji_build_model.nvr,
+        if not self.job_config.scratch:
+            koji_build_models = self._skip_already_triggered(koji_build_models)
+
+        errors = {}
+        # all the submitted builds are recorded before the failed ones are retried
+        retried: list[KojiBuildTargetModel] = []
+        retry_exception: Optional[PackitException] = None
+        internal_error: Optional[Exception] = None
+        for koji_build_model, result in self._submit_builds(koji_build_models):
+            if isinstance(result, PackitException):
+                if (
+                    self.celery_task
+                    and self.celery_task.can_retry_for(result)
+                    and not self.celery_task.is_last_try()
                 ):
-                    logger.info(
-                        f"Skipping downstream Koji build {koji_build_model.nvr} "
-                        f"for branch {branch} that was already triggered.",
-                    )
-                    koji_build_model.set_status("skipped")
+                    retried.append(koji_build_model)
+                    retry_exception = result
                     continue
 
-            logger.debug(f"Running downstream Koji build for {branch}")
-            koji_build_model.set_status("pending")
+                error = str(result)
+                with sa_unit_of_work():
+                    if isinstance(result, PackitCommandFailedError):
+                        error += f"\n{result.stderr_output}"
+                        koji_build_model.set_build_submission_stdout(result.stdout_output)
+                    koji_build_model.set_data({"error": error})
+                    koji_build_model.set_status("error")
 
-            try:
-                stdout = self.packit_api.build(
-                    dist_git_branch=koji_build_model.target,
-                    scratch=self.job_config.scratch,
-                    nowait=True,
-                    from_upstream=False,
-                    koji_target=koji_build_model.sidetag,
+                errors[koji_build_model.target] = get_koji_build_info_url(
+                    koji_build_model.id,
                 )
-                if stdout:
-                    task_id, web_url = get_koji_task_id_and_url_from_stdout(stdout)
+                continue
+
+            if isinstance(result, Exception):
+                internal_error = internal_error or result
+                continue
+
+            if result:
+                task_id, web_url = get_koji_task_id_and_url_from_stdout(result)
+                with sa_unit_of_work():
                     koji_build_model.set_task_id(str(task_id))
                     koji_build_model.set_web_url(web_url)
-                    koji_build_model.set_build_submission_stdout(stdout)
-            except PackitException as ex:
-                if (
-                    self.celery_task
-                    and self.celery_task.can_retry_for(ex)
-                    and not self.celery_task.is_last_try()
-                ):
-                    kargs = self.celery_task.task.request.kwargs.copy()
-                    kargs["koji_group_model_id"] = group.id
-                    for model in group.grouped_targets:
-                        model.set_status("retry")
+                    koji_build_model.set_build_submission_stdout(result)
 
-                    logger.debug(
-                        "Celery task will be retried. User will not be notified about the failure.",
-                    )
-                    retry_backoff = int(
-                        getenv("CELERY_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF),
-                    )
-                    delay = retry_backoff * 2**self.celery_task.retries
-                    self.celery_task.task.retry(exc=ex, countdown=delay, kwargs=kargs)
-                    return TaskResults(
-                        success=True,
-                        details={
-                            "msg": f"There was an error: {ex}. Task will be retried.",
-                        },
-                    )
-                error = str(ex)
-                if isinstance(ex, PackitCommandFailedError):
-                    error += f"\n{ex.stderr_output}"
-                    koji_build_model.set_build_submission_stdout(ex.stdout_output)
-
-                errors[branch] = get_koji_build_info_url(koji_build_model.id)
-                koji_build_model.set_data({"error": error})
-                koji_build_model.set_status("error")
-                continue
+        if retry_exception:
+            kargs = self.celery_task.task.request.kwargs.copy()
+            kargs["koji_group_model_id"] = group.id
+            with sa_unit_of_work():
+                for koji_build_model in retried:
+                    koji_build_model.set_status("retry")
+
+            logger.debug(
+                "Celery task will be retried. User will not be notified about the failure.",
+            )
+            retry_backoff = int(
+                getenv("CELERY_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF),
+            )
+            delay = retry_backoff * 2**self.celery_task.retries
+            self.celery_task.task.retry(exc=retry_exception, countdown=delay, kwargs=kargs)
+            return TaskResults(
+                success=True,
+                details={
+                    "msg": f"There was an error: {retry_exception}. Task will be retried.",
+                },
+            )
 
         if errors:
             self.report_in_issue_repository(errors)
 
+        if internal_error:
+            raise internal_error
+
         return TaskResults(success=True, details={})
 
     @abc.abstractmethod
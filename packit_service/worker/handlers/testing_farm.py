@@ -199,23 +199,23 @@ class TestingFarmHandler(
         group = TFTTestRunGroupModel.create(
             run_model, ranch=self.testing_farm_job_helper.tft_client.default_ranch
         )
-        runs = []
-        for target, build in builds.items():
-            test_builds = [build] if build else []
-            runs.append(
-                TFTTestRunTargetModel.create(
-                    pipeline_id=None,
-                    identifier=self.job_config.identifier,
-                    status=TestingFarmResult.new,
-                    target=target,
-                    web_url=None,
-                    test_run_group=group,
-                    copr_build_targets=test_builds,
+        runs = TFTTestRunTargetModel.bulk_create(
+            test_run_group=group,
+            test_runs=[
+                {
+                    "pipeline_id": None,
+                    "identifier": self.job_config.identifier,
+                    "status": TestingFarmResult.new,
+                    "target": target,
+                    "web_url": None,
+                    "copr_build_targets": [build] if build else [],
                     # In _payload() we ask TF to test commit_sha of fork (PR's source).
                     # Store original url. If this proves to work, make it a separate column.
-                    data={"base_project_url": self.project.get_web_url()},
-                ),
-            )
+                    "data": {"base_project_url": self.project.get_web_url()},
+                }
+                for target, build in builds.items()
+            ],
+        )
 
         return group, runs
 
@@ -485,22 +485,26 @@ class DownstreamTestingFarmHandler(
         distro = target.rsplit("-", 1)[0]
         distro = get_default_tf_mapping(internal=False).get(distro, distro)
 
-        runs = []
-        for test in fedora_ci_tests:
-            runs.append(  # noqa: PERF401
-                TFTTestRunTargetModel.create(
-                    pipeline_id=None,
-                    identifier=None,
-                    status=TestingFarmResult.new,
-                    target=distro,
-                    web_url=None,
-                    test_run_group=group,
-                    koji_build_targets=[self.koji_build] if self.koji_build else [],
+        runs = TFTTestRunTargetModel.bulk_create(
+            test_run_group=group,
+            test_runs=[
+                {
+                    "pipeline_id": None,
+                    "identifier": None,
+                    "status": TestingFarmResult.new,
+                    "target": distro,
+                    "web_url": None,
+                    "koji_build_targets": [self.koji_build] if self.koji_build else [],
                     # In _payload() we ask TF to test commit_sha of fork (PR's source).
                     # Store original url. If this proves to work, make it a separate column.
-                    data={"base_project_url": self.project.get_web_url(), "fedora_ci_test": test},
-                ),
-            )
+                    "data": {
+                        "base_project_url": self.project.get_web_url(),
+                        "fedora_ci_test": test,
+                    },
+                }
+                for test in fedora_ci_tests
+            ],
+        )
         return group, runs
 
     def run_for_fedora_ci_test(
@@ -3,9 +3,11 @@
 
 import collections
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from typing import Any, Optional
 
 import celery
@@ -14,7 +16,9 @@ import requests
 from celery.canvas import Signature
 from copr.v3 import Client as CoprClient
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
 
+from packit_service.cache import redis_pipeline
 from packit_service.constants import (
     COPR_API_FAIL_STATE,
     COPR_API_SUCC_STATE,
@@ -23,6 +27,9 @@ from packit_service.constants import (
     COPR_SUCC_STATE,
     DEFAULT_JOB_TIMEOUT,
     TESTING_FARM_API_URL,
+    TESTING_FARM_BABYSIT_CONCURRENCY,
+    TESTING_FARM_BABYSIT_MAX_INTERVAL,
+    TESTING_FARM_BABYSIT_REQUEST_TIMEOUT,
 )
 from packit_service.events import copr as copr_events
 from packit_service.events import (
@@ -57,6 +64,10 @@ from packit_service.worker.parser import Parser
 
 logger = logging.getLogger(__name__)
 
+# Redis hash of the times (timestamps) of the next checks of the pending
+# Testing Farm requests, by their IDs
+TESTING_FARM_NEXT_CHECKS_KEY = "packit-service:babysit:testing-farm-next-checks"
+
 
 def celery_run_async(signatures: list[Signature]) -> None:
     logger.debug("Signatures are going to be sent to Celery (from babysit task).")
@@ -77,8 +88,125 @@ def celery_run_async(signatures: list[Signature]) -> None:
     logger.debug("Signatures were sent to Celery.")
 
 
+def get_testing_farm_check_interval(state: TestingFarmResult, pending_for: float) -> float:
+    """
+    Get the number of seconds after which a pending Testing Farm request
+    should be checked again.
+
+    The longer the request has been pending, the less likely it is to finish
+    before the next check. Running requests are checked more often than
+    the ones still waiting in the queue.
+
+    Args:
+        state: Last observed state of the request.
+        pending_for: Number of seconds since the request was submitted.
+
+    Returns:
+        Number of seconds to wait before the next check.
+    """
+    max_interval = TESTING_FARM_BABYSIT_MAX_INTERVAL
+    if state == TestingFarmResult.running:
+        max_interval //= 2
+    elif state == TestingFarmResult.cancel_requested:
+        max_interval = 0
+    return min(pending_for / 4, max_interval)
+
+
+def get_testing_farm_request_details(
+    session: requests.Session,
+    pipeline_id: str,
+) -> Optional[dict]:
+    """Fetch the details of the Testing Farm request, `None` if not available."""
+    try:
+        response = session.get(
+            f"{TESTING_FARM_API_URL}requests/{pipeline_id}",
+            timeout=TESTING_FARM_BABYSIT_REQUEST_TIMEOUT,
+        )
+    except requests.RequestException as ex:
+        logger.info(f"Failed to obtain state of TF pipeline {pipeline_id}: {ex}")
+        return None
+
+    if not response.ok:
+        logger.info(
+            f"Failed to obtain state of TF pipeline {pipeline_id}. "
+            f"Status code {response.status_code}. Reason: {response.reason}. "
+            "Let's try again later.",
+        )
+        return None
+    return response.json()
+
+
+def fetch_testing_farm_requests_details(pipeline_ids: list[str]) -> Iterator[Optional[dict]]:
+    """
+    Fetch the details of the Testing Farm requests concurrently over a single
+    keep-alive session.
+
+    Args:
+        pipeline_ids: IDs of the Testing Farm requests.
+
+    Returns:
+        Details of the requests in the order of `pipeline_ids`,
+        `None` for the ones that could not be fetched.
+    """
+    with requests.Session() as session:
+        session.mount(
+            TESTING_FARM_API_URL,
+            HTTPAdapter(pool_maxsize=TESTING_FARM_BABYSIT_CONCURRENCY),
+        )
+        with ThreadPoolExecutor(max_workers=TESTING_FARM_BABYSIT_CONCURRENCY) as executor:
+            yield from executor.map(
+                partial(get_testing_farm_request_details, session),
+                pipeline_ids,
+            )
+
+
+def filter_testing_farm_runs_to_check(
+    runs: list[TFTTestRunTargetModel],
+    now: float,
+) -> list[TFTTestRunTargetModel]:
+    """Drop the runs whose next check was postponed after now, keep all if Redis is down."""
+    if not runs:
+        return []
+
+    results = redis_pipeline(
+        ("hmget", TESTING_FARM_NEXT_CHECKS_KEY, [run.pipeline_id for run in runs]),
+    )
+    if results is None:
+        return runs
+
+    return [
+        run
+        for run, next_check in zip(runs, results[0])
+        if not next_check or float(next_check) <= now
+    ]
+
+
+def store_testing_farm_next_checks(postponed: dict[str, float], finished: list[str]) -> None:
+    """
+    Remember when to check the pending Testing Farm requests again.
+
+    Args:
+        postponed: Timestamps of the next checks by the IDs of the requests.
+        finished: IDs of the requests that do not need to be checked anymore.
+    """
+    commands: list[tuple] = []
+    if postponed:
+        commands.append(("hset", TESTING_FARM_NEXT_CHECKS_KEY, None, None, postponed))
+    if finished:
+        commands.append(("hdel", TESTING_FARM_NEXT_CHECKS_KEY, *finished))
+    if commands:
+        commands.append(("expire", TESTING_FARM_NEXT_CHECKS_KEY, DEFAULT_JOB_TIMEOUT))
+        redis_pipeline(*commands)
+
+
 def check_pending_testing_farm_runs() -> None:
-    """Checks the status of pending TFT runs and updates it if needed."""
+    """
+    Checks the status of pending TFT runs and updates it if needed.
+
+    The requests are fetched concurrently over a single keep-alive session
+    and the runs that recently turned out to be still pending are skipped
+    for a while (see `get_testing_farm_check_interval`).
+    """
     logger.info("Getting pending TFT runs from DB")
     current_time = datetime.now(timezone.utc)
     not_completed = (
@@ -87,9 +215,9 @@ def check_pending_testing_farm_runs() -> None:
         TestingFarmResult.running,
         TestingFarmResult.cancel_requested,
     )
-    pending_test_runs = TFTTestRunTargetModel.get_all_by_status(*not_completed)
-    for run in pending_test_runs:
-        logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
+    timed_out_runs = []
+    runs_to_check = []
+    for run in TFTTestRunTargetModel.get_all_by_status(*not_completed):
         # .submitted_time can be None, we'll set it later
         if run.submitted_time:
             elapsed = elapsed_seconds(begin=run.submitted_time, end=current_time)
@@ -99,25 +227,45 @@ def check_pending_testing_farm_runs() -> None:
                     f"{elapsed}s, probably an internal error occurred. "
                     "Not checking it anymore.",
                 )
-                run.set_status(TestingFarmResult.error)
+                timed_out_runs.append(run)
                 continue
-        run_url = f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}"
-        response = requests.get(run_url)
-        if not response.ok:
-            logger.info(
-                f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
-                f"Status code {response.status_code}. Reason: {response.reason}. "
-                "Let's try again later.",
-            )
+        if not run.pipeline_id:
+            logger.debug(f"TFT run {run.id} was not submitted yet.")
             continue
+        runs_to_check.append(run)
 
-        details = response.json()
-        data = Parser.parse_data_from_testing_farm(run, details)
+    TFTTestRunTargetModel.set_status_of_all(
+        [run.id for run in timed_out_runs],
+        TestingFarmResult.error,
+    )
 
+    runs_to_check = filter_testing_farm_runs_to_check(runs_to_check, current_time.timestamp())
+
+    postponed: dict[str, float] = {}
+    finished: list[str] = [run.pipeline_id for run in timed_out_runs if run.pipeline_id]
+    # the responses are processed in this thread while the others are fetched
+    for run, details in zip(
+        runs_to_check,
+        fetch_testing_farm_requests_details([run.pipeline_id for run in runs_to_check]),
+    ):
+        if details is None:
+            continue
+
+        data = Parser.parse_data_from_testing_farm(run, details)
         logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {data.result}.")
         if data.result in not_completed:
             logger.debug("Skip updating a pipeline which is not yet completed.")
+            pending_for = (
+                elapsed_seconds(begin=run.submitted_time, end=current_time)
+                if run.submitted_time
+                else 0
+            )
+            postponed[run.pipeline_id] = current_time.timestamp() + (
+                get_testing_farm_check_interval(data.result, pending_for)
+            )
             continue
+
+        finished.append(run.pipeline_id)
         event = testing_farm.Result(
             pipeline_id=details["id"],
             result=data.result,
@@ -139,6 +287,8 @@ def check_pending_testing_farm_runs() -> None:
                 f"with pipeline ID {run.pipeline_id}: {ex}",
             )
 
+    store_testing_farm_next_checks(postponed, finished)
+
 
 def update_testing_farm_run(event: testing_farm.Result, run: TFTTestRunTargetModel):
     """
@@ -33,7 +33,7 @@ from packit_service.models import (
     SRPMBuildModel,
 )
 from packit_service.service.urls import get_srpm_build_info_url
-from packit_service.utils import pr_labels_match_configuration
+from packit_service.utils import labels_match_configuration, pr_labels_match_configuration
 from packit_service.worker.helpers.job_helper import BaseJobHelper
 from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.reporting import BaseCommitStatus, DuplicateCheckMode
@@ -650,6 +650,14 @@ class BaseBuildJobHelper(BaseJobHelper):
         if not (test_job.require.label.present or test_job.require.label.absent):
             return True
 
+        if (pr_labels := self.metadata.pr_labels) is not None:
+            # fetched when dispatching the event
+            return labels_match_configuration(
+                pr_labels=pr_labels,
+                configured_labels_present=test_job.require.label.present,
+                configured_labels_absent=test_job.require.label.absent,
+            )
+
         return pr_labels_match_configuration(
             pull_request=self.pull_request_object,
             configured_labels_absent=test_job.require.label.absent,
@@ -59,6 +59,11 @@ from packit_service.service.urls import (
 from packit_service.utils import elapsed_seconds, get_default_tf_mapping
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.helpers.build.build_helper import BaseBuildJobHelper
+from packit_service.worker.helpers.build.copr_chroots import (
+    COPR_CHROOTS_MIN_REFRESH_AGE,
+    get_available_chroots,
+    invalidate_available_chroots,
+)
 from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.result import TaskResults
@@ -363,13 +368,24 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
     def available_chroots(self) -> set[str]:
         """
         Returns set of available COPR targets.
+
+        The set is served from the catalog shared by all the workers,
+        see `copr_chroots.get_available_chroots`.
         """
-        return {
-            *filter(
-                lambda chroot: not chroot.startswith("_"),
-                self.api.copr_helper.get_copr_client().mock_chroot_proxy.get_list().keys(),
-            ),
-        }
+        return get_available_chroots(self._fetch_copr_chroots)
+
+    def _fetch_copr_chroots(self) -> dict:
+        return self.api.copr_helper.get_copr_client().mock_chroot_proxy.get_list()
+
+    @staticmethod
+    def _invalidate_rejected_chroots(ex: Exception, chroots: Iterable[str]) -> None:
+        """
+        Drop the catalog of the available chroots if Copr refused any of the chroots,
+        they may have been disabled (e.g. EOL) since the catalog was fetched.
+        """
+        if rejected := sorted(chroot for chroot in chroots if chroot in str(ex)):
+            logger.info(f"Copr refused {rejected}, the available chroots will be refetched.")
+            invalidate_available_chroots()
 
     def is_custom_copr_project_defined(self) -> bool:
         return (
@@ -585,9 +601,18 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
         group, self.run_model = CoprBuildGroupModel.create(
             self.run_model, package_name=handler_package_name
         )
+        available_chroots = self.available_chroots
+        if not self.build_targets <= available_chroots:
+            # the catalog may be outdated, e.g. Copr has just enabled a new chroot
+            available_chroots = get_available_chroots(
+                self._fetch_copr_chroots,
+                max_age=COPR_CHROOTS_MIN_REFRESH_AGE,
+            )
+
         unprocessed_chroots = []
+        builds = []
         for chroot in self.build_targets:
-            if chroot not in self.available_chroots:
+            if chroot not in available_chroots:
                 self.report_status_to_all_for_chroot(
                     state=BaseCommitStatus.error,
                     description=f"Not supported target: {chroot}",
@@ -598,21 +623,23 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
                 unprocessed_chroots.append(chroot)
                 continue
 
-            CoprBuildTargetModel.create(
-                build_id=None,
-                project_name=self.job_project,
-                owner=self.job_owner,
-                web_url=None,
-                target=chroot,
-                status=BuildStatus.waiting_for_srpm,
-                copr_build_group=group,
-                task_accepted_time=self.metadata.task_accepted_time,
-                identifier=self.job_config.identifier,
+            builds.append(
+                {
+                    "build_id": None,
+                    "project_name": self.job_project,
+                    "owner": self.job_owner,
+                    "web_url": None,
+                    "target": chroot,
+                    "status": BuildStatus.waiting_for_srpm,
+                    "task_accepted_time": self.metadata.task_accepted_time,
+                    "identifier": self.job_config.identifier,
+                },
             )
+        CoprBuildTargetModel.bulk_create(copr_build_group=group, builds=builds)
 
         if unprocessed_chroots:
             unprocessed = "\n".join(sorted(unprocessed_chroots))
-            available = "\n".join(sorted(self.available_chroots))
+            available = "\n".join(sorted(available_chroots))
             self.status_reporter.comment(
                 body="There are build targets that are not supported by COPR.\n"
                 "<details>\n<summary>Unprocessed build targets</summary>\n\n"
@@ -678,6 +705,7 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
                 )
 
         except (CoprRequestException, CoprAuthException) as ex:
+            self._invalidate_rejected_chroots(ex, self.build_targets)
             if MISSING_PERMISSIONS_TO_BUILD_IN_COPR in str(
                 ex,
             ) or NOT_ALLOWED_TO_BUILD_IN_COPR in str(ex):
@@ -905,11 +933,12 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
                 "Copr owner not set. Use Copr config file or `--owner` when calling packit CLI.",
             )
 
+        chroots = list(self.build_targets_all)
         try:
             overwrite_booleans = owner == self.service_config.fas_user
             self.api.copr_helper.create_or_update_copr_project(
                 project=self.job_project,
-                chroots=list(self.build_targets_all),
+                chroots=chroots,
                 owner=owner,
                 description=None,
                 instructions=None,
@@ -990,6 +1019,7 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
             self.status_reporter.comment(body=msg)
             raise ex
         except PackitCoprProjectException as ex:
+            self._invalidate_rejected_chroots(ex, chroots)
             msg = (
                 "We were not able to find or create Copr project"
                 f" `{owner}/{self.job_project}` "
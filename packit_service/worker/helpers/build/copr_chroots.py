@@ -0,0 +1,105 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Catalog of the chroots available in Copr.
+
+The list of mock chroots changes only a few times per Fedora release cycle,
+but it used to be fetched from Copr on each access. The catalog is shared
+by all the workers (see `packit_service.cache`) and served
+stale-while-revalidate: once the entry is older than
+`COPR_CHROOTS_FRESH_TTL`, the stale list is still returned and a single
+background thread refreshes it. The catalog is dropped right away when
+Copr refuses a chroot from it (see `invalidate_available_chroots`).
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from packit_service.cache import MISSING, SharedCache
+
+logger = logging.getLogger(__name__)
+
+# age (in seconds) after which the catalog is refreshed
+COPR_CHROOTS_FRESH_TTL = 60 * 60
+# age (in seconds) after which the stale catalog is not served anymore
+COPR_CHROOTS_STALE_TTL = 12 * 60 * 60
+# minimal age (in seconds) of the catalog to be refetched when a chroot is missing
+COPR_CHROOTS_MIN_REFRESH_AGE = 5 * 60
+
+_CACHE_KEY = "available"
+
+copr_chroots_cache = SharedCache(
+    namespace="copr-chroots",
+    ttl=COPR_CHROOTS_STALE_TTL,
+    maxsize=1,
+)
+_refresh_lock = threading.Lock()
+
+ChrootsFetcher = Callable[[], dict]
+
+
+def _fetch(fetch_chroots: ChrootsFetcher) -> dict:
+    chroots = sorted(chroot for chroot in fetch_chroots() if not chroot.startswith("_"))
+    entry = {"chroots": chroots, "fetched_at": time.time()}
+    copr_chroots_cache.set(_CACHE_KEY, entry)
+    logger.debug(f"Fetched {len(chroots)} available Copr chroots.")
+    return entry
+
+
+def _refresh_in_background(fetch_chroots: ChrootsFetcher) -> None:
+    # at most one refresh per process and (via the Redis lock) across all workers
+    if not _refresh_lock.acquire(blocking=False):
+        return
+    if not copr_chroots_cache.acquire_lock(_CACHE_KEY):
+        _refresh_lock.release()
+        return
+
+    def refresh():
+        try:
+            _fetch(fetch_chroots)
+        except Exception as ex:
+            logger.warning(f"Failed to refresh the available Copr chroots: {ex}")
+        finally:
+            copr_chroots_cache.release_lock(_CACHE_KEY)
+            _refresh_lock.release()
+
+    threading.Thread(target=refresh, name="copr-chroots-refresh", daemon=True).start()
+
+
+def get_available_chroots(
+    fetch_chroots: ChrootsFetcher,
+    max_age: Optional[int] = None,
+) -> set[str]:
+    """
+    Get the chroots available in Copr.
+
+    Args:
+        fetch_chroots: Callable returning the mock chroots from Copr
+            (mapping of the chroot name to its description), called only
+            when the catalog needs to be (re)fetched.
+        max_age: If set, refetch the catalog synchronously when it is
+            older than this many seconds.
+
+    Returns:
+        Set of the available chroot names.
+    """
+    entry = copr_chroots_cache.get(_CACHE_KEY)
+
+    if entry is not MISSING:
+        age = time.time() - entry["fetched_at"]
+        if max_age is not None and age > max_age:
+            entry = _fetch(fetch_chroots)
+        elif age > COPR_CHROOTS_FRESH_TTL:
+            _refresh_in_background(fetch_chroots)
+    else:
+        entry = _fetch(fetch_chroots)
+
+    return set(entry["chroots"])
+
+
+def invalidate_available_chroots() -> None:
+    """Drop the catalog so that the next access fetches it from Copr."""
+    copr_chroots_cache.delete(_CACHE_KEY)
@@ -37,10 +37,10 @@ class FedoraCIHelper:
         return self._status_reporter
 
     def report(self, state: BaseCommitStatus, description: str, url: str, check_name: str):
-        self.status_reporter.set_status(
+        self.status_reporter.report(
             state=state,
             description=description,
             url=url,
-            check_name=check_name,
+            check_names=check_name,
             target_branch=self.target_branch,
         )
@@ -18,7 +18,6 @@ from packit.local_project import (
     LocalProject,
     LocalProjectBuilder,
 )
-from packit.utils.repo import RepositoryCache
 
 from packit_service.config import Deployment, ServiceConfig
 from packit_service.events.event_data import EventData
@@ -27,6 +26,7 @@ from packit_service.models import (
     PipelineModel,
     ProjectEventModel,
 )
+from packit_service.worker.helpers.repository_mirror import get_repository_cache
 from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.reporting import BaseCommitStatus, StatusReporter
 
@@ -86,16 +86,7 @@ class BaseJobHelper:
     @property
     def local_project(self) -> LocalProject:
         if self._local_project is None:
-            builder = LocalProjectBuilder(
-                cache=(
-                    RepositoryCache(
-                        cache_path=self.service_config.repository_cache,
-                        add_new=self.service_config.add_repositories_to_repository_cache,
-                    )
-                    if self.service_config.repository_cache
-                    else None
-                ),
-            )
+            builder = LocalProjectBuilder(cache=get_repository_cache(self.service_config))
             self._local_project = builder.build(
                 git_project=self.project,
                 working_dir=self.service_config.command_handler_work_dir,
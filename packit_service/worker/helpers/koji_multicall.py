@@ -0,0 +1,196 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import logging
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from packit.utils.koji_helper import KojiHelper
+from specfile.utils import NEVR
+
+logger = logging.getLogger(__name__)
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+# results of the Koji lookups in the current task, `None` when they are not memoized
+_koji_memo: ContextVar[Optional[dict[tuple, Any]]] = ContextVar("_koji_memo", default=None)
+
+
+@contextmanager
+def memoized_koji_lookups() -> Iterator[None]:
+    """
+    Memoize the tag listings and the latest stable builds looked up
+    by `MulticallKojiHelper` within the context (a task).
+    """
+    token = _koji_memo.set({})
+    try:
+        yield
+    finally:
+        _koji_memo.reset(token)
+
+
+class MulticallKojiHelper(KojiHelper):
+    """
+    Koji helper doing multiple lookups in a single XML-RPC round-trip
+    (Koji multicall).
+
+    Tag listings and the latest stable builds are memoized within
+    `memoized_koji_lookups()`.
+    """
+
+    @staticmethod
+    def _memoized(key: tuple, fetch: Callable[[], Any]) -> Any:
+        if (memo := _koji_memo.get()) is None:
+            return fetch()
+        if key not in memo:
+            memo[key] = fetch()
+        return memo[key]
+
+    @staticmethod
+    def _forget(key: tuple) -> None:
+        if (memo := _koji_memo.get()) is not None:
+            memo.pop(key, None)
+
+    @staticmethod
+    def _get_result(method: str, key: Hashable, call: Any) -> Any:
+        try:
+            return call.result
+        except Exception as ex:
+            logger.debug(f"Failed to call {method}() for {key} in Koji: {ex}")
+            return None
+
+    def _multicall(
+        self,
+        method: str,
+        calls: dict[KeyT, dict[str, Any]],
+    ) -> dict[KeyT, Any]:
+        """
+        Call the Koji method with multiple sets of arguments at once.
+
+        Args:
+            method: Name of the Koji API method.
+            calls: Keyword arguments of the calls by the keys of the results.
+
+        Returns:
+            Results of the calls by their keys, `None` for the failed ones.
+        """
+        if not calls:
+            return {}
+
+        try:
+            # the raw session, the wrapper can't wrap the multicall
+            with self.session.session.multicall(strict=False) as multicall:
+                pending = {
+                    key: getattr(multicall, method)(**kwargs) for key, kwargs in calls.items()
+                }
+        except Exception as ex:
+            logger.debug(f"Failed to call {method}() for {len(calls)} items in Koji: {ex}")
+            return dict.fromkeys(calls)
+
+        return {key: self._get_result(method, key, call) for key, call in pending.items()}
+
+    def get_builds_info(
+        self,
+        builds: Iterable[Union[int, str]],
+    ) -> dict[Union[int, str], Optional[dict]]:
+        """
+        Gets information of multiple builds.
+
+        Args:
+            builds: Koji build IDs or NVRs.
+
+        Returns:
+            Build information by the IDs or NVRs, `None` if there is no such build.
+        """
+        return self._multicall("getBuild", {build: {"buildInfo": build} for build in builds})
+
+    # zero-argument super() doesn't work in the lambdas, bind the parent methods first
+
+    def get_builds_in_tag(self, tag: str) -> list[dict]:
+        fetch = super().get_builds_in_tag
+        return self._memoized(("builds_in_tag", tag), lambda: fetch(tag))
+
+    def get_candidate_tag(self, dist_git_branch: str) -> Optional[str]:
+        fetch = super().get_candidate_tag
+        return self._memoized(("candidate_tag", dist_git_branch), lambda: fetch(dist_git_branch))
+
+    def get_stable_tags(self, tag: str) -> list[str]:
+        fetch = super().get_stable_tags
+        # the callers extend the list
+        return list(self._memoized(("stable_tags", tag), lambda: fetch(tag)))
+
+    def tag_build(self, nvr: str, tag: str) -> Optional[str]:
+        self._forget(("builds_in_tag", tag))
+        return super().tag_build(nvr, tag)
+
+    def untag_build(self, nvr: str, tag: str) -> None:
+        self._forget(("builds_in_tag", tag))
+        super().untag_build(nvr, tag)
+
+    def get_latest_stable_nvrs(
+        self,
+        packages: Iterable[str],
+        dist_git_branch: str,
+        include_candidate: bool = False,
+    ) -> dict[str, Optional[str]]:
+        """
+        Gets the NVRs of the latest builds of multiple packages tagged into any stable or,
+        if requested, the candidate tag for the given branch.
+
+        The builds of all the packages in all the tags are looked up
+        in a single multicall.
+
+        Args:
+            packages: Package names.
+            dist_git_branch: dist-git branch name.
+            include_candidate: Whether to consider also builds tagged
+              into the corresponding candidate tag.
+
+        Returns:
+            NVRs of the latest builds by the package names, `None` if there is no such build.
+        """
+        memo = _koji_memo.get()
+        if memo is None:
+            memo = {}
+
+        def memo_key(package: str) -> tuple:
+            return ("latest_stable_nvr", package, dist_git_branch, include_candidate)
+
+        packages = set(packages)
+        missing = {package for package in packages if memo_key(package) not in memo}
+        if missing:
+            if candidate_tag := self.get_candidate_tag(dist_git_branch):
+                tags = self.get_stable_tags(candidate_tag)
+                if include_candidate:
+                    tags.append(candidate_tag)
+            else:
+                tags = []
+
+            latest_builds = self._multicall(
+                "listTagged",
+                {
+                    (package, tag): {
+                        "tag": tag,
+                        "package": package,
+                        "inherit": True,
+                        "latest": True,
+                        "strict": True,
+                    }
+                    for package in missing
+                    for tag in tags
+                },
+            )
+            for package in missing:
+                memo[memo_key(package)] = max(
+                    (
+                        builds[0]["nvr"]
+                        for tag in tags
+                        if (builds := latest_builds.get((package, tag)))
+                    ),
+                    key=NEVR.from_string,
+                    default=None,
+                )
+
+        return {package: memo[memo_key(package)] for package in packages}
@@ -0,0 +1,251 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Persistent cache of local mirrors of the upstream and dist-git repositories.
+"""
+
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+import git
+from packit.config import RunCommandType
+from packit.utils.repo import RepositoryCache, get_repo, is_git_repo
+
+from packit_service.config import ServiceConfig
+from packit_service.constants import REPOSITORY_MIRROR_EVICTION_MIN_AGE
+
+logger = logging.getLogger(__name__)
+
+# branches and tags only, not the pull request refs and such
+MIRROR_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+# the shared clones borrow the objects of the mirrors, never prune them
+MIRROR_CONFIG = {("gc", "auto"): "0", ("maintenance", "auto"): "false"}
+
+
+class RepositoryMirrorCache(RepositoryCache):
+    """
+    Repository cache keeping a bare mirror of every cloned repository.
+
+    The mirrors persist between the tasks, they are updated incrementally
+    and the repositories are cloned from them (`git clone --shared`),
+    so only the new objects are transferred. The least recently used mirrors
+    are removed when the cache exceeds its size limit.
+
+    Every mirror is guarded by a file lock, so the workers sharing the cache
+    don't update or remove a mirror another worker is using. The size
+    of every mirror is recorded next to it when it's updated.
+
+    The shared clones reference the objects of the mirror, so the garbage
+    collection is disabled in the mirrors (the pruned branches keep
+    their objects until the mirror is evicted) and a mirror is evicted
+    only after it hasn't been used for `REPOSITORY_MIRROR_EVICTION_MIN_AGE`.
+    The clones that have to be usable without the mirror (e.g. in the sandcastle
+    pod that doesn't mount the cache) are dissociated from it.
+    """
+
+    def __init__(
+        self,
+        cache_path: Union[str, Path],
+        size_limit: int,
+        dissociate: bool = False,
+    ) -> None:
+        """
+        Args:
+            cache_path: Directory of the mirrors, has to persist between the tasks.
+            size_limit: Size limit of the cache in bytes.
+            dissociate: Whether to copy the objects of the mirror to the clones
+              instead of referencing them.
+        """
+        super().__init__(cache_path=cache_path)
+        self.size_limit = size_limit
+        self.dissociate = dissociate
+
+    def get_mirror_path(self, url: str) -> Path:
+        """Path of the mirror of the repository, unique for the URL."""
+        normalized_url = url.rstrip("/").removesuffix(".git")
+        name = Path(urlparse(normalized_url).path).name
+        digest = hashlib.sha256(normalized_url.encode()).hexdigest()[:16]
+        return self.cache_path / f"{name}-{digest}.git"
+
+    @staticmethod
+    @contextmanager
+    def _locked(mirror: Path, blocking: bool = True) -> Iterator[bool]:
+        """
+        Lock the mirror exclusively, the modification time of the lock file
+        records the last use of the mirror.
+
+        Yields:
+            Whether the lock was acquired (always when blocking).
+        """
+        lock_path = mirror.with_suffix(".lock")
+        while True:
+            with lock_path.open("a") as lock_file:
+                try:
+                    fcntl.flock(
+                        lock_file,
+                        fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB,
+                    )
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    # the mirror could have been evicted while waiting for the lock
+                    if lock_path.exists() and os.path.samestat(
+                        os.fstat(lock_file.fileno()),
+                        lock_path.stat(),
+                    ):
+                        yield True
+                        return
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _update_mirror(url: str, mirror: Path) -> None:
+        start = time.monotonic()
+        if mirror.is_dir():
+            logger.debug(f"Updating mirror {mirror} of {url}")
+            path = mirror
+            repo = git.Repo(path)
+            repo.remote("origin").set_url(url)
+        else:
+            logger.info(f"Creating mirror {mirror} of {url}")
+            path = mirror.with_suffix(".tmp")
+            shutil.rmtree(path, ignore_errors=True)
+            repo = git.Repo.init(path, bare=True)
+            repo.create_remote("origin", url)
+        with repo.config_writer() as config:
+            for (section, option), value in MIRROR_CONFIG.items():
+                config.set_value(section, option, value)
+
+        repo.git.fetch("origin", *MIRROR_REFSPECS, prune=True, prune_tags=True)
+        # let the clones check out the default branch
+        # e.g. "ref: refs/heads/main\tHEAD"
+        head = str(repo.git.ls_remote("origin", "HEAD", symref=True))
+        if head.startswith("ref: "):
+            repo.git.symbolic_ref("HEAD", head.split()[1])
+
+        if path != mirror:
+            # publish the mirror only once it's complete
+            path.rename(mirror)
+        RepositoryMirrorCache._record_size(mirror)
+        logger.debug(f"Mirror {mirror} updated in {time.monotonic() - start:.1f}s.")
+
+    def get_repo(self, url: str, directory: Union[Path, str, None] = None) -> git.Repo:
+        directory = str(directory) if directory else tempfile.mkdtemp()
+        if is_git_repo(directory=directory):
+            return git.Repo(directory)
+
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        mirror = self.get_mirror_path(url)
+        try:
+            with self._locked(mirror):
+                self._update_mirror(url, mirror)
+                logger.info(f"Cloning repo {url} -> {directory} from mirror {mirror}")
+                repo = git.Repo.clone_from(
+                    str(mirror),
+                    directory,
+                    shared=True,
+                    dissociate=self.dissociate,
+                )
+                repo.remote("origin").set_url(url)
+                os.utime(mirror.with_suffix(".lock"))
+        except git.GitCommandError as ex:
+            logger.warning(f"Failed to use mirror {mirror} of {url}: {ex}")
+            shutil.rmtree(directory, ignore_errors=True)
+            return get_repo(url=url, directory=directory)
+
+        self.evict(keep=mirror)
+        return repo
+
+    @staticmethod
+    def _get_size(path: Path) -> int:
+        return sum(
+            (Path(root) / name).lstat().st_size
+            for root, _, names in os.walk(path)
+            for name in names
+        )
+
+    @staticmethod
+    def _record_size(mirror: Path) -> None:
+        """Record the size of the mirror, so that the eviction doesn't have to walk it."""
+        tmp_path = mirror.with_suffix(".size-tmp")
+        tmp_path.write_text(str(RepositoryMirrorCache._get_size(mirror)))
+        tmp_path.replace(mirror.with_suffix(".size"))
+
+    @staticmethod
+    def _get_recorded_size(mirror: Path) -> int:
+        try:
+            return int(mirror.with_suffix(".size").read_text())
+        except FileNotFoundError:
+            # e.g. a mirror created before the sizes were recorded
+            return RepositoryMirrorCache._get_size(mirror)
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """
+        Remove the least recently used mirrors until the cache fits the size limit.
+
+        Mirrors in use or used recently (the clones of running tasks
+        borrow their objects) are kept.
+
+        Args:
+            keep: Mirror not to remove.
+        """
+        mirrors = sorted(
+            (
+                (lock_file.stat().st_mtime, lock_file.with_suffix(".git"))
+                for lock_file in self.cache_path.glob("*.lock")
+            ),
+        )
+        sizes = {mirror: self._get_recorded_size(mirror) for _, mirror in mirrors}
+        size = sum(sizes.values())
+        for last_used, mirror in mirrors:
+            if size <= self.size_limit:
+                return
+            if mirror == keep or time.time() - last_used < REPOSITORY_MIRROR_EVICTION_MIN_AGE:
+                continue
+            with self._locked(mirror, blocking=False) as locked:
+                if not locked:
+                    continue
+                logger.info(f"Removing mirror {mirror} ({sizes[mirror]} B) from the cache")
+                shutil.rmtree(mirror, ignore_errors=True)
+                mirror.with_suffix(".size").unlink(missing_ok=True)
+                mirror.with_suffix(".lock").unlink(missing_ok=True)
+                size -= sizes[mirror]
+
+        if size > self.size_limit:
+            logger.warning(
+                f"Repository mirror cache exceeds its size limit: {size} > {self.size_limit} B",
+            )
+
+
+def get_repository_cache(service_config: ServiceConfig) -> Optional[RepositoryCache]:
+    """
+    Get the repository cache to clone the repositories with, if configured.
+
+    The persistent mirror cache takes precedence over the static cache
+    of reference repositories.
+    """
+    if service_config.repository_mirror_cache:
+        return RepositoryMirrorCache(
+            cache_path=service_config.repository_mirror_cache,
+            size_limit=service_config.repository_mirror_cache_size * 1024**3,
+            # the sandcastle pod doesn't mount the cache, it gets just the clone
+            dissociate=service_config.command_handler == RunCommandType.sandcastle,
+        )
+    if service_config.repository_cache:
+        return RepositoryCache(
+            cache_path=service_config.repository_cache,
+            add_new=service_config.add_repositories_to_repository_cache,
+        )
+    return None
@@ -6,16 +6,16 @@ from typing import Any, Optional
 
 from packit.config.aliases import get_branches
 from packit.exceptions import PackitException
-from packit.utils.koji_helper import KojiHelper
 from specfile.utils import NEVR
 
 from packit_service.models import SidetagGroupModel, SidetagModel
+from packit_service.worker.helpers.koji_multicall import MulticallKojiHelper
 
 logger = logging.getLogger(__name__)
 
 
 class Sidetag:
-    def __init__(self, sidetag: SidetagModel, koji_helper: KojiHelper) -> None:
+    def __init__(self, sidetag: SidetagModel, koji_helper: MulticallKojiHelper) -> None:
         self.sidetag = sidetag
         self.koji_helper = koji_helper
 
@@ -42,14 +42,21 @@ class Sidetag:
         return dependencies - self.get_packages()
 
     def get_builds_suitable_for_update(self, dependencies: set[str]) -> set[NEVR]:
-        builds = self.get_builds()
+        latest_builds: dict[str, NEVR] = {}
+        for build in self.get_builds():
+            if build.name in dependencies and (
+                build.name not in latest_builds or build > latest_builds[build.name]
+            ):
+                latest_builds[build.name] = build
+        # all the packages at once, with a single Koji multicall
+        latest_stable_nvrs = self.koji_helper.get_latest_stable_nvrs(
+            dependencies,
+            self.dist_git_branch,
+        )
         result = set()
         for package in dependencies:
-            latest_build = max(b for b in builds if b.name == package)
-            latest_stable_nvr = self.koji_helper.get_latest_stable_nvr(
-                package,
-                self.dist_git_branch,
-            )
+            latest_build = latest_builds[package]
+            latest_stable_nvr = latest_stable_nvrs[package]
             # exclude NVRs that are already in stable tags - if a build
             # has been manually tagged into the sidetag to satisfy dependencies,
             # we don't want it in the update
@@ -84,12 +91,12 @@ class Sidetag:
 
 class SidetagHelperMeta(type):
     def __init__(cls, *args: Any, **kwargs: Any) -> None:
-        cls._koji_helper: Optional[KojiHelper] = None
+        cls._koji_helper: Optional[MulticallKojiHelper] = None
 
     @property
-    def koji_helper(cls) -> KojiHelper:
+    def koji_helper(cls) -> MulticallKojiHelper:
         if not cls._koji_helper:
-            cls._koji_helper = KojiHelper()
+            cls._koji_helper = MulticallKojiHelper()
         return cls._koji_helper
 
 
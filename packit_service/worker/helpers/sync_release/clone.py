@@ -0,0 +1,154 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Isolated clones of the repositories for syncing multiple dist-git branches
+in parallel.
+"""
+
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import git
+from packit.local_project import LocalProject, LocalProjectBuilder
+
+if TYPE_CHECKING:
+    from packit.distgit import DistGit
+
+logger = logging.getLogger(__name__)
+
+
+def clone_local_project(local_project: LocalProject, working_dir: Path) -> LocalProject:
+    """
+    Clone the local project without accessing the network.
+
+    The clone shares the objects of the local project (`git clone --shared`),
+    gets all its branches and tags and its remotes point to the same URLs,
+    so it can be used in place of the local project, with its own
+    working tree, index, refs and config.
+
+    Args:
+        local_project: Local project to clone.
+        working_dir: Path of the clone, must not exist.
+
+    Returns:
+        Local project of the clone.
+    """
+    source = local_project.git_repo
+    logger.debug(f"Cloning {source.working_dir} to {working_dir}")
+    repo = git.Repo.clone_from(source.working_dir, working_dir, shared=True)
+    repo.git.fetch(
+        source.working_dir,
+        "+refs/heads/*:refs/heads/*",
+        "+refs/remotes/*:refs/remotes/*",
+        "+refs/tags/*:refs/tags/*",
+        update_head_ok=True,
+    )
+    for remote in source.remotes:
+        if remote.name in repo.remotes:
+            repo.remote(remote.name).set_url(remote.url)
+        else:
+            repo.create_remote(remote.name, remote.url)
+    repo.git.checkout(source.head.commit.hexsha, detach=True, force=True)
+
+    return LocalProjectBuilder().build(
+        local_project=local_project,
+        git_repo=repo,
+        working_dir=Path(working_dir),
+    )
+
+
+class SharedUpstreamArchives:
+    """
+    Upstream archives downloaded just once for all the clones of the dist-git
+    repository with the same sources.
+
+    The first clone to need the archives downloads them, the archives are
+    linked to the directory of the shared archives and from there to the other
+    clones resolving the same sources from their spec files (the branches can
+    have different spec files, e.g. with `use_downstream_specfile`).
+    A failed download is not repeated, the other clones get the same error.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Args:
+            directory: Directory for the shared archives, must not exist,
+              on the same filesystem as the clones.
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        # lock and directory of the archives per the sources
+        self._sources: dict[tuple, tuple[threading.Lock, Path]] = {}
+        # paths relative to the source directory of the dist-git
+        self._archives: dict[tuple, list[Path]] = {}
+        self._errors: dict[tuple, Exception] = {}
+
+    @staticmethod
+    def _get_sources_key(dg: "DistGit") -> tuple:
+        """Identify the sources the archives are downloaded from for the dist-git."""
+        with dg.specfile.sources() as sources, dg.specfile.patches() as patches:
+            spec_sources = tuple(
+                (source.expanded_location, source.expanded_filename)
+                for source in [*sources, *patches]
+                if source.valid
+            )
+        lookaside_sources = dg.specfile.path.parent / "sources"
+        return (
+            spec_sources,
+            tuple(dg.upstream_archive_names),
+            lookaside_sources.read_text() if lookaside_sources.is_file() else None,
+        )
+
+    @staticmethod
+    def _link(source: Path, target: Path) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def _download(self, dg: "DistGit", download: Callable[[], list[Path]]) -> list[Path]:
+        key = self._get_sources_key(dg)
+        with self._lock:
+            if key not in self._sources:
+                self._sources[key] = (
+                    threading.Lock(),
+                    self.directory / str(len(self._sources)),
+                )
+            lock, directory = self._sources[key]
+
+        with lock:
+            if key in self._errors:
+                raise self._errors[key]
+            if key in self._archives:
+                logger.debug(f"Using the archives downloaded to {directory}")
+                for archive in self._archives[key]:
+                    if not (dg.absolute_source_dir / archive).exists():
+                        self._link(directory / archive, dg.absolute_source_dir / archive)
+                return [dg.absolute_source_dir / archive for archive in self._archives[key]]
+
+            try:
+                archives = download()
+            except Exception as ex:
+                self._errors[key] = ex
+                raise
+            self._archives[key] = [
+                archive.relative_to(dg.absolute_source_dir) for archive in archives
+            ]
+            for archive in self._archives[key]:
+                self._link(dg.absolute_source_dir / archive, directory / archive)
+            return archives
+
+    def share_with(self, dg: "DistGit") -> None:
+        """Make the dist-git of a clone use the shared archives."""
+        download = dg.download_upstream_archives
+        dg.download_upstream_archives = lambda: self._download(dg, download)  # type: ignore[method-assign]
+
+    def clean(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
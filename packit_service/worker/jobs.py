@@ -6,7 +6,7 @@ We love you, Steve Jobs.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from functools import cached_property
 from re import match
@@ -38,6 +38,7 @@ from packit_service.events import (
 from packit_service.events.event import Event
 from packit_service.events.event_data import EventData
 from packit_service.fedora_ci_config import FedoraCIConfig
+from packit_service.forge_cache import is_project_private
 from packit_service.models import PipelineModel
 from packit_service.package_config_getter import PackageConfigGetter
 from packit_service.utils import (
@@ -45,7 +46,7 @@ from packit_service.utils import (
     get_comment_parser,
     get_comment_parser_fedora_ci,
     get_packit_commands_from_comment,
-    pr_labels_match_configuration,
+    labels_match_configuration,
 )
 from packit_service.worker.allowlist import Allowlist
 from packit_service.worker.handlers import (
@@ -113,6 +114,32 @@ class ParsedComment:
     check_target: Optional[str] = None
 
 
+@dataclass
+class DispatchPlan:
+    """
+    Decisions about an event that are needed by several steps of the handler
+    selection, computed at most once per event since they parse the comment
+    or call the forge.
+
+    Attributes:
+        parsed_comments: Parsed comment per the comment and the command prefix.
+        pr_labels: Labels of the PR of the event (`None` if there is no PR),
+            fetched with the first job requiring labels.
+        jobs_matching_event: Jobs matching the event per monorepo package.
+        handlers: Handlers to run for the event per monorepo package.
+        jobs_for_handler: Job configs per the handler and monorepo package.
+    """
+
+    parsed_comments: dict[tuple[str, str], ParsedComment] = field(default_factory=dict)
+    pr_labels: Optional[list[str]] = None
+    pr_labels_fetched: bool = False
+    jobs_matching_event: dict[Optional[str], list[JobConfig]] = field(default_factory=dict)
+    handlers: dict[Optional[str], set[type[JobHandler]]] = field(default_factory=dict)
+    jobs_for_handler: dict[tuple[type[JobHandler], Optional[str]], list[JobConfig]] = field(
+        default_factory=dict,
+    )
+
+
 def get_handlers_for_command(
     command: str,
 ) -> set[type[JobHandler]]:
@@ -200,7 +227,8 @@ class SteveJobs:
 
     def __init__(self, event: Optional[Event] = None) -> None:
         self.event = event
-        self.pushgateway = Pushgateway()
+        self.pushgateway = Pushgateway.get_instance()
+        self.dispatch_plan = DispatchPlan()
 
     @cached_property
     def service_config(self) -> ServiceConfig:
@@ -264,6 +292,19 @@ class SteveJobs:
             it would return `ParsedComment(command="build", package="best-package-ever")`
             Other arguments are ignored because they are handled separately by job handlers
         """
+        key = (comment, packit_comment_command_prefix)
+        if key not in self.dispatch_plan.parsed_comments:
+            self.dispatch_plan.parsed_comments[key] = self._parse_comment(
+                comment,
+                packit_comment_command_prefix,
+            )
+        return self.dispatch_plan.parsed_comments[key]
+
+    def _parse_comment(
+        self,
+        comment: str,
+        packit_comment_command_prefix: str,
+    ) -> ParsedComment:
         commands = get_packit_commands_from_comment(comment, packit_comment_command_prefix)
         if not commands:
             return ParsedComment()
@@ -770,8 +811,6 @@ class SteveJobs:
 
         statuses_check_feedback: list[datetime] = []
         for handler_kls in handler_classes:
-            # TODO: merge to to get_handlers_for_event so
-            # so we don't need to go through the similar process twice.
             job_configs = self.get_config_for_handler_kls(
                 handler_kls=handler_kls,
                 monorepo_package=monorepo_package,
@@ -918,7 +957,7 @@ class SteveJobs:
             logger.warning(
                 "Cannot obtain project from this event! Skipping private repository check!",
             )
-        elif self.event.project.is_private():
+        elif is_project_private(self.event.project):
             service_with_namespace = (
                 f"{self.event.project.service.hostname}/{self.event.project.namespace}"
             )
@@ -1021,6 +1060,26 @@ class SteveJobs:
 
         return matching_jobs
 
+    def get_pr_labels(self) -> Optional[list[str]]:
+        """
+        Get the labels of the PR the event relates to.
+
+        Returns:
+            Names of the labels or `None` if there is no PR.
+        """
+        if not self.dispatch_plan.pr_labels_fetched:
+            if isinstance(self.event, abstract.base.ForgeIndependent) and (
+                pull_request := self.event.pull_request_object
+            ):
+                self.dispatch_plan.pr_labels = [label.name for label in pull_request.labels]
+                logger.info(f"Labels on PR {pull_request.id}: {self.dispatch_plan.pr_labels}")
+                # the checks of the handlers reuse them
+                self.event.pr_labels = self.dispatch_plan.pr_labels
+            else:
+                logger.debug("No PR to check the labels on.")
+            self.dispatch_plan.pr_labels_fetched = True
+        return self.dispatch_plan.pr_labels
+
     def get_jobs_matching_event(
         self,
         monorepo_package: Optional[str] = None,
@@ -1031,6 +1090,16 @@ class SteveJobs:
         Returns:
             List of all jobs that match the event's trigger.
         """
+        if monorepo_package not in self.dispatch_plan.jobs_matching_event:
+            self.dispatch_plan.jobs_matching_event[monorepo_package] = (
+                self._get_jobs_matching_event(monorepo_package)
+            )
+        return self.dispatch_plan.jobs_matching_event[monorepo_package]
+
+    def _get_jobs_matching_event(
+        self,
+        monorepo_package: Optional[str] = None,
+    ) -> list[JobConfig]:
         jobs_matching_trigger = []
         for job in self.event.packages_config.get_job_views():
             if (
@@ -1051,8 +1120,9 @@ class SteveJobs:
                     job.trigger != JobConfigTriggerType.pull_request
                     or not (job.require.label.present or job.require.label.absent)
                     or not isinstance(self.event, abstract.base.ForgeIndependent)
-                    or pr_labels_match_configuration(
-                        pull_request=self.event.pull_request_object,
+                    or (pr_labels := self.get_pr_labels()) is None
+                    or labels_match_configuration(
+                        pr_labels=pr_labels,
                         configured_labels_absent=job.require.label.absent,
                         configured_labels_present=job.require.label.present,
                     )
@@ -1123,7 +1193,16 @@ class SteveJobs:
         Returns:
             Set of handler instances that we need to run for given event and user configuration.
         """
+        if monorepo_package not in self.dispatch_plan.handlers:
+            self.dispatch_plan.handlers[monorepo_package] = self._get_handlers_for_event(
+                monorepo_package,
+            )
+        return self.dispatch_plan.handlers[monorepo_package]
 
+    def _get_handlers_for_event(
+        self,
+        monorepo_package: Optional[str] = None,
+    ) -> set[type[JobHandler]]:
         jobs_matching_trigger = self.get_jobs_matching_event(monorepo_package)
 
         handlers_triggered_by_job = self.get_handlers_for_comment_and_rerun_event()
@@ -1199,6 +1278,19 @@ class SteveJobs:
             List of JobConfigs relevant to the given handler and event
             preserving the order in the config.
         """
+        key = (handler_kls, monorepo_package)
+        if key not in self.dispatch_plan.jobs_for_handler:
+            self.dispatch_plan.jobs_for_handler[key] = self._get_config_for_handler_kls(
+                handler_kls,
+                monorepo_package,
+            )
+        return self.dispatch_plan.jobs_for_handler[key]
+
+    def _get_config_for_handler_kls(
+        self,
+        handler_kls: type[JobHandler],
+        monorepo_package: Optional[str] = None,
+    ) -> list[JobConfig]:
         jobs_matching_trigger: list[JobConfig] = self.get_jobs_matching_event(monorepo_package)
 
         matching_jobs: list[JobConfig] = [
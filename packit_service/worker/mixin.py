@@ -14,7 +14,6 @@ from fasjson_client.errors import APIError
 from ogr.abstract import GitProject, Issue, PullRequest
 from packit.api import PackitAPI
 from packit.local_project import CALCULATE, LocalProject, LocalProjectBuilder
-from packit.utils.repo import RepositoryCache
 
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
@@ -25,6 +24,7 @@ from packit_service.constants import (
 from packit_service.events.event_data import EventData
 from packit_service.utils import get_packit_commands_from_comment
 from packit_service.worker.helpers.job_helper import BaseJobHelper
+from packit_service.worker.helpers.repository_mirror import get_repository_cache
 from packit_service.worker.reporting import BaseCommitStatus
 
 logger = logging.getLogger(__name__)
@@ -317,16 +317,7 @@ class LocalProjectMixin(Config):
     @property
     def local_project(self) -> LocalProject:
         if not self._local_project:
-            builder = LocalProjectBuilder(
-                cache=(
-                    RepositoryCache(
-                        cache_path=self.service_config.repository_cache,
-                        add_new=self.service_config.add_repositories_to_repository_cache,
-                    )
-                    if self.service_config.repository_cache
-                    else None
-                ),
-            )
+            builder = LocalProjectBuilder(cache=get_repository_cache(self.service_config))
             working_dir = Path(
                 Path(self.service_config.command_handler_work_dir) / SANDCASTLE_LOCAL_PROJECT_DIR,
             )
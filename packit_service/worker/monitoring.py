@@ -1,15 +1,34 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import atexit
 import logging
 import os
+import threading
+from typing import Optional
 
 from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, push_to_gateway
 
+from packit_service.constants import PUSHGATEWAY_FLUSH_INTERVAL
+
 logger = logging.getLogger(__name__)
 
 
 class Pushgateway:
+    """
+    Metrics of a worker pushed to the Pushgateway.
+
+    The metrics are collected in a single registry per worker process
+    (see `get_instance()`) and pushed by a background thread every
+    `PUSHGATEWAY_FLUSH_INTERVAL` seconds instead of on each processed message.
+    Each push replaces the whole group of the worker with the current totals,
+    so repeating it (or losing one) does not skew the values.
+    """
+
+    _instance: Optional["Pushgateway"] = None
+    _instance_pid: Optional[int] = None
+    _instance_lock = threading.Lock()
+
     def __init__(self):
         self.pushgateway_address = os.getenv(
             "PUSHGATEWAY_ADDRESS",
@@ -20,6 +39,12 @@ class Pushgateway:
         self.worker_name = os.getenv("HOSTNAME")
         self.registry = CollectorRegistry()
 
+        self._pending = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._flush_thread_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
         # metrics
         self.copr_builds_queued = Counter(
             "copr_builds_queued",
@@ -273,17 +298,82 @@ class Pushgateway:
             registry=self.registry,
         )
 
+        self.redis_pidbox_keys_scanned = Gauge(
+            "redis_pidbox_keys_scanned",
+            "Number of Celery pidbox reply queues scanned by the last cleanup",
+            registry=self.registry,
+        )
+
+        self.redis_pidbox_keys_expired = Gauge(
+            "redis_pidbox_keys_expired",
+            "Number of orphaned Celery pidbox reply queues the last cleanup set TTL on",
+            registry=self.registry,
+        )
+
+        self.redis_pidbox_cleanup_time = Gauge(
+            "redis_pidbox_cleanup_time",
+            "Time (in seconds) the last cleanup of Celery pidbox reply queues took",
+            registry=self.registry,
+        )
+
+    @classmethod
+    def get_instance(cls) -> "Pushgateway":
+        """Get the metrics shared by the current worker process."""
+        with cls._instance_lock:
+            # the thread flushing the metrics does not survive a fork
+            if cls._instance is None or cls._instance_pid != os.getpid():
+                cls._instance = cls()
+                cls._instance_pid = os.getpid()
+            return cls._instance
+
     def push(self):
+        """Schedule pushing of the metrics with the next flush."""
         if not (self.pushgateway_address and self.worker_name):
             logger.debug("Pushgateway address or worker name not defined.")
             return
 
-        logger.info("Pushing the metrics to pushgateway.")
-        try:
-            push_to_gateway(
-                self.pushgateway_address,
-                job=self.worker_name,
-                registry=self.registry,
-            )
-        except Exception as e:
-            logger.error(f"Failed to push metrics to pushgateway: {e}")
+        self._pending.set()
+        with self._flush_thread_lock:
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_periodically,
+                    name="pushgateway-flush",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+                atexit.register(self._flush_pending)
+
+    def _flush_periodically(self):
+        while not self._stopped.wait(PUSHGATEWAY_FLUSH_INTERVAL):
+            self._flush_pending()
+
+    def stop(self):
+        """Stop the background flushing, the pending metrics are not pushed."""
+        with self._flush_thread_lock:
+            if self._flush_thread is None:
+                return
+            self._stopped.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+            self._stopped.clear()
+            atexit.unregister(self._flush_pending)
+
+    def _flush_pending(self):
+        if self._pending.is_set():
+            self.flush()
+
+    def flush(self):
+        """Push the current values of the metrics to the Pushgateway."""
+        with self._flush_lock:
+            self._pending.clear()
+            logger.info("Pushing the metrics to pushgateway.")
+            try:
+                push_to_gateway(
+                    self.pushgateway_address,
+                    job=self.worker_name,
+                    registry=self.registry,
+                )
+            except Exception as e:
+                logger.error(f"Failed to push metrics to pushgateway: {e}")
+                # retry with the next flush
+                self._pending.set()
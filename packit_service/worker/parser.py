@@ -42,6 +42,7 @@ from packit_service.events.enums import (
     PullRequestAction,
     PullRequestCommentAction,
 )
+from packit_service.known_builds import KnownBuildKind, is_build_id_known
 from packit_service.models import (
     GitBranchModel,
     LogDetectiveBuildSystem,
@@ -167,6 +168,13 @@ class Parser:
             logger.warning("No event to process!")
             return None
 
+        if parser := Parser.get_event_parser(event):
+            if response := parser(event):
+                return response
+            logger.debug("We don't process this event.")
+            return None
+
+        # unknown shape of the payload, try all the parsers
         for response in (
             parser(event)
             for parser in (
@@ -212,6 +220,61 @@ class Parser:
         logger.debug("We don't process this event.")
         return None
 
+    @staticmethod
+    def get_event_parser(event: dict) -> Optional[Callable]:
+        """
+        Find the parser for the event based on the shape of its payload,
+        so that only one parser needs to be tried.
+
+        The routing key corresponds to the `event_type` in `Parser.MAPPING`:
+        the topic of the fedora-messaging messages, the `object_kind`
+        of GitLab webhooks and the top-level keys of GitHub webhooks
+        (the `X-GitHub-Event` header is not part of the payload).
+
+        Args:
+            event: JSON from GitHub/GitLab/Testing Farm or fedora-messaging.
+
+        Returns:
+            Parser of the event or `None` if the shape of the payload is not known.
+        """
+        if topic := event.get("topic"):
+            # topics are matched with the environment prefix (e.g. `org.fedoraproject.prod.`)
+            # stripped, component by component
+            components = topic.split(".")
+            for i in range(len(components)):
+                if parser := Parser.MAPPING["fedora-messaging"].get(".".join(components[i:])):
+                    return parser
+            return None
+
+        if event.get("source") == "testing-farm":
+            return Parser.MAPPING["testing-farm"]["results"]
+
+        if object_kind := event.get("object_kind"):
+            return nested_get(
+                Parser.MAPPING,
+                "gitlab",
+                Parser.GITLAB_OBJECT_KIND_TO_EVENT_TYPE.get(object_kind),
+            )
+
+        if "check_run" in event:
+            event_type = "check_run"
+        elif "pull_request" in event and not ({"comment", "review"} & event.keys()):
+            event_type = "pull_request"
+        elif "issue" in event and "comment" in event:
+            event_type = "issue_comment"
+        elif "comment" in event and "pull_request" not in event:
+            event_type = "commit_comment"
+        elif "release" in event:
+            event_type = "release"
+        elif "pusher" in event:
+            event_type = "push"
+        elif nested_get(event, "installation", "account"):
+            event_type = "installation"
+        else:
+            return None
+
+        return Parser.MAPPING["github"][event_type]
+
     @staticmethod
     def parse_mr_event(event) -> Optional[gitlab.mr.Action]:
         """Look into the provided event and see if it's one for a new gitlab MR."""
@@ -1415,9 +1478,13 @@ class Parser:
             # Topic not supported.
             return None
 
+        build_id = event.get("build")
+        if not is_build_id_known(KnownBuildKind.copr, build_id):
+            logger.debug(f"Copr build {build_id} was not submitted by us, ignoring.")
+            return None
+
         logger.info(f"Copr event; {event.get('what')}")
 
-        build_id = event.get("build")
         chroot = event.get("chroot")
         status = event.get("status")
         owner = event.get("owner")
@@ -1442,6 +1509,10 @@ class Parser:
             return None
 
         task_id = event.get("id")
+        if not is_build_id_known(KnownBuildKind.koji_task, task_id):
+            logger.debug(f"Koji task {task_id} was not submitted by us, ignoring.")
+            return None
+
         logger.info(f"Koji task event: task ID={task_id}")
 
         state = nested_get(event, "info", "state")
@@ -2316,3 +2387,13 @@ class Parser:
             "results": parse_testing_farm_results_event.__func__,  # type: ignore
         },
     }
+
+    # `object_kind` of the GitLab webhook payloads to the value of the `X-Gitlab-Event` header
+    GITLAB_OBJECT_KIND_TO_EVENT_TYPE: ClassVar[dict[str, str]] = {
+        "merge_request": "Merge Request Hook",
+        "note": "Note Hook",
+        "push": "Push Hook",
+        "tag_push": "Tag Push Hook",
+        "pipeline": "Pipeline Hook",
+        "release": "Release Hook",
+    }
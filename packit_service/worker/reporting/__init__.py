@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 from packit_service.worker.reporting.enums import BaseCommitStatus, DuplicateCheckMode
-from packit_service.worker.reporting.reporters.base import StatusReporter
+from packit_service.worker.reporting.reporters.base import StatusReporter, coalesced_reporting
 from packit_service.worker.reporting.reporters.github import (
     StatusReporterGithubChecks,
     StatusReporterGithubStatuses,
@@ -26,4 +26,5 @@ __all__ = [
     StatusReporterGitlab.__name__,
     create_issue_if_needed.__name__,
     comment_without_duplicating.__name__,
+    coalesced_reporting.__name__,
 ]
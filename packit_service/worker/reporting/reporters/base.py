@@ -1,9 +1,16 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import hashlib
+import json
 import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Callable, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from ogr.abstract import GitProject, PullRequest
 from ogr.services.forgejo import ForgejoProject
@@ -11,6 +18,8 @@ from ogr.services.github import GithubProject
 from ogr.services.gitlab import GitlabProject
 from ogr.services.pagure import PagureProject
 
+from packit_service.cache import REDIS_CACHE_KEY_PREFIX, redis_pipeline
+from packit_service.forge_cache import get_project_key
 from packit_service.worker.reporting.enums import (
     MAP_TO_CHECK_RUN,
     MAP_TO_COMMIT_STATUS,
@@ -21,6 +30,37 @@ from packit_service.worker.reporting.utils import has_identical_comment_in_comme
 
 logger = logging.getLogger(__name__)
 
+# for how long (in seconds) the last reported status of a check is remembered
+REPORTED_STATUS_TTL = 24 * 60 * 60
+REPORTED_STATUS_KEY_PREFIX = f"{REDIS_CACHE_KEY_PREFIX}:reported-status"
+# non-final states of a check reported within this window (in seconds)
+# are coalesced into a single update
+STATUS_COALESCING_WINDOW = 3
+
+# reporters with deferred updates, `None` when the updates are not coalesced
+_coalescing_reporters: ContextVar[Optional[list["StatusReporter"]]] = ContextVar(
+    "_coalescing_reporters",
+    default=None,
+)
+
+
+@contextmanager
+def coalesced_reporting() -> Iterator[None]:
+    """
+    Coalesce rapid transitions of non-final states of the checks.
+
+    The deferred updates are reported once the coalescing window elapses,
+    the remaining ones when leaving the context.
+    """
+    token = _coalescing_reporters.set([])
+    try:
+        yield
+    finally:
+        reporters = _coalescing_reporters.get() or []
+        _coalescing_reporters.reset(token)
+        for reporter in reporters:
+            reporter.flush()
+
 
 class StatusReporter:
     def __init__(
@@ -43,6 +83,15 @@ class StatusReporter:
         self.pr_id: Optional[int] = pr_id
         self._pull_request_object: Optional[PullRequest] = None
 
+        # check name -> monotonic time of the last update
+        self._reported_at: dict[str, float] = {}
+        # check name -> deferred status and the feedback time callback
+        self._deferred: dict[str, tuple[dict[str, Any], Optional[Callable]]] = {}
+        # reports the deferred updates when the coalescing window elapses
+        self._flush_timer: Optional[threading.Timer] = None
+        # the timer reports from another thread
+        self._lock = threading.RLock()
+
     @classmethod
     def get_instance(
         cls,
@@ -128,6 +177,7 @@ class StatusReporter:
         check_names: Union[str, list, None] = None,
         markdown_content: Optional[str] = None,
         update_feedback_time: Optional[Callable] = None,
+        target_branch: Optional[str] = None,
     ) -> None:
         """
         Set commit check status.
@@ -151,6 +201,9 @@ class StatusReporter:
 
             update_feedback_time: a callable which tells the caller when a check
                 status has been updated.
+            target_branch: Branch the checks are reported for (Fedora CI).
+
+                Defaults to None
 
         Returns:
             None
@@ -162,19 +215,113 @@ class StatusReporter:
         if isinstance(check_names, str):
             check_names = [check_names]
 
-        for check in check_names:
-            self.set_status(
-                state=state,
-                description=description,
-                check_name=check,
-                url=url,
-                links_to_external_services=links_to_external_services,
-                markdown_content=markdown_content,
-            )
+        status = {
+            "state": state,
+            "description": description,
+            "url": url,
+            "links_to_external_services": links_to_external_services,
+            "markdown_content": markdown_content,
+        }
+        if target_branch:
+            # not all the reporters accept it
+            status["target_branch"] = target_branch
+        coalescing_reporters = _coalescing_reporters.get()
+        with self._lock:
+            now = time.monotonic()
+            to_report = []
+            for check in check_names:
+                if (
+                    coalescing_reporters is not None
+                    and not self.is_final_state(state)
+                    and check in self._reported_at
+                    and now - self._reported_at[check] < STATUS_COALESCING_WINDOW
+                ):
+                    logger.debug(f"Deferring the update of check {check!r}: {description}")
+                    self._deferred[check] = (status, update_feedback_time)
+                    if self not in coalescing_reporters:
+                        coalescing_reporters.append(self)
+                    self._schedule_flush(
+                        STATUS_COALESCING_WINDOW - (now - self._reported_at[check])
+                    )
+                    continue
+
+                # a newer status supersedes the deferred one
+                self._deferred.pop(check, None)
+                to_report.append(check)
+
+            self._report_unless_reported(to_report, status, update_feedback_time)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Report the deferred updates of the checks."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            deferred, self._deferred = self._deferred, {}
+            try:
+                for check, (status, update_feedback_time) in deferred.items():
+                    self._report_unless_reported([check], status, update_feedback_time)
+            except Exception as ex:
+                logger.warning(f"Failed to report the deferred statuses: {ex}")
+
+    def _get_reported_status_key(self, check_name: str) -> Optional[str]:
+        if not self.commit_sha or not (project_key := get_project_key(self.project)):
+            return None
+        return (
+            f"{REPORTED_STATUS_KEY_PREFIX}:{project_key}:{self.pr_id or ''}:"
+            f"{self.commit_sha}:{check_name}"
+        )
+
+    def _get_status_fingerprint(self, status: dict[str, Any]) -> str:
+        content = json.dumps(
+            [self.__class__.__name__, *status.values()],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _report_unless_reported(
+        self,
+        check_names: list[str],
+        status: dict[str, Any],
+        update_feedback_time: Optional[Callable] = None,
+    ) -> None:
+        """
+        Set the status of the checks, skipping those whose last reported
+        status (remembered in Redis) is identical.
+        """
+        if not check_names:
+            return
+
+        fingerprint = self._get_status_fingerprint(status)
+        keys = [self._get_reported_status_key(check) for check in check_names]
+        reported = None
+        if all(keys):
+            reported = redis_pipeline(*(("get", key) for key in keys))
+        reported = reported or [None] * len(check_names)
+
+        newly_reported = []
+        for check, key, last_fingerprint in zip(check_names, keys, reported):
+            if last_fingerprint == fingerprint:
+                logger.debug(f"Status of check {check!r} is already reported.")
+            else:
+                self.set_status(check_name=check, **status)
+                if key:
+                    newly_reported.append(("setex", key, REPORTED_STATUS_TTL, fingerprint))
+            self._reported_at[check] = time.monotonic()
 
             if update_feedback_time:
                 update_feedback_time(datetime.now(timezone.utc))
 
+        if newly_reported:
+            redis_pipeline(*newly_reported)
+
     @staticmethod
     def is_final_state(state: BaseCommitStatus) -> bool:
         return state in {
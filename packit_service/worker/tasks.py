@@ -3,6 +3,7 @@
 
 import logging
 import socket
+import time
 from datetime import datetime, timedelta, timezone
 from os import getenv
 from typing import ClassVar, Optional
@@ -10,7 +11,7 @@ from typing import ClassVar, Optional
 import redis
 from celery import Task
 from celery._state import get_current_task
-from celery.signals import after_setup_logger
+from celery.signals import after_setup_logger, worker_ready
 from copr.v3 import CoprException
 from kubernetes.client import V1DeleteOptions
 from kubernetes.client.rest import ApiException
@@ -27,8 +28,12 @@ from packit_service.celerizer import celery_app, get_redis_config
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     CELERY_DEFAULT_MAIN_TASK_NAME,
+    DATABASE_MAINTENANCE_TIME_LIMIT,
+    DATABASE_MAINTENANCE_TIME_RESERVE,
     DEFAULT_RETRY_BACKOFF,
     DEFAULT_RETRY_LIMIT,
+    REDIS_PIDBOX_CLEANUP_TIME_BUDGET,
+    REDIS_PIDBOX_SCAN_COUNT,
     REDIS_PIDBOX_TTL_SECONDS,
     USAGE_CURRENT_DATE,
     USAGE_DATE_IN_THE_PAST,
@@ -43,6 +48,7 @@ from packit_service.models import (
     SyncReleaseTargetModel,
     VMImageBuildTargetModel,
     get_usage_data,
+    refresh_usage_rollups,
 )
 from packit_service.utils import (
     load_job_config,
@@ -53,6 +59,7 @@ from packit_service.worker.database import (
     backup,
     discard_old_package_configs,
     discard_old_srpm_build_logs,
+    rebuild_known_build_ids_index,
 )
 from packit_service.worker.handlers import (
     CoprBuildEndHandler,
@@ -920,11 +927,27 @@ def babysit_pending_tft_runs() -> None:
 
 @celery_app.task
 def database_maintenance() -> None:
+    # the removal of old data gets the time left after the backup, so that it's
+    # interrupted (and resumed by the next run) before the task is killed
+    deadline = (
+        time.monotonic() + DATABASE_MAINTENANCE_TIME_LIMIT - DATABASE_MAINTENANCE_TIME_RESERVE
+    )
     backup()
     # TODO: uncomment once we did the first manual cleanup
-    # delete_old_data()
-    discard_old_srpm_build_logs()
-    discard_old_package_configs()
+    # delete_old_data(time_budget=deadline - time.monotonic())
+    discard_old_srpm_build_logs(time_budget=deadline - time.monotonic())
+    discard_old_package_configs(time_budget=deadline - time.monotonic())
+
+
+@celery_app.task(queue="long-running")
+def rebuild_known_build_ids() -> None:
+    rebuild_known_build_ids_index()
+
+
+@worker_ready.connect
+def schedule_known_build_ids_rebuild(**kwargs):
+    # the index might have missed IDs while no worker was running
+    rebuild_known_build_ids.delay()
 
 
 @celery_app.task
@@ -945,6 +968,11 @@ def run_check_onboarded_projects() -> None:
     check_onboarded_projects(almost_onboarded_projects)
 
 
+@celery_app.task(queue="long-running")
+def update_usage_rollups() -> None:
+    refresh_usage_rollups()
+
+
 def _get_usage_interval_data(days, hours, count) -> None:
     """Call functions collecting usage statistics and **cache** results
     to be used quicker later.
@@ -1026,11 +1054,18 @@ def cleanup_orphaned_pidbox_queues() -> None:
     - Counts total keys in database for monitoring
     - Exports metrics to Prometheus
 
+    The TTLs of each batch of scanned keys are looked up and set in pipelines,
+    so a batch takes at most three round-trips regardless of its size. The scan stops
+    once the time budget is exhausted, the remaining keys are handled
+    by the next run.
+
     Runs periodically via Celery beat to prevent disk/memory leaks.
     """
     logger.info("Starting cleanup of orphaned pidbox reply queues")
 
-    pushgateway = Pushgateway()
+    pushgateway = Pushgateway.get_instance()
+    started = time.monotonic()
+    deadline = started + REDIS_PIDBOX_CLEANUP_TIME_BUDGET
 
     try:
         # Get Redis connection from Celery's broker
@@ -1048,38 +1083,62 @@ def cleanup_orphaned_pidbox_queues() -> None:
         cursor = 0
         keys_processed = 0
         keys_with_ttl_set = 0
+        round_trips = 0
         pattern = "*.reply.celery.pidbox"
 
         while True:
             cursor, keys = redis_client.scan(
                 cursor=cursor,
                 match=pattern,
-                count=100,
+                count=REDIS_PIDBOX_SCAN_COUNT,
             )
+            round_trips += 1
+            keys_processed += len(keys)
 
-            for key in keys:
-                keys_processed += 1
+            if keys:
+                pipeline = redis_client.pipeline(transaction=False)
+                for key in keys:
+                    pipeline.ttl(key)
+                ttls = pipeline.execute()
+                round_trips += 1
 
                 # Set TTL if key exists but has no expiry (TTL = -1)
-                if redis_client.ttl(key) == -1:
-                    redis_client.expire(key, REDIS_PIDBOX_TTL_SECONDS)
-                    keys_with_ttl_set += 1
+                orphaned = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+                if orphaned:
+                    pipeline = redis_client.pipeline(transaction=False)
+                    for key in orphaned:
+                        pipeline.expire(key, REDIS_PIDBOX_TTL_SECONDS)
+                    keys_with_ttl_set += sum(pipeline.execute())
+                    round_trips += 1
 
             # Break when cursor returns to 0 (full scan complete)
             if cursor == 0:
                 break
 
+            if time.monotonic() > deadline:
+                logger.warning(
+                    f"Pidbox cleanup ran out of its time budget of "
+                    f"{REDIS_PIDBOX_CLEANUP_TIME_BUDGET}s, "
+                    "the rest of the keys is left for the next run.",
+                )
+                break
+
         # Get total number of keys in database for monitoring
         total_keys = redis_client.dbsize()
+        elapsed = time.monotonic() - started
 
         logger.info(
             f"Pidbox cleanup complete: scanned {keys_processed} pidbox keys, "
-            f"set TTL on {keys_with_ttl_set} orphaned queues. "
+            f"set TTL on {keys_with_ttl_set} orphaned queues "
+            f"in {elapsed:.1f}s and {round_trips} round-trips. "
             f"Total keys in DB: {total_keys}"
         )
 
         # Export metrics to Prometheus
         pushgateway.redis_keys_total.set(total_keys)
+        pushgateway.redis_pidbox_keys_scanned.set(keys_processed)
+        pushgateway.redis_pidbox_keys_expired.set(keys_with_ttl_set)
+        pushgateway.redis_pidbox_cleanup_time.set(elapsed)
         pushgateway.push()
 
     except redis.RedisError as e:
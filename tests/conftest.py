@@ -13,7 +13,7 @@ from ogr import ForgejoService, GithubService, GitlabService, PagureService
 from packit.config import JobConfig, JobConfigTriggerType, PackageConfig
 from packit.config.common_package_config import Deployment
 
-from packit_service import events
+from packit_service import cache, events
 from packit_service.config import ServiceConfig
 from packit_service.fedora_ci_config import FedoraCIConfig
 from packit_service.models import (
@@ -55,6 +55,16 @@ def global_service_config():
     ServiceConfig.service_config = service_config
 
 
+@pytest.fixture(autouse=True)
+def _process_local_shared_caches():
+    """
+    Don't reach Redis from the shared caches and start each test
+    with empty process-local caches.
+    """
+    flexmock(cache).should_receive("get_cache_redis").and_return(None)
+    cache.clear_local_caches()
+
+
 @pytest.fixture(autouse=True)
 def _reset_fedora_ci_config():
     """Reset the FedoraCIConfig cached singleton so each test gets
@@ -26,6 +26,7 @@ from packit_service.models import (
     SidetagGroupModel,
 )
 from packit_service.service.db_project_events import AddPullRequestEventToDb
+from packit_service.worker.helpers.koji_multicall import MulticallKojiHelper
 from packit_service.worker.reporting.news import DistgitAnnouncement
 
 
@@ -241,12 +242,16 @@ def bodhi_update_target_mocks():
         flexmock(BodhiUpdateTargetModel).should_receive(
             "get_all_successful_or_in_progress_by_nvrs",
         ).with_args(nvr).and_return(set())
-        flexmock(BodhiUpdateTargetModel).should_receive("create").with_args(
-            target=target,
-            koji_nvrs=nvr,
-            sidetag=sidetag,
-            status="queued",
+        flexmock(BodhiUpdateTargetModel).should_receive("bulk_create").with_args(
             bodhi_update_group=group_model,
+            updates=[
+                {
+                    "target": target,
+                    "koji_nvrs": nvr,
+                    "sidetag": sidetag,
+                    "status": "queued",
+                },
+            ],
         ).and_return()
         return group_model
 
@@ -296,10 +301,10 @@ def sidetag_koji_mocks():
             ],
         )
 
-        flexmock(KojiHelper).should_receive("get_latest_stable_nvr").with_args(
-            package_name,
+        flexmock(MulticallKojiHelper).should_receive("get_latest_stable_nvrs").with_args(
+            {package_name},
             target,
-        ).and_return(None)
+        ).and_return({package_name: None})
 
         flexmock(KojiHelper).should_receive("get_build_info").with_args(nvr).and_return(
             {
@@ -2,7 +2,12 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+import fakeredis
 import pytest
 import requests
 from copr.v3 import Client, CoprNoResultException
@@ -17,7 +22,7 @@ from packit.config import (
 from packit.copr_helper import CoprHelper
 
 import packit_service.worker.helpers.build.babysit
-from packit_service import events
+from packit_service import cache, events
 from packit_service.models import (
     BuildStatus,
     CoprBuildTargetModel,
@@ -35,12 +40,15 @@ from packit_service.worker.handlers.testing_farm import (
     DownstreamTestingFarmResultsHandler,
 )
 from packit_service.worker.helpers.build.babysit import (
+    TESTING_FARM_NEXT_CHECKS_KEY,
     check_copr_build,
     check_pending_copr_builds,
     check_pending_testing_farm_runs,
+    get_testing_farm_check_interval,
     update_copr_builds,
     update_testing_farm_run,
 )
+from packit_service.worker.parser import Parser
 from packit_service.worker.tasks import (
     run_copr_build_end_handler,
     run_copr_build_start_handler,
@@ -580,7 +588,7 @@ def test_check_pending_testing_farm_runs_no_runs():
         TestingFarmResult.cancel_requested,
     ).and_return([])
     # No request should be performed
-    flexmock(requests).should_receive("get").never()
+    flexmock(requests.Session).should_receive("get").never()
     check_pending_testing_farm_runs()
 
 
@@ -596,6 +604,7 @@ def test_check_pending_testing_farm_runs(created):
     pipeline_id = 1
     run = (
         flexmock(
+            id=1,
             pipeline_id=pipeline_id,
             submitted_time=created,
             commit_sha="123456",
@@ -630,7 +639,7 @@ def test_check_pending_testing_farm_runs(created):
         pipeline_id=pipeline_id,
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(url, timeout=30).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -668,11 +677,16 @@ def test_check_pending_testing_farm_runs(created):
 )
 def test_check_pending_testing_farm_runs_timeout(status):
     run = flexmock(
+        id=1,
         pipeline_id=1,
         status=status,
         submitted_time=datetime.datetime.utcnow() - datetime.timedelta(weeks=2),
     )
-    run.should_receive("set_status").with_args(TestingFarmResult.error).once()
+    flexmock(TFTTestRunTargetModel).should_receive("set_status_of_all").with_args(
+        [1],
+        TestingFarmResult.error,
+    ).once()
+    flexmock(requests.Session).should_receive("get").never()
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
         TestingFarmResult.new,
         TestingFarmResult.queued,
@@ -690,6 +704,7 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
     pipeline_id = 1
     run = (
         flexmock(
+            id=1,
             pipeline_id=pipeline_id,
             submitted_time=datetime.datetime.utcnow(),
             commit_sha="123456",
@@ -724,7 +739,7 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
         pipeline_id=pipeline_id,
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(url, timeout=30).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -862,3 +877,108 @@ def test_update_testing_farm_run_downstream_pre_check_fails():
     flexmock(packit_service.worker.helpers.build.babysit).should_receive("celery_run_async").never()
 
     update_testing_farm_run(event, run)
+
+
+@pytest.mark.parametrize(
+    "state, pending_for, interval",
+    [
+        (TestingFarmResult.queued, 60, 15),
+        (TestingFarmResult.queued, 10 * 60 * 60, 60 * 60),
+        (TestingFarmResult.running, 10 * 60 * 60, 30 * 60),
+        (TestingFarmResult.cancel_requested, 10 * 60 * 60, 0),
+    ],
+)
+def test_get_testing_farm_check_interval(state, pending_for, interval):
+    assert get_testing_farm_check_interval(state, pending_for) == interval
+
+
+def pending_testing_farm_runs(count):
+    submitted_time = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=1)
+    return [
+        flexmock(id=i, pipeline_id=f"pipeline-{i}", submitted_time=submitted_time)
+        for i in range(count)
+    ]
+
+
+def test_check_pending_testing_farm_runs_postponed():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    client.hset(
+        TESTING_FARM_NEXT_CHECKS_KEY,
+        mapping={"pipeline-0": time.time() + 60, "pipeline-1": time.time() - 60},
+    )
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").and_return(
+        pending_testing_farm_runs(2),
+    )
+    flexmock(requests.Session).should_receive("get").with_args(
+        "https://api.dev.testing-farm.io/v0.1/requests/pipeline-1",
+        timeout=30,
+    ).and_return(flexmock(ok=True, json=lambda: {"state": "running"})).once()
+    flexmock(Parser).should_receive("parse_data_from_testing_farm").and_return(
+        flexmock(result=TestingFarmResult.running),
+    )
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_testing_farm_run",
+    ).never()
+
+    check_pending_testing_farm_runs()
+
+    # pending for an hour, checked again in 15 minutes
+    next_check = float(client.hget(TESTING_FARM_NEXT_CHECKS_KEY, "pipeline-1"))
+    assert 14 * 60 < next_check - time.time() <= 15 * 60
+
+
+@pytest.fixture()
+def testing_farm_api():
+    """Fake Testing Farm API answering slowly, counting the requests in flight."""
+    stats = {"in_flight": 0, "max_in_flight": 0, "requests": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            with lock:
+                stats["requests"] += 1
+                stats["in_flight"] += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            time.sleep(0.05)
+            body = json.dumps({"id": self.path.split("/")[-1], "state": "queued"}).encode()
+            with lock:
+                stats["in_flight"] -= 1
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    flexmock(
+        packit_service.worker.helpers.build.babysit,
+        TESTING_FARM_API_URL=f"http://127.0.0.1:{server.server_port}/",
+    )
+    yield stats
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_pending_testing_farm_runs_concurrently(testing_farm_api):
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").and_return(
+        pending_testing_farm_runs(50),
+    )
+    flexmock(Parser).should_receive("parse_data_from_testing_farm").and_return(
+        flexmock(result=TestingFarmResult.queued),
+    )
+
+    check_pending_testing_farm_runs()
+
+    assert testing_farm_api["requests"] == 50
+    assert 1 < testing_farm_api["max_in_flight"] <= 16
+    assert client.hlen(TESTING_FARM_NEXT_CHECKS_KEY) == 50
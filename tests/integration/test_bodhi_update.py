@@ -39,6 +39,7 @@ from packit_service.utils import (
 )
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.handlers.bodhi import CreateBodhiUpdateHandler
+from packit_service.worker.helpers.koji_multicall import MulticallKojiHelper
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.tasks import (
@@ -700,12 +701,16 @@ def test_bodhi_update_for_unknown_koji_build_not_for_unfinished(
     flexmock(BodhiUpdateTargetModel).should_receive(
         "get_all_successful_or_in_progress_by_nvrs",
     ).with_args("packit-0.43.0-1.fc36").and_return(set())
-    flexmock(BodhiUpdateTargetModel).should_receive("create").with_args(
-        target="rawhide",
-        koji_nvrs="packit-0.43.0-1.fc36",
-        sidetag=None,
-        status="queued",
+    flexmock(BodhiUpdateTargetModel).should_receive("bulk_create").with_args(
         bodhi_update_group=group_model,
+        updates=[
+            {
+                "target": "rawhide",
+                "koji_nvrs": "packit-0.43.0-1.fc36",
+                "sidetag": None,
+                "status": "queued",
+            },
+        ],
     ).and_return()
     git_branch_model_flexmock = flexmock(
         id=1,
@@ -1064,14 +1069,15 @@ def test_bodhi_update_from_sidetag(
         sidetag_name,
     ).and_return(builds_in_sidetag)
 
-    flexmock(KojiHelper).should_receive("get_latest_stable_nvr").with_args(
-        "python-specfile",
+    flexmock(MulticallKojiHelper).should_receive("get_latest_stable_nvrs").with_args(
+        {"python-specfile", "packit"},
         "f40",
-    ).and_return("python-specfile-0.30.0-1.fc40")
-    flexmock(KojiHelper).should_receive("get_latest_stable_nvr").with_args(
-        "packit",
-        "f40",
-    ).and_return("packit-0.98.0-1.fc40")
+    ).and_return(
+        {
+            "python-specfile": "python-specfile-0.30.0-1.fc40",
+            "packit": "packit-0.98.0-1.fc40",
+        },
+    )
 
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=task_id,
@@ -1214,17 +1220,18 @@ def test_bodhi_update_from_sidetag(
         {flexmock(), update_model} if non_unique_builds else {update_model},
     )
 
-    def _create(target, koji_nvrs, sidetag, status, bodhi_update_group):
-        assert target == dg_branch
-        assert set(koji_nvrs.split()) == {
+    def _bulk_create(bodhi_update_group, updates):
+        assert bodhi_update_group == group_model
+        (update,) = updates
+        assert update["target"] == dg_branch
+        assert set(update["koji_nvrs"].split()) == {
             "python-specfile-0.31.0-1.fc40",
             "packit-0.99.0-1.fc40",
         }
-        assert sidetag == sidetag_name
-        assert status == "queued"
-        assert bodhi_update_group == group_model
+        assert update["sidetag"] == sidetag_name
+        assert update["status"] == "queued"
 
-    flexmock(BodhiUpdateTargetModel).should_receive("create").replace_with(_create)
+    flexmock(BodhiUpdateTargetModel).should_receive("bulk_create").replace_with(_bulk_create)
 
     flexmock(Pushgateway).should_receive("push").and_return()
 
@@ -117,7 +117,9 @@ def test_check_rerun_pr_testing_farm_handler(
     ).and_return(
         flexmock(grouped_targets=[test]),
     )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test],
+    )
     flexmock(TestingFarmJobHelper).should_receive("run_testing_farm").once().and_return(
         TaskResults(success=True, details={}),
     )
@@ -320,7 +322,9 @@ def test_check_rerun_push_testing_farm_handler(
     ).and_return(
         flexmock(grouped_targets=[test]),
     )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test],
+    )
     flexmock(TestingFarmJobHelper).should_receive("run_testing_farm").once().and_return(
         TaskResults(success=True, details={}),
     )
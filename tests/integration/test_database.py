@@ -1,39 +1,105 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import datetime, timezone
-from pathlib import Path
+import gzip
+import os
+from base64 import b64encode
+from hashlib import sha256
 
-from boto3.s3.transfer import S3Transfer
+import pytest
 from flexmock import flexmock
+from packit.exceptions import PackitCommandFailedError
 
-from packit_service.models import ProjectEventModel, SRPMBuildModel
 from packit_service.worker import database
 
 
-def test_cleanup_old_srpm_build_logs():
-    srpm_build = flexmock(id=1, submitted_time=datetime.now(timezone.utc))
-    flexmock(srpm_build).should_receive("set_logs").with_args(None).once()
-    flexmock(srpm_build).should_receive("set_url").with_args(None).once()
-    flexmock(SRPMBuildModel).should_receive("get_older_than").and_return(
-        [srpm_build],
-    ).once()
-    database.discard_old_srpm_build_logs()
+@pytest.mark.parametrize(
+    "discard, step_name",
+    [
+        (database.discard_old_srpm_build_logs, "srpm_build_logs"),
+        (database.discard_old_package_configs, "package_configs"),
+    ],
+)
+def test_discard_old_data_time_budget(discard, step_name):
+    steps = []
+    flexmock(database.time).should_receive("monotonic").and_return(100)
+    flexmock(database).should_receive("run_retention_step").with_args(
+        database.RetentionStep,
+        batch_size=1000,
+        deadline=110,
+    ).replace_with(lambda step, batch_size, deadline: steps.append(step)).once()
 
+    discard(time_budget=10)
 
-def test_discard_old_package_configs():
-    event_model1 = flexmock(id=1)
-    event_model2 = flexmock(id=2)
-    flexmock(ProjectEventModel).should_receive(
-        "get_and_reset_older_than_with_packages_config",
-    ).and_return([event_model1, event_model2]).once()
-    database.discard_old_package_configs()
+    # the rows themselves are checked in tests_openshift/database/test_retention.py
+    assert [step.name for step in steps] == [step_name]
 
 
-def test_backup():
+class FakeS3Client:
+    """In-memory stub of the S3 multipart upload API."""
+
+    def __init__(self):
+        self.parts = {}
+        self.objects = {}
+        self.aborted = False
+
+    def create_multipart_upload(self, Bucket, Key, ChecksumAlgorithm):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, **kwargs):
+        assert kwargs["ChecksumSHA256"] == b64encode(sha256(Body).digest()).decode()
+        self.parts[PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.objects[Key] = b"".join(
+            self.parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+@pytest.fixture()
+def s3_client():
+    client = FakeS3Client()
+    flexmock(database).should_receive("boto3_client").with_args("s3").and_return(client)
+    return client
+
+
+@pytest.fixture()
+def pg_dump(tmp_path, monkeypatch):
+    """Put a fake pg_dump printing the numbers up to 100000 into PATH."""
+    script = tmp_path / "pg_dump"
+    script.write_text("#!/bin/sh\nseq 1 100000\n")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    flexmock(database).should_receive("get_pg_url").and_return("postgresql://packit")
+    return script
+
+
+def test_backup(s3_client, pg_dump):
     flexmock(database).should_receive("is_aws_configured").once().and_return(True)
-    flexmock(database).should_receive("dump_to").once()
-    flexmock(database).should_receive("gzip_file").once().and_return(Path("xyz"))
-    flexmock(S3Transfer).should_receive("upload_file").once()
-    flexmock(Path).should_receive("unlink").twice()
     database.backup()
+
+    (dump,) = s3_client.objects.values()
+    assert gzip.decompress(dump) == "".join(f"{i}\n" for i in range(1, 100001)).encode()
+
+
+def test_backup_pg_dump_fails(s3_client, pg_dump):
+    pg_dump.write_text("#!/bin/sh\necho partial\necho 'connection refused' >&2\nexit 1\n")
+    flexmock(database).should_receive("is_aws_configured").once().and_return(True)
+    with pytest.raises(PackitCommandFailedError) as exc_info:
+        database.backup()
+
+    assert exc_info.value.stderr_output == "connection refused\n"
+
+    assert s3_client.aborted
+    assert not s3_client.objects
+
+
+def test_upload_to_s3_parts(s3_client):
+    database.upload_to_s3((b"abc" for _ in range(10)), key="dump.sql.gz", part_size=7)
+
+    assert [len(part) for part in s3_client.parts.values()] == [7, 7, 7, 7, 2]
+    assert s3_client.objects["dump.sql.gz"] == b"abc" * 10
@@ -333,8 +333,8 @@ def test_downstream_koji_build(sidetag_group):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).and_return({koji_build})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build.nvr: {koji_build}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
     )
@@ -438,8 +438,8 @@ def test_downstream_koji_build_failure_no_issue():
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).and_return({koji_build})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build.nvr: {koji_build}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(id=1, grouped_targets=[koji_build]),
     )
@@ -550,8 +550,8 @@ def test_downstream_koji_build_failure_issue_created():
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).and_return({koji_build})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build.nvr: {koji_build}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
     )
@@ -665,8 +665,8 @@ def test_downstream_koji_build_failure_issue_comment():
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).and_return({koji_build})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build.nvr: {koji_build}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
     )
@@ -865,8 +865,8 @@ def test_downstream_koji_build_where_multiple_branches_defined(jobs_config):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).and_return({koji_build})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build.nvr: {koji_build}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
     )
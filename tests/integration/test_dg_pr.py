@@ -108,6 +108,7 @@ def test_downstream_koji_scratch_build(distgit_pr_event, target_branch, uid, che
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
             add_repositories_to_repository_cache=False,
+            repository_mirror_cache=None,
             deployment=Deployment.stg,
         )
         .should_receive("get_project")
@@ -455,11 +455,8 @@ def mock_repository_issue_retriggering():
 
     flexmock(KojiBuildTargetModel).should_receive("create")
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).with_args(nvr_f37).and_return({koji_build_f37})
-    flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).with_args(nvr_f38).and_return({koji_build_f38})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({nvr_f37: {koji_build_f37}, nvr_f38: {koji_build_f38}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build_f38, koji_build_f37]),
     )
@@ -564,23 +561,31 @@ def test_issue_comment_retrigger_bodhi_update_handler(
     flexmock(BodhiUpdateTargetModel).should_receive(
         "get_all_successful_or_in_progress_by_nvrs",
     ).with_args("python-teamcity-messages.fc38").and_return(set())
-    flexmock(BodhiUpdateTargetModel).should_receive("create").with_args(
-        target="f38",
-        koji_nvrs="python-teamcity-messages.fc38",
-        sidetag=None,
-        status="queued",
-        bodhi_update_group=group_model,
-    ).and_return().once()
     flexmock(BodhiUpdateTargetModel).should_receive(
         "get_all_successful_or_in_progress_by_nvrs",
     ).with_args("python-teamcity-messages.fc37").and_return(set())
-    flexmock(BodhiUpdateTargetModel).should_receive("create").with_args(
-        target="f37",
-        koji_nvrs="python-teamcity-messages.fc37",
-        sidetag=None,
-        status="queued",
-        bodhi_update_group=group_model,
-    ).and_return().once()
+
+    def bulk_create(bodhi_update_group, updates):
+        assert bodhi_update_group is group_model
+        # the branches are collected in a set
+        assert sorted(updates, key=lambda update: update["target"]) == [
+            {
+                "target": "f37",
+                "koji_nvrs": "python-teamcity-messages.fc37",
+                "sidetag": None,
+                "status": "queued",
+            },
+            {
+                "target": "f38",
+                "koji_nvrs": "python-teamcity-messages.fc38",
+                "sidetag": None,
+                "status": "queued",
+            },
+        ]
+
+    flexmock(BodhiUpdateTargetModel).should_receive("bulk_create").replace_with(
+        bulk_create,
+    ).once()
 
     results = run_issue_comment_retrigger_bodhi_update(
         package_config=package_config,
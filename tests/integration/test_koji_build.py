@@ -186,8 +186,8 @@ def test_koji_build_error_msg(distgit_push_packit):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).and_return({koji_build})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build.nvr: {koji_build}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
     )
@@ -87,6 +87,7 @@ def mock_distgit_pr_functionality():
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
             add_repositories_to_repository_cache=False,
+            repository_mirror_cache=None,
             deployment=Deployment.stg,
         )
         .should_receive("get_project")
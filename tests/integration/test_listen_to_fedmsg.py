@@ -792,16 +792,20 @@ def test_copr_build_end_testing_farm(copr_build_end, copr_build_pr):
         copr_build_pr.group_of_targets.runs[-1],
         ranch="public",
     ).and_return(group)
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target="fedora-rawhide-x86_64",
-        web_url=None,
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").with_args(
         test_run_group=group,
-        copr_build_targets=[copr_build_pr],
-        data={"base_project_url": "https://github.com/foo/bar"},
-    ).and_return(tft_test_run_model)
+        test_runs=[
+            {
+                "pipeline_id": None,
+                "identifier": None,
+                "status": TestingFarmResult.new,
+                "target": "fedora-rawhide-x86_64",
+                "web_url": None,
+                "copr_build_targets": [copr_build_pr],
+                "data": {"base_project_url": "https://github.com/foo/bar"},
+            },
+        ],
+    ).and_return([tft_test_run_model])
 
     flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
@@ -2042,7 +2046,9 @@ def test_copr_build_end_failed_testing_farm(copr_build_end, copr_build_pr):
         .with_args(TestingFarmResult.error)
         .mock()
     )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test],
+    )
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         copr_build_pr.group_of_targets.runs[-1], ranch="public"
     ).and_return(flexmock(grouped_targets=[test]))
@@ -2238,7 +2244,9 @@ def test_copr_build_end_failed_testing_farm_no_json(copr_build_end, copr_build_p
         copr_build_pr.group_of_targets.runs[-1],
         ranch="public",
     ).and_return(flexmock(grouped_targets=[test]))
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test],
+    )
     flexmock(TestingFarmJobHelper).should_receive("is_fmf_configured").and_return(True)
     flexmock(TestingFarmClient).should_receive("distro2compose").with_args(
         "fedora-rawhide",
@@ -2975,175 +2983,128 @@ def test_koji_build_end_downstream(
         koji_build_pr_downstream.group_of_targets.runs[-1],
         ranch="public",
     ).and_return(group)
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target=distro,
-        web_url=None,
-        test_run_group=group,
-        koji_build_targets=[koji_build_pr_downstream],
-        data={
-            "base_project_url": "https://src.fedoraproject.org/rpms/packit",
-            "fedora_ci_test": "installability",
-        },
-    ).and_return(tft_test_run_model_installability).once()
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target=distro,
-        web_url=None,
-        test_run_group=group,
-        koji_build_targets=[koji_build_pr_downstream],
-        data={
-            "base_project_url": "https://src.fedoraproject.org/rpms/packit",
-            "fedora_ci_test": "custom",
-        },
-    ).and_return(tft_test_run_model_custom).once()
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target=distro,
-        web_url=None,
-        test_run_group=group,
-        koji_build_targets=[koji_build_pr_downstream],
-        data={
-            "base_project_url": "https://src.fedoraproject.org/rpms/packit",
-            "fedora_ci_test": "rpminspect",
-        },
-    ).and_return(tft_test_run_model_rpminspect).once()
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target=distro,
-        web_url=None,
-        test_run_group=group,
-        koji_build_targets=[koji_build_pr_downstream],
-        data={
-            "base_project_url": "https://src.fedoraproject.org/rpms/packit",
-            "fedora_ci_test": "rpmlint",
-        },
-    ).and_return(tft_test_run_model_rpmlint).once()
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target=distro,
-        web_url=None,
-        test_run_group=group,
-        koji_build_targets=[koji_build_pr_downstream],
-        data={
-            "base_project_url": "https://src.fedoraproject.org/rpms/packit",
-            "fedora_ci_test": "rmdepcheck",
-        },
-    ).and_return(tft_test_run_model_rmdepcheck).once()
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target=distro,
-        web_url=None,
-        test_run_group=group,
-        koji_build_targets=[koji_build_pr_downstream],
-        data={
-            "base_project_url": "https://src.fedoraproject.org/rpms/packit",
-            "fedora_ci_test": "license-validate",
-        },
-    ).and_return(tft_test_run_model_license_validate).once()
+    test_runs_by_fedora_ci_test = {
+        "installability": tft_test_run_model_installability,
+        "custom": tft_test_run_model_custom,
+        "rpminspect": tft_test_run_model_rpminspect,
+        "rpmlint": tft_test_run_model_rpmlint,
+        "rmdepcheck": tft_test_run_model_rmdepcheck,
+        "license-validate": tft_test_run_model_license_validate,
+    }
+
+    def bulk_create(test_run_group, test_runs):
+        assert test_run_group is group
+        fedora_ci_tests = [test_run["data"]["fedora_ci_test"] for test_run in test_runs]
+        assert sorted(fedora_ci_tests) == sorted(test_runs_by_fedora_ci_test)
+        for test_run, fedora_ci_test in zip(test_runs, fedora_ci_tests):
+            assert test_run == {
+                "pipeline_id": None,
+                "identifier": None,
+                "status": TestingFarmResult.new,
+                "target": distro,
+                "web_url": None,
+                "koji_build_targets": [koji_build_pr_downstream],
+                "data": {
+                    "base_project_url": "https://src.fedoraproject.org/rpms/packit",
+                    "fedora_ci_test": fedora_ci_test,
+                },
+            }
+        return [test_runs_by_fedora_ci_test[test] for test in fedora_ci_tests]
+
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        bulk_create,
+    ).once()
 
     # check if packit-service set correct PR statuses
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.success,
         description="RPM build succeeded.",
         url=url,
-        check_name="Packit-stg - scratch build",
+        check_names="Packit-stg - scratch build",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Submitting the tests ...",
         url="https://dashboard.localhost/jobs/testing-farm/5",
-        check_name="Packit-stg - installability",
+        check_names="Packit-stg - installability",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Tests have been submitted ...",
         url="https://dashboard.localhost/jobs/testing-farm/5",
-        check_name="Packit-stg - installability",
+        check_names="Packit-stg - installability",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Submitting the tests ...",
         url="https://dashboard.localhost/jobs/testing-farm/6",
-        check_name="Packit-stg - custom",
+        check_names="Packit-stg - custom",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Tests have been submitted ...",
         url="https://dashboard.localhost/jobs/testing-farm/6",
-        check_name="Packit-stg - custom",
+        check_names="Packit-stg - custom",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Submitting the tests ...",
         url="https://dashboard.localhost/jobs/testing-farm/7",
-        check_name="Packit-stg - rpminspect",
+        check_names="Packit-stg - rpminspect",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Tests have been submitted ...",
         url="https://dashboard.localhost/jobs/testing-farm/7",
-        check_name="Packit-stg - rpminspect",
+        check_names="Packit-stg - rpminspect",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Submitting the tests ...",
         url="https://dashboard.localhost/jobs/testing-farm/8",
-        check_name="Packit-stg - rpmlint",
+        check_names="Packit-stg - rpmlint",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Tests have been submitted ...",
         url="https://dashboard.localhost/jobs/testing-farm/8",
-        check_name="Packit-stg - rpmlint",
+        check_names="Packit-stg - rpmlint",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Submitting the tests ...",
         url="https://dashboard.localhost/jobs/testing-farm/9",
-        check_name="Packit-stg - rmdepcheck",
+        check_names="Packit-stg - rmdepcheck",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Tests have been submitted ...",
         url="https://dashboard.localhost/jobs/testing-farm/9",
-        check_name="Packit-stg - rmdepcheck",
+        check_names="Packit-stg - rmdepcheck",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Submitting the tests ...",
         url="https://dashboard.localhost/jobs/testing-farm/10",
-        check_name="Packit-stg - license-validate",
+        check_names="Packit-stg - license-validate",
         target_branch=koji_target,
     ).once()
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
         description="Tests have been submitted ...",
         url="https://dashboard.localhost/jobs/testing-farm/10",
-        check_name="Packit-stg - license-validate",
+        check_names="Packit-stg - license-validate",
         target_branch=koji_target,
     ).once()
 
@@ -3468,6 +3429,7 @@ def test_pagure_pr_updated(pagure_pr_updated, project_namespace, project_repo):
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
             add_repositories_to_repository_cache=False,
+            repository_mirror_cache=None,
             deployment=Deployment.stg,
             testing_farm_secret="secret token",
         )
@@ -3560,11 +3522,11 @@ def test_pagure_pr_updated(pagure_pr_updated, project_namespace, project_repo):
             print_live=True,
         ).and_return(flexmock(stdout="some output")).once()
 
-        flexmock(StatusReporter).should_receive("set_status").with_args(
+        flexmock(StatusReporter).should_receive("report").with_args(
             state=BaseCommitStatus.running,
             description="RPM build was submitted ...",
             url="https://dashboard.localhost/jobs/koji/123",
-            check_name="Packit-stg - scratch build",
+            check_names="Packit-stg - scratch build",
             target_branch="rawhide",
         ).once()
     else:
@@ -3639,32 +3601,36 @@ def test_pagure_pr_updated(pagure_pr_updated, project_namespace, project_repo):
             pipeline,
             ranch="public",
         ).and_return(group)
-        flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-            pipeline_id=None,
-            identifier=None,
-            status=TestingFarmResult.new,
-            target="fedora-rawhide",
-            web_url=None,
+        flexmock(TFTTestRunTargetModel).should_receive("bulk_create").with_args(
             test_run_group=group,
-            koji_build_targets=[],
-            data={
-                "base_project_url": f"https://src.fedoraproject.org/{project_namespace}/{project_repo}",
-                "fedora_ci_test": "custom",
-            },
-        ).and_return(tft_test_run_model_custom).once()
+            test_runs=[
+                {
+                    "pipeline_id": None,
+                    "identifier": None,
+                    "status": TestingFarmResult.new,
+                    "target": "fedora-rawhide",
+                    "web_url": None,
+                    "koji_build_targets": [],
+                    "data": {
+                        "base_project_url": f"https://src.fedoraproject.org/{project_namespace}/{project_repo}",
+                        "fedora_ci_test": "custom",
+                    },
+                },
+            ],
+        ).and_return([tft_test_run_model_custom]).once()
 
-        flexmock(StatusReporter).should_receive("set_status").with_args(
+        flexmock(StatusReporter).should_receive("report").with_args(
             state=BaseCommitStatus.running,
             description="Submitting the tests ...",
             url="https://dashboard.localhost/jobs/testing-farm/6",
-            check_name="Packit-stg - custom",
+            check_names="Packit-stg - custom",
             target_branch="rawhide",
         ).once()
-        flexmock(StatusReporter).should_receive("set_status").with_args(
+        flexmock(StatusReporter).should_receive("report").with_args(
             state=BaseCommitStatus.running,
             description="Tests have been submitted ...",
             url="https://dashboard.localhost/jobs/testing-farm/6",
-            check_name="Packit-stg - custom",
+            check_names="Packit-stg - custom",
             target_branch="rawhide",
         ).once()
 
@@ -137,7 +137,7 @@ def test_logdetective_koji_build_scratch_downstream(
     pushgateway.log_detective_runs_started.should_receive("inc").times(failed_builds).and_return()
     pushgateway.fedora_ci_koji_builds_finished.should_receive("inc").once().and_return()
     pushgateway.should_receive("push").and_return()
-    flexmock(Pushgateway).new_instances(pushgateway)
+    flexmock(Pushgateway).should_receive("get_instance").and_return(pushgateway)
 
     koji_build_pr_downstream.should_receive("add_log_detective_run").times(failed_builds)
 
@@ -211,7 +211,7 @@ def test_logdetective_skipped_when_project_disabled(
     pushgateway.log_detective_runs_started.should_receive("inc").never()
     pushgateway.fedora_ci_koji_builds_finished.should_receive("inc").once().and_return()
     pushgateway.should_receive("push").and_return()
-    flexmock(Pushgateway).new_instances(pushgateway)
+    flexmock(Pushgateway).should_receive("get_instance").and_return(pushgateway)
 
     koji_build_pr_downstream.should_receive("add_log_detective_run").never()
 
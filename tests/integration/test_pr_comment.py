@@ -781,7 +781,9 @@ def test_pr_test_command_handler(
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test_run],
+    )
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         run, ranch="public"
     ).and_return(
@@ -868,7 +870,9 @@ def test_pr_test_command_handler_identifiers(
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test_run],
+    )
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         run, ranch="public"
     ).and_return(
@@ -1145,14 +1149,16 @@ def test_pr_test_command_handler_retries(
     if retry_number > 0:
         flexmock(PipelineModel).should_receive("create").never()
         flexmock(TFTTestRunGroupModel).should_receive("create").never()
-        flexmock(TFTTestRunTargetModel).should_receive("create").never()
+        flexmock(TFTTestRunTargetModel).should_receive("bulk_create").never()
         flexmock(TFTTestRunTargetModel).should_receive("get_by_id").and_return(test_run)
     else:
         flexmock(PipelineModel).should_receive("create").and_return(
             flexmock(test_run_group=None),
         )
         flexmock(TFTTestRunGroupModel).should_receive("create").and_return(group)
-        flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+        flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+            lambda test_run_group, test_runs: len(test_runs) * [test_run],
+        )
 
     if retry_number == 2:
         flexmock(test_run).should_receive("set_status").with_args(
@@ -1357,16 +1363,20 @@ def test_pr_test_command_handler_skip_build_option(
         run_model,
         ranch="public",
     ).and_return(group)
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-        pipeline_id=None,
-        identifier=None,
-        status=TestingFarmResult.new,
-        target="fedora-rawhide-x86_64",
-        web_url=None,
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").with_args(
         test_run_group=group,
-        copr_build_targets=[],
-        data={"base_project_url": "https://github.com/packit-service/hello-world"},
-    ).and_return(tft_test_run_model)
+        test_runs=[
+            {
+                "pipeline_id": None,
+                "identifier": None,
+                "status": TestingFarmResult.new,
+                "target": "fedora-rawhide-x86_64",
+                "web_url": None,
+                "copr_build_targets": [],
+                "data": {"base_project_url": "https://github.com/packit-service/hello-world"},
+            },
+        ],
+    ).and_return([tft_test_run_model])
     flexmock(tft_test_run_model).should_receive("set_pipeline_id").with_args(
         pipeline_id,
     ).once()
@@ -1449,7 +1459,9 @@ def test_pr_test_command_handler_compose_not_present(
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test_run],
+    )
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         run_model,
         ranch="public",
@@ -1577,7 +1589,9 @@ def test_pr_test_command_handler_composes_not_available(
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test_run],
+    )
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         run_model,
         ranch="public",
@@ -2024,7 +2038,9 @@ def test_pr_test_command_handler_skip_build_option_no_fmf_metadata(
         run_model,
         ranch="public",
     ).and_return(group_model)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test_run],
+    )
     flexmock(TestingFarmJobHelper).should_receive("get_latest_copr_build").never()
     flexmock(Pushgateway).should_receive("push").times(2).and_return()
     flexmock(TestingFarmJobHelper).should_receive("report_status_to_tests").with_args(
@@ -2402,20 +2418,26 @@ def test_pr_test_command_handler_multiple_builds(
         grouped_targets=[tft_test_run_model_rawhide, tft_test_run_model_35],
     )
     flexmock(TFTTestRunGroupModel).should_receive("create").and_return(group)
-    for t, model in (
-        ("fedora-35-x86_64", tft_test_run_model_35),
-        ("fedora-rawhide-x86_64", tft_test_run_model_rawhide),
-    ):
-        flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-            pipeline_id=None,
-            identifier=None,
-            status=TestingFarmResult.new,
-            target=t,
-            web_url=None,
-            test_run_group=group,
-            copr_build_targets=[build],
-            data={"base_project_url": "https://github.com/packit-service/hello-world"},
-        ).and_return(model)
+    test_runs_by_target = {
+        "fedora-35-x86_64": tft_test_run_model_35,
+        "fedora-rawhide-x86_64": tft_test_run_model_rawhide,
+    }
+
+    def bulk_create(test_run_group, test_runs):
+        assert test_run_group is group
+        for test_run in test_runs:
+            assert test_run == {
+                "pipeline_id": None,
+                "identifier": None,
+                "status": TestingFarmResult.new,
+                "target": test_run["target"],
+                "web_url": None,
+                "copr_build_targets": [build],
+                "data": {"base_project_url": "https://github.com/packit-service/hello-world"},
+            }
+        return [test_runs_by_target[test_run["target"]] for test_run in test_runs]
+
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(bulk_create)
     flexmock(tft_test_run_model_rawhide).should_receive("add_copr_build").with_args(
         additional_copr_build,
     )
@@ -2510,8 +2532,8 @@ def test_koji_build_retrigger_via_dist_git_pr_comment(pagure_pr_comment_added):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).and_return({koji_build})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build.nvr: {koji_build}})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
     )
@@ -2665,6 +2687,7 @@ def test_downstream_koji_scratch_build_retrigger_via_dist_git_pr_comment(
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
             add_repositories_to_repository_cache=False,
+            repository_mirror_cache=None,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
             package_config_path_override=None,
@@ -3762,6 +3785,7 @@ def _test_downstream_tf_retrigger_common(
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
             add_repositories_to_repository_cache=False,
+            repository_mirror_cache=None,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
             package_config_path_override=None,
@@ -3817,7 +3841,9 @@ def _test_downstream_tf_retrigger_common(
         target=target_branch,
     )
     flexmock(PipelineModel).should_receive("create").and_return(run)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test_run],
+    )
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         run, ranch="public"
     ).and_return(
@@ -4058,6 +4084,7 @@ def test_downstream_testing_farm_retrigger_rawhide_pr_eln_package_fedora_ci(
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
             add_repositories_to_repository_cache=False,
+            repository_mirror_cache=None,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
             package_config_path_override=None,
@@ -4114,7 +4141,9 @@ def test_downstream_testing_farm_retrigger_rawhide_pr_eln_package_fedora_ci(
         target=check_target,
     )
     flexmock(PipelineModel).should_receive("create").and_return(run)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: len(test_runs) * [test_run],
+    )
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         run, ranch="public"
     ).and_return(
@@ -4245,6 +4274,7 @@ def test_downstream_build_retrigger_rawhide_pr_eln_package_fedora_ci(
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
             add_repositories_to_repository_cache=False,
+            repository_mirror_cache=None,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
             package_config_path_override=None,
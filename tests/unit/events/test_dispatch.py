@@ -0,0 +1,89 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.worker.parser import Parser
+from tests.spellbook import DATA_DIR
+
+
+def load(path: str) -> dict:
+    return json.loads((DATA_DIR / path).read_text())
+
+
+@pytest.mark.parametrize(
+    "path, parser_name",
+    [
+        ("webhooks/github/checkrun_rerequested.json", "parse_check_rerun_event"),
+        ("webhooks/github/commit_comment.json", "parse_commit_comment_event"),
+        ("webhooks/github/installation_created.json", "parse_installation_event"),
+        ("webhooks/github/issue_comment_help_command.json", "parse_github_comment_event"),
+        ("webhooks/github/pr.json", "parse_pr_event"),
+        ("webhooks/github/pr_comment_copr_build.json", "parse_github_comment_event"),
+        ("webhooks/github/push_branch.json", "parse_github_push_event"),
+        ("webhooks/github/release.json", "parse_release_event"),
+        ("webhooks/gitlab/commit_comment.json", "parse_gitlab_comment_event"),
+        ("webhooks/gitlab/issue_comment.json", "parse_gitlab_comment_event"),
+        ("webhooks/gitlab/mr_comment.json", "parse_gitlab_comment_event"),
+        ("webhooks/gitlab/mr_event.json", "parse_mr_event"),
+        ("webhooks/gitlab/mr_pipeline.json", "parse_pipeline_event"),
+        ("webhooks/gitlab/push_branch.json", "parse_gitlab_push_event"),
+        ("webhooks/gitlab/release.json", "parse_gitlab_release_event"),
+        ("webhooks/gitlab/tag_push.json", "parse_gitlab_tag_push_event"),
+        ("fedmsg/anitya_version_update.json", "parse_anitya_version_update_event"),
+        ("fedmsg/copr_build_end.json", "parse_copr_event"),
+        ("fedmsg/copr_build_start.json", "parse_copr_event"),
+        ("fedmsg/distgit_commit.json", "parse_pagure_push_event"),
+        ("fedmsg/forgejo_action_run_pr.json", "parse_forgejo_action_run_event"),
+        ("fedmsg/forgejo_issue_comment.json", "parse_forgejo_comment_event"),
+        ("fedmsg/forgejo_pr.json", "parse_forgejo_pr_event"),
+        ("fedmsg/forgejo_push.json", "parse_forgejo_push_event"),
+        ("fedmsg/koji_build_completed_f36.json", "parse_koji_build_event"),
+        ("fedmsg/koji_build_scratch_end.json", "parse_koji_task_event"),
+        ("fedmsg/koji_build_tagged.json", "parse_koji_build_tag_event"),
+        ("fedmsg/logdetective_analysis_result.json", "parse_logdetective_analysis_event"),
+        ("fedmsg/new_hotness_update.json", "parse_new_hotness_update_event"),
+        ("fedmsg/open_scan_hub_task_finished.json", "parse_openscanhub_task_finished_event"),
+        ("fedmsg/open_scan_hub_task_started.json", "parse_openscanhub_task_started_event"),
+        ("fedmsg/pagure_pr_comment.json", "parse_pagure_pull_request_comment_event"),
+        ("fedmsg/pagure_pr_flag_updated.json", "parse_pagure_pr_flag_event"),
+        ("fedmsg/pagure_pr_new.json", "parse_pagure_pull_request_event"),
+    ],
+)
+def test_get_event_parser(path, parser_name):
+    assert Parser.get_event_parser(load(path)).__name__ == parser_name
+
+
+def test_get_event_parser_testing_farm():
+    event = {"source": "testing-farm", "request_id": "123"}
+    assert Parser.get_event_parser(event).__name__ == "parse_testing_farm_results_event"
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"topic": "org.fedoraproject.prod.bodhi.update.comment"},
+        {"object_kind": "wiki_page"},
+        {"action": "created", "hook": {}},
+    ],
+)
+def test_get_event_parser_unknown(event):
+    assert Parser.get_event_parser(event) is None
+
+
+def test_parse_event_skips_other_parsers():
+    flexmock(Parser).should_receive("parse_pr_event").never()
+    flexmock(Parser).should_receive("parse_issue_comment_event").never()
+
+    event_object = Parser.parse_event(load("webhooks/github/push_branch.json"))
+
+    assert event_object.commit_sha
+
+
+def test_parse_event_unknown_payload_falls_back_to_all_parsers():
+    flexmock(Parser).should_receive("parse_pr_event").and_return(None).once()
+
+    assert Parser.parse_event({"action": "created", "hook": {}}) is None
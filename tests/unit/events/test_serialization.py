@@ -0,0 +1,126 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import inspect
+import json
+import typing
+from enum import Enum
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.events.event import Event
+from packit_service.events.event_data import EventData
+from packit_service.worker.parser import Parser
+from tests.spellbook import DATA_DIR
+
+# the messages that can be parsed without the DB or the forge
+MESSAGES = [
+    "webhooks/github/installation_created.json",
+    "webhooks/github/pr.json",
+    "webhooks/github/pr_comment_copr_build.json",
+    "webhooks/github/push_branch.json",
+    "webhooks/gitlab/mr_comment.json",
+    "webhooks/gitlab/mr_event.json",
+    "webhooks/gitlab/push_branch.json",
+    "webhooks/gitlab/release.json",
+    "webhooks/gitlab/tag_push.json",
+    "fedmsg/distgit_commit.json",
+    "fedmsg/forgejo_action_run_pr.json",
+    "fedmsg/forgejo_action_run_push.json",
+    "fedmsg/forgejo_issue_comment.json",
+    "fedmsg/forgejo_pr.json",
+    "fedmsg/forgejo_pr_comment.json",
+    "fedmsg/forgejo_push.json",
+    "fedmsg/pagure_pr_comment.json",
+    "fedmsg/pagure_pr_flag_updated.json",
+    "fedmsg/pagure_pr_new.json",
+]
+
+
+def get_event_classes(kls: type[Event] = Event) -> list[type[Event]]:
+    classes = []
+    for subclass in kls.__subclasses__():
+        if subclass.__module__.startswith("packit_service.") and not inspect.isabstract(
+            subclass,
+        ):
+            classes.append(subclass)
+        classes.extend(get_event_classes(subclass))
+    return classes
+
+
+class NotCopyable:
+    def __deepcopy__(self, memo):
+        raise AssertionError("Lazy attributes should not be copied.")
+
+
+@pytest.fixture(params=MESSAGES)
+def event(request):
+    with open(DATA_DIR / request.param) as message:
+        event = Parser.parse_event(json.load(message))
+    assert event
+    if "_commit_sha" in event.__dict__ and not event._commit_sha:
+        # would be fetched from the forge
+        event._commit_sha = "0" * 40
+    if "_tag_name" in event.__dict__ and not event._tag_name:
+        # would be fetched from the forge
+        event._tag_name = "0.1.0"
+    return event
+
+
+def test_event_round_trip(event):
+    event_dict = json.loads(json.dumps(event.get_dict()))
+    assert event_dict["event_type"] == event.event_type()
+
+    data = EventData.from_event_dict(event_dict)
+    assert data.event_dict == event_dict
+    assert data.event_type == event.event_type()
+    assert data.actor == (getattr(event, "user_login", None) or getattr(event, "actor", None))
+    assert data.project_url == event_dict["project_url"]
+    assert data.commit_sha == getattr(event, "commit_sha", None)
+
+    data_dict = json.loads(json.dumps(data.get_dict()))
+    assert data_dict["event_dict"] == event_dict
+    assert EventData.from_event_dict(data_dict["event_dict"]).get_dict() == data_dict
+
+
+def test_event_lazy_attributes_not_copied(event):
+    # the ogr objects
+    for attribute in ("_project", "_base_project", "_comment_object", "_package_config"):
+        if attribute in event.__dict__:
+            setattr(event, attribute, NotCopyable())
+
+    event_dict = event.get_dict()
+
+    assert not set(event.get_non_serializable_attributes()) & set(event_dict)
+
+
+def test_event_repr_does_not_serialize(event):
+    flexmock(event).should_receive("get_dict").never()
+
+    assert repr(event).startswith(f"{event.__class__.__name__}(")
+    assert str(event)
+
+
+def test_event_data_project_not_copied(event):
+    data = EventData.from_event_dict(event.get_dict())
+    data._project = NotCopyable()
+
+    assert "_project" not in data.get_dict()
+
+
+@pytest.mark.parametrize(
+    "event_class",
+    # the same class can be reached through more parents
+    sorted(set(get_event_classes()), key=lambda kls: f"{kls.__module__}.{kls.__name__}"),
+)
+def test_event_declares_serializers(event_class):
+    # enums are not JSON serializable, their values are
+    for name, parameter in inspect.signature(event_class.__init__).parameters.items():
+        types = typing.get_args(parameter.annotation) or (parameter.annotation,)
+        if any(isinstance(type_, type) and issubclass(type_, Enum) for type_ in types):
+            assert name in event_class._serializers
+
+    # the serializers of the parents are kept
+    for parent in event_class.__mro__:
+        assert parent.__dict__.get("serializers", {}).items() <= event_class._serializers.items()
@@ -3,6 +3,7 @@
 
 from collections.abc import Iterable
 
+import fakeredis
 import pytest
 from copr.v3 import Client
 from fasjson_client import Client as FasjsonClient
@@ -15,6 +16,7 @@ from packit.config import CommonPackageConfig, JobConfig, JobConfigTriggerType,
 from packit.copr_helper import CoprHelper
 from packit.local_project import LocalProject
 
+from packit_service import cache
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     DENIED_MSG,
@@ -942,3 +944,86 @@ def test_is_github_username_from_fas_account_matching(
         )
         is result
     )
+
+
+@pytest.fixture()
+def fake_redis():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    return client
+
+
+@pytest.fixture()
+def allowlist_statuses(allowlist_entries):
+    statuses = [
+        (entry.namespace, AllowlistStatus(entry.status))
+        for entry in allowlist_entries.values()
+        if entry
+    ] + [
+        # nested GitLab groups
+        ("gitlab.com/redhat", AllowlistStatus.approved_manually),
+        ("gitlab.com/redhat/rhel/sub", AllowlistStatus.denied),
+        ("gitlab.com/redhat/rhel/sub/group/allowed.git", AllowlistStatus.approved_manually),
+        ("gitlab.com/redhat/centos/group", AllowlistStatus.waiting),
+    ]
+    flexmock(DBAllowlist).should_receive("get_namespace").never()
+    return statuses
+
+
+@pytest.mark.parametrize(
+    "namespace, is_approved, is_denied, is_exactly_denied",
+    [
+        ("github.com/fero", True, False, False),
+        ("github.com/fero/denied_packit.git", False, True, True),
+        ("github.com/konipas", False, False, False),
+        ("github.com/packit/packit.git", True, True, False),
+        ("gitlab.com/packit-service/src/glibc.git", True, True, False),
+        ("gitlab.com/redhat/rhel/kernel.git", True, False, False),
+        ("gitlab.com/redhat/rhel/sub", False, True, True),
+        ("gitlab.com/redhat/rhel/sub/group/kernel.git", False, True, False),
+        ("gitlab.com/redhat/rhel/sub/group/allowed.git", True, True, False),
+        ("gitlab.com/redhat/centos/group/kernel.git", True, False, False),
+        ("gitlab.com/red", False, False, False),
+        ("gitlab.com", False, False, False),
+    ],
+)
+def test_allowlist_trie(
+    fake_redis,
+    allowlist_statuses,
+    namespace,
+    is_approved,
+    is_denied,
+    is_exactly_denied,
+):
+    flexmock(DBAllowlist).should_receive("get_statuses").and_return(allowlist_statuses).once()
+
+    assert Allowlist.is_namespace_or_parent_approved(namespace) == is_approved
+    assert Allowlist.is_namespace_or_parent_denied(namespace) == is_denied
+    assert Allowlist.is_denied(namespace) == is_exactly_denied
+
+
+def test_allowlist_trie_reloaded_on_change(fake_redis, allowlist_statuses):
+    flexmock(DBAllowlist).should_receive("get_statuses").and_return(allowlist_statuses).and_return(
+        [*allowlist_statuses, ("github.com/konipas", AllowlistStatus.approved_manually)],
+    ).twice()
+
+    assert not Allowlist.is_namespace_or_parent_approved("github.com/konipas")
+    assert not Allowlist.is_namespace_or_parent_approved("github.com/konipas")
+    DBAllowlist.bump_generation()
+    assert Allowlist.is_namespace_or_parent_approved("github.com/konipas")
+    assert Allowlist.is_namespace_or_parent_approved("github.com/konipas/ogr.git")
+
+
+def test_large_allowlist_loaded_once(fake_redis):
+    flexmock(DBAllowlist).should_receive("get_namespace").never()
+    flexmock(DBAllowlist).should_receive("get_statuses").and_return(
+        [
+            (f"gitlab.com/group-{i % 100}/user-{i}", AllowlistStatus.approved_automatically)
+            for i in range(50_000)
+        ],
+    ).once()
+
+    for i in range(0, 50_000, 50):
+        assert Allowlist.is_namespace_or_parent_approved(f"gitlab.com/group-{i % 100}/user-{i}")
+        assert not Allowlist.is_namespace_or_parent_denied(f"gitlab.com/group-{i % 100}/user-{i}")
+        assert not Allowlist.is_namespace_or_parent_approved(f"gitlab.com/group-{i % 100}/x.git")
@@ -0,0 +1,252 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from flexmock import flexmock
+from packit.exceptions import PackitException
+
+from packit_service.models import BodhiUpdateTargetModel
+from packit_service.worker.handlers import bodhi
+from packit_service.worker.handlers.bodhi import RetriggerBodhiUpdateHandler
+
+
+class FakeBodhi:
+    """Bodhi creating the updates with a delay, tracking the concurrent requests."""
+
+    def __init__(self, failing=None, delay=0.05):
+        # exceptions by the dist-git branches
+        self.failing = failing or {}
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.created = []
+
+    def create_update(self, dist_git_branch, update_type, koji_builds, sidetag, alias):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delay)
+            if dist_git_branch in self.failing:
+                raise self.failing[dist_git_branch]
+            self.created.append(dist_git_branch)
+            alias = f"FEDORA-{dist_git_branch}"
+            return alias, f"https://bodhi.fedoraproject.org/updates/{alias}"
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class FakeDatabase:
+    """
+    Counts the commits, the setters commit on their own
+    unless they are called within a unit of work, which is committed at its end.
+    """
+
+    def __init__(self):
+        self.commits = 0
+        self.depth = 0
+        self.handler_thread = threading.get_ident()
+
+    @contextmanager
+    def unit_of_work(self):
+        # the models are not thread-safe
+        assert threading.get_ident() == self.handler_thread
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if not self.depth:
+                self.commits += 1
+
+    def write(self):
+        assert threading.get_ident() == self.handler_thread
+        if not self.depth:
+            self.commits += 1
+
+
+class FakeTarget:
+    def __init__(self, db, branch, finished):
+        self.db = db
+        self.id = int(branch.removeprefix("f"))
+        self.target = branch
+        self.koji_nvrs = f"package-1.0-1.fc{self.id}"
+        self.sidetag = None
+        self.status = "queued"
+        self.finished = finished
+
+    def _set(self, **kwargs):
+        self.db.write()
+        self.__dict__.update(kwargs)
+
+    def set_status(self, status):
+        self._set(status=status)
+        if status in ("success", "error", "skipped"):
+            self.finished.append(self.target)
+
+    def set_alias(self, alias):
+        self._set(alias=alias)
+
+    def set_web_url(self, web_url):
+        self._set(web_url=web_url)
+
+    def set_data(self, data):
+        self._set(data=data)
+
+    def set_update_creation_time(self, time):
+        self._set(update_creation_time=time)
+
+
+def get_handler(
+    fake_bodhi,
+    concurrency,
+    branches,
+    celery_task=None,
+    group_model_id=None,
+    parallel=None,
+):
+    db = FakeDatabase()
+    finished = []
+    targets = [FakeTarget(db, branch, finished) for branch in branches]
+
+    flexmock(bodhi).should_receive("sa_unit_of_work").replace_with(db.unit_of_work)
+    # authenticated just once, before the updates are created in parallel
+    bodhi_client = flexmock()
+    if parallel is None:
+        parallel = concurrency > 1 and len(branches) > 1
+    bodhi_client.should_receive("ensure_auth").times(1 if parallel else 0)
+    flexmock(bodhi).should_receive("get_bodhi_client").and_return(bodhi_client)
+    flexmock(BodhiUpdateTargetModel).should_receive(
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).replace_with(
+        lambda koji_nvrs: {target for target in targets if target.koji_nvrs == koji_nvrs},
+    )
+    handler = RetriggerBodhiUpdateHandler(
+        package_config=flexmock(),
+        job_config=flexmock(),
+        event={},
+        celery_task=celery_task,
+        bodhi_update_group_model_id=group_model_id,
+    )
+    handler._service_config = flexmock(bodhi_update_concurrency=concurrency)
+    handler._packit_api = flexmock(create_update=fake_bodhi.create_update, dg=flexmock())
+    flexmock(handler).should_receive("_get_or_create_bodhi_update_group_model").and_return(
+        flexmock(id=1, grouped_targets=targets),
+    )
+    return handler, db, targets, finished
+
+
+@pytest.mark.parametrize(
+    "branches, concurrency",
+    [
+        pytest.param(1, 4, id="single"),
+        pytest.param(4, 1, id="sequential"),
+        pytest.param(4, 4, id="parallel"),
+        pytest.param(12, 4, id="bounded"),
+    ],
+)
+def test_create_updates(branches, concurrency):
+    branches = [f"f{i}" for i in range(30, 30 + branches)]
+    fake_bodhi = FakeBodhi(failing={"f31": PackitException("Bodhi is down")})
+    handler, db, targets, finished = get_handler(
+        fake_bodhi,
+        concurrency,
+        branches,
+        celery_task=flexmock(
+            request=flexmock(retries=3),
+            max_retries=3,
+            autoretry_for=(PackitException,),
+        ),
+    )
+    flexmock(bodhi.sentry_integration).should_receive("send_to_sentry")
+    flexmock(handler).should_receive("report_in_issue_repository").with_args(
+        errors={"f31": "/jobs/bodhi/31"},
+    ).times(1 if "f31" in branches else 0)
+
+    start = time.monotonic()
+    assert handler._run()["success"]
+    elapsed = time.monotonic() - start
+
+    # the outcomes are recorded in the order of the branches, one commit per branch
+    assert finished == branches
+    assert db.commits == len(branches)
+    assert {target.target: target.status for target in targets} == {
+        branch: "error" if branch == "f31" else "success" for branch in branches
+    }
+    assert sorted(fake_bodhi.created) == [branch for branch in branches if branch != "f31"]
+    assert targets[0].alias == f"FEDORA-{branches[0]}"
+
+    expected_concurrency = min(concurrency, len(branches))
+    assert fake_bodhi.max_running <= expected_concurrency
+    if expected_concurrency > 1:
+        assert fake_bodhi.max_running > 1
+        # faster than creating the updates one by one
+        assert elapsed < len(branches) * fake_bodhi.delay
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_create_updates_retried(concurrency):
+    branches = [f"f{i}" for i in range(30, 36)]
+    fake_bodhi = FakeBodhi(failing={"f31": PackitException("Bodhi is down")})
+    celery_task = flexmock(
+        request=flexmock(retries=0, kwargs={"event": {}}),
+        max_retries=3,
+        autoretry_for=(PackitException,),
+    )
+    celery_task.should_receive("retry").with_args(
+        exc=PackitException,
+        countdown=int,
+        kwargs={"event": {}, "bodhi_update_group_model_id": 1},
+    ).once()
+    handler, db, targets, finished = get_handler(
+        fake_bodhi,
+        concurrency,
+        branches,
+        celery_task=celery_task,
+    )
+    flexmock(handler).should_receive("report_in_issue_repository").never()
+
+    assert "will be retried" in handler._run()["details"]["msg"]
+
+    # the updates created in the meantime are recorded, only the failed one is retried
+    assert finished == [branch for branch in branches if branch != "f31"]
+    assert {target.target: target.status for target in targets} == {
+        branch: "retry" if branch == "f31" else "success" for branch in branches
+    }
+    assert sorted(fake_bodhi.created) == finished
+    assert all(
+        target.alias == f"FEDORA-{target.target}" for target in targets if target.target != "f31"
+    )
+    # one commit per created update and one for the retried ones
+    assert db.commits == len(branches)
+
+
+def test_create_updates_retry_only_failed():
+    branches = [f"f{i}" for i in range(30, 34)]
+    fake_bodhi = FakeBodhi()
+    handler, db, targets, finished = get_handler(
+        fake_bodhi,
+        4,
+        branches,
+        celery_task=flexmock(
+            request=flexmock(retries=1),
+            max_retries=3,
+            autoretry_for=(PackitException,),
+        ),
+        group_model_id=1,
+        parallel=False,
+    )
+    for target in targets:
+        target.status = "retry" if target.target == "f31" else "success"
+
+    assert handler._run()["success"]
+
+    assert fake_bodhi.created == ["f31"]
+    assert finished == ["f31"]
+    assert db.commits == 1
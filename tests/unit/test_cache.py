@@ -0,0 +1,73 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import time
+
+import fakeredis
+import pytest
+import redis
+from flexmock import flexmock
+
+from packit_service import cache
+from packit_service.cache import MISSING, SharedCache, get_cache_redis
+
+
+@pytest.fixture()
+def fake_redis():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    return client
+
+
+def test_shared_cache_local_tier():
+    shared_cache = SharedCache(namespace="test", ttl=60)
+
+    assert shared_cache.get("key") is MISSING
+    assert shared_cache.get("key", default=None) is None
+
+    shared_cache.set("key", {"a": [1, 2]})
+    assert shared_cache.get("key") == {"a": [1, 2]}
+
+    shared_cache.delete("key")
+    assert shared_cache.get("key") is MISSING
+
+
+def test_shared_cache_redis_tier(fake_redis):
+    writer = SharedCache(namespace="test", ttl=60)
+    reader = SharedCache(namespace="test", ttl=60)
+
+    writer.set("key", ["value"])
+    assert fake_redis.ttl("packit-service:cache:test:key") == 60
+
+    # another process has an empty local tier
+    assert reader.get("key") == ["value"]
+
+    # cached `None` is not a miss
+    writer.set("none", None)
+    reader.clear_local()
+    assert reader.get("none") is None
+
+    writer.delete("key")
+    reader.clear_local()
+    assert reader.get("key") is MISSING
+
+
+def test_shared_cache_lock(fake_redis):
+    shared_cache = SharedCache(namespace="test", ttl=60)
+
+    assert shared_cache.acquire_lock("key")
+    assert not shared_cache.acquire_lock("key")
+    shared_cache.release_lock("key")
+    assert shared_cache.acquire_lock("key")
+
+
+def test_redis_call_error_disables_redis_tier():
+    client = flexmock()
+    client.should_receive("get").and_raise(redis.ConnectionError("unreachable")).once()
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    flexmock(cache, _redis_disabled_until=0.0)
+
+    assert cache.redis_call("get", "key") is None
+    assert cache._redis_disabled_until > time.monotonic()
+    # the real client getter backs off until the time passes
+    assert get_cache_redis() is None
@@ -1052,6 +1052,35 @@ def test_labels_on_distgit_pr(
     assert checker.pre_check() == should_pass
 
 
+@pytest.mark.parametrize(
+    "pr_labels, should_pass",
+    ((["allowed-1"], True), (["skip-ci"], False)),
+)
+def test_labels_on_distgit_pr_already_fetched(distgit_push_event, pr_labels, should_pass):
+    job_config = JobConfig(
+        type=JobType.koji_build,
+        trigger=JobConfigTriggerType.commit,
+        packages={
+            "package": CommonPackageConfig(
+                dist_git_branches=["f36"],
+                require=RequirementsConfig(
+                    LabelRequirementsConfig(present=["allowed-1"], absent=["skip-ci"]),
+                ),
+            ),
+        },
+    )
+    flexmock(PagureProject).should_receive("get_pr").never()
+    event = distgit_push_event.get_dict()
+    event["pr_labels"] = pr_labels
+
+    checker = LabelsOnDistgitPR(
+        PackageConfig(jobs=[job_config], packages={"package": CommonPackageConfig()}),
+        job_config,
+        event,
+    )
+    assert checker.pre_check() == should_pass
+
+
 @pytest.mark.parametrize(
     "allowed_builders,owner,should_pass",
     (
@@ -1,12 +1,13 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import fakeredis
 import pytest
 from flexmock import flexmock
 from marshmallow import ValidationError
 from packit.exceptions import PackitConfigException
 
-from packit_service import package_config_getter
+from packit_service import cache, package_config_getter
 from packit_service.config import (
     Deployment,
     MRTarget,
@@ -273,6 +274,113 @@ def test_get_package_config_from_repo_not_found_exception_create_issue():
         )
 
 
+COMMIT_SHA = "2a3bca3d0a7e4a1b0f7c3e5d0b7c2f4b8f8a9c1d"
+PACKIT_YAML = "{'downstream_package_name': 'packit', 'jobs': [{'job': 'copr_build', 'trigger': 'pull_request'}]}"  # noqa: E501
+
+
+def counting_project(files=(".packit.yaml", "packit.spec"), content=PACKIT_YAML, fetches=1):
+    """Project expecting the config to be fetched from the forge `fetches` times."""
+    project = flexmock(
+        repo="packit",
+        namespace="packit",
+        full_repo_name="packit/packit",
+        service=flexmock(instance_url="https://github.com"),
+    )
+    project.should_receive("get_files").with_args(ref=COMMIT_SHA, recursive=False).and_return(
+        list(files),
+    ).times(fetches)
+    project.should_receive("get_file_content").and_return(content).times(
+        fetches if ".packit.yaml" in files else 0,
+    )
+    return project
+
+
+@pytest.fixture()
+def fake_redis():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    return client
+
+
+def test_get_package_config_from_repo_cached_for_commit():
+    project = counting_project()
+
+    configs = [
+        PackageConfigGetter.get_package_config_from_repo(project=project, reference=COMMIT_SHA)
+        for _ in range(50)
+    ]
+
+    assert configs[0].downstream_package_name == "packit"
+    assert all(config == configs[0] for config in configs)
+    # callers can't modify the cached config
+    assert configs[0] is not configs[1]
+
+
+def test_get_package_config_from_repo_not_cached_for_branch():
+    project = flexmock()
+    flexmock(package_config_getter).should_receive("get_package_config_from_repo").with_args(
+        project=project,
+        ref="main",
+        package_config_path=None,
+    ).times(2).and_return(flexmock())
+
+    for _ in range(2):
+        PackageConfigGetter.get_package_config_from_repo(project=project, reference="main")
+
+
+def test_get_package_config_from_repo_negative_cache():
+    project = counting_project(files=("README.md",))
+
+    for _ in range(2):
+        assert (
+            PackageConfigGetter.get_package_config_from_repo(
+                project=project,
+                reference=COMMIT_SHA,
+                fail_when_missing=False,
+            )
+            is None
+        )
+
+
+def test_get_package_config_from_repo_searched_specfile_cached(fake_redis):
+    project = counting_project(content="{'jobs': []}")
+    project.should_receive("get_files").with_args(
+        ref=COMMIT_SHA,
+        filter_regex=r".+\.spec$",
+    ).and_return(["packit.spec"]).once()
+
+    config = PackageConfigGetter.get_package_config_from_repo(
+        project=project,
+        reference=COMMIT_SHA,
+    )
+    # another worker with an empty process-local cache
+    cache.clear_local_caches()
+    assert (
+        PackageConfigGetter.get_package_config_from_repo(project=project, reference=COMMIT_SHA)
+        == config
+    )
+    assert config.specfile_path == "packit.spec"
+
+
+def test_get_package_config_from_repo_shared_content(fake_redis):
+    project = counting_project()
+
+    PackageConfigGetter.get_package_config_from_repo(project=project, reference=COMMIT_SHA)
+    cache.clear_local_caches()
+    PackageConfigGetter.get_package_config_from_repo(project=project, reference=COMMIT_SHA)
+
+    assert len(fake_redis.keys("packit-service:cache:package-config-content:*")) == 1
+    assert len(fake_redis.keys("packit-service:cache:package-config-ref:*")) == 1
+
+
+def test_get_package_config_from_repo_too_big_not_cached():
+    content = PACKIT_YAML + "\n#" + "x" * package_config_getter.PACKAGE_CONFIG_CACHE_MAX_SIZE
+    project = counting_project(content=content, fetches=2)
+
+    for _ in range(2):
+        PackageConfigGetter.get_package_config_from_repo(project=project, reference=COMMIT_SHA)
+
+
 @pytest.mark.parametrize(
     "issues, create_new, title, message, comment_to_existing",
     [
@@ -8,7 +8,7 @@ from typing import Optional
 import packit
 import pytest
 from celery import Celery
-from copr.v3 import Client, CoprAuthException
+from copr.v3 import Client, CoprAuthException, CoprRequestException
 from copr.v3.proxies.build import BuildProxy
 from flexmock import flexmock
 from ogr.abstract import GitProject
@@ -57,6 +57,7 @@ from packit_service.models import (
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.checker.copr import IsGitForgeProjectAndEventOk
 from packit_service.worker.handlers import CoprBuildHandler
+from packit_service.worker.helpers.build import copr_chroots
 from packit_service.worker.helpers.build.copr_build import (
     BaseBuildJobHelper,
     CoprBuildJobHelper,
@@ -294,9 +295,16 @@ def test_run_copr_build_from_source_script(github_pr_event, srpm_build_deps):
     flexmock(build).should_receive("set_build_id")
     flexmock(build).should_receive("set_web_url")
     group = flexmock(id=1, grouped_targets=4 * [build])
-    flexmock(CoprBuildTargetModel).should_receive("create").and_return(build)
     flexmock(CoprBuildGroupModel).should_receive("create").and_return((group, flexmock()))
-    flexmock(CoprBuildTargetModel).should_receive("create").and_return(build).times(4)
+
+    def bulk_create(copr_build_group, builds):
+        assert copr_build_group is group
+        assert len(builds) == 4
+        return len(builds) * [build]
+
+    flexmock(CoprBuildTargetModel).should_receive("bulk_create").replace_with(
+        bulk_create,
+    ).once()
     flexmock(github.pr.Action).should_receive("db_project_object").and_return(
         flexmock(),
     )
@@ -440,7 +448,7 @@ def test_run_copr_build_from_source_script_github_outage_retry(
     group = flexmock(id=1, grouped_targets=[build])
     if retry_number > 0:
         flexmock(CoprBuildGroupModel).should_receive("get_by_id").and_return(group)
-        flexmock(CoprBuildTargetModel).should_receive("create").never()
+        flexmock(CoprBuildTargetModel).should_receive("bulk_create").never()
         flexmock(CoprBuildGroupModel).should_receive("create").never()
         # We set it to pending
         flexmock(build).should_receive("set_status").with_args(
@@ -781,6 +789,31 @@ def test_submit_copr_build(
         helper.submit_copr_build()
 
 
+@pytest.mark.parametrize(
+    "error,invalidated",
+    [
+        ("Such chroot is not enabled: fedora-39-x86_64", True),
+        ("Internal Server Error", False),
+    ],
+)
+def test_submit_copr_build_refused_chroot(github_pr_event, error, invalidated):
+    helper = build_helper(event=github_pr_event)
+    flexmock(helper).should_receive("create_or_update_copr_project").and_return("")
+    flexmock(helper).should_receive("is_custom_copr_project_defined").and_return(False)
+    flexmock(helper).should_receive("job_project").and_return("")
+    flexmock(helper).should_receive("srpm_path").and_return("")
+    flexmock(helper).should_receive("build_targets").and_return({"fedora-39-x86_64"})
+    flexmock(BuildProxy).should_receive("create_from_file").and_raise(
+        CoprRequestException(error),
+    )
+    flexmock(packit_service.worker.helpers.build.copr_build).should_receive(
+        "invalidate_available_chroots",
+    ).times(1 if invalidated else 0)
+
+    with pytest.raises(CoprRequestException):
+        helper.submit_copr_build()
+
+
 @pytest.mark.parametrize(
     "raw_name,expected_name",
     [
@@ -1174,3 +1207,58 @@ def test_copr_build_end_skips_reporting_for_superseded_build():
     result = CoprBuildEndHandler._run(handler)
     assert not result["success"]
     assert result["details"]["msg"] == "RPMs failed to be built."
+
+
+def test_available_chroots_fetched_once(github_pr_event):
+    helper = build_helper(event=github_pr_event)
+    flexmock(helper).should_receive("_fetch_copr_chroots").and_return(
+        {**dict.fromkeys(DEFAULT_TARGETS, ""), "_hidden": ""},
+    ).once()
+
+    for _ in range(40):
+        assert helper.available_chroots == set(DEFAULT_TARGETS)
+
+
+def test_available_chroots_stale_while_revalidate():
+    fetched = []
+
+    def fetch():
+        fetched.append(1)
+        return dict.fromkeys(DEFAULT_TARGETS[: len(fetched)], "")
+
+    assert copr_chroots.get_available_chroots(fetch) == {DEFAULT_TARGETS[0]}
+
+    # make the entry stale, the stale value is served and refreshed in the background
+    entry = copr_chroots.copr_chroots_cache.get("available")
+    entry["fetched_at"] -= copr_chroots.COPR_CHROOTS_FRESH_TTL + 1
+    threads = []
+    flexmock(copr_chroots.threading).should_receive("Thread").replace_with(
+        lambda target, **_: flexmock(start=lambda: threads.append(target)),
+    )
+    assert copr_chroots.get_available_chroots(fetch) == {DEFAULT_TARGETS[0]}
+    # only one refresh at a time
+    assert copr_chroots.get_available_chroots(fetch) == {DEFAULT_TARGETS[0]}
+    assert len(threads) == 1
+
+    threads[0]()
+    assert copr_chroots.get_available_chroots(fetch) == set(DEFAULT_TARGETS[:2])
+    assert len(fetched) == 2
+
+
+def test_available_chroots_max_age_and_invalidation():
+    fetched = []
+
+    def fetch():
+        fetched.append(1)
+        return dict.fromkeys(DEFAULT_TARGETS, "")
+
+    copr_chroots.get_available_chroots(fetch)
+    copr_chroots.get_available_chroots(fetch, max_age=copr_chroots.COPR_CHROOTS_MIN_REFRESH_AGE)
+    assert len(fetched) == 1
+
+    copr_chroots.get_available_chroots(fetch, max_age=-1)
+    assert len(fetched) == 2
+
+    copr_chroots.invalidate_available_chroots()
+    copr_chroots.get_available_chroots(fetch)
+    assert len(fetched) == 3
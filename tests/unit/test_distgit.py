@@ -1,6 +1,9 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import json
+import threading
+import time
+from contextlib import contextmanager
 
 import pytest
 from fasjson_client import Client
@@ -9,10 +12,14 @@ from ogr.parsing import parse_git_repo
 from ogr.services.github import GithubService
 from packit.api import PackitAPI
 from packit.config.notifications import NotificationsConfig
+from packit.exceptions import PackitDownloadFailedException, PackitException
 
 from packit_service.events.event_data import EventData
+from packit_service.service.urls import get_koji_build_info_url
 from packit_service.worker.checker.run_condition import IsRunConditionSatisfied
+from packit_service.worker.handlers import distgit
 from packit_service.worker.handlers.distgit import (
+    AbortSyncRelease,
     AbstractSyncReleaseHandler,
     DownstreamKojiBuildHandler,
     DownstreamKojiScratchBuildHandler,
@@ -251,3 +258,246 @@ def test_filter_tags(tags, upstream_tag_include, upstream_tag_exclude, expected)
         None,
     )
     assert handler._filter_tags(tags) == expected
+
+
+def get_sync_release_handler(concurrency, synced):
+    """Handler syncing the branches by the given function instead of packit."""
+    handler = ProposeDownstreamHandler(None, None, {"event_type": "unknown"}, None)
+    flexmock(handler.service_config, sync_release_concurrency=concurrency)
+    handler._packit_api = flexmock(
+        up=flexmock(local_project=None),
+        dg=flexmock(local_project=flexmock(working_dir="dist-git")),
+    )
+    flexmock(handler).should_receive("_start_target").replace_with(
+        lambda model: f"url-{model.branch}",
+    )
+    flexmock(handler).should_receive("_get_sync_release_kwargs").replace_with(
+        lambda branch, tag, version: {"dist_git_branch": branch},
+    )
+    flexmock(handler).should_receive("sync_branch_in_clone").replace_with(
+        lambda branch, kwargs, archives: (
+            synced(kwargs["dist_git_branch"]),
+            f"logs of {branch}",
+        ),
+    )
+    return handler
+
+
+def get_target_models(branches):
+    return [
+        flexmock(branch=branch, set_finished_time=lambda finished_time: None)
+        .should_receive("set_logs")
+        .with_args(f"logs of {branch}")
+        .once()
+        .mock()
+        for branch in branches
+    ]
+
+
+@pytest.mark.parametrize("branches, concurrency", [(2, 2), (6, 3), (12, 4)])
+def test_run_for_targets_in_parallel(branches, concurrency):
+    branches = [f"f{i}" for i in range(branches)]
+    lock = threading.Lock()
+    running = []
+    max_running = 0
+
+    def synced(branch):
+        nonlocal max_running
+        with lock:
+            running.append(branch)
+            max_running = max(max_running, len(running))
+        # the later branches are synced faster
+        time.sleep(0.01 * (len(branches) - branches.index(branch)))
+        with lock:
+            running.remove(branch)
+        if branch == "f1":
+            return Exception("failed")
+        return flexmock(url=f"pr-{branch}"), {}
+
+    handler = get_sync_release_handler(concurrency, synced)
+    finished = []
+
+    def finish_target(model, url, result):
+        finished.append((model.branch, url))
+        return str(result) if isinstance(result, Exception) else None
+
+    flexmock(handler).should_receive("_finish_target").replace_with(finish_target)
+
+    errors = handler.run_for_targets_in_parallel(flexmock(), get_target_models(branches))
+
+    assert errors == {"f1": "failed"}
+    # reported in the order of the branches
+    assert finished == [(branch, f"url-{branch}") for branch in branches]
+    assert 1 < max_running <= concurrency
+
+
+def test_run_for_targets_in_parallel_retried():
+    def synced(branch):
+        if branch in ("f0", "f2"):
+            return PackitDownloadFailedException("not uploaded yet")
+        return flexmock(url=f"pr-{branch}"), {}
+
+    handler = get_sync_release_handler(3, synced)
+    flexmock(handler).should_receive("_retry_after_download_failure").and_raise(
+        AbortSyncRelease,
+    ).once()
+    # the branch synced in the meantime is recorded
+    flexmock(handler).should_receive("_finish_target").with_args(
+        object,
+        "url-f1",
+        tuple,
+    ).once()
+
+    models = get_target_models(["f0", "f1", "f2"])
+    with pytest.raises(AbortSyncRelease):
+        handler.run_for_targets_in_parallel(flexmock(), models)
+
+
+@pytest.mark.parametrize(
+    "concurrency, branches, ff_branches, parallel",
+    [
+        (1, ["f40", "f41"], set(), False),
+        (4, ["f41"], set(), False),
+        (4, ["f40", "f41"], set(), True),
+        (4, ["f40", "f41"], {"f39"}, False),
+    ],
+)
+def test_can_run_targets_in_parallel(concurrency, branches, ff_branches, parallel):
+    handler = ProposeDownstreamHandler(None, None, {"event_type": "unknown"}, None)
+    flexmock(handler.service_config, sync_release_concurrency=concurrency)
+    handler.helper = flexmock(get_fast_forward_merge_branches_for=lambda branch: ff_branches)
+
+    models = [flexmock(branch=branch) for branch in branches]
+    assert handler._can_run_targets_in_parallel(models) is parallel
+
+
+def get_koji_build_handler(branches, concurrency, submit, celery_task):
+    """Handler submitting the builds of the branches, recording the submitted tasks."""
+
+    def submit_in_clone(branch, koji_target):
+        try:
+            return submit(branch)
+        except PackitException as ex:
+            return ex
+
+    recorded = []
+    models = [
+        flexmock(
+            id=i,
+            target=branch,
+            sidetag=None,
+            status="queued",
+            task_id=None,
+            set_task_id=lambda task_id, branch=branch: recorded.append((branch, task_id)),
+            set_web_url=lambda web_url: None,
+            set_build_submission_stdout=lambda stdout: None,
+            set_data=lambda data: None,
+        )
+        for i, branch in enumerate(branches)
+    ]
+    for model in models:
+        model.set_status = lambda status, model=model: setattr(model, "status", status)
+
+    @contextmanager
+    def unit_of_work():
+        yield
+
+    flexmock(distgit).should_receive("sa_unit_of_work").replace_with(unit_of_work)
+    handler = DownstreamKojiBuildHandler(
+        package_config=flexmock(),
+        job_config=flexmock(scratch=True),
+        event={},
+        celery_task=celery_task,
+    )
+    flexmock(handler.service_config, koji_build_concurrency=concurrency)
+    handler._packit_api = flexmock(
+        dg=flexmock(local_project=flexmock(working_dir="dist-git")),
+        init_kerberos_ticket=lambda: None,
+        build=lambda dist_git_branch, **kwargs: submit(dist_git_branch),
+    )
+    flexmock(handler).should_receive("submit_build_in_clone").replace_with(submit_in_clone)
+    flexmock(handler).should_receive("_get_or_create_koji_group_model").and_return(
+        flexmock(id=1, grouped_targets=models),
+    )
+    return handler, models, recorded
+
+
+def get_koji_build_output(task_id):
+    return (
+        f"Created task: {task_id}\n"
+        f"Task info: https://koji.fedoraproject.org/koji/taskinfo?taskID={task_id}\n"
+    )
+
+
+@pytest.mark.parametrize("branches, concurrency", [(4, 1), (2, 2), (6, 3), (12, 4)])
+def test_koji_builds_submitted_in_parallel(branches, concurrency):
+    branches = [f"f{i}" for i in range(branches)]
+    lock = threading.Lock()
+    running = []
+    max_running = 0
+
+    def submit(branch):
+        nonlocal max_running
+        with lock:
+            running.append(branch)
+            max_running = max(max_running, len(running))
+        # the later branches are submitted faster
+        time.sleep(0.01 * (len(branches) - branches.index(branch)))
+        with lock:
+            running.remove(branch)
+        if branch == "f1":
+            raise PackitException("failed")
+        return get_koji_build_output(branches.index(branch))
+
+    handler, _, recorded = get_koji_build_handler(
+        branches,
+        concurrency,
+        submit,
+        # the last try, the failure is reported
+        celery_task=flexmock(
+            request=flexmock(retries=3),
+            max_retries=3,
+            autoretry_for=(PackitException,),
+        ),
+    )
+    flexmock(handler).should_receive("report_in_issue_repository").with_args(
+        {"f1": get_koji_build_info_url(1)},
+    ).once()
+
+    assert handler._run()["success"]
+
+    # recorded in the order of the branches
+    assert recorded == [(branch, str(i)) for i, branch in enumerate(branches) if branch != "f1"]
+    if concurrency == 1:
+        assert max_running == 1
+    else:
+        assert 1 < max_running <= concurrency
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_koji_builds_retried(concurrency):
+    branches = ["f0", "f1", "f2"]
+
+    def submit(branch):
+        if branch == "f0":
+            raise PackitException("Koji is down")
+        return get_koji_build_output(branches.index(branch))
+
+    celery_task = flexmock(
+        request=flexmock(retries=0, kwargs={"event": {}}),
+        max_retries=3,
+        autoretry_for=(PackitException,),
+    )
+    celery_task.should_receive("retry").with_args(
+        exc=PackitException,
+        countdown=int,
+        kwargs={"event": {}, "koji_group_model_id": 1},
+    ).once()
+    handler, models, recorded = get_koji_build_handler(branches, concurrency, submit, celery_task)
+    flexmock(handler).should_receive("report_in_issue_repository").never()
+
+    assert "will be retried" in handler._run()["details"]["msg"]
+
+    # the builds submitted in the meantime are recorded, only the failed one is retried
+    assert recorded == [("f1", "1"), ("f2", "2")]
+    assert [model.status for model in models] == ["retry", "pending", "pending"]
@@ -0,0 +1,162 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import fakeredis
+import pytest
+from flexmock import flexmock
+
+from packit_service import cache, forge_cache
+from packit_service.forge_cache import (
+    can_merge_pr,
+    get_group_members,
+    has_write_access,
+    invalidate_from_github_webhook,
+    is_project_private,
+)
+
+
+@pytest.fixture()
+def fake_redis():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    return client
+
+
+class FakeService:
+    instance_url = "https://github.com"
+
+    def __init__(self):
+        self.calls = []
+
+    def get_group(self, name):
+        self.calls.append(("get_group", name))
+        return flexmock(members=["alice", "bob"])
+
+
+class FakeProject:
+    """Project of a fake forge counting the API calls."""
+
+    def __init__(self, service, namespace="packit", repo="ogr", private=False):
+        self.service = service
+        self.namespace = namespace
+        self.repo = repo
+        self.private = private
+        self.maintainers = {"alice"}
+
+    def is_private(self):
+        self.service.calls.append(("is_private", self.repo))
+        return self.private
+
+    def can_merge_pr(self, user):
+        self.service.calls.append(("can_merge_pr", user))
+        return user in self.maintainers
+
+    def has_write_access(self, user):
+        self.service.calls.append(("has_write_access", user))
+        return user in self.maintainers
+
+
+def forget_local_tier():
+    """Simulate another worker process."""
+    cache.clear_local_caches()
+
+
+def test_checks_cached_across_workers(fake_redis):
+    service = FakeService()
+    project = FakeProject(service)
+
+    for _ in range(3):
+        assert not is_project_private(project)
+        assert can_merge_pr(project, "alice")
+        assert not can_merge_pr(project, "eve")
+        assert has_write_access(project, "alice")
+        assert get_group_members(service, "packit") == {"alice", "bob"}
+        forget_local_tier()
+
+    assert service.calls == [
+        ("is_private", "ogr"),
+        ("can_merge_pr", "alice"),
+        ("can_merge_pr", "eve"),
+        ("has_write_access", "alice"),
+        ("get_group", "packit"),
+    ]
+    # denied permissions expire sooner
+    ttl = fake_redis.ttl(
+        "packit-service:cache:forge-permissions:https://github.com/packit/ogr:0:can-merge-pr:eve",
+    )
+    assert 0 < ttl <= forge_cache.PERMISSIONS_NEGATIVE_CACHE_TTL
+
+
+def test_waits_for_entry_fetched_by_another_worker(fake_redis):
+    service = FakeService()
+    project = FakeProject(service)
+    key = "https://github.com/packit/ogr"
+    assert forge_cache.project_visibility_cache.acquire_lock(key)
+
+    def another_worker_fetches(_):
+        forge_cache.project_visibility_cache.set(key, True)
+
+    flexmock(forge_cache.time).should_receive("sleep").replace_with(another_worker_fetches).once()
+
+    assert is_project_private(project)
+    assert service.calls == []
+
+
+@pytest.mark.parametrize(
+    "event_type, payload, changed",
+    [
+        pytest.param(
+            "repository",
+            {
+                "action": "privatized",
+                "repository": {"html_url": "https://github.com/packit/ogr"},
+            },
+            "visibility",
+            id="repository",
+        ),
+        pytest.param(
+            "member",
+            {
+                "action": "added",
+                "repository": {"html_url": "https://github.com/packit/ogr"},
+            },
+            "permissions",
+            id="member",
+        ),
+        pytest.param(
+            "organization",
+            {"action": "member_added", "organization": {"login": "packit"}},
+            "permissions",
+            id="organization",
+        ),
+    ],
+)
+def test_invalidated_by_webhooks(fake_redis, event_type, payload, changed):
+    service = FakeService()
+    project = FakeProject(service)
+    assert not is_project_private(project)
+    assert not can_merge_pr(project, "eve")
+
+    project.private = True
+    project.maintainers.add("eve")
+    invalidate_from_github_webhook(event_type, payload)
+    forget_local_tier()
+
+    assert is_project_private(project) == (changed == "visibility")
+    assert can_merge_pr(project, "eve") == (changed == "permissions")
+
+
+def test_api_calls_saved_on_replayed_events(fake_redis):
+    service = FakeService()
+    projects = [FakeProject(service, repo=f"repo-{i}") for i in range(10)]
+
+    # a day of events: each project gets many comments by a few users,
+    # handled by different workers
+    for i in range(1000):
+        project = projects[i % len(projects)]
+        is_project_private(project)
+        can_merge_pr(project, ["alice", "bob", "eve"][i % 3])
+        if i % 100 == 0:
+            forget_local_tier()
+
+    assert len(service.calls) == len(projects) * (1 + 3)
@@ -14,6 +14,7 @@ from packit.config import (
     JobType,
     PackageConfig,
 )
+from packit.config.requirements import LabelRequirementsConfig, RequirementsConfig
 
 from packit_service.config import ServiceConfig
 from packit_service.constants import COMMENT_REACTION
@@ -3563,6 +3564,74 @@ def test_monorepo_jobs_matching_event():
     assert double_ref == 2
 
 
+def test_dispatch_plan_computed_once_per_event():
+    labels_fetched = []
+
+    class PullRequest:
+        id = 1
+
+        @property
+        def labels(self):
+            labels_fetched.append(True)
+            return [flexmock(name="a-label")]
+
+    jobs = [
+        JobConfig(
+            type=JobType.copr_build if i % 2 else JobType.tests,
+            trigger=JobConfigTriggerType.pull_request,
+            packages={
+                "package": CommonPackageConfig(
+                    _targets=[f"fedora-{i}"],
+                    require=RequirementsConfig(
+                        label=LabelRequirementsConfig(present=["a-label"]),
+                    ),
+                ),
+            },
+        )
+        for i in range(50)
+    ]
+
+    class Event(github.pr.Comment):
+        def __init__(self):
+            self.comment = "/packit build"
+
+        @property
+        def job_config_trigger_type(self):
+            return JobConfigTriggerType.pull_request
+
+        @property
+        def packages_config(self):
+            return flexmock(get_job_views=lambda: jobs)
+
+        @property
+        def pull_request_object(self):
+            return PullRequest()
+
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig(comment_command_prefix="/packit"),
+    )
+    flexmock(SteveJobs).should_call("_parse_comment").once()
+
+    event = Event()
+    comment_object = flexmock()
+    event._comment_object = comment_object
+    flexmock(comment_object).should_receive("add_reaction").with_args(
+        COMMENT_REACTION,
+    ).once()
+
+    steve = SteveJobs(event)
+    steve.parse_comment(event.comment, "/packit")
+    handlers = steve.get_handlers_for_event()
+    assert handlers == steve.get_handlers_for_event()
+    for handler in handlers:
+        assert steve.get_config_for_handler_kls(handler)
+        assert steve.get_config_for_handler_kls(handler)
+
+    assert len(labels_fetched) == 1
+    # passed to the handlers
+    assert event.pr_labels == ["a-label"]
+
+
 def test_no_handlers_for_rerun():
     result = get_handlers_for_check_rerun("whatever")
     assert not result, "There are no handlers for whatever"
@@ -0,0 +1,127 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import copy
+import json
+import time
+
+import fakeredis
+import pytest
+from flexmock import flexmock
+
+from packit_service import cache, known_builds
+from packit_service.known_builds import (
+    KNOWN_BUILDS_READY_KEY,
+    KnownBuildKind,
+    is_build_id_known,
+    rebuild_known_build_ids,
+    remember_build_id,
+)
+from packit_service.models import CoprBuildTargetModel, KojiBuildTargetModel
+from packit_service.worker.parser import Parser
+from tests.spellbook import DATA_DIR
+
+NOW = time.time()
+
+
+@pytest.fixture()
+def fake_redis():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    flexmock(known_builds, _missed_ids=False)
+    return client
+
+
+@pytest.fixture(scope="module")
+def copr_build_start():
+    with open(DATA_DIR / "fedmsg" / "copr_build_start.json") as outfile:
+        return json.load(outfile)
+
+
+def test_unknown_ids_known_until_index_is_ready(fake_redis):
+    assert is_build_id_known(KnownBuildKind.copr, 1)
+
+    rebuild_known_build_ids({KnownBuildKind.copr: [("2", NOW)], KnownBuildKind.koji_task: []})
+
+    assert fake_redis.exists(KNOWN_BUILDS_READY_KEY)
+    assert not is_build_id_known(KnownBuildKind.copr, 1)
+    assert not is_build_id_known(KnownBuildKind.koji_task, 2)
+
+
+def test_remember_build_id(fake_redis):
+    rebuild_known_build_ids({KnownBuildKind.copr: [], KnownBuildKind.koji_task: []})
+
+    remember_build_id(KnownBuildKind.copr, "123")
+    remember_build_id(KnownBuildKind.koji_task, None)
+
+    assert is_build_id_known(KnownBuildKind.copr, 123)
+    assert is_build_id_known(KnownBuildKind.copr, "123")
+    assert not is_build_id_known(KnownBuildKind.koji_task, 123)
+
+
+def test_rebuild_keeps_concurrently_added_ids(fake_redis):
+    remember_build_id(KnownBuildKind.copr, "1")
+
+    rebuild_known_build_ids(
+        {KnownBuildKind.copr: iter([("2", NOW), ("3", NOW), ("expired", 0.0)])},
+    )
+
+    for build_id in ("1", "2", "3"):
+        assert is_build_id_known(KnownBuildKind.copr, build_id)
+    assert not is_build_id_known(KnownBuildKind.copr, "4")
+    assert not is_build_id_known(KnownBuildKind.copr, "expired")
+    assert not fake_redis.exists(f"{KnownBuildKind.copr.key}:rebuild")
+
+
+def test_missed_id_marks_index_incomplete(fake_redis):
+    rebuild_known_build_ids({KnownBuildKind.copr: []})
+
+    flexmock(known_builds).should_receive("redis_pipeline").and_return(None).once()
+    remember_build_id(KnownBuildKind.copr, "1")
+    flexmock(known_builds).should_call("redis_pipeline")
+
+    # Redis is back, the missed ID must not cause its messages to be dropped
+    assert is_build_id_known(KnownBuildKind.copr, "1")
+    assert not fake_redis.exists(KNOWN_BUILDS_READY_KEY)
+
+
+def test_redis_unavailable():
+    assert is_build_id_known(KnownBuildKind.copr, 1)
+    assert is_build_id_known(KnownBuildKind.koji_task, 1)
+
+
+def test_parse_copr_event_unknown_build_skips_db(fake_redis, copr_build_start):
+    rebuild_known_build_ids({KnownBuildKind.copr: [("1", NOW)]})
+    flexmock(CoprBuildTargetModel).should_receive("get_by_build_id").never()
+
+    assert Parser.parse_event(copr_build_start) is None
+
+
+def test_parse_koji_task_event_unknown_task(fake_redis):
+    rebuild_known_build_ids({KnownBuildKind.koji_task: [("1", NOW)]})
+    flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").never()
+
+    assert (
+        Parser.parse_koji_task_event(
+            {
+                "topic": "org.fedoraproject.prod.buildsys.task.state.change",
+                "id": 2,
+                "info": {"state": 2},
+            },
+        )
+        is None
+    )
+
+
+def test_parse_copr_events_stream(fake_redis, copr_build_start):
+    """Only the messages about our builds reach the database."""
+    ours = {str(build_id) for build_id in range(0, 10_000, 100)}
+    rebuild_known_build_ids({KnownBuildKind.copr: [(build_id, NOW) for build_id in ours]})
+    flexmock(CoprBuildTargetModel).should_receive("get_by_build_id").and_return(None).times(
+        len(ours),
+    )
+
+    for build_id in range(10_000):
+        message = copy.deepcopy(copr_build_start)
+        message["build"] = build_id
+        Parser.parse_copr_event(message)
@@ -0,0 +1,232 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from contextlib import contextmanager
+
+import pytest
+from flexmock import flexmock
+from specfile.utils import NEVR
+
+from packit_service.models import KojiBuildTargetModel
+from packit_service.worker.handlers.distgit import DownstreamKojiBuildHandler
+from packit_service.worker.helpers.koji_multicall import (
+    MulticallKojiHelper,
+    memoized_koji_lookups,
+)
+from packit_service.worker.helpers.sidetag import Sidetag
+
+
+class FakeCall:
+    def __init__(self, result):
+        self._result = result
+
+    @property
+    def result(self):
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+class FakeMulticall:
+    def __init__(self, session):
+        self.session = session
+
+    def __getattr__(self, method):
+        return lambda **kwargs: FakeCall(self.session.handle(method, **kwargs))
+
+
+class FakeKojiSession:
+    """Koji session counting the XML-RPC round-trips."""
+
+    def __init__(self, builds=None, tagged=None):
+        # build info by NVRs
+        self.builds = builds or {}
+        # NVRs by tags
+        self.tagged = tagged or {}
+        self.round_trips = 0
+        self.calls = []
+
+    @property
+    def session(self):
+        # the raw session of the wrapper
+        return self
+
+    def handle(self, method, **kwargs):
+        self.calls.append((method, kwargs))
+        if method == "getBuild":
+            if kwargs["buildInfo"] == "broken":
+                return Exception("GenericError")
+            return self.builds.get(kwargs["buildInfo"])
+        if method == "listTagged":
+            builds = [
+                {"nvr": nvr}
+                for nvr in self.tagged.get(kwargs["tag"], [])
+                if kwargs.get("package") in (None, NEVR.from_string(nvr).name)
+            ]
+            return builds[-1:] if kwargs.get("latest") else builds
+        raise AssertionError(f"Unexpected call of {method}()")
+
+    def getBuildTarget(self, name, strict=False):
+        self.round_trips += 1
+        return {"dest_tag_name": f"{name.removesuffix('-candidate')}-updates-candidate"}
+
+    def getFullInheritance(self, tag):
+        self.round_trips += 1
+        release = tag.split("-")[0]
+        return [{"name": f"{release}-updates"}, {"name": release}]
+
+    def listTagged(self, tag, inherit=False, latest=False, strict=True):
+        self.round_trips += 1
+        return self.handle("listTagged", tag=tag, inherit=inherit, latest=latest)
+
+    def tagBuild(self, tag, build):
+        self.round_trips += 1
+        self.tagged.setdefault(tag, []).append(build)
+        return 123
+
+    @contextmanager
+    def multicall(self, strict=False):
+        yield FakeMulticall(self)
+        self.round_trips += 1
+
+
+def get_koji_helper(session):
+    helper = MulticallKojiHelper()
+    helper.session = session
+    return helper
+
+
+def test_get_builds_info():
+    session = FakeKojiSession({"a-1-1": {"state": 1}})
+    helper = get_koji_helper(session)
+
+    assert helper.get_builds_info(["a-1-1", "b-1-1", "broken"]) == {
+        "a-1-1": {"state": 1},
+        "b-1-1": None,
+        "broken": None,
+    }
+    assert session.round_trips == 1
+    assert helper.get_builds_info([]) == {}
+    assert session.round_trips == 1
+
+
+def test_get_builds_info_multicall_failed():
+    session = FakeKojiSession()
+    flexmock(session).should_receive("multicall").and_raise(Exception("Koji is down"))
+
+    assert get_koji_helper(session).get_builds_info(["a-1-1"]) == {"a-1-1": None}
+
+
+@pytest.mark.parametrize("branches", [2, 6, 12])
+def test_already_triggered_builds_looked_up_at_once(branches):
+    statuses = {}
+
+    def koji_build(i, nvr):
+        return flexmock(
+            target=f"f{i}",
+            nvr=nvr,
+            set_status=lambda status: statuses.__setitem__(f"f{i}", status),
+        )
+
+    # every third branch was already built in Koji, every fourth one (from the third)
+    # by another handler, the last two share the NVR
+    models = [koji_build(i, f"package-1.0-1.fc{i}") for i in range(branches - 1)]
+    models.append(koji_build(branches - 1, models[-1].nvr))
+    in_koji = {model.nvr: {"state": 1} for model in models[::3]}
+    in_db = {model.nvr: {model, flexmock()} for model in models[2::4]}
+    session = FakeKojiSession(in_koji)
+
+    flexmock(KojiBuildTargetModel).should_receive(
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return(in_db).once()
+    handler = DownstreamKojiBuildHandler(
+        package_config=flexmock(),
+        job_config=flexmock(),
+        event={},
+        celery_task=flexmock(),
+    )
+    handler._koji_helper = get_koji_helper(session)
+
+    to_submit = handler._skip_already_triggered(models)
+
+    assert session.round_trips == 1
+    assert {kwargs["buildInfo"] for _, kwargs in session.calls} == {
+        model.nvr for model in models
+    } - set(in_db)
+    skipped = [
+        model
+        for model in models
+        if model.nvr in in_koji or model.nvr in in_db or model is models[-1]
+    ]
+    assert to_submit == [model for model in models if model not in skipped]
+    assert statuses == {model.target: "skipped" for model in skipped}
+
+
+def test_get_latest_stable_nvrs():
+    session = FakeKojiSession(
+        tagged={
+            "f40": ["a-1.0-1.fc40", "b-1.0-1.fc40"],
+            "f40-updates": ["a-1.1-1.fc40"],
+            "f40-updates-candidate": ["a-1.2-1.fc40", "c-1.0-1.fc40"],
+        },
+    )
+    helper = get_koji_helper(session)
+
+    assert helper.get_latest_stable_nvrs({"a", "b", "c"}, "f40") == {
+        "a": "a-1.1-1.fc40",
+        "b": "b-1.0-1.fc40",
+        "c": None,
+    }
+    # build target, inheritance and a single multicall
+    assert session.round_trips == 3
+    assert helper.get_latest_stable_nvrs({"a", "c"}, "f40", include_candidate=True) == {
+        "a": "a-1.2-1.fc40",
+        "c": "c-1.0-1.fc40",
+    }
+    assert helper.get_latest_stable_nvrs(set(), "f40") == {}
+
+
+def test_lookups_memoized_within_task():
+    session = FakeKojiSession(tagged={"f40": ["a-1.0-1.fc40"]})
+    helper = get_koji_helper(session)
+
+    with memoized_koji_lookups():
+        for _ in range(3):
+            assert helper.get_latest_stable_nvrs({"a"}, "f40") == {"a": "a-1.0-1.fc40"}
+            assert helper.get_builds_in_tag("f40") == [{"nvr": "a-1.0-1.fc40"}]
+        round_trips = session.round_trips
+
+        # tagging changes the listing
+        helper.tag_build("a-1.1-1.fc40", "f40")
+        assert len(helper.get_builds_in_tag("f40")) == 2
+        assert session.round_trips == round_trips + 2
+
+    # another task
+    helper.get_builds_in_tag("f40")
+    assert session.round_trips == round_trips + 3
+
+
+@pytest.mark.parametrize("packages", [1, 10, 50])
+def test_sidetag_update_round_trips(packages):
+    names = [f"package-{i}" for i in range(packages)]
+    session = FakeKojiSession(
+        tagged={
+            "f40": [f"{name}-1.0-1.fc40" for name in names],
+            # all the packages were rebuilt in the sidetag, some of the stable builds
+            # were tagged there to satisfy the dependencies
+            "f40-build-side-1": [f"{name}-1.{j}-1.fc40" for name in names for j in (1, 2)]
+            + [f"{name}-1.0-1.fc40" for name in names[1::2]],
+        },
+    )
+    sidetag = Sidetag(
+        flexmock(koji_name="f40-build-side-1", target="f40"),
+        get_koji_helper(session),
+    )
+
+    with memoized_koji_lookups():
+        assert not sidetag.get_missing_dependencies(set(names))
+        builds = sidetag.get_builds_suitable_for_update(set(names))
+
+    assert builds == {NEVR.from_string(f"{name}-1.2-1.fc40") for name in names}
+    # sidetag listing, build target, inheritance and a single multicall
+    assert session.round_trips == 4
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+import time
 
 import pytest
 from flexmock import flexmock
@@ -86,4 +87,50 @@ def test_pushgateway_push_error_handled():
     pushgateway.worker_name = "test-worker"
 
     # Should not raise an exception
+    pushgateway.flush()
+
+
+def test_pushgateway_instance_shared():
+    assert Pushgateway.get_instance() is Pushgateway.get_instance()
+
+
+@pytest.fixture()
+def pushgateway():
+    pushgateway = Pushgateway()
+    pushgateway.pushgateway_address = "http://pushgateway"
+    pushgateway.worker_name = "test-worker"
+    yield pushgateway
+    pushgateway.stop()
+
+
+def test_pushgateway_push_flushed_in_background(pushgateway):
+    """Test that the metrics of multiple messages are pushed at once with their totals."""
+    pushed = []
+    flexmock(monitoring, PUSHGATEWAY_FLUSH_INTERVAL=0.01)
+    flexmock(monitoring).should_receive("push_to_gateway").replace_with(
+        lambda address, job, registry: pushed.append(
+            registry.get_sample_value("events_processed_total"),
+        ),
+    )
+
+    for _ in range(100):
+        pushgateway.events_processed.inc()
+        pushgateway.push()
+
+    for _ in range(100):
+        if pushed and pushed[-1] == 100:
+            break
+        time.sleep(0.01)
+
+    assert pushed[-1] == 100
+    assert len(pushed) < 100
+
+
+def test_pushgateway_stop(pushgateway):
+    flexmock(monitoring, PUSHGATEWAY_FLUSH_INTERVAL=3600)
+    flexmock(monitoring).should_receive("push_to_gateway").never()
+
     pushgateway.push()
+    pushgateway.stop()
+
+    assert pushgateway._flush_thread is None
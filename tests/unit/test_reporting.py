@@ -1,6 +1,9 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import time
+
+import fakeredis
 import pytest
 from flexmock import flexmock
 from gitlab.exceptions import GitlabError
@@ -8,7 +11,7 @@ from ogr import ForgejoService, PagureService
 from ogr.abstract import CommitStatus
 from ogr.exceptions import GithubAPIException, GitlabAPIException
 from ogr.services.forgejo import ForgejoProject
-from ogr.services.github import GithubProject
+from ogr.services.github import GithubProject, GithubService
 from ogr.services.github.check_run import (
     GithubCheckRunResult,
     GithubCheckRunStatus,
@@ -21,6 +24,7 @@ from packit.config.notifications import (
     NotificationsConfig,
 )
 
+from packit_service import cache
 from packit_service.worker.reporting import (
     BaseCommitStatus,
     DuplicateCheckMode,
@@ -28,9 +32,11 @@ from packit_service.worker.reporting import (
     StatusReporterGithubChecks,
     StatusReporterGithubStatuses,
     StatusReporterGitlab,
+    coalesced_reporting,
     update_message_with_configured_failure_comment_message,
 )
 from packit_service.worker.reporting.news import News
+from packit_service.worker.reporting.reporters import base
 
 create_table_content = StatusReporterGithubChecks._create_table
 
@@ -872,3 +878,138 @@ def test_update_message_with_configured_failure_comment_message(
         ),
     )
     assert update_message_with_configured_failure_comment_message(comment, job_config) == result
+
+
+@pytest.fixture()
+def fake_redis():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    flexmock(cache).should_receive("get_cache_redis").and_return(client)
+    return client
+
+
+@pytest.fixture()
+def fake_forge():
+    """GitHub project counting the statuses set."""
+    project = GithubProject("packit", GithubService(), "packit-service")
+    project.statuses = []
+    flexmock(project).should_receive("set_commit_status").replace_with(
+        lambda commit, state, target_url, description, context, trim: project.statuses.append(
+            (context, state, description),
+        ),
+    )
+    return project
+
+
+def get_reporter(project, pr_id=None):
+    # a new reporter as in another task
+    return StatusReporterGithubStatuses(
+        project,
+        "7654321",
+        packit_user="packit",
+        pr_id=pr_id,
+    )
+
+
+def test_report_skips_identical_status(fake_redis, fake_forge):
+    for _ in range(3):
+        get_reporter(fake_forge).report(
+            BaseCommitStatus.running,
+            "Build in progress.",
+            url="https://dashboard.packit.dev/jobs/copr/1",
+            check_names=["rpm-build:fedora-rawhide", "rpm-build:fedora-42"],
+        )
+    assert len(fake_forge.statuses) == 2
+
+    get_reporter(fake_forge).report(
+        BaseCommitStatus.success,
+        "RPMs were built successfully.",
+        check_names="rpm-build:fedora-rawhide",
+    )
+    # same commit and check of a PR
+    get_reporter(fake_forge, pr_id=1).report(
+        BaseCommitStatus.running,
+        "Build in progress.",
+        url="https://dashboard.packit.dev/jobs/copr/1",
+        check_names="rpm-build:fedora-42",
+    )
+    assert len(fake_forge.statuses) == 4
+
+
+def test_report_without_redis(fake_forge):
+    for _ in range(2):
+        get_reporter(fake_forge).report(
+            BaseCommitStatus.running,
+            "Build in progress.",
+            check_names="rpm-build:fedora-rawhide",
+        )
+    assert len(fake_forge.statuses) == 2
+
+
+def test_report_coalesces_transitions(fake_redis, fake_forge):
+    checks = ["rpm-build:fedora-rawhide", "rpm-build:fedora-42"]
+    feedback_times = []
+    reporter = get_reporter(fake_forge)
+
+    with coalesced_reporting():
+        reporter.report(BaseCommitStatus.pending, "Starting RPM build...", check_names=checks)
+        reporter.report(BaseCommitStatus.running, "SRPM build in progress...", check_names=checks)
+        reporter.report(
+            BaseCommitStatus.running,
+            "RPM build in progress...",
+            check_names=checks,
+            update_feedback_time=feedback_times.append,
+        )
+        reporter.report(BaseCommitStatus.failure, "RPM build failed.", check_names=checks[0])
+        assert [description for _, _, description in fake_forge.statuses] == [
+            "Starting RPM build...",
+            "Starting RPM build...",
+            "RPM build failed.",
+        ]
+
+    # the deferred update is reported when leaving the context
+    assert fake_forge.statuses[3:] == [
+        (checks[1], CommitStatus.pending, "RPM build in progress..."),
+    ]
+    assert len(feedback_times) == 1
+
+
+def test_report_deferred_flushed_when_window_elapses(fake_redis, fake_forge, monkeypatch):
+    monkeypatch.setattr(base, "STATUS_COALESCING_WINDOW", 0.1)
+    check = "rpm-build:fedora-rawhide"
+    reporter = get_reporter(fake_forge)
+
+    with coalesced_reporting():
+        reporter.report(BaseCommitStatus.pending, "Starting RPM build...", check_names=check)
+        reporter.report(BaseCommitStatus.running, "RPM build in progress...", check_names=check)
+        assert len(fake_forge.statuses) == 1
+
+        # reported while the task is still running
+        time.sleep(0.5)
+        assert fake_forge.statuses[1:] == [
+            (check, CommitStatus.pending, "RPM build in progress..."),
+        ]
+
+    assert len(fake_forge.statuses) == 2
+
+
+def test_report_build_lifecycle(fake_redis, fake_forge):
+    """Statuses of a build in 60 chroots, as reported by the individual tasks."""
+    chroots = [f"rpm-build:fedora-{version}-{arch}" for version in range(30) for arch in "ab"]
+
+    def run_task(*args, **kwargs):
+        with coalesced_reporting():
+            get_reporter(fake_forge).report(*args, **kwargs)
+
+    run_task(BaseCommitStatus.pending, "Starting RPM build...", check_names=chroots)
+    run_task(BaseCommitStatus.running, "SRPM build in progress...", check_names=chroots)
+    # the SRPM build end and a retried task
+    for _ in range(2):
+        run_task(BaseCommitStatus.running, "RPM build in progress...", check_names=chroots)
+    for chroot in chroots:
+        # the RPM build start of the chroot, also received twice
+        for _ in range(2):
+            run_task(BaseCommitStatus.running, "RPM build in progress...", check_names=chroot)
+        run_task(BaseCommitStatus.success, "RPMs were built successfully.", check_names=chroot)
+
+    # without the deduplication, there would be 7 * 60 updates
+    assert len(fake_forge.statuses) == 4 * 60
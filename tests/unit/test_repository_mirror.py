@@ -0,0 +1,215 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import os
+import time
+
+import git
+import pytest
+from flexmock import flexmock
+from packit.config import RunCommandType
+from packit.utils.repo import RepositoryCache
+
+from packit_service.worker.helpers import repository_mirror
+from packit_service.worker.helpers.repository_mirror import (
+    RepositoryMirrorCache,
+    get_repository_cache,
+)
+
+
+def add_commits(repo: git.Repo, count: int, branch: str = "main") -> None:
+    """Commit synthetic changes and push them to the upstream."""
+    repo.git.checkout(B=branch)
+    for i in range(count):
+        path = os.path.join(repo.working_dir, f"file-{i % 10}")
+        with open(path, "a") as f:
+            f.write(f"{branch} {i} {os.urandom(512).hex()}\n")
+        repo.index.add([path])
+        repo.index.commit(f"Change {i}")
+    repo.git.push("origin", branch)
+
+
+@pytest.fixture()
+def upstream(tmp_path):
+    """Bare repository with synthetic history and a clone to push to it."""
+    bare = git.Repo.init(tmp_path / "upstream.git", bare=True, initial_branch="main")
+    work = git.Repo.clone_from(bare.working_dir, tmp_path / "work")
+    with work.config_writer() as config:
+        config.set_value("user", "name", "Packit")
+        config.set_value("user", "email", "packit@example.com")
+    add_commits(work, 100)
+    work.create_tag("1.0")
+    work.git.push("origin", "1.0")
+    add_commits(work, 10, branch="stable")
+    return bare.working_dir, work
+
+
+def count_objects(repo: git.Repo) -> int:
+    """Number of the objects stored in the repository itself."""
+    stats = dict(line.split(": ") for line in repo.git.count_objects(v=True).splitlines())
+    return int(stats["count"]) + int(stats["in-pack"])
+
+
+def test_get_repo(tmp_path, upstream):
+    url, work = upstream
+    cache = RepositoryMirrorCache(tmp_path / "mirrors", size_limit=1024**3)
+
+    repo = cache.get_repo(url, directory=tmp_path / "clone-1")
+
+    assert repo.remote("origin").url == url
+    assert repo.active_branch.name == "main"
+    assert repo.head.commit == work.heads.main.commit
+    assert {ref.name for ref in repo.remote("origin").refs} >= {"origin/main", "origin/stable"}
+    assert "1.0" in [tag.name for tag in repo.tags]
+    # all the objects are borrowed from the mirror
+    assert count_objects(repo) == 0
+    mirror = git.Repo(cache.get_mirror_path(url))
+    assert mirror.bare
+    assert mirror.config_reader().get_value("gc", "auto") == 0
+    mirror_objects = count_objects(mirror)
+    assert int(cache.get_mirror_path(url).with_suffix(".size").read_text()) > 0
+
+    # commit, tree and blob of each commit
+    add_commits(work, 5)
+    repo = cache.get_repo(url, directory=tmp_path / "clone-2")
+
+    assert repo.head.commit == work.heads.main.commit
+    assert count_objects(repo) == 0
+    # only the new objects were fetched, thin packs are completed with their bases
+    assert 15 <= count_objects(mirror) - mirror_objects <= 30
+
+
+def test_get_repo_dissociated(tmp_path, upstream):
+    url, work = upstream
+    cache = RepositoryMirrorCache(tmp_path / "mirrors", size_limit=1024**3, dissociate=True)
+
+    repo = cache.get_repo(url, directory=tmp_path / "clone")
+
+    assert repo.head.commit == work.heads.main.commit
+    assert not (tmp_path / "clone" / ".git" / "objects" / "info" / "alternates").exists()
+    assert count_objects(repo) == count_objects(git.Repo(cache.get_mirror_path(url)))
+
+
+def test_get_repo_existing(tmp_path, upstream):
+    url, work = upstream
+    cache = RepositoryMirrorCache(tmp_path / "mirrors", size_limit=1024**3)
+
+    assert cache.get_repo(url, directory=work.working_dir).working_dir == work.working_dir
+    assert not (tmp_path / "mirrors").exists()
+
+
+def test_get_repo_mirror_failed(tmp_path, upstream):
+    url, _ = upstream
+    cache = RepositoryMirrorCache(tmp_path / "mirrors", size_limit=1024**3)
+    flexmock(RepositoryMirrorCache).should_receive("_update_mirror").and_raise(
+        git.GitCommandError("fetch", 128),
+    )
+    flexmock(repository_mirror).should_receive("get_repo").with_args(
+        url=url,
+        directory=str(tmp_path / "clone"),
+    ).and_return(flexmock()).once()
+
+    cache.get_repo(url, directory=tmp_path / "clone")
+
+
+def test_mirror_path(tmp_path):
+    cache = RepositoryMirrorCache(tmp_path, size_limit=0)
+
+    assert cache.get_mirror_path("https://github.com/packit/ogr.git") == cache.get_mirror_path(
+        "https://github.com/packit/ogr/",
+    )
+    assert cache.get_mirror_path("https://github.com/packit/ogr").name.startswith("ogr-")
+    assert cache.get_mirror_path("https://github.com/packit/ogr") != cache.get_mirror_path(
+        "https://gitlab.com/packit/ogr",
+    )
+
+
+def test_evict(tmp_path):
+    cache = RepositoryMirrorCache(tmp_path, size_limit=2500)
+    now = time.time()
+    # name, last use, size
+    for name, last_used, size in (
+        ("oldest", now - 3 * 24 * 3600, 1000),
+        ("old", now - 24 * 3600, 1000),
+        ("locked", now - 48 * 3600, 1000),
+        ("recent", now - 60, 1000),
+    ):
+        (tmp_path / f"{name}.git" / "objects").mkdir(parents=True)
+        (tmp_path / f"{name}.git" / "objects" / "pack").write_bytes(b"x" * size)
+        (tmp_path / f"{name}.lock").touch()
+        os.utime(tmp_path / f"{name}.lock", (last_used, last_used))
+
+    with cache._locked(tmp_path / "locked.git"):
+        cache.evict()
+
+    assert sorted(path.name for path in tmp_path.glob("*.git")) == ["locked.git", "recent.git"]
+    assert sorted(path.name for path in tmp_path.glob("*.lock")) == ["locked.lock", "recent.lock"]
+
+
+def test_evict_keeps_recently_used(tmp_path):
+    cache = RepositoryMirrorCache(tmp_path, size_limit=0)
+    (tmp_path / "recent.git").mkdir()
+    (tmp_path / "recent.git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (tmp_path / "recent.lock").touch()
+
+    cache.evict()
+
+    assert (tmp_path / "recent.git").is_dir()
+
+
+@pytest.mark.parametrize(
+    "mirror_cache, cache, expected",
+    [
+        ("/var/cache/mirrors", "/repository-cache", RepositoryMirrorCache),
+        (None, "/repository-cache", RepositoryCache),
+        (None, None, None),
+    ],
+)
+def test_get_repository_cache(mirror_cache, cache, expected):
+    service_config = flexmock(
+        repository_mirror_cache=mirror_cache,
+        repository_mirror_cache_size=20,
+        repository_cache=cache,
+        add_repositories_to_repository_cache=False,
+        command_handler=RunCommandType.local,
+    )
+
+    repository_cache = get_repository_cache(service_config)
+
+    if expected is None:
+        assert repository_cache is None
+    else:
+        assert type(repository_cache) is expected
+
+
+@pytest.mark.parametrize(
+    "command_handler, dissociate",
+    [(RunCommandType.local, False), (RunCommandType.sandcastle, True)],
+)
+def test_get_repository_cache_dissociated(command_handler, dissociate):
+    service_config = flexmock(
+        repository_mirror_cache="/var/cache/mirrors",
+        repository_mirror_cache_size=20,
+        command_handler=command_handler,
+    )
+
+    assert get_repository_cache(service_config).dissociate is dissociate
+
+
+def test_evict_recorded_sizes(tmp_path):
+    cache = RepositoryMirrorCache(tmp_path, size_limit=1500)
+    for name, last_used in (("old", time.time() - 24 * 3600), ("recent", time.time())):
+        (tmp_path / f"{name}.git").mkdir()
+        (tmp_path / f"{name}.size").write_text("1000")
+        (tmp_path / f"{name}.lock").touch()
+        os.utime(tmp_path / f"{name}.lock", (last_used, last_used))
+    # the mirrors are not walked
+    flexmock(RepositoryMirrorCache).should_receive("_get_size").never()
+
+    cache.evict()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "recent.git",
+        "recent.lock",
+        "recent.size",
+    ]
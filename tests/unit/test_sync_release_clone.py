@@ -0,0 +1,162 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from contextlib import nullcontext
+
+import git
+import pytest
+from flexmock import flexmock
+from packit.exceptions import PackitDownloadFailedException
+from packit.local_project import LocalProjectBuilder
+
+from packit_service.worker.helpers.sync_release.clone import (
+    SharedUpstreamArchives,
+    clone_local_project,
+)
+
+
+@pytest.fixture()
+def dist_git(tmp_path):
+    """Bare repository standing in for dist-git, and its clone."""
+    remote = git.Repo.init(tmp_path / "remote.git", bare=True)
+    repo = git.Repo.clone_from(remote.working_dir, tmp_path / "dist-git")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Packit")
+        config.set_value("user", "email", "packit@example.com")
+    for branch in ("main", "f40", "f41"):
+        repo.git.checkout(b=branch)
+        (tmp_path / "dist-git" / "package.spec").write_text(f"# {branch}\n")
+        repo.index.add(["package.spec"])
+        repo.index.commit(f"Update {branch}")
+        repo.git.push("origin", branch)
+    repo.git.checkout("main")
+    repo.create_tag("1.0")
+    repo.git.branch("-D", "f40", "f41")
+    repo.create_remote("fork", "https://src.fedoraproject.org/forks/packit/rpms/package.git")
+
+    flexmock(LocalProjectBuilder).should_receive("build").replace_with(
+        lambda **kwargs: flexmock(**kwargs),
+    )
+    return remote, flexmock(git_repo=repo, working_dir=tmp_path / "dist-git")
+
+
+def test_clone_local_project(tmp_path, dist_git):
+    remote, local_project = dist_git
+
+    clone = clone_local_project(local_project, tmp_path / "f40" / "dist-git")
+
+    repo = clone.git_repo
+    assert clone.local_project is local_project
+    assert clone.working_dir == tmp_path / "f40" / "dist-git"
+    assert repo.head.commit == local_project.git_repo.head.commit
+    assert repo.remote("origin").url == remote.working_dir
+    assert repo.remote("fork").url == local_project.git_repo.remote("fork").url
+    assert {ref.name for ref in repo.remote("origin").refs} >= {
+        "origin/main",
+        "origin/f40",
+        "origin/f41",
+    }
+    assert "1.0" in [tag.name for tag in repo.tags]
+
+
+def test_clones_are_isolated(tmp_path, dist_git):
+    remote, local_project = dist_git
+    clones = {
+        branch: clone_local_project(local_project, tmp_path / branch / "dist-git").git_repo
+        for branch in ("f40", "f41")
+    }
+
+    for branch, repo in clones.items():
+        with repo.config_writer() as config:
+            config.set_value("user", "name", "Packit")
+            config.set_value("user", "email", "packit@example.com")
+        repo.git.checkout("-B", f"{branch}-update", f"origin/{branch}")
+        (tmp_path / branch / "dist-git" / "package.spec").write_text("# updated\n")
+        repo.git.commit("-a", "-m", "Update")
+        repo.git.push("origin", f"{branch}-update")
+
+    assert local_project.git_repo.head.ref.name == "main"
+    assert not local_project.git_repo.is_dirty()
+    assert {head.name for head in remote.heads} == {
+        "main",
+        "f40",
+        "f41",
+        "f40-update",
+        "f41-update",
+    }
+
+
+def get_specfile(path, version="1.0"):
+    """Spec file with a remote Source0 of the given version."""
+    source = flexmock(
+        expanded_location=f"https://example.com/package-{version}.tar.gz",
+        expanded_filename=f"package-{version}.tar.gz",
+        valid=True,
+    )
+    return flexmock(
+        path=path / "package.spec",
+        sources=lambda: nullcontext([source]),
+        patches=lambda: nullcontext([]),
+    )
+
+
+def test_shared_upstream_archives(tmp_path):
+    archives = SharedUpstreamArchives(tmp_path / "archives")
+    downloads = []
+
+    def get_dist_git(name, version):
+        source_dir = tmp_path / name
+        source_dir.mkdir()
+        archive = source_dir / f"package-{version}.tar.gz"
+
+        def download():
+            downloads.append(name)
+            archive.write_bytes(version.encode())
+            return [archive]
+
+        dg = flexmock(
+            absolute_source_dir=source_dir,
+            specfile=get_specfile(source_dir, version),
+            upstream_archive_names=[archive.name],
+            download_upstream_archives=download,
+        )
+        archives.share_with(dg)
+        return dg
+
+    # f42 has its own spec file with a different version
+    dist_gits = {
+        **{f"f4{i}": get_dist_git(f"f4{i}", "1.0") for i in range(2)},
+        "f42": get_dist_git("f42", "0.9"),
+    }
+
+    for dg in dist_gits.values():
+        version = "0.9" if dg is dist_gits["f42"] else "1.0"
+        archive = dg.absolute_source_dir / f"package-{version}.tar.gz"
+        assert dg.download_upstream_archives() == [archive]
+        assert archive.read_bytes() == version.encode()
+    assert downloads == ["f40", "f42"]
+
+    archives.clean()
+    assert not (tmp_path / "archives").exists()
+
+
+def test_shared_upstream_archives_failed(tmp_path):
+    archives = SharedUpstreamArchives(tmp_path / "archives")
+    dist_gits = [
+        flexmock(
+            absolute_source_dir=tmp_path,
+            specfile=get_specfile(tmp_path),
+            upstream_archive_names=["package-1.0.tar.gz"],
+        )
+        .should_receive("download_upstream_archives")
+        .and_raise(PackitDownloadFailedException("not uploaded yet"))
+        .times(1 if i == 0 else 0)
+        .mock()
+        for i in range(2)
+    ]
+    for dg in dist_gits:
+        archives.share_with(dg)
+
+    for dg in dist_gits:
+        with pytest.raises(PackitDownloadFailedException):
+            dg.download_upstream_archives()
@@ -1,6 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import fakeredis
 import prometheus_client
 import pytest
 import redis
@@ -9,9 +10,14 @@ from flexmock import flexmock
 from packit.exceptions import PackitException
 
 from packit_service.constants import REDIS_PIDBOX_TTL_SECONDS
+from packit_service.worker import tasks
 from packit_service.worker.handlers import CoprBuildHandler
 from packit_service.worker.monitoring import Pushgateway
-from packit_service.worker.tasks import cleanup_orphaned_pidbox_queues, run_copr_build_handler
+from packit_service.worker.tasks import (
+    cleanup_orphaned_pidbox_queues,
+    database_maintenance,
+    run_copr_build_handler,
+)
 
 
 def test_autoretry():
@@ -26,39 +32,97 @@ def test_autoretry():
         run_copr_build_handler({}, {}, {})
 
 
-def test_cleanup_orphaned_pidbox_queues():
-    """Test that pidbox cleanup scans keys, sets TTL, and pushes metrics."""
-    # Mock Redis client
-    redis_client = flexmock()
-    redis_client.should_receive("scan").with_args(
-        cursor=0,
-        match="*.reply.celery.pidbox",
-        count=100,
-    ).and_return((0, ["key1.reply.celery.pidbox", "key2.reply.celery.pidbox"])).once()
-
-    # key1 has no TTL (-1), key2 already has TTL
-    redis_client.should_receive("ttl").with_args("key1.reply.celery.pidbox").and_return(-1).once()
-    redis_client.should_receive("ttl").with_args("key2.reply.celery.pidbox").and_return(1800).once()
-
-    # Only key1 should get TTL set
-    redis_client.should_receive("expire").with_args(
-        "key1.reply.celery.pidbox",
-        REDIS_PIDBOX_TTL_SECONDS,
-    ).once()
+@pytest.fixture()
+def pidbox_redis():
+    """Fake broker with a mix of orphaned and expiring pidbox reply queues."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    pipeline = client.pipeline(transaction=False)
+    for i in range(5_000):
+        key = f"worker{i}.reply.celery.pidbox"
+        pipeline.rpush(key, "reply")
+        # every tenth queue is orphaned
+        if i % 10:
+            pipeline.expire(key, 1800)
+    pipeline.set("unrelated", "value")
+    pipeline.execute()
 
-    redis_client.should_receive("dbsize").and_return(42).once()
+    # multiple batches with just a few thousand keys
+    flexmock(tasks, REDIS_PIDBOX_SCAN_COUNT=100)
+    flexmock(redis).should_receive("Redis").and_return(client).once()
+    # TTLs are looked up and set only in pipelines
+    flexmock(client).should_receive("ttl").never()
+    flexmock(client).should_receive("expire").never()
+    return client
 
-    # Mock Redis constructor
-    flexmock(redis).should_receive("Redis").and_return(redis_client).once()
 
-    # Mock Pushgateway
-    gauge = flexmock()
-    gauge.should_receive("set").with_args(42).once()
+def mock_pidbox_pushgateway():
+    """Mock Pushgateway, return the values of the gauges set by the cleanup."""
+    metrics = {}
 
-    pushgateway = flexmock(redis_keys_total=gauge)
-    pushgateway.should_receive("push").once()
+    def gauge(name):
+        mock = flexmock()
+        mock.should_receive("set").replace_with(
+            lambda value: metrics.__setitem__(name, value),
+        ).once()
+        return mock
 
-    flexmock(Pushgateway).new_instances(pushgateway)
+    pushgateway = flexmock(
+        redis_keys_total=gauge("total"),
+        redis_pidbox_keys_scanned=gauge("scanned"),
+        redis_pidbox_keys_expired=gauge("expired"),
+        redis_pidbox_cleanup_time=gauge("time"),
+    )
+    pushgateway.should_receive("push").once()
+    flexmock(Pushgateway).should_receive("get_instance").and_return(pushgateway)
     flexmock(prometheus_client).should_receive("push_to_gateway")
+    return metrics
+
+
+def test_cleanup_orphaned_pidbox_queues(pidbox_redis):
+    """Test that pidbox cleanup scans keys, sets TTL, and pushes metrics."""
+    metrics = mock_pidbox_pushgateway()
+
+    cleanup_orphaned_pidbox_queues()
+
+    assert metrics["total"] == 5_001
+    assert metrics["scanned"] == 5_000
+    assert metrics["expired"] == 500
+    # `ttl()` of the client itself is not expected to be called
+    pipeline = pidbox_redis.pipeline(transaction=False)
+    for key in ("worker0.reply.celery.pidbox", "worker1.reply.celery.pidbox", "unrelated"):
+        pipeline.ttl(key)
+    orphaned, expiring, unrelated = pipeline.execute()
+    assert orphaned == REDIS_PIDBOX_TTL_SECONDS
+    assert 0 < expiring <= 1800
+    assert unrelated == -1
+
+
+def test_cleanup_orphaned_pidbox_queues_time_budget(pidbox_redis):
+    """Test that pidbox cleanup stops after the first batch with no time left."""
+    flexmock(tasks, REDIS_PIDBOX_CLEANUP_TIME_BUDGET=-1)
+    metrics = mock_pidbox_pushgateway()
 
     cleanup_orphaned_pidbox_queues()
+
+    assert metrics["scanned"] < 5_000
+    assert metrics["expired"] < 500
+
+
+def test_database_maintenance_time_budget():
+    """Test that the removal of old data gets the time left after the backup."""
+    flexmock(
+        tasks,
+        DATABASE_MAINTENANCE_TIME_LIMIT=3600,
+        DATABASE_MAINTENANCE_TIME_RESERVE=300,
+    )
+    # started, after the backup, after discarding the SRPM build logs
+    flexmock(tasks.time).should_receive("monotonic").and_return(0, 3000, 3200).one_by_one()
+    flexmock(tasks).should_receive("backup").once()
+    flexmock(tasks).should_receive("discard_old_srpm_build_logs").with_args(
+        time_budget=300,
+    ).once()
+    flexmock(tasks).should_receive("discard_old_package_configs").with_args(
+        time_budget=100,
+    ).once()
+
+    database_maintenance()
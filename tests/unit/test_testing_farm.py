@@ -426,11 +426,11 @@ def test_downstream_testing_farm_response(
         job_config=None,
         event=event_dict,
     )
-    flexmock(StatusReporter).should_receive("set_status").with_args(
+    flexmock(StatusReporter).should_receive("report").with_args(
         state=status_status,
         description=status_message,
         url="some url",
-        check_name="Packit-stg - installability",
+        check_names="Packit-stg - installability",
         target_branch="rawhide",
     ).once()
 
@@ -1459,9 +1459,9 @@ def test_trigger_build(copr_build, wait_for_build, monkeypatch):
         )
         for target in targets
     ]
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(
-        *tests,
-    ).one_by_one()
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: tests[: len(test_runs)],
+    )
     flexmock(PipelineModel).should_receive("create").and_return(flexmock())
     flexmock(TFTTestRunGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=tests),
@@ -1545,9 +1545,9 @@ def test_trigger_build_manual_tests_dont_report(monkeypatch):
         )
         for target in targets
     ]
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(
-        *tests,
-    ).one_by_one()
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").replace_with(
+        lambda test_run_group, test_runs: tests[: len(test_runs)],
+    )
     flexmock(PipelineModel).should_receive("create").and_return(flexmock())
     flexmock(TFTTestRunGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=tests),
@@ -18,6 +18,7 @@ from typing import ClassVar
 
 import pytest
 from ogr import GithubService, GitlabService, PagureService
+from sqlalchemy import event
 
 from packit_service.config import ServiceConfig
 from packit_service.events import github
@@ -48,6 +49,7 @@ from packit_service.models import (
     ProjectEventModelType,
     ProjectReleaseModel,
     PullRequestModel,
+    RetentionCheckpointModel,
     SourceGitPRDistGitPRModel,
     SRPMBuildModel,
     SyncReleaseJobType,
@@ -59,6 +61,10 @@ from packit_service.models import (
     TestingFarmResult,
     TFTTestRunGroupModel,
     TFTTestRunTargetModel,
+    UsageEventDayModel,
+    UsageJobDayModel,
+    UsageRollupWatermarkModel,
+    engine,
     sa_session_transaction,
     sync_release_pr_association_table,
     tf_copr_association_table,
@@ -251,6 +257,12 @@ def clean_db():
         session.query(LogDetectiveRunModel).delete()
         session.query(LogDetectiveRunGroupModel).delete()
 
+        session.query(UsageEventDayModel).delete()
+        session.query(UsageJobDayModel).delete()
+        session.query(UsageRollupWatermarkModel).delete()
+
+        session.query(RetentionCheckpointModel).delete()
+
 
 @pytest.fixture()
 def clean_before_and_after():
@@ -259,6 +271,35 @@ def clean_before_and_after():
     clean_db()
 
 
+@pytest.fixture()
+def executed_statements():
+    """
+    SQL statements executed while the test runs, including the commits and rollbacks,
+    clear it before the measured part of the test.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    def commit(conn):
+        statements.append("COMMIT")
+
+    def rollback(conn):
+        statements.append("ROLLBACK")
+
+    listeners = {
+        "before_cursor_execute": before_cursor_execute,
+        "commit": commit,
+        "rollback": rollback,
+    }
+    for identifier, listener in listeners.items():
+        event.listen(engine, identifier, listener)
+    yield statements
+    for identifier, listener in listeners.items():
+        event.remove(engine, identifier, listener)
+
+
 @pytest.fixture()
 def pr_project_event_model():
     _, event = ProjectEventModel.add_pull_request_event(
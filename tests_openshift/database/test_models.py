@@ -1,9 +1,11 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import pytest
+from flexmock import flexmock
 from sqlalchemy import null
 from sqlalchemy.exc import IntegrityError, ProgrammingError
 
@@ -39,7 +41,9 @@ from packit_service.models import (
     TestingFarmResult,
     TFTTestRunGroupModel,
     TFTTestRunTargetModel,
+    bulk_insert,
     sa_session_transaction,
+    sa_unit_of_work,
 )
 from tests_openshift.conftest import SampleValues
 
@@ -322,6 +326,114 @@ def test_errors_while_doing_db(clean_before_and_after):
         assert len(session.query(PullRequestModel).all()) == 1
 
 
+def test_add_pull_request_event_concurrently(clean_before_and_after):
+    def add_event(_):
+        try:
+            _, project_event = ProjectEventModel.add_pull_request_event(
+                pr_id=42,
+                namespace="clapton",
+                repo_name="layla",
+                project_url="https://github.com/clapton/layla",
+                commit_sha="abcdef",
+            )
+            return project_event.id
+        finally:
+            Session.remove()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        project_event_ids = set(executor.map(add_event, range(64)))
+
+    assert len(project_event_ids) == 1
+    with sa_session_transaction() as session:
+        assert session.query(GitProjectModel).count() == 1
+        assert session.query(PullRequestModel).count() == 1
+        assert session.query(ProjectEventModel).count() == 1
+
+
+@pytest.mark.parametrize(
+    "commit_sha, statements",
+    [
+        # the rows are looked up and the missing ones inserted, all committed at once
+        pytest.param("abcdef", ["SELECT", "INSERT"] * 3 + ["COMMIT"], id="new"),
+        pytest.param(None, ["SELECT", "INSERT"] * 3 + ["COMMIT"], id="new-without-commit"),
+    ],
+)
+def test_add_pull_request_event_statements(
+    clean_before_and_after,
+    executed_statements,
+    commit_sha,
+    statements,
+):
+    def add_event(commit_sha):
+        executed_statements.clear()
+        ProjectEventModel.add_pull_request_event(
+            pr_id=42,
+            namespace="clapton",
+            repo_name="layla",
+            project_url="https://github.com/clapton/layla",
+            commit_sha=commit_sha,
+        )
+        return [statement.split()[0] for statement in executed_statements]
+
+    assert add_event(commit_sha) == statements
+    # nothing is written for the existing rows
+    assert add_event(commit_sha) == ["SELECT"] * 3 + ["COMMIT"]
+    # only the event of another commit is inserted
+    assert add_event("123456") == ["SELECT"] * 3 + ["INSERT", "COMMIT"]
+
+
+def test_add_pull_request_event_rolled_back(clean_before_and_after):
+    flexmock(ProjectEventModel).should_receive("get_or_create").and_raise(
+        ProgrammingError("INSERT", {}, Exception()),
+    )
+
+    with pytest.raises(ProgrammingError):
+        ProjectEventModel.add_pull_request_event(
+            pr_id=42,
+            namespace="clapton",
+            repo_name="layla",
+            project_url="https://github.com/clapton/layla",
+            commit_sha="abcdef",
+        )
+
+    # the project and the pull request are not committed without their event
+    with sa_session_transaction() as session:
+        assert session.query(GitProjectModel).count() == 0
+        assert session.query(PullRequestModel).count() == 0
+
+
+@pytest.mark.parametrize("targets", [1, 10, 60])
+def test_copr_build_bulk_create(
+    clean_before_and_after,
+    srpm_build_model_with_new_run_for_pr,
+    targets,
+    executed_statements,
+):
+    _, run_model = srpm_build_model_with_new_run_for_pr
+    group, _ = CoprBuildGroupModel.create(run_model)
+
+    executed_statements.clear()
+    builds = CoprBuildTargetModel.bulk_create(
+        copr_build_group=group,
+        builds=[
+            {
+                "build_id": None,
+                "project_name": SampleValues.project,
+                "owner": SampleValues.owner,
+                "web_url": None,
+                "target": f"fedora-{i}-x86_64",
+                "status": BuildStatus.waiting_for_srpm,
+            }
+            for i in range(targets)
+        ],
+    )
+
+    inserts = [statement for statement in executed_statements if statement.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert [build.target for build in builds] == [f"fedora-{i}-x86_64" for i in range(targets)]
+    assert len(CoprBuildGroupModel.get_by_id(group.id).copr_build_targets) == targets
+
+
 def test_get_srpm_builds_in_give_range(
     clean_before_and_after,
     srpm_build_model_with_new_run_for_pr,
@@ -870,6 +982,66 @@ def test_get_project_releases(clean_before_and_after, release_model):
     assert len(releases) == 1
 
 
+@pytest.fixture()
+def projects_with_many_prs(clean_before_and_after):
+    with sa_session_transaction(commit=True) as session:
+        projects = [
+            GitProjectModel(
+                namespace="the-namespace",
+                repo_name=f"repo-{i}",
+                project_url=f"https://github.com/the-namespace/repo-{i}",
+            )
+            for i in range(3)
+        ]
+        session.add_all(projects)
+        session.flush()
+
+        bulk_insert(
+            session,
+            PullRequestModel,
+            [
+                {"pr_id": pr_id, "project_id": project.id}
+                for project, prs in zip(projects, (3000, 1000, 0))
+                for pr_id in range(prs)
+            ],
+        )
+        bulk_insert(
+            session,
+            GitBranchModel,
+            [{"name": f"branch-{i}", "project_id": projects[0].id} for i in range(20)],
+        )
+        bulk_insert(
+            session,
+            ProjectReleaseModel,
+            [{"tag_name": f"v{i}", "project_id": projects[1].id} for i in range(5)],
+        )
+        return [project.id for project in projects]
+
+
+def test_get_handled_counts(projects_with_many_prs, executed_statements):
+    executed_statements.clear()
+    counts = GitProjectModel.get_handled_counts(tuple(projects_with_many_prs))
+
+    assert len(executed_statements) == 1
+    assert counts == {
+        project_id: {
+            "prs_handled": len(project.pull_requests),
+            "branches_handled": len(project.branches),
+            "releases_handled": len(project.releases),
+            "issues_handled": len(project.issues),
+        }
+        for project_id in projects_with_many_prs
+        if (project := GitProjectModel.get_by_id(project_id))
+    }
+    assert counts[projects_with_many_prs[0]]["prs_handled"] == 3000
+    assert counts[projects_with_many_prs[2]] == {
+        "prs_handled": 0,
+        "branches_handled": 0,
+        "releases_handled": 0,
+        "issues_handled": 0,
+    }
+
+
 def test_project_property_for_koji_build(a_koji_build_for_pr):
     project = a_koji_build_for_pr.get_project()
     assert isinstance(project, GitProjectModel)
@@ -1181,40 +1353,6 @@ def test_get_all_downstream_projects(clean_before_and_after, propose_model_submi
     assert projects.pop().project_url == SampleValues.downstream_project_url
 
 
-def test_project_event_get_and_reset_older_than_with_packages_config(
-    clean_before_and_after,
-    branch_project_event_model,
-):
-    branch_project_event_model.set_packages_config({"key": "value"})
-    run1 = PipelineModel.create(project_event=branch_project_event_model)
-    run1.datetime = datetime(2024, 4, 8, 12, 0, 0)
-
-    assert (
-        len(
-            list(
-                ProjectEventModel.get_and_reset_older_than_with_packages_config(
-                    timedelta(days=1),
-                ),
-            ),
-        )
-        == 1
-    )
-
-    # default datetime = now
-    PipelineModel.create(project_event=branch_project_event_model)
-
-    assert (
-        len(
-            list(
-                ProjectEventModel.get_and_reset_older_than_with_packages_config(
-                    timedelta(days=1),
-                ),
-            ),
-        )
-        == 0
-    )
-
-
 def test_create_scan(clean_before_and_after, a_scan):
     assert a_scan.task_id == 123
     assert a_scan.status == "succeeded"
@@ -1265,6 +1403,32 @@ def test_bodhi_model_get_all_successful_or_in_progress_by_nvrs(
     assert model.id == successful_bodhi_update_model.id
 
 
+def test_bodhi_model_outcome_committed_once(
+    clean_before_and_after,
+    bodhi_update_model,
+    executed_statements,
+):
+    executed_statements.clear()
+    with sa_unit_of_work():
+        bodhi_update_model.set_status("success")
+        bodhi_update_model.set_alias("FEDORA-2024-abcdef")
+        bodhi_update_model.set_web_url("https://bodhi.fedoraproject.org/updates/FEDORA-2024-abcdef")
+        bodhi_update_model.set_update_creation_time(datetime.now())
+
+    assert executed_statements.count("COMMIT") == 1
+    model = BodhiUpdateTargetModel.get_by_id(bodhi_update_model.id)
+    assert model.status == "success"
+    assert model.alias == "FEDORA-2024-abcdef"
+
+
+def test_unit_of_work_rolled_back(clean_before_and_after, bodhi_update_model):
+    with pytest.raises(ValueError), sa_unit_of_work():
+        bodhi_update_model.set_status("success")
+        raise ValueError
+
+    assert BodhiUpdateTargetModel.get_by_id(bodhi_update_model.id).status == "error"
+
+
 def test_create_koji_tag_request(clean_before_and_after, a_koji_tag_request):
     assert a_koji_tag_request.task_id == SampleValues.build_id
     assert a_koji_tag_request.web_url == SampleValues.koji_web_url
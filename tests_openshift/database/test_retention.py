@@ -0,0 +1,135 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flexmock import flexmock
+from sqlalchemy import null, select
+
+from packit_service.models import (
+    CoprBuildGroupModel,
+    CoprBuildTargetModel,
+    GitProjectModel,
+    PipelineModel,
+    ProjectEventModel,
+    ProjectEventModelType,
+    PullRequestModel,
+    RetentionCheckpointModel,
+    SRPMBuildModel,
+    sa_session_transaction,
+)
+from packit_service.worker import database
+
+NOW = datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture()
+def retention_database(clean_before_and_after):
+    """A pull request with a pipeline per day over the last 20 days, each with a build."""
+    flexmock(time).should_receive("sleep")
+    with sa_session_transaction(commit=True) as session:
+        project = GitProjectModel(
+            namespace="namespace",
+            repo_name="repo",
+            project_url="https://github.com/namespace/repo",
+            instance_url="github.com",
+        )
+        session.add(project)
+        session.flush()
+        pull_request = PullRequestModel(pr_id=1, project_id=project.id)
+        session.add(pull_request)
+        session.flush()
+
+        for day in range(20):
+            project_event = ProjectEventModel(
+                type=ProjectEventModelType.pull_request,
+                event_id=pull_request.id,
+                commit_sha=f"sha-{day}",
+            )
+            session.add(project_event)
+            session.flush()
+            copr_build_group = CoprBuildGroupModel()
+            copr_build_group.copr_build_targets.append(
+                CoprBuildTargetModel(build_id=str(day), target="fedora-rawhide-x86_64"),
+            )
+            session.add(
+                PipelineModel(
+                    datetime=NOW - timedelta(days=day, hours=1),
+                    project_event_id=project_event.id,
+                    srpm_build=SRPMBuildModel(
+                        logs="logs",
+                        url="url",
+                        submitted_time=NOW - timedelta(days=day, hours=1),
+                    ),
+                    copr_build_group=copr_build_group,
+                ),
+            )
+
+
+def count(model) -> int:
+    with sa_session_transaction() as session:
+        return session.query(model).count()
+
+
+def test_delete_old_data(retention_database):
+    database.delete_old_data(age="10 days", batch_size=3)
+
+    assert count(PipelineModel) == 10
+    assert count(ProjectEventModel) == 10
+    assert count(SRPMBuildModel) == 10
+    assert count(CoprBuildGroupModel) == 10
+    assert count(CoprBuildTargetModel) == 10
+    # still referenced by the pull request
+    assert count(GitProjectModel) == 1
+    assert count(RetentionCheckpointModel) == 0
+
+
+def test_delete_old_data_resumed(retention_database):
+    # no time for any batch
+    database.delete_old_data(age="10 days", batch_size=3, time_budget=-1)
+    assert count(PipelineModel) == 20
+
+    # interrupted after deleting the pipelines of the days 10 to 14
+    (step, *_) = database.get_delete_old_data_steps("10 days")
+    with sa_session_transaction(commit=True) as session:
+        pipeline_ids = session.execute(select(PipelineModel.id).order_by(PipelineModel.id))
+        pipeline_ids = pipeline_ids.scalars().all()
+        session.merge(RetentionCheckpointModel(step=step.name, last_id=pipeline_ids[14]))
+
+    database.delete_old_data(age="10 days", batch_size=3, time_budget=None)
+
+    # the old pipelines up to the checkpoint were not deleted again
+    assert count(PipelineModel) == 15
+    assert count(ProjectEventModel) == 15
+    assert count(RetentionCheckpointModel) == 0
+
+
+def test_discard_old_srpm_build_logs(retention_database, monkeypatch):
+    monkeypatch.setenv("SRPMBUILDS_OUTDATED_AFTER_DAYS", "10")
+    monkeypatch.setenv("RETENTION_BATCH_SIZE", "4")
+    database.discard_old_srpm_build_logs()
+
+    with sa_session_transaction() as session:
+        assert session.query(SRPMBuildModel).filter(SRPMBuildModel.logs.isnot(None)).count() == 10
+        assert session.query(SRPMBuildModel).filter(SRPMBuildModel.url.isnot(None)).count() == 10
+    assert count(RetentionCheckpointModel) == 0
+
+
+def test_discard_old_package_configs(retention_database, monkeypatch):
+    with sa_session_transaction(commit=True) as session:
+        session.query(ProjectEventModel).update({"packages_config": {"key": "value"}})
+    monkeypatch.setenv("PACKAGE_CONFIGS_OUTDATED_AFTER_DAYS", "10")
+    monkeypatch.setenv("RETENTION_BATCH_SIZE", "4")
+    database.discard_old_package_configs()
+
+    with sa_session_transaction() as session:
+        # only the events with a pipeline in the last 10 days keep it
+        assert (
+            session.query(ProjectEventModel)
+            .filter(ProjectEventModel.packages_config.isnot(null()))
+            .count()
+            == 10
+        )
+    assert count(RetentionCheckpointModel) == 0
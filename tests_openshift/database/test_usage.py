@@ -0,0 +1,235 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from packit_service.models import (
+    CoprBuildGroupModel,
+    GitBranchModel,
+    GitProjectModel,
+    PipelineModel,
+    ProjectEventModel,
+    ProjectEventModelType,
+    PullRequestModel,
+    SRPMBuildModel,
+    UsageRollupWatermarkModel,
+    get_usage_data,
+    get_usage_numbers,
+    refresh_usage_rollups,
+    sa_session_transaction,
+)
+
+NOW = datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture()
+def usage_database(clean_before_and_after):
+    """Pipelines of a few projects spread over the last 40 days."""
+    rng = random.Random(42)
+    with sa_session_transaction(commit=True) as session:
+        projects = [
+            GitProjectModel(
+                namespace=f"namespace-{i}",
+                repo_name="repo",
+                project_url=f"https://github.com/namespace-{i}/repo",
+                instance_url="github.com" if i % 2 else "gitlab.com",
+            )
+            for i in range(5)
+        ]
+        session.add_all(projects)
+        session.flush()
+
+        project_events = []
+        for i in range(20):
+            pull_request = PullRequestModel(pr_id=i, project_id=rng.choice(projects).id)
+            branch = GitBranchModel(name=f"branch-{i}", project_id=rng.choice(projects).id)
+            session.add_all([pull_request, branch])
+            session.flush()
+            for event_type, event in (
+                (ProjectEventModelType.pull_request, pull_request),
+                (ProjectEventModelType.branch_push, branch),
+            ):
+                project_events.extend(
+                    ProjectEventModel(type=event_type, event_id=event.id, commit_sha=f"{i}{sha}")
+                    for sha in "ab"
+                )
+        session.add_all(project_events)
+        session.flush()
+
+        for _ in range(500):
+            pipeline = PipelineModel(
+                datetime=NOW - timedelta(minutes=rng.randint(0, 40 * 24 * 60)),
+                project_event_id=rng.choice(project_events).id,
+            )
+            if rng.random() < 0.7:
+                pipeline.srpm_build = SRPMBuildModel()
+            if rng.random() < 0.5:
+                pipeline.copr_build_group = CoprBuildGroupModel()
+            session.add(pipeline)
+
+
+def get_expected_usage_numbers(datetime_from, datetime_to):
+    """Compute the usage numbers from all the pipelines in Python."""
+
+    def in_period(pipeline):
+        return (datetime_from is None or pipeline.datetime >= datetime_from) and (
+            datetime_to is None or pipeline.datetime <= datetime_to
+        )
+
+    events: dict = {project_event_type: {} for project_event_type in ProjectEventModelType}
+    jobs: dict = {"srpm_builds": {}, "copr_build_groups": {}}
+    instances: dict = {}
+    first_pipelines: dict = {}
+    with sa_session_transaction() as session:
+        for pipeline in session.query(PipelineModel).order_by(PipelineModel.datetime):
+            project_event = pipeline.project_event
+            project = project_event.get_project_event_object().project
+            for job_type, job_id in (
+                ("srpm_builds", pipeline.srpm_build_id),
+                ("copr_build_groups", pipeline.copr_build_group_id),
+            ):
+                if job_id is not None and (job_type, job_id) not in first_pipelines:
+                    first_pipelines[job_type, job_id] = pipeline
+                    if in_period(pipeline):
+                        per_project = jobs[job_type]
+                        per_project[project.project_url] = (
+                            per_project.get(project.project_url, 0) + 1
+                        )
+            if in_period(pipeline):
+                events[project_event.type].setdefault(project.project_url, set()).add(
+                    project_event.event_id,
+                )
+                instances.setdefault(project.instance_url, set()).add(project.project_url)
+
+    return (
+        {
+            project_event_type: {
+                project_url: len(event_ids) for project_url, event_ids in per_project.items()
+            }
+            for project_event_type, per_project in events.items()
+        },
+        jobs,
+        {instance_url: len(project_urls) for instance_url, project_urls in instances.items()},
+    )
+
+
+def assert_usage_numbers_match_expected(datetime_from, datetime_to):
+    events, jobs, instances = get_usage_numbers(datetime_from, datetime_to)
+    expected_events, expected_jobs, expected_instances = get_expected_usage_numbers(
+        datetime_from,
+        datetime_to,
+    )
+
+    assert events == expected_events
+    for job_type, expected_numbers in expected_jobs.items():
+        numbers: dict[str, int] = {}
+        for per_project in jobs[job_type].values():
+            for project_url, runs in per_project.items():
+                numbers[project_url] = numbers.get(project_url, 0) + runs
+        assert numbers == expected_numbers
+    assert instances == expected_instances
+
+
+@pytest.mark.parametrize(
+    "datetime_from, datetime_to",
+    [
+        (None, None),
+        (NOW - timedelta(days=10), None),
+        (NOW - timedelta(days=20, hours=5), NOW - timedelta(days=3, hours=2)),
+        (
+            datetime.combine((NOW - timedelta(days=15)).date(), datetime.min.time()),
+            datetime.combine((NOW - timedelta(days=5)).date(), datetime.min.time()),
+        ),
+        (NOW - timedelta(hours=5), NOW),
+    ],
+)
+def test_usage_numbers(usage_database, datetime_from, datetime_to):
+    # read from the pipelines only
+    assert_usage_numbers_match_expected(datetime_from, datetime_to)
+
+    refresh_usage_rollups()
+
+    assert UsageRollupWatermarkModel.get_day() == NOW.date()
+    assert_usage_numbers_match_expected(datetime_from, datetime_to)
+
+
+@pytest.fixture()
+def reused_srpm_build(usage_database):
+    """SRPM build of a pipeline from 10 days ago reused by a pipeline from 3 days ago."""
+    with sa_session_transaction(commit=True) as session:
+        project_event_id = session.query(ProjectEventModel.id).limit(1).scalar()
+        srpm_build = SRPMBuildModel()
+        session.add_all(
+            [
+                PipelineModel(
+                    datetime=NOW - timedelta(days=days),
+                    project_event_id=project_event_id,
+                    srpm_build=srpm_build,
+                )
+                for days in (10, 3)
+            ],
+        )
+
+
+@pytest.mark.parametrize("refresh_rollups", [False, True])
+@pytest.mark.parametrize(
+    "datetime_from, datetime_to",
+    [
+        (None, None),
+        # the first pipeline only
+        (NOW - timedelta(days=12), NOW - timedelta(days=8)),
+        # the reusing pipeline only
+        (NOW - timedelta(days=5), None),
+        (
+            datetime.combine((NOW - timedelta(days=5)).date(), datetime.min.time()),
+            datetime.combine((NOW - timedelta(days=1)).date(), datetime.min.time()),
+        ),
+    ],
+)
+def test_usage_numbers_reused_job(
+    reused_srpm_build,
+    refresh_rollups,
+    datetime_from,
+    datetime_to,
+):
+    if refresh_rollups:
+        refresh_usage_rollups()
+
+    assert_usage_numbers_match_expected(datetime_from, datetime_to)
+
+
+def get_srpm_builds_count() -> int:
+    _, jobs, _ = get_usage_numbers(datetime_to=datetime.combine(NOW.date(), datetime.min.time()))
+    return sum(sum(numbers.values()) for numbers in jobs["srpm_builds"].values())
+
+
+def test_refresh_usage_rollups_incrementally(usage_database):
+    refresh_usage_rollups()
+    srpm_builds_count = get_srpm_builds_count()
+
+    with sa_session_transaction(commit=True) as session:
+        session.add(
+            PipelineModel(
+                datetime=NOW - timedelta(days=1),
+                project_event_id=session.query(ProjectEventModel.id).limit(1).scalar(),
+                srpm_build=SRPMBuildModel(),
+            ),
+        )
+    refresh_usage_rollups()
+
+    assert get_srpm_builds_count() == srpm_builds_count + 1
+
+
+def test_usage_data_kept_after_pipelines_are_deleted(usage_database):
+    refresh_usage_rollups()
+    datetime_to = datetime.combine((NOW - timedelta(days=2)).date(), datetime.min.time())
+    usage_data = get_usage_data(datetime_to=datetime_to, top=None)
+
+    with sa_session_transaction(commit=True) as session:
+        session.query(PipelineModel).filter(PipelineModel.datetime < datetime_to).delete()
+    get_usage_data.cache_clear()
+
+    assert get_usage_data(datetime_to=datetime_to, top=None) == usage_data
@@ -5,13 +5,17 @@ import datetime
 import pytest
 from flask import url_for
 from packit.utils import nested_get
+from sqlalchemy import text
 
 from packit_service.models import (
     PipelineModel,
     SyncReleaseStatus,
     SyncReleaseTargetStatus,
     TestingFarmResult,
+    get_estimated_count,
+    sa_session_transaction,
 )
+from packit_service.service.api.parsers import encode_cursor
 from packit_service.service.api.runs import process_runs
 from tests_openshift.conftest import SampleValues
 
@@ -80,6 +84,76 @@ def test_pagination(client, clean_before_and_after, too_many_copr_builds):
     assert len(response_dict_2) == 30  # three builds, but two unique build ids
 
 
+def get_next_page(client, response):
+    """Follow the 'Link' header of the response to the next page."""
+    link = response.headers["Link"]
+    assert link.endswith('>; rel="next"')
+    return client.get(link[link.index("<") + 1 : link.index(">")])
+
+
+def test_pagination_cursor(client, clean_before_and_after, too_many_copr_builds):
+    url = url_for("api.copr-builds_copr_builds_list")
+    response_page_2 = client.get(url + "?page=2&per_page=20")
+
+    response_cursor = get_next_page(client, client.get(url + "?per_page=20"))
+
+    assert response_cursor.status_code == 206
+    assert response_cursor.json == response_page_2.json
+    assert response_cursor.headers["Content-Range"] == "copr-builds 21-40/*"
+
+
+def test_pagination_cursor_runs(client, clean_before_and_after, too_many_copr_builds):
+    url = url_for("api.runs_runs_list")
+    response_page_2 = client.get(url + "?page=2&per_page=20")
+
+    response_cursor = get_next_page(client, client.get(url + "?per_page=20"))
+
+    assert response_cursor.status_code == 206
+    assert response_cursor.json
+    assert response_cursor.json == response_page_2.json
+
+
+def test_pagination_cursor_projects(client, clean_before_and_after, multiple_forge_projects):
+    url = url_for("api.projects_projects_list")
+    response_page_2 = client.get(url + "?page=2&per_page=2")
+
+    response_cursor = get_next_page(client, client.get(url + "?per_page=2"))
+
+    assert response_cursor.status_code == 206
+    assert len(response_cursor.json) == 2
+    assert response_cursor.json == response_page_2.json
+    # the last page is not full
+    assert "Link" not in get_next_page(client, response_cursor).headers
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "foo",
+        encode_cursor(2, None),
+        encode_cursor(2, []),
+        encode_cursor(2, {"namespace": "namespace"}),
+    ],
+)
+def test_pagination_invalid_cursor(client, clean_before_and_after, cursor):
+    for url in (url_for("api.copr-builds_copr_builds_list"), url_for("api.projects_projects_list")):
+        response = client.get(url, query_string={"cursor": cursor})
+        assert response.status_code == 400
+
+
+def test_pagination_with_total(client, clean_before_and_after, multiple_forge_projects):
+    with sa_session_transaction(commit=True) as session:
+        session.execute(text("ANALYZE git_projects"))
+    get_estimated_count.cache_clear()
+    url = url_for("api.projects_projects_list")
+
+    response = client.get(url + "?per_page=2&with_total=true")
+    assert response.headers["Content-Range"] == "git-projects 1-2/4"
+
+    response = client.get(url + "?per_page=2")
+    assert response.headers["Content-Range"] == "git-projects 1-2/*"
+
+
 # Test detailed build info
 def test_detailed_copr_build_info(client, clean_before_and_after, a_copr_build_for_pr):
     response = client.get(
@@ -557,6 +631,29 @@ def test_process_runs_without_build(clean_before_and_after, runs_without_build):
         assert item["trigger"]
 
 
+def test_runs_list_constant_number_of_queries(
+    client,
+    clean_before_and_after,
+    too_many_copr_builds,
+    executed_statements,
+):
+    url = url_for("api.runs_runs_list")
+    executed_statements.clear()
+    response_small = client.get(url + "?per_page=2")
+    statements_small = len(executed_statements)
+    executed_statements.clear()
+    response_large = client.get(url + "?per_page=50")
+    statements_large = len(executed_statements)
+
+    assert len(response_small.json) == 2
+    assert len(response_large.json) == 50
+    assert all(run["trigger"]["pr_id"] for run in response_large.json)
+    # the pipelines, SRPM builds, build groups with their targets and pipelines,
+    # project events and project event objects with their projects
+    assert statements_large == statements_small
+    assert statements_large <= 25
+
+
 def test_propose_downstream_list_releases(
     client,
     clean_before_and_after,